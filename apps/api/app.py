@@ -11,8 +11,9 @@ import msgspec
 import sentry_sdk
 from aio_pika.abc import AbstractRobustConnection
 from aio_pika.pool import Pool
-from asyncpg import Connection
+from asyncpg import Connection, create_pool
 from litestar import Litestar, Request, Response, get
+from litestar.config.compression import CompressionConfig
 from litestar.exceptions import HTTPException
 from litestar.logging.config import LoggingConfig
 from litestar.middleware import DefineMiddleware
@@ -21,13 +22,22 @@ from litestar.openapi.plugins import ScalarRenderPlugin
 from litestar.openapi.spec import Server
 from litestar.static_files.config import create_static_files_router
 from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_503_SERVICE_UNAVAILABLE
+from litestar.types import Middleware
 from litestar_asyncpg import AsyncpgConfig, AsyncpgConnection, AsyncpgPlugin, PoolConfig
 
 from events import listeners
 from middleware.auth import CustomAuthenticationMiddleware
 from middleware.guards import scope_guard
+from middleware.profiling import LOCAL_PROFILING, LocalProfilingMiddleware
+from middleware.replica_routing import ReplicaRoutingMiddleware
+from middleware.sql_instrumentation import SQL_INSTRUMENTATION, SqlInstrumentationMiddleware, log_query
+from repository.replica import POSTGRES_REPLICA_DSN, READ_REPLICA, monitor_replica_lag, replica_reads
+from repository.statements import SQL_STATEMENT_CACHE_SIZE, SQL_WARM_STATEMENTS, STATEMENTS
 from routes.v3 import route_handlers as v3_route_handlers
 from utilities.errors import CustomHTTPException
+from utilities.image_variants import IMAGE_VARIANTS
+from utilities.password_hashing import PASSWORD_HASHER
+from utilities.tracing import SENTRY_PROFILE_SESSION_SAMPLE_RATE, traces_sampler
 
 APP_ENVIRONMENT = os.getenv("APP_ENVIRONMENT")
 
@@ -43,6 +53,11 @@ POSTGRES_HOST = os.getenv(
 )
 DEFAULT_DSN = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:5432/{POSTGRES_DB}"
 
+AUTH_WRITE_BEHIND_FLUSH_SECONDS = float(os.getenv("AUTH_WRITE_BEHIND_FLUSH_SECONDS", "5"))
+
+# Responses at least this large are gzipped for clients that accept it (0 disables).
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+
 
 log = logging.getLogger(__name__)
 
@@ -167,7 +182,9 @@ async def skill_nightly_rebuild_poller(_app: Litestar) -> AsyncGenerator[None, N
             try:
                 skill_repo = await provide_skill_repository(_app.state)
                 skill_service = await provide_skill_service(_app.state, skill_repo)
-                await skill_service.recompute_all()
+                # The backstop has no write to read back, so its input scan may use the replica.
+                with replica_reads():
+                    await skill_service.recompute_all()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -182,6 +199,128 @@ async def skill_nightly_rebuild_poller(_app: Litestar) -> AsyncGenerator[None, N
             await task
 
 
+@asynccontextmanager
+async def playtest_plot_cache(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Close the shared keep-alive playtest plotter session on shutdown."""
+    from services.maps_service import (  # noqa: PLC0415  # local import avoids circular import
+        close_playtest_plot_cache,
+    )
+
+    try:
+        yield
+    finally:
+        await close_playtest_plot_cache()
+
+
+@asynccontextmanager
+async def object_storage_client(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Build the shared S3 client at boot and drain its upload threads on shutdown."""
+    from services.image_storage_service import OBJECT_STORAGE  # noqa: PLC0415  # defers the boto3 import chain
+
+    try:
+        await asyncio.to_thread(OBJECT_STORAGE.start)
+    except Exception:
+        # Storage is optional for most routes; the first upload retries the build.
+        log.exception("Failed to build the object storage client at startup.")
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(OBJECT_STORAGE.close)
+
+
+@asynccontextmanager
+async def auth_write_behind_flusher(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Write buffered auth attempts and session touches every few seconds.
+
+    Like the pollers above, the loop sleeps before each flush so the asyncpg
+    lifespan has created the pool. The pool is closed before this lifespan exits,
+    so at most one interval of writes is lost on shutdown: audit rows, which rate
+    limits do not depend on, and last-activity refreshes, which only matter to
+    sessions idle for the whole lifetime.
+    """
+    from services.auth_service import (  # noqa: PLC0415  # local import avoids circular import
+        flush_auth_attempt_log,
+        flush_session_touches,
+    )
+
+    async def _loop() -> None:
+        while True:
+            await asyncio.sleep(AUTH_WRITE_BEHIND_FLUSH_SECONDS)
+            try:
+                await flush_auth_attempt_log(_app.state)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("[!] auth attempt log flush failed")
+            try:
+                await flush_session_touches(_app.state)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("[!] session touch flush failed")
+
+    task = asyncio.create_task(_loop())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+@asynccontextmanager
+async def read_replica_pool(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Open the read replica pool and keep its lag current, when a replica is configured.
+
+    The replica is optional: if it cannot be reached at startup the API runs on
+    the primary alone until the next restart.
+    """
+    if not POSTGRES_REPLICA_DSN:
+        yield
+        return
+    try:
+        pool = await create_pool(
+            dsn=POSTGRES_REPLICA_DSN,
+            init=_async_pg_init,
+            statement_cache_size=SQL_STATEMENT_CACHE_SIZE,
+        )
+    except Exception:
+        log.exception("Failed to open the read replica pool; reading from the primary.")
+        yield
+        return
+    READ_REPLICA.attach(pool)
+    await READ_REPLICA.check_lag()
+    task = asyncio.create_task(monitor_replica_lag())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        READ_REPLICA.detach()
+        await pool.close()
+
+
+@asynccontextmanager
+async def image_variant_pool(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Start the image variant worker processes at boot and stop them on shutdown."""
+    IMAGE_VARIANTS.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(IMAGE_VARIANTS.close)
+
+
+@asynccontextmanager
+async def password_hashing_pool(_app: Litestar) -> AsyncGenerator[None, None]:
+    """Start the bcrypt worker processes at boot and stop them on shutdown."""
+    PASSWORD_HASHER.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(PASSWORD_HASHER.close)
+
+
 def default_exception_handler(_: Request, exc: Exception) -> Response:
     """Handle errors."""
     status_code = getattr(exc, "status_code", HTTP_500_INTERNAL_SERVER_ERROR)
@@ -189,7 +328,8 @@ def default_exception_handler(_: Request, exc: Exception) -> Response:
         log.error("500: \n", exc_info=exc)
     detail = getattr(exc, "detail", "")
     extra = getattr(exc, "extra", {})
-    return Response(content={"error": detail, "extra": extra}, status_code=status_code)
+    headers = getattr(exc, "headers", None)
+    return Response(content={"error": detail, "extra": extra}, status_code=status_code, headers=headers)
 
 
 def internal_server_error_handler(_: Request, exc: Exception) -> Response:
@@ -202,6 +342,11 @@ async def _async_pg_init(conn: AsyncpgConnection) -> None:
     await conn.set_type_codec(
         "jsonb", encoder=_jsonb_encoder, decoder=_jsonb_decoder, schema="pg_catalog", format="text"
     )
+    if SQL_INSTRUMENTATION:
+        conn.add_query_logger(log_query)
+    # Last: setting a type codec clears the connection's statement cache.
+    if SQL_WARM_STATEMENTS and SQL_STATEMENT_CACHE_SIZE:
+        await STATEMENTS.warm(conn)
 
 
 def _jsonb_encoder(value: object) -> str:
@@ -246,7 +391,11 @@ def create_app(psql_dsn: str | None = None) -> Litestar:
     assert dsn
     asyncpg = AsyncpgPlugin(
         config=AsyncpgConfig(
-            pool_config=PoolConfig(dsn=dsn, init=_async_pg_init),
+            pool_config=PoolConfig(
+                dsn=dsn,
+                init=_async_pg_init,
+                connect_kwargs={"statement_cache_size": SQL_STATEMENT_CACHE_SIZE},
+            ),
             connection_dependency_key="conn",
         ),
     )
@@ -285,18 +434,47 @@ def create_app(psql_dsn: str | None = None) -> Litestar:
         log_exceptions="always",
     )
 
+    compression_config = (
+        CompressionConfig(
+            backend="gzip",
+            minimum_size=RESPONSE_COMPRESSION_MIN_SIZE,
+            gzip_compress_level=5,
+            # Playtest plots are WebP images, already compressed; gzip would only cost CPU.
+            exclude=[
+                "/healthcheck",
+                r"^/api/v3/maps/playtests/(\d+/plot|plots/)",
+                r"^/api/v3/maps/[A-Z0-9]+/plot$",
+            ],
+        )
+        if RESPONSE_COMPRESSION_MIN_SIZE > 0
+        else None
+    )
+
     auth_middleware = DefineMiddleware(CustomAuthenticationMiddleware, exclude=["/docs", "/schema", "/healthcheck"])
 
-    sentry_sdk.init(
-        dsn=os.getenv("SENTRY_DSN"),
-        send_default_pii=True,
-        enable_logs=True,
-        traces_sample_rate=1.0,
-        profile_session_sample_rate=1.0,
-        profile_lifecycle="trace",
-        environment=APP_ENVIRONMENT,
-        release=os.getenv("SENTRY_RELEASE", "unknown"),
-    )
+    # Without a DSN the client is a no-op, but init would still import and patch every
+    # auto-enabled integration (aiohttp, botocore, ...), which dominates cold start.
+    if sentry_dsn := os.getenv("SENTRY_DSN"):
+        sentry_sdk.init(
+            dsn=sentry_dsn,
+            send_default_pii=True,
+            enable_logs=True,
+            traces_sampler=traces_sampler,
+            profile_session_sample_rate=SENTRY_PROFILE_SESSION_SAMPLE_RATE,
+            profile_lifecycle="trace",
+            environment=APP_ENVIRONMENT,
+            release=os.getenv("SENTRY_RELEASE", "unknown"),
+        )
+
+    middleware: list[Middleware] = [auth_middleware]
+    if POSTGRES_REPLICA_DSN:
+        middleware.append(ReplicaRoutingMiddleware())
+    if SQL_INSTRUMENTATION:
+        # Outside authentication, so the API key lookup is counted.
+        middleware.insert(0, SqlInstrumentationMiddleware())
+    if LOCAL_PROFILING:
+        # Outermost, so the timings include authentication.
+        middleware.insert(0, LocalProfilingMiddleware())
 
     _app = Litestar(
         plugins=[asyncpg],
@@ -317,9 +495,20 @@ def create_app(psql_dsn: str | None = None) -> Litestar:
             HTTP_500_INTERNAL_SERVER_ERROR: internal_server_error_handler,
         },
         listeners=listeners,
-        lifespan=[rabbitmq_connection, tournament_outbox_poller, skill_nightly_rebuild_poller],
+        lifespan=[
+            rabbitmq_connection,
+            tournament_outbox_poller,
+            skill_nightly_rebuild_poller,
+            playtest_plot_cache,
+            object_storage_client,
+            image_variant_pool,
+            password_hashing_pool,
+            auth_write_behind_flusher,
+            read_replica_pool,
+        ],
         logging_config=logging_config,
-        middleware=[auth_middleware],
+        middleware=middleware,
+        compression_config=compression_config,
         guards=[scope_guard],
     )
     logging.getLogger("uvicorn.access").addFilter(EndpointLogFilter())
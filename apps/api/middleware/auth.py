@@ -5,9 +5,22 @@ from litestar.connection import ASGIConnection
 from litestar.exceptions import NotAuthorizedException
 from litestar.middleware.authentication import AbstractAuthenticationMiddleware, AuthenticationResult
 
+from repository.statements import STATEMENTS
+
 if TYPE_CHECKING:
     from asyncpg import Pool
 
+_API_KEY_QUERY = STATEMENTS.register(
+    "auth.api_key",
+    """
+    SELECT u.id, u.username, u.info, t.api_key, t.is_superuser, t.scopes
+    FROM public.api_tokens t
+    JOIN public.auth_users u ON t.user_id = u.id
+    WHERE t.api_key = $1
+    """,
+    warm=True,
+)
+
 
 class AuthUser(msgspec.Struct):
     id: int
@@ -30,14 +43,7 @@ class CustomAuthenticationMiddleware(AbstractAuthenticationMiddleware):
         if not api_key:
             raise NotAuthorizedException("Missing API key")
 
-        query = """
-            SELECT u.id, u.username, u.info, t.api_key, t.is_superuser, t.scopes
-            FROM public.api_tokens t
-            JOIN public.auth_users u ON t.user_id = u.id
-            WHERE t.api_key = $1
-        """
-
-        row = await conn.fetchrow(query, api_key)
+        row = await conn.fetchrow(_API_KEY_QUERY, api_key)
 
         if not row:
             raise NotAuthorizedException("Invalid API key")
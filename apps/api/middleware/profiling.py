@@ -0,0 +1,246 @@
+"""Opt-in local request profiling, independent of Sentry.
+
+When ``LOCAL_PROFILING`` is enabled, :class:`LocalProfilingMiddleware` records a
+latency histogram per ``METHOD path-template`` and profiles requests, keeping the
+reports of the ``LOCAL_PROFILING_KEEP`` slowest ones. The superuser-only
+``/api/v3/internal/profiling`` endpoints expose and reset what was collected.
+
+pyinstrument is used when it is installed (its async mode attributes time to the
+awaiting request); otherwise the stdlib ``cProfile`` is used. Only one profiler
+can be active per interpreter, so while one request is being profiled,
+overlapping requests are timed but not profiled, and a cProfile report may
+include work from other tasks that ran on the loop in the meantime.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import heapq
+import io
+import itertools
+import os
+import pstats
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+LOCAL_PROFILING = os.getenv("LOCAL_PROFILING", "false").lower() in {"1", "true", "yes"}
+LOCAL_PROFILING_KEEP = int(os.getenv("LOCAL_PROFILING_KEEP", "10"))
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RouteLatencyResponse(msgspec.Struct):
+    """Latency histogram for one route.
+
+    ``buckets[i]`` counts requests at or under ``LATENCY_BUCKETS_MS[i]``
+    milliseconds; the final bucket counts everything slower.
+    """
+
+    route: str
+    count: int
+    total_ms: float
+    max_ms: float
+    buckets: list[int]
+    status_codes: dict[int, int]
+
+
+class ProfileSnapshotResponse(msgspec.Struct):
+    """A profiled request kept among the slowest seen."""
+
+    route: str
+    path: str
+    status_code: int
+    duration_ms: float
+    captured_at: float
+    profiler: str
+    report: str
+
+
+class ProfilingReportResponse(msgspec.Struct):
+    """Everything collected since the last reset."""
+
+    enabled: bool
+    buckets_ms: list[float]
+    routes: list[RouteLatencyResponse]
+    slowest: list[ProfileSnapshotResponse]
+
+
+class _RouteLatency:
+    __slots__ = ("buckets", "count", "max_ms", "status_codes", "total_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.status_codes: dict[int, int] = {}
+
+    def add(self, duration_ms: float, status_code: int) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+
+class _Profiler:
+    """Wrap pyinstrument or cProfile behind start/stop/report."""
+
+    def __init__(self) -> None:
+        try:
+            from pyinstrument import Profiler  # noqa: PLC0415  # optional dependency
+        except ImportError:
+            self.name = "cProfile"
+            self._impl: Any = cProfile.Profile()
+            self._impl.enable()
+        else:
+            self.name = "pyinstrument"
+            self._impl = Profiler(async_mode="enabled")
+            self._impl.start()
+
+    def stop(self) -> None:
+        if self.name == "cProfile":
+            self._impl.disable()
+        else:
+            self._impl.stop()
+
+    def report(self) -> str:
+        if self.name == "pyinstrument":
+            return self._impl.output_text(unicode=True)
+        out = io.StringIO()
+        pstats.Stats(self._impl, stream=out).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+        return out.getvalue()
+
+
+class LocalProfile:
+    """Process-wide latency histograms and slowest-request profiles.
+
+    Middleware instances are built once per route, so the collected data MUST
+    live at module scope to be shared across routes.
+    """
+
+    def __init__(self, keep: int) -> None:
+        self.keep = keep
+        self.routes: dict[str, _RouteLatency] = {}
+        self._slowest: list[tuple[float, int, ProfileSnapshotResponse]] = []
+        self._seq = itertools.count()
+        self._profiling = False
+
+    def start_profile(self) -> _Profiler | None:
+        """Start profiling unless another request already is."""
+        if self._profiling or self.keep <= 0:
+            return None
+        self._profiling = True
+        return _Profiler()
+
+    def finish_profile(self, profiler: _Profiler) -> None:
+        """Stop ``profiler`` and allow the next request to be profiled."""
+        profiler.stop()
+        self._profiling = False
+
+    def is_slow_enough(self, duration_ms: float) -> bool:
+        """Return whether a request of this duration belongs among the slowest kept."""
+        return len(self._slowest) < self.keep or duration_ms > self._slowest[0][0]
+
+    def record(
+        self,
+        route: str,
+        path: str,
+        status_code: int,
+        duration_ms: float,
+        profiler: _Profiler | None,
+    ) -> None:
+        """Record one request, keeping its profile if it is among the slowest.
+
+        Args:
+            route: ``METHOD path-template`` key.
+            path: Concrete request path.
+            status_code: Response status code.
+            duration_ms: Wall-clock duration of the request.
+            profiler: The stopped profiler, if this request was profiled.
+        """
+        self.routes.setdefault(route, _RouteLatency()).add(duration_ms, status_code)
+        if profiler is None or not self.is_slow_enough(duration_ms):
+            return
+        snapshot = ProfileSnapshotResponse(
+            route=route,
+            path=path,
+            status_code=status_code,
+            duration_ms=duration_ms,
+            captured_at=time.time(),
+            profiler=profiler.name,
+            report=profiler.report(),
+        )
+        entry = (duration_ms, next(self._seq), snapshot)
+        if len(self._slowest) < self.keep:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> list[ProfileSnapshotResponse]:
+        """Return kept profiles, slowest first."""
+        return [snapshot for _, _, snapshot in sorted(self._slowest, reverse=True)]
+
+    def report(self) -> ProfilingReportResponse:
+        """Return the collected histograms and profiles."""
+        return ProfilingReportResponse(
+            enabled=LOCAL_PROFILING,
+            buckets_ms=list(LATENCY_BUCKETS_MS),
+            routes=[
+                RouteLatencyResponse(
+                    route=route,
+                    count=stats.count,
+                    total_ms=stats.total_ms,
+                    max_ms=stats.max_ms,
+                    buckets=list(stats.buckets),
+                    status_codes=dict(stats.status_codes),
+                )
+                for route, stats in sorted(self.routes.items())
+            ],
+            slowest=self.slowest(),
+        )
+
+    def reset(self) -> None:
+        """Drop everything collected so far."""
+        self.routes.clear()
+        self._slowest.clear()
+
+
+# Single process-wide collector shared by every LocalProfilingMiddleware.
+LOCAL_PROFILE = LocalProfile(LOCAL_PROFILING_KEEP)
+
+
+class LocalProfilingMiddleware(ASGIMiddleware):
+    """Time every HTTP request and profile it when no other profile is running."""
+
+    scopes = (ScopeType.HTTP,)
+    exclude_path_pattern = "^/api/v3/internal/profiling"
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        """Run the request under the timer (and profiler) and record the result."""
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        route = f"{scope.get('method', '')} {scope.get('path_template', scope['path'])}"
+        profiler = LOCAL_PROFILE.start_profile()
+        started = time.perf_counter()
+        try:
+            await next_app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            if profiler is not None:
+                LOCAL_PROFILE.finish_profile(profiler)
+            LOCAL_PROFILE.record(route, scope["path"], status_code, duration_ms, profiler)
@@ -0,0 +1,60 @@
+"""Per-request choice between the read replica and the primary.
+
+``GET`` and ``HEAD`` requests run inside :func:`repository.replica.replica_reads`,
+so their replica-safe repository reads may use the replica. Any other method
+pins its client to the primary for ``REPLICA_STICKY_SECONDS`` once its response
+starts, so a client reading back what it just wrote never sees the replica
+before it has caught up. Clients are told apart by their API key, falling back
+to the peer address; the bot shares one key across its users, so one bot write
+pins all of the bot's reads for the window, which errs towards the primary.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+
+from repository.replica import READ_REPLICA, replica_reads
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+_READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _client_key(scope: Scope) -> str:
+    for name, value in scope["headers"]:
+        if name == b"x-api-key":
+            return value.decode("latin-1")
+    client = scope.get("client")
+    return client[0] if client else ""
+
+
+class ReplicaRoutingMiddleware(ASGIMiddleware):
+    """Let safe requests read from the replica and pin writers to the primary."""
+
+    scopes = (ScopeType.HTTP,)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        """Run reads with replica routing; record writes for read-your-writes stickiness."""
+        client = _client_key(scope)
+        if scope["method"] in _READ_METHODS:
+            if READ_REPLICA.is_sticky(client):
+                await next_app(scope, receive, send)
+                return
+            with replica_reads():
+                await next_app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                READ_REPLICA.note_write(client)
+            await send(message)
+
+        try:
+            await next_app(scope, receive, send_wrapper)
+        finally:
+            # Also when the handler failed part way: some of its writes may have committed.
+            READ_REPLICA.note_write(client)
@@ -0,0 +1,187 @@
+"""Per-request SQL statistics: query count, database time and N+1 detection.
+
+Every pool connection gets :func:`log_query` as an asyncpg query logger (see
+``_async_pg_init``), so statements are seen whichever repository, service or
+middleware sends them, on the pool or on an acquired connection.
+:class:`SqlInstrumentationMiddleware` opens a :class:`RequestQueryStats` in a
+context variable for each HTTP request; asyncpg runs query loggers with
+``call_soon``, which copies the running context, so each statement lands in the
+stats of the request that sent it.
+
+When the response starts the middleware adds a ``Server-Timing`` header
+(``db`` with the count and total time, ``db-slowest`` with the slowest
+statement), logs the same numbers as log record fields, and warns when a single
+statement ran ``SQL_REPEAT_THRESHOLD`` times, the signature of an N+1 loop.
+
+Routes may declare ``opt={"query_budget": n}``. A request sending more than
+``n`` statements is logged and recorded in :func:`budget_violations`, which the
+test suite checks after every test.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import msgspec
+from asyncpg import introspection
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+
+if TYPE_CHECKING:
+    from asyncpg.connection import LoggedQuery
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "true").lower() in {"1", "true", "yes"}
+SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "10"))
+
+# Type introspection asyncpg runs on its own the first time a connection meets a
+# type; counting it would make a route's query count depend on connection age.
+_DRIVER_STATEMENTS = frozenset({introspection.INTRO_LOOKUP_TYPES, introspection.INTRO_LOOKUP_TYPES_13})
+
+
+def fingerprint(query: str, width: int = 120) -> str:
+    """Return ``query`` on one line, truncated to ``width`` characters, for logs and reports."""
+    text = " ".join(query.split())
+    return text if len(text) <= width else f"{text[: width - 3]}..."
+
+
+class RequestQueryStats:
+    """Statements sent while handling one request."""
+
+    __slots__ = ("by_statement", "count", "slowest_ms", "slowest_query", "total_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_query: str | None = None
+        self.by_statement: dict[str, int] = {}
+
+    def add(self, query: str, elapsed_ms: float) -> None:
+        """Record one statement."""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_query = query
+        self.by_statement[query] = self.by_statement.get(query, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statements sent at least ``threshold`` times, most repeated first."""
+        repeats = [(query, n) for query, n in self.by_statement.items() if n >= threshold]
+        return sorted(repeats, key=lambda item: item[1], reverse=True)
+
+    def server_timing(self) -> str:
+        """Return the ``Server-Timing`` header value for these statements."""
+        value = f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+        if self.count:
+            value += f", db-slowest;dur={self.slowest_ms:.2f}"
+        return value
+
+    def log_fields(self) -> dict[str, object]:
+        """Return the statistics as log record fields."""
+        return {
+            "db_queries": self.count,
+            "db_ms": round(self.total_ms, 2),
+            "db_slowest_ms": round(self.slowest_ms, 2),
+            "db_slowest_query": fingerprint(self.slowest_query) if self.slowest_query else None,
+        }
+
+
+_REQUEST_STATS: contextvars.ContextVar[RequestQueryStats | None] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def log_query(record: LoggedQuery) -> None:
+    """Add a statement to the current request's stats; installed as an asyncpg query logger."""
+    stats = _REQUEST_STATS.get()
+    if stats is not None and record.query not in _DRIVER_STATEMENTS:
+        stats.add(record.query, record.elapsed * 1000)
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueryStats]:
+    """Collect the statements sent by the current task (and tasks it starts) in the block."""
+    stats = RequestQueryStats()
+    token = _REQUEST_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _REQUEST_STATS.reset(token)
+
+
+class QueryBudgetViolation(msgspec.Struct):
+    """A request that sent more statements than its route's ``query_budget``."""
+
+    route: str
+    path: str
+    budget: int
+    queries: int
+    top_statements: list[tuple[str, int]]
+
+
+# Most recent violations in this process; the test suite fails on any new entry.
+_BUDGET_VIOLATIONS: deque[QueryBudgetViolation] = deque(maxlen=100)
+
+
+def budget_violations() -> list[QueryBudgetViolation]:
+    """Return the recorded query budget violations, oldest first."""
+    return list(_BUDGET_VIOLATIONS)
+
+
+def clear_budget_violations() -> None:
+    """Forget the recorded query budget violations."""
+    _BUDGET_VIOLATIONS.clear()
+
+
+class SqlInstrumentationMiddleware(ASGIMiddleware):
+    """Track the statements of each HTTP request and report them when the response starts."""
+
+    scopes = (ScopeType.HTTP,)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        """Run the request with query tracking, then report in headers and logs."""
+        route = f"{scope.get('method', '')} {scope.get('path_template', scope['path'])}"
+        handler = scope.get("route_handler")
+        budget = handler.opt.get("query_budget") if handler is not None else None
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Loggers for the last statements are scheduled with call_soon; let them run.
+                    await asyncio.sleep(0)
+                    MutableScopeHeaders.from_message(message).add("server-timing", stats.server_timing())
+                    _report(route, scope["path"], stats, budget)
+                await send(message)
+
+            await next_app(scope, receive, send_wrapper)
+
+
+def _report(route: str, path: str, stats: RequestQueryStats, budget: int | None) -> None:
+    fields = {"route": route, **stats.log_fields()}
+    log.debug("%s sent %d queries in %.2f ms", route, stats.count, stats.total_ms, extra=fields)
+    for query, times in stats.repeated(SQL_REPEAT_THRESHOLD):
+        log.warning("Possible N+1 on %s: %d runs of %s", route, times, fingerprint(query), extra=fields)
+    if budget is not None and stats.count > budget:
+        log.warning("%s sent %d queries, over its budget of %d", route, stats.count, budget, extra=fields)
+        _BUDGET_VIOLATIONS.append(
+            QueryBudgetViolation(
+                route=route,
+                path=path,
+                budget=budget,
+                queries=stats.count,
+                top_statements=[(fingerprint(q), n) for q, n in stats.repeated(1)[:5]],
+            )
+        )
@@ -0,0 +1,45 @@
+-- Migration 0034: Auth rate limit buckets
+--
+-- Rate limiting used to COUNT(*) rows of users.auth_rate_limits inside the
+-- window on every check, and that table grew without bound. Limits are now
+-- GCRA buckets (apps/api/utilities/rate_limiting.py): one row per
+-- identifier + action holding its theoretical arrival time (tat), advanced
+-- atomically by an upsert. This table is only used when the API runs with
+-- AUTH_RATE_LIMIT_BACKEND=postgres (shared across replicas); the default
+-- backend keeps the buckets in memory.
+--
+-- The table is UNLOGGED: losing buckets on a crash only resets the limits.
+--
+-- users.auth_rate_limits stays as the append-only audit log of attempts,
+-- written in batches and no longer read on the request path.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS users.auth_rate_limit_buckets
+(
+    identifier text        NOT NULL, -- lower-cased email or IP address
+    action     text        NOT NULL,
+    tat        timestamptz NOT NULL,
+    PRIMARY KEY (identifier, action)
+);
+
+COMMENT ON TABLE users.auth_rate_limit_buckets IS 'GCRA rate limit state per identifier and action';
+COMMENT ON TABLE users.auth_rate_limits IS 'Append-only audit log of authentication attempts';
+
+-- A bucket whose tat has passed is equivalent to no bucket; prune them hourly.
+DO $body$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule('auth-rate-limit-bucket-prune') WHERE EXISTS (
+            SELECT 1 FROM cron.job WHERE jobname = 'auth-rate-limit-bucket-prune'
+        );
+
+        PERFORM cron.schedule(
+            'auth-rate-limit-bucket-prune',
+            '17 * * * *',
+            'DELETE FROM users.auth_rate_limit_buckets WHERE tat < now()'
+        );
+
+        RAISE NOTICE 'Scheduled pg_cron job: auth-rate-limit-bucket-prune';
+    ELSE
+        RAISE NOTICE 'pg_cron extension not available, skipping cron scheduling';
+    END IF;
+END $body$;
@@ -0,0 +1,119 @@
+-- Migration 0035: Partition users.sessions by last_activity
+--
+-- Session GC used to be one DELETE over every expired row. users.sessions is
+-- now range-partitioned by month of last_activity, so expiry drops whole
+-- partitions (users.maintain_session_partitions) and only the month straddling
+-- the cutoff needs a row-level DELETE.
+--
+-- Reads no longer refresh last_activity on every request; the API coalesces
+-- touches and applies them in batches at most once per SESSION_TOUCH_GRANULARITY,
+-- so rows only move between partitions when a touch crosses a month boundary.
+--
+-- A partitioned table's unique keys must include the partition key, so the
+-- primary key becomes (id, last_activity). The API serialises the first write
+-- of a session id with an advisory lock to keep ids unique.
+
+CREATE TABLE users.sessions_new
+(
+    id            text        NOT NULL,
+    user_id       bigint CONSTRAINT sessions_user_id_fkey REFERENCES core.users (id) ON UPDATE CASCADE ON DELETE CASCADE,
+    payload       text        NOT NULL,
+    last_activity timestamptz NOT NULL DEFAULT now(),
+    ip_address    text,
+    user_agent    text,
+    PRIMARY KEY (id, last_activity)
+) PARTITION BY RANGE (last_activity);
+
+-- Safety net for rows outside every monthly partition (e.g. if maintenance
+-- stopped running); normally empty.
+CREATE TABLE users.sessions_default PARTITION OF users.sessions_new DEFAULT;
+
+ALTER TABLE users.sessions RENAME TO sessions_unpartitioned;
+ALTER TABLE users.sessions_new RENAME TO sessions;
+ALTER TABLE users.sessions_unpartitioned RENAME CONSTRAINT sessions_pkey TO sessions_unpartitioned_pkey;
+ALTER TABLE users.sessions RENAME CONSTRAINT sessions_new_pkey TO sessions_pkey;
+
+-- Create monthly partitions from the oldest live month through two months
+-- ahead, and drop those that ended before now() - lifetime. Returns the number
+-- of sessions dropped with them.
+CREATE OR REPLACE FUNCTION users.maintain_session_partitions(lifetime interval) RETURNS bigint
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    month_start date := date_trunc('month', now() - lifetime)::date;
+    last_month  date := date_trunc('month', now() + INTERVAL '2 months')::date;
+    part_name   text;
+    dropped     bigint := 0;
+    n           bigint;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        part_name := 'sessions_' || to_char(month_start, 'YYYYMM');
+        IF to_regclass('users.' || part_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE users.%I PARTITION OF users.sessions FOR VALUES FROM (%L) TO (%L)',
+                    part_name, month_start, (month_start + INTERVAL '1 month')::date
+                );
+            EXCEPTION
+                WHEN check_violation THEN
+                    -- The default partition already holds rows for this month;
+                    -- leave them there rather than fail maintenance.
+                    RAISE NOTICE 'users.sessions_default has rows for %, skipping %', month_start, part_name;
+            END;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+
+    FOR part_name IN
+        SELECT c.relname
+        FROM pg_class c
+        JOIN pg_inherits i ON i.inhrelid = c.oid
+        WHERE i.inhparent = 'users.sessions'::regclass
+          AND c.relname ~ '^sessions_[0-9]{6}$'
+          AND to_date(substring(c.relname FROM 10), 'YYYYMM') + INTERVAL '1 month' <= now() - lifetime
+    LOOP
+        EXECUTE format('SELECT count(*) FROM users.%I', part_name) INTO n;
+        EXECUTE format('DROP TABLE users.%I', part_name);
+        dropped := dropped + n;
+    END LOOP;
+
+    RETURN dropped;
+END;
+$$;
+
+-- Keep in sync with SESSION_LIFETIME_MINUTES in apps/api/services/auth_service.py.
+SELECT users.maintain_session_partitions(INTERVAL '90 days');
+
+INSERT INTO users.sessions (id, user_id, payload, last_activity, ip_address, user_agent)
+SELECT id, user_id, payload, COALESCE(last_activity, now()), ip_address, user_agent
+FROM users.sessions_unpartitioned
+WHERE last_activity IS NULL OR last_activity > now() - INTERVAL '90 days';
+
+DROP TABLE users.sessions_unpartitioned;
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON users.sessions (user_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_last_activity ON users.sessions (last_activity);
+
+COMMENT ON TABLE users.sessions IS 'User sessions for Laravel website authentication, partitioned by month of last_activity';
+COMMENT ON COLUMN users.sessions.id IS 'Session ID (Laravel generated)';
+COMMENT ON COLUMN users.sessions.payload IS 'Base64-encoded session data';
+COMMENT ON COLUMN users.sessions.last_activity IS 'Last activity timestamp for expiry, refreshed at most once per touch granularity';
+
+DO $body$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule('session-partition-maintenance') WHERE EXISTS (
+            SELECT 1 FROM cron.job WHERE jobname = 'session-partition-maintenance'
+        );
+
+        PERFORM cron.schedule(
+            'session-partition-maintenance',
+            '23 3 * * *',
+            $$SELECT users.maintain_session_partitions(INTERVAL '90 days')$$
+        );
+
+        RAISE NOTICE 'Scheduled pg_cron job: session-partition-maintenance';
+    ELSE
+        RAISE NOTICE 'pg_cron extension not available, skipping cron scheduling';
+    END IF;
+END $body$;
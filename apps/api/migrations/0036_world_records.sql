@@ -0,0 +1,239 @@
+-- Migration 0036: Maintained world-record table and history
+--
+-- World-record reads (a user's WR count on the rank card, the community
+-- leaderboard's wr_count, a user's WR list) used to rank every verified
+-- completion on every map with a window function. maps.world_records now holds
+-- the current record per map, so those reads are indexed lookups.
+--
+-- A map's record is the map leaderboard's rank 1: among each user's latest
+-- verified, non-legacy completion on the map, the fastest record run
+-- (completion = FALSE), ties broken by the earliest submission. As in the WR
+-- counts this replaces, system users (id <= 1000) and placeholder times
+-- (>= 99999999) never hold a record.
+--
+-- Statement-level triggers on core.completions refresh the affected maps in the
+-- same transaction as the write. That covers verification, rejection,
+-- moderation and patch edits, legacy conversion, and direct SQL writes such as
+-- seeds. maps.world_record_history keeps every holder with the period they held
+-- the record; the open row (ended_at IS NULL) mirrors maps.world_records.
+-- maps.world_record_drift() compares the table with a full recompute.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS maps.world_records
+(
+    map_id        int            PRIMARY KEY REFERENCES core.maps (id) ON DELETE CASCADE,
+    completion_id int            NOT NULL REFERENCES core.completions (id) ON DELETE CASCADE,
+    user_id       bigint         NOT NULL REFERENCES core.users (id) ON DELETE CASCADE,
+    time          numeric(10, 2) NOT NULL,
+    achieved_at   timestamptz    NOT NULL,
+    updated_at    timestamptz    NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_world_records_user_id ON maps.world_records (user_id);
+
+COMMENT ON TABLE maps.world_records IS 'Current world record per map; maintained by triggers on core.completions';
+COMMENT ON COLUMN maps.world_records.achieved_at IS 'When the record completion was submitted';
+
+CREATE TABLE IF NOT EXISTS maps.world_record_history
+(
+    id            bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    map_id        int            NOT NULL REFERENCES core.maps (id) ON DELETE CASCADE,
+    completion_id int            REFERENCES core.completions (id) ON DELETE SET NULL,
+    user_id       bigint         NOT NULL REFERENCES core.users (id) ON DELETE CASCADE,
+    time          numeric(10, 2) NOT NULL,
+    started_at    timestamptz    NOT NULL DEFAULT now(),
+    ended_at      timestamptz
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_world_record_history_open
+    ON maps.world_record_history (map_id) WHERE ended_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_world_record_history_map_started
+    ON maps.world_record_history (map_id, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_world_record_history_user_id ON maps.world_record_history (user_id);
+
+COMMENT ON TABLE maps.world_record_history IS 'Every world record holder per map and the period they held it';
+
+-- Backs check_previous_world_record_xp.
+CREATE INDEX IF NOT EXISTS idx_completions_wr_xp_granted
+    ON core.completions (map_id, user_id) WHERE wr_xp_check AND NOT legacy;
+
+-- The record definition, shared by the refresh and the drift check.
+CREATE OR REPLACE FUNCTION maps.compute_world_records(p_map_ids int[])
+    RETURNS TABLE
+            (
+                map_id        int,
+                completion_id int,
+                user_id       bigint,
+                "time"        numeric(10, 2),
+                achieved_at   timestamptz
+            )
+    LANGUAGE sql
+    STABLE AS
+$$
+    WITH latest AS (
+        SELECT DISTINCT ON (c.map_id, c.user_id)
+            c.map_id, c.id, c.user_id, c.time, c.completion, c.inserted_at
+        FROM core.completions c
+        WHERE c.map_id = ANY (p_map_ids)
+          AND c.verified = TRUE
+          AND c.legacy = FALSE
+          AND c.user_id > 1000
+          AND c.time < 99999999
+        ORDER BY c.map_id, c.user_id, c.inserted_at DESC
+    )
+    SELECT DISTINCT ON (l.map_id) l.map_id, l.id, l.user_id, l.time, l.inserted_at
+    FROM latest l
+    WHERE l.completion = FALSE
+    ORDER BY l.map_id, l.time, l.inserted_at;
+$$;
+
+CREATE OR REPLACE FUNCTION maps.refresh_world_records(p_map_ids int[]) RETURNS void
+    LANGUAGE plpgsql AS
+$$
+BEGIN
+    -- Serialise refreshes of the same map so concurrent writes cannot both
+    -- open a history row; ordered to avoid lock-order deadlocks.
+    PERFORM pg_advisory_xact_lock(hashtext('maps.world_records'), m)
+    FROM (SELECT DISTINCT unnest(p_map_ids) AS m ORDER BY 1) ids;
+
+    WITH best AS (
+        SELECT * FROM maps.compute_world_records(p_map_ids)
+    ), removed AS (
+        DELETE FROM maps.world_records wr
+        WHERE wr.map_id = ANY (p_map_ids)
+          AND NOT EXISTS (SELECT 1 FROM best b WHERE b.map_id = wr.map_id)
+    )
+    INSERT INTO maps.world_records AS wr (map_id, completion_id, user_id, time, achieved_at)
+    SELECT b.map_id, b.completion_id, b.user_id, b.time, b.achieved_at
+    FROM best b
+    ON CONFLICT (map_id) DO UPDATE
+        SET completion_id = excluded.completion_id,
+            user_id       = excluded.user_id,
+            time          = excluded.time,
+            achieved_at   = excluded.achieved_at,
+            updated_at    = now()
+    WHERE (wr.completion_id, wr.time) IS DISTINCT FROM (excluded.completion_id, excluded.time);
+
+    UPDATE maps.world_record_history h
+    SET ended_at = now()
+    WHERE h.map_id = ANY (p_map_ids)
+      AND h.ended_at IS NULL
+      AND NOT EXISTS (
+        SELECT 1
+        FROM maps.world_records wr
+        WHERE wr.map_id = h.map_id
+          AND wr.completion_id = h.completion_id
+          AND wr.time = h.time
+    );
+
+    INSERT INTO maps.world_record_history (map_id, completion_id, user_id, time)
+    SELECT wr.map_id, wr.completion_id, wr.user_id, wr.time
+    FROM maps.world_records wr
+    WHERE wr.map_id = ANY (p_map_ids)
+      AND NOT EXISTS (
+        SELECT 1 FROM maps.world_record_history h WHERE h.map_id = wr.map_id AND h.ended_at IS NULL
+    );
+END
+$$;
+
+-- Maps whose stored record differs from a full recompute; empty when consistent.
+CREATE OR REPLACE FUNCTION maps.world_record_drift()
+    RETURNS TABLE
+            (
+                map_id                int,
+                expected_completion_id int,
+                stored_completion_id  int
+            )
+    LANGUAGE sql
+    STABLE AS
+$$
+    SELECT coalesce(e.map_id, s.map_id), e.completion_id, s.completion_id
+    FROM maps.compute_world_records(ARRAY(SELECT m.id FROM core.maps m)) e
+    FULL JOIN maps.world_records s ON s.map_id = e.map_id
+    WHERE (e.completion_id, e.time) IS DISTINCT FROM (s.completion_id, s.time)
+    ORDER BY 1;
+$$;
+
+-- Only verified, non-legacy rows can hold or displace a record, so pending
+-- submissions and unrelated column updates skip the refresh.
+CREATE OR REPLACE FUNCTION maps.world_records_after_insert() RETURNS trigger
+    LANGUAGE plpgsql AS
+$$
+BEGIN
+    PERFORM maps.refresh_world_records(ids)
+    FROM (
+        SELECT array_agg(DISTINCT n.map_id) AS ids
+        FROM new_rows n
+        WHERE n.verified AND n.legacy = FALSE
+    ) changed
+    WHERE ids IS NOT NULL;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION maps.world_records_after_update() RETURNS trigger
+    LANGUAGE plpgsql AS
+$$
+BEGIN
+    PERFORM maps.refresh_world_records(ids)
+    FROM (
+        SELECT array_agg(DISTINCT m.map_id) AS ids
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        CROSS JOIN LATERAL (VALUES (n.map_id), (o.map_id)) AS m (map_id)
+        WHERE ((n.verified AND n.legacy = FALSE) OR (o.verified AND o.legacy = FALSE))
+          AND (n.map_id, n.user_id, n.time, n.completion, n.verified, n.legacy, n.inserted_at)
+              IS DISTINCT FROM (o.map_id, o.user_id, o.time, o.completion, o.verified, o.legacy, o.inserted_at)
+    ) changed
+    WHERE ids IS NOT NULL;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION maps.world_records_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS
+$$
+BEGIN
+    PERFORM maps.refresh_world_records(ids)
+    FROM (
+        SELECT array_agg(DISTINCT o.map_id) AS ids
+        FROM old_rows o
+        WHERE o.verified AND o.legacy = FALSE
+    ) changed
+    WHERE ids IS NOT NULL;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER trg_completions_world_records_insert
+    AFTER INSERT
+    ON core.completions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION maps.world_records_after_insert();
+
+CREATE TRIGGER trg_completions_world_records_update
+    AFTER UPDATE
+    ON core.completions
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION maps.world_records_after_update();
+
+CREATE TRIGGER trg_completions_world_records_delete
+    AFTER DELETE
+    ON core.completions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION maps.world_records_after_delete();
+
+-- Backfill; history starts at each current record's submission time.
+INSERT INTO maps.world_records (map_id, completion_id, user_id, time, achieved_at)
+SELECT map_id, completion_id, user_id, time, achieved_at
+FROM maps.compute_world_records(ARRAY(SELECT id FROM core.maps));
+
+INSERT INTO maps.world_record_history (map_id, completion_id, user_id, time, started_at)
+SELECT map_id, completion_id, user_id, time, achieved_at
+FROM maps.world_records;
+
+COMMIT;
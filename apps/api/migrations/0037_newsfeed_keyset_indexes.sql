@@ -0,0 +1,14 @@
+-- Migration 0037: Keyset indexes for newsfeed pages
+--
+-- Newsfeed pages are read newest first, optionally for one event type, and
+-- continue from a (timestamp, id) cursor instead of an OFFSET. Both shapes are
+-- now a single descending index range scan. newsfeed_type_idx is a prefix of
+-- the per-type index and is dropped.
+
+CREATE INDEX IF NOT EXISTS newsfeed_timestamp_id_idx
+    ON public.newsfeed (timestamp DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS newsfeed_type_timestamp_id_idx
+    ON public.newsfeed (event_type, timestamp DESC, id DESC);
+
+DROP INDEX IF EXISTS public.newsfeed_type_idx;
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
 from logging import getLogger
 
 import asyncpg
-from asyncpg import Connection, Pool  # noqa: F401
+from asyncpg import Connection, Pool
 from genjishimada_sdk.auth import EmailRegisterRequest  # noqa: F401
 from litestar.datastructures import State
 
@@ -24,59 +25,82 @@ log = getLogger(__name__)
 class AuthRepository(BaseRepository):
     """Repository for authentication data access."""
 
-    async def fetch_rate_limit_count(
+    async def insert_attempts(
+        self,
+        attempts: Sequence[tuple[str, str, bool, dt.datetime]],
+        *,
+        conn: Connection | None = None,
+    ) -> None:
+        """Append a batch of authentication attempts to the audit log.
+
+        Args:
+            attempts: ``(identifier, action, success, attempt_at)`` rows.
+            conn: Optional connection for transaction participation.
+        """
+        if not attempts:
+            return
+        _conn = self._get_connection(conn)
+
+        identifiers, actions, successes, attempted_at = zip(*attempts)
+        query = """
+            INSERT INTO users.auth_rate_limits (identifier, action, success, attempt_at)
+            SELECT LOWER(a.identifier), a.action, a.success, a.attempt_at
+            FROM unnest($1::text[], $2::text[], $3::bool[], $4::timestamptz[])
+                AS a(identifier, action, success, attempt_at)
+        """
+        await _conn.execute(query, list(identifiers), list(actions), list(successes), list(attempted_at))
+
+    async def rate_limit_backlog(
         self,
         identifier: str,
         action: str,
-        window_start: dt.datetime,
         *,
         conn: Connection | None = None,
-    ) -> int:
-        """Get rate limit attempt count for identifier and action.
+    ) -> float:
+        """Get how far a rate limit bucket's theoretical arrival time is ahead of now.
 
         Args:
             identifier: Email or IP address.
             action: The action being rate limited.
-            window_start: Start of the rate limit window.
             conn: Optional connection for transaction participation.
 
         Returns:
-            Number of attempts in the window.
+            Seconds ahead of now, or 0 when the bucket is idle or missing.
         """
         _conn = self._get_connection(conn)
 
         query = """
-            SELECT COUNT(*) FROM users.auth_rate_limits
-            WHERE identifier = LOWER($1)
-              AND action = $2
-              AND attempt_at > $3
+            SELECT GREATEST(EXTRACT(EPOCH FROM tat - now()), 0)::float8
+            FROM users.auth_rate_limit_buckets
+            WHERE identifier = LOWER($1) AND action = $2
         """
-        count = await _conn.fetchval(query, identifier, action, window_start)
-        return count or 0
+        return await _conn.fetchval(query, identifier, action) or 0.0
 
-    async def record_attempt(
+    async def rate_limit_hit(
         self,
         identifier: str,
         action: str,
-        success: bool = False,
+        emission_interval: float,
         *,
         conn: Connection | None = None,
     ) -> None:
-        """Record an authentication attempt.
+        """Atomically advance a rate limit bucket by one attempt.
 
         Args:
             identifier: Email or IP address.
-            action: The action being attempted.
-            success: Whether the attempt was successful.
+            action: The action being rate limited.
+            emission_interval: Seconds one attempt adds to the bucket.
             conn: Optional connection for transaction participation.
         """
         _conn = self._get_connection(conn)
 
         query = """
-            INSERT INTO users.auth_rate_limits (identifier, action, success)
-            VALUES (LOWER($1), $2, $3)
+            INSERT INTO users.auth_rate_limit_buckets AS b (identifier, action, tat)
+            VALUES (LOWER($1), $2, now() + make_interval(secs => $3))
+            ON CONFLICT (identifier, action)
+            DO UPDATE SET tat = GREATEST(b.tat, now()) + make_interval(secs => $3)
         """
-        await _conn.execute(query, identifier, action, success)
+        await _conn.execute(query, identifier, action, emission_interval)
 
     async def check_email_exists(
         self,
@@ -406,7 +430,10 @@ class AuthRepository(BaseRepository):
         *,
         conn: Connection | None = None,
     ) -> str | None:
-        """Read session payload if not expired and refresh last activity.
+        """Read session payload if not expired.
+
+        This does not refresh ``last_activity``; callers queue a touch and apply
+        it later with :meth:`touch_sessions`.
 
         Args:
             session_id: The session ID.
@@ -419,14 +446,55 @@ class AuthRepository(BaseRepository):
         _conn = self._get_connection(conn)
 
         query = """
-            UPDATE users.sessions
-            SET last_activity = now()
+            SELECT payload
+            FROM users.sessions
             WHERE id = $1
               AND last_activity > now() - ($2 * INTERVAL '1 minute')
-            RETURNING payload
         """
         return await _conn.fetchval(query, session_id, session_lifetime_minutes)
 
+    async def touch_sessions(
+        self,
+        touches: Sequence[tuple[str, dt.datetime]],
+        granularity_seconds: float,
+        *,
+        conn: Connection | None = None,
+    ) -> int:
+        """Apply a batch of deferred last-activity refreshes.
+
+        Rows whose ``last_activity`` is already within ``granularity_seconds`` of
+        the touch are left alone, so repeated touches do not rewrite the row.
+
+        Args:
+            touches: ``(session_id, seen_at)`` pairs.
+            granularity_seconds: Minimum age before ``last_activity`` is rewritten.
+            conn: Optional connection for transaction participation.
+
+        Returns:
+            Number of sessions updated.
+        """
+        if not touches:
+            return 0
+        _conn = self._get_connection(conn)
+
+        session_ids, seen_at = zip(*touches)
+        result = await _conn.execute(
+            """
+            UPDATE users.sessions AS s
+            SET last_activity = t.seen_at
+            FROM unnest($1::text[], $2::timestamptz[]) AS t(id, seen_at)
+            WHERE s.id = t.id
+              AND s.last_activity < t.seen_at - make_interval(secs => $3)
+            """,
+            list(session_ids),
+            list(seen_at),
+            granularity_seconds,
+        )
+        try:
+            return int(result.split()[1])
+        except (IndexError, ValueError):
+            return 0
+
     async def write_session(  # noqa: PLR0913
         self,
         session_id: str,
@@ -450,26 +518,38 @@ class AuthRepository(BaseRepository):
         Raises:
             UniqueConstraintViolationError: If session_id conflicts.
         """
-        _conn = self._get_connection(conn)
+        update = """
+            UPDATE users.sessions
+            SET user_id = $2, payload = $3, last_activity = now(), ip_address = $4, user_agent = $5
+            WHERE id = $1
+        """
+        args = (session_id, user_id, payload, ip_address, user_agent)
+
+        async def _do_write(c: Connection) -> None:
+            # Existing sessions take a single UPDATE. users.sessions is partitioned
+            # by last_activity, so it cannot enforce UNIQUE (id) by itself; the
+            # first write of an id is serialised on an advisory lock instead.
+            if await c.execute(update, *args) != "UPDATE 0":
+                return
+            async with c.transaction():
+                await c.execute("SELECT pg_advisory_xact_lock(hashtextextended($1, 0))", session_id)
+                if await c.execute(update, *args) != "UPDATE 0":
+                    return
+                await c.execute(
+                    """
+                    INSERT INTO users.sessions (id, user_id, payload, last_activity, ip_address, user_agent)
+                    VALUES ($1, $2, $3, now(), $4, $5)
+                    """,
+                    *args,
+                )
 
+        _conn = self._get_connection(conn)
         try:
-            await _conn.execute(
-                """
-                INSERT INTO users.sessions (id, user_id, payload, last_activity, ip_address, user_agent)
-                VALUES ($1, $2, $3, now(), $4, $5)
-                ON CONFLICT (id) DO UPDATE SET
-                    user_id = EXCLUDED.user_id,
-                    payload = EXCLUDED.payload,
-                    last_activity = now(),
-                    ip_address = EXCLUDED.ip_address,
-                    user_agent = EXCLUDED.user_agent
-                """,
-                session_id,
-                user_id,
-                payload,
-                ip_address,
-                user_agent,
-            )
+            if isinstance(_conn, Pool):
+                async with _conn.acquire() as acquired:
+                    await _do_write(acquired)
+            else:
+                await _do_write(_conn)
         except asyncpg.UniqueViolationError as e:
             constraint = extract_constraint_name(e)
             raise UniqueConstraintViolationError(
@@ -529,6 +609,31 @@ class AuthRepository(BaseRepository):
         except (IndexError, ValueError):
             return 0
 
+    async def drop_expired_session_partitions(
+        self,
+        session_lifetime_minutes: int,
+        *,
+        conn: Connection | None = None,
+    ) -> int:
+        """Drop session partitions that ended before the lifetime cutoff.
+
+        Also creates the partitions for the coming months.
+
+        Args:
+            session_lifetime_minutes: Session lifetime in minutes.
+            conn: Optional connection for transaction participation.
+
+        Returns:
+            Number of sessions dropped with their partitions.
+        """
+        _conn = self._get_connection(conn)
+
+        dropped = await _conn.fetchval(
+            "SELECT users.maintain_session_partitions($1 * INTERVAL '1 minute')",
+            session_lifetime_minutes,
+        )
+        return int(dropped or 0)
+
     async def get_user_sessions(
         self,
         user_id: int,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from asyncpg import Connection, Pool
 
+from repository.replica import READ_REPLICA
+
 
 class BaseRepository:
     """Base class for all repositories.
@@ -30,3 +32,19 @@ class BaseRepository:
             Connection if provided (for transactions), otherwise pool.
         """
         return conn or self._pool
+
+    def _get_read_connection(self, conn: Connection | None = None) -> Connection | Pool:
+        """Get connection for a replica-safe read.
+
+        Like ``_get_connection``, but outside a transaction the read may go to
+        the read replica (see ``repository.replica``). Only use it for reads that
+        can tolerate data up to ``REPLICA_MAX_LAG_SECONDS`` old.
+
+        Args:
+            conn: Optional connection from transaction context.
+
+        Returns:
+            Connection if provided, otherwise the replica pool when the current
+            context may use it, otherwise the primary pool.
+        """
+        return conn or READ_REPLICA.read_pool() or self._pool
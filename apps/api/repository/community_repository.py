@@ -9,6 +9,216 @@ from genjishimada_sdk.maps import OverwatchCode
 from litestar.datastructures import State
 
 from .base import BaseRepository
+from .statements import STATEMENTS
+
+_COMMUNITY_LEADERBOARD_QUERY = STATEMENTS.register(
+    "community.leaderboard",
+    """
+    WITH unioned_records AS (
+        SELECT DISTINCT ON (map_id, user_id)
+            map_id,
+            user_id,
+            time,
+            screenshot,
+            video,
+            verified,
+            message_id,
+            completion,
+            NULL AS medal
+        FROM core.completions
+        ORDER BY map_id,
+            user_id,
+            inserted_at DESC
+    ), thresholds AS (
+        SELECT *
+        FROM (
+            VALUES ('Easy',10),
+                   ('Medium', 10),
+                   ('Hard', 10),
+                   ('Very Hard', 10),
+                   ('Extreme', 7),
+                   ('Hell', 3)
+        ) AS t(name, threshold)
+    ), map_data AS (
+        SELECT DISTINCT ON (m.id, r.user_id)
+            r.user_id,
+            regexp_replace(m.difficulty, '\\s*[-+]\\s*$', '', '') AS base_difficulty
+        FROM unioned_records r
+        LEFT JOIN core.maps m ON r.map_id = m.id
+        WHERE m.official = TRUE
+    ), skill_rank_data AS (
+        SELECT
+            base_difficulty AS difficulty,
+            md.user_id,
+            coalesce(sum(CASE WHEN md.base_difficulty IS NOT NULL THEN 1 ELSE 0 END), 0) AS completions,
+            coalesce(sum(CASE WHEN md.base_difficulty IS NOT NULL THEN 1 ELSE 0 END), 0) >= t.threshold AS rank_met
+        FROM map_data md
+        LEFT JOIN thresholds t ON base_difficulty=t.name
+        GROUP BY base_difficulty,
+            t.threshold,
+            md.user_id
+    ), first_rank AS (
+        SELECT
+            difficulty,
+            user_id,
+            CASE
+                WHEN difficulty = 'Easy' THEN 'Jumper'
+                WHEN difficulty = 'Medium' THEN 'Skilled'
+                WHEN difficulty = 'Hard' THEN 'Pro'
+                WHEN difficulty = 'Very Hard' THEN 'Master'
+                WHEN difficulty = 'Extreme' THEN 'Grandmaster'
+                WHEN difficulty = 'Hell' THEN 'God'
+            END AS rank_name,
+            row_number() OVER (
+                PARTITION BY user_id ORDER BY CASE difficulty
+                    WHEN 'Easy' THEN 1
+                    WHEN 'Medium' THEN 2
+                    WHEN 'Hard' THEN 3
+                    WHEN 'Very Hard' THEN 4
+                    WHEN 'Extreme' THEN 5
+                    WHEN 'Hell' THEN 6
+            END DESC ) AS rank_order
+        FROM skill_rank_data
+        WHERE rank_met
+    ), all_users AS (
+        SELECT DISTINCT
+            user_id
+        FROM unioned_records
+    ), highest_ranks AS (
+        SELECT
+            u.user_id,
+            coalesce(fr.rank_name, 'Ninja') AS rank_name
+        FROM all_users u
+        LEFT JOIN first_rank fr ON u.user_id = fr.user_id AND fr.rank_order = 1
+    ), world_records AS (
+        SELECT
+            wr.user_id,
+            count(*) AS amount
+        FROM maps.world_records wr
+        GROUP BY wr.user_id
+    ), map_counts AS (
+        SELECT
+            user_id,
+            count(*) AS amount
+        FROM maps.creators
+        GROUP BY user_id
+    ), xp_tiers AS (
+        SELECT
+            u.id,
+            coalesce(own.username, nickname) AS nickname,
+            u.global_name,
+            coalesce(xp.amount, 0) AS xp,
+            (coalesce(xp.amount, 0) / 100) AS raw_tier,               -- Integer division for raw tier
+            ((coalesce(xp.amount, 0) / 100) % 100) AS normalized_tier,-- Normalized tier, resetting every 100 tiers
+            (coalesce(xp.amount, 0) / 100) / 100 AS prestige_level,-- Prestige level based on multiples of 100 tiers
+            x.name AS main_tier_name,                                 -- Main tier label without sub-tier levels
+            s.name AS sub_tier_name,
+            x.name || ' ' || s.name AS full_tier_name                 -- Sub-tier label
+        FROM core.users u
+        LEFT JOIN users.overwatch_usernames own ON u.id = own.user_id AND own.is_primary = TRUE
+        LEFT JOIN lootbox.xp xp ON u.id = xp.user_id
+        LEFT JOIN lootbox.main_tiers x ON (((coalesce(xp.amount, 0) / 100) % 100)) / 5 = x.threshold
+        LEFT JOIN lootbox.sub_tiers s ON (coalesce(xp.amount, 0) / 100) % 5 = s.threshold
+
+        WHERE u.id > 100000
+    ),
+    playtest_counts AS (
+        SELECT pv.user_id, count(*) + coalesce(dc.count, 0) AS amount
+        FROM playtests.votes pv
+        LEFT JOIN playtests.deprecated_count dc ON pv.user_id = dc.user_id
+        GROUP BY pv.user_id, dc.count
+    )
+    SELECT
+        u.id as user_id,
+        u.nickname AS nickname,
+        xp AS xp_amount,
+        raw_tier,
+        normalized_tier,
+        prestige_level,
+        full_tier_name AS tier_name,
+        coalesce(wr.amount, 0) AS wr_count,
+        coalesce(mc.amount, 0) AS map_count,
+        coalesce(ptc.amount, 0) AS playtest_count,
+        coalesce(u.global_name, 'Unknown Username') AS discord_tag,
+        coalesce(rank_name, 'Ninja') AS skill_rank,
+        coalesce(ss.skill_score, 0) AS skill_score,
+        CASE WHEN coalesce(ss.skill_score, 0) <= 0 OR cardinality(tc.boundaries) = 0 THEN 0
+             ELSE width_bucket(ss.skill_score, tc.boundaries) + 1 END AS skill_tier,
+        coalesce(
+            (SELECT count(*) FROM skill.snapshot s2
+               WHERE s2.skill_score > 0 AND s2.skill_score <= ss.skill_score)::float8
+            / NULLIF((SELECT count(*) FROM skill.snapshot s3 WHERE s3.skill_score > 0), 0),
+            0.0) AS skill_percentile,
+        count(*) OVER () AS total_results
+    FROM xp_tiers u
+    LEFT JOIN playtest_counts ptc ON u.id = ptc.user_id
+    LEFT JOIN map_counts mc ON u.id = mc.user_id
+    LEFT JOIN world_records wr ON u.id = wr.user_id
+    LEFT JOIN highest_ranks hr ON u.id = hr.user_id
+    LEFT JOIN skill.snapshot ss ON u.id = ss.user_id
+    LEFT JOIN skill.tier_config tc ON TRUE
+    WHERE ($3::text IS NULL OR (nickname ILIKE $3::text OR u.global_name ILIKE $3::text))
+      AND ($4::text IS NULL OR full_tier_name = $4::text)
+      AND ($5::text IS NULL OR rank_name = $5::text)
+    -- Sort column and direction are parameters so every sort shares one prepared statement;
+    -- the key that is not selected is NULL for every row and does not affect the order.
+    ORDER BY
+        CASE WHEN $7::text = 'asc' THEN
+            CASE $6::text
+                WHEN 'xp_amount' THEN xp
+                WHEN 'prestige_level' THEN prestige_level
+                WHEN 'wr_count' THEN coalesce(wr.amount, 0)
+                WHEN 'map_count' THEN coalesce(mc.amount, 0)
+                WHEN 'playtest_count' THEN coalesce(ptc.amount, 0)
+                WHEN 'skill_score' THEN coalesce(ss.skill_score, 0)
+                WHEN 'skill_rank' THEN
+                    CASE
+                        WHEN rank_name = 'Ninja' THEN 7
+                        WHEN rank_name = 'Jumper' THEN 6
+                        WHEN rank_name = 'Skilled' THEN 5
+                        WHEN rank_name = 'Pro' THEN 4
+                        WHEN rank_name = 'Master' THEN 3
+                        WHEN rank_name = 'Grandmaster' THEN 2
+                        WHEN rank_name = 'God' THEN 1
+                    END
+            END::float8
+        END ASC,
+        CASE WHEN $7::text = 'desc' THEN
+            CASE $6::text
+                WHEN 'xp_amount' THEN xp
+                WHEN 'prestige_level' THEN prestige_level
+                WHEN 'wr_count' THEN coalesce(wr.amount, 0)
+                WHEN 'map_count' THEN coalesce(mc.amount, 0)
+                WHEN 'playtest_count' THEN coalesce(ptc.amount, 0)
+                WHEN 'skill_score' THEN coalesce(ss.skill_score, 0)
+                WHEN 'skill_rank' THEN
+                    CASE
+                        WHEN rank_name = 'Ninja' THEN 7
+                        WHEN rank_name = 'Jumper' THEN 6
+                        WHEN rank_name = 'Skilled' THEN 5
+                        WHEN rank_name = 'Pro' THEN 4
+                        WHEN rank_name = 'Master' THEN 3
+                        WHEN rank_name = 'Grandmaster' THEN 2
+                        WHEN rank_name = 'God' THEN 1
+                    END
+            END::float8
+        END DESC,
+        CASE WHEN $7::text = 'asc' THEN
+            CASE $6::text
+                WHEN 'nickname' THEN u.nickname
+                WHEN 'discord_tag' THEN coalesce(u.global_name, 'Unknown Username')
+            END
+        END ASC,
+        CASE WHEN $7::text = 'desc' THEN
+            CASE $6::text
+                WHEN 'nickname' THEN u.nickname
+                WHEN 'discord_tag' THEN coalesce(u.global_name, 'Unknown Username')
+            END
+        END DESC
+    LIMIT $1::int OFFSET $2::int
+    """,
+    warm=True,
+)
 
 
 class CommunityRepository(BaseRepository):
@@ -64,187 +274,13 @@ class CommunityRepository(BaseRepository):
             + ``skill_percentile`` (population percentile) derived from the cached
             ``skill.tier_config`` boundaries.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
-        if sort_column == "skill_rank":
-            sort_values = """
-                CASE
-                    WHEN rank_name = 'Ninja' THEN 7
-                    WHEN rank_name = 'Jumper' THEN 6
-                    WHEN rank_name = 'Skilled' THEN 5
-                    WHEN rank_name = 'Pro' THEN 4
-                    WHEN rank_name = 'Master' THEN 3
-                    WHEN rank_name = 'Grandmaster' THEN 2
-                    WHEN rank_name = 'God' THEN 1
-                END
-            """
-        else:
-            sort_values = sort_column
-
-        query = f"""
-        WITH unioned_records AS (
-            SELECT DISTINCT ON (map_id, user_id)
-                map_id,
-                user_id,
-                time,
-                screenshot,
-                video,
-                verified,
-                message_id,
-                completion,
-                NULL AS medal
-            FROM core.completions
-            ORDER BY map_id,
-                user_id,
-                inserted_at DESC
-        ), thresholds AS (
-            SELECT *
-            FROM (
-                VALUES ('Easy',10),
-                       ('Medium', 10),
-                       ('Hard', 10),
-                       ('Very Hard', 10),
-                       ('Extreme', 7),
-                       ('Hell', 3)
-            ) AS t(name, threshold)
-        ), map_data AS (
-            SELECT DISTINCT ON (m.id, r.user_id)
-                r.user_id,
-                regexp_replace(m.difficulty, '\\s*[-+]\\s*$', '', '') AS base_difficulty
-            FROM unioned_records r
-            LEFT JOIN core.maps m ON r.map_id = m.id
-            WHERE m.official = TRUE
-        ), skill_rank_data AS (
-            SELECT
-                base_difficulty AS difficulty,
-                md.user_id,
-                coalesce(sum(CASE WHEN md.base_difficulty IS NOT NULL THEN 1 ELSE 0 END), 0) AS completions,
-                coalesce(sum(CASE WHEN md.base_difficulty IS NOT NULL THEN 1 ELSE 0 END), 0) >= t.threshold AS rank_met
-            FROM map_data md
-            LEFT JOIN thresholds t ON base_difficulty=t.name
-            GROUP BY base_difficulty,
-                t.threshold,
-                md.user_id
-        ), first_rank AS (
-            SELECT
-                difficulty,
-                user_id,
-                CASE
-                    WHEN difficulty = 'Easy' THEN 'Jumper'
-                    WHEN difficulty = 'Medium' THEN 'Skilled'
-                    WHEN difficulty = 'Hard' THEN 'Pro'
-                    WHEN difficulty = 'Very Hard' THEN 'Master'
-                    WHEN difficulty = 'Extreme' THEN 'Grandmaster'
-                    WHEN difficulty = 'Hell' THEN 'God'
-                END AS rank_name,
-                row_number() OVER (
-                    PARTITION BY user_id ORDER BY CASE difficulty
-                        WHEN 'Easy' THEN 1
-                        WHEN 'Medium' THEN 2
-                        WHEN 'Hard' THEN 3
-                        WHEN 'Very Hard' THEN 4
-                        WHEN 'Extreme' THEN 5
-                        WHEN 'Hell' THEN 6
-                END DESC ) AS rank_order
-            FROM skill_rank_data
-            WHERE rank_met
-        ), all_users AS (
-            SELECT DISTINCT
-                user_id
-            FROM unioned_records
-        ), highest_ranks AS (
-            SELECT
-                u.user_id,
-                coalesce(fr.rank_name, 'Ninja') AS rank_name
-            FROM all_users u
-            LEFT JOIN first_rank fr ON u.user_id = fr.user_id AND fr.rank_order = 1
-        ), ranks AS (
-            SELECT
-                r.user_id,
-                r.map_id,
-                rank() OVER (PARTITION BY r.map_id ORDER BY time) AS rank_num
-            FROM core.completions r
-            JOIN core.users u ON r.user_id = u.id
-            WHERE u.id > 1000
-              AND r.time < 99999999
-              AND r.verified = TRUE
-        ), world_records AS (
-            SELECT
-                r.user_id,
-                count(r.user_id) AS amount
-            FROM ranks r
-            WHERE rank_num = 1
-            GROUP BY r.user_id
-        ), map_counts AS (
-            SELECT
-                user_id,
-                count(*) AS amount
-            FROM maps.creators
-            GROUP BY user_id
-        ), xp_tiers AS (
-            SELECT
-                u.id,
-                coalesce(own.username, nickname) AS nickname,
-                u.global_name,
-                coalesce(xp.amount, 0) AS xp,
-                (coalesce(xp.amount, 0) / 100) AS raw_tier,               -- Integer division for raw tier
-                ((coalesce(xp.amount, 0) / 100) % 100) AS normalized_tier,-- Normalized tier, resetting every 100 tiers
-                (coalesce(xp.amount, 0) / 100) / 100 AS prestige_level,-- Prestige level based on multiples of 100 tiers
-                x.name AS main_tier_name,                                 -- Main tier label without sub-tier levels
-                s.name AS sub_tier_name,
-                x.name || ' ' || s.name AS full_tier_name                 -- Sub-tier label
-            FROM core.users u
-            LEFT JOIN users.overwatch_usernames own ON u.id = own.user_id AND own.is_primary = TRUE
-            LEFT JOIN lootbox.xp xp ON u.id = xp.user_id
-            LEFT JOIN lootbox.main_tiers x ON (((coalesce(xp.amount, 0) / 100) % 100)) / 5 = x.threshold
-            LEFT JOIN lootbox.sub_tiers s ON (coalesce(xp.amount, 0) / 100) % 5 = s.threshold
-
-            WHERE u.id > 100000
-        ),
-        playtest_counts AS (
-            SELECT pv.user_id, count(*) + coalesce(dc.count, 0) AS amount
-            FROM playtests.votes pv
-            LEFT JOIN playtests.deprecated_count dc ON pv.user_id = dc.user_id
-            GROUP BY pv.user_id, dc.count
-        )
-        SELECT
-            u.id as user_id,
-            u.nickname AS nickname,
-            xp AS xp_amount,
-            raw_tier,
-            normalized_tier,
-            prestige_level,
-            full_tier_name AS tier_name,
-            coalesce(wr.amount, 0) AS wr_count,
-            coalesce(mc.amount, 0) AS map_count,
-            coalesce(ptc.amount, 0) AS playtest_count,
-            coalesce(u.global_name, 'Unknown Username') AS discord_tag,
-            coalesce(rank_name, 'Ninja') AS skill_rank,
-            coalesce(ss.skill_score, 0) AS skill_score,
-            CASE WHEN coalesce(ss.skill_score, 0) <= 0 OR cardinality(tc.boundaries) = 0 THEN 0
-                 ELSE width_bucket(ss.skill_score, tc.boundaries) + 1 END AS skill_tier,
-            coalesce(
-                (SELECT count(*) FROM skill.snapshot s2
-                   WHERE s2.skill_score > 0 AND s2.skill_score <= ss.skill_score)::float8
-                / NULLIF((SELECT count(*) FROM skill.snapshot s3 WHERE s3.skill_score > 0), 0),
-                0.0) AS skill_percentile,
-            count(*) OVER () AS total_results
-        FROM xp_tiers u
-        LEFT JOIN playtest_counts ptc ON u.id = ptc.user_id
-        LEFT JOIN map_counts mc ON u.id = mc.user_id
-        LEFT JOIN world_records wr ON u.id = wr.user_id
-        LEFT JOIN highest_ranks hr ON u.id = hr.user_id
-        LEFT JOIN skill.snapshot ss ON u.id = ss.user_id
-        LEFT JOIN skill.tier_config tc ON TRUE
-        WHERE ($3::text IS NULL OR (nickname ILIKE $3::text OR u.global_name ILIKE $3::text))
-          AND ($4::text IS NULL OR full_tier_name = $4::text)
-          AND ($5::text IS NULL OR rank_name = $5::text)
-        ORDER BY {sort_values} {sort_direction}
-        LIMIT $1::int OFFSET $2::int
-        """
         offset = (page_number - 1) * page_size
         _name = f"%{name}%" if name else name
-        rows = await _conn.fetch(query, page_size, offset, _name, tier_name, skill_rank)
+        rows = await _conn.fetch(
+            _COMMUNITY_LEADERBOARD_QUERY, page_size, offset, _name, tier_name, skill_rank, sort_column, sort_direction
+        )
         return [dict(row) for row in rows]
 
     async def fetch_players_per_xp_tier(
@@ -259,7 +295,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Count of players for every main XP tier.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
         WITH player_xp AS (
@@ -302,7 +338,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Count of players per skill rank.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
         WITH all_completions AS (
@@ -415,7 +451,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Single-row summary with min/max/avg.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
         WITH target_map AS (
@@ -451,7 +487,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Counts per base difficulty.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = r"""
         WITH filtered AS (
@@ -486,7 +522,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Top maps per difficulty with rank.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = r"""
         WITH eligible_maps AS (
@@ -574,7 +610,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Creators with map count and average quality.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
         WITH map_creator_data AS (
@@ -610,7 +646,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Per-name counts for non-archived, non-hidden maps.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
             SELECT
@@ -635,7 +671,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Per-name counts for all maps.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
             SELECT
@@ -668,7 +704,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Time-series of record improvements.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = """
         WITH target_map AS (
@@ -702,7 +738,7 @@ class CommunityRepository(BaseRepository):
         Returns:
             list[dict]: Total seconds played per base difficulty.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         query = r"""
         WITH record_sum_by_map_code AS (
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from asyncpg import Connection, Pool
@@ -17,6 +18,164 @@ from repository.exceptions import (
 from repository.exceptions import (
     ForeignKeyViolationError as RepoFKError,
 )
+from repository.statements import STATEMENTS
+
+# LIMIT NULL returns every row, so a page size of 0 (all results) shares this statement.
+_MAP_LEADERBOARD_QUERY = STATEMENTS.register(
+    "completions.map_leaderboard",
+    """
+    WITH target_map AS (
+        SELECT
+            id AS map_id,
+            code,
+            map_name,
+            difficulty
+        FROM core.maps
+        WHERE code = $1
+    ), latest_per_user_all AS (
+        SELECT DISTINCT ON (c.user_id)
+            c.user_id,
+            c.map_id,
+            c.time,
+            c.completion,
+            c.verified,
+            c.screenshot,
+            c.video,
+            c.legacy,
+            c.legacy_medal,
+            c.message_id,
+            c.inserted_at
+        FROM core.completions c
+        JOIN target_map tm ON tm.map_id = c.map_id
+        WHERE c.verified = TRUE
+        ORDER BY c.user_id,
+            c.inserted_at DESC
+    ), split AS (
+        SELECT
+            l.user_id,
+            l.map_id,
+            l.time,
+            l.completion,
+            l.verified,
+            l.screenshot,
+            l.video,
+            l.legacy,
+            l.legacy_medal,
+            l.message_id,
+            l.inserted_at
+        FROM latest_per_user_all l
+    ), rankable AS (
+        SELECT
+            s.*,
+            rank() OVER (ORDER BY s.time) AS rank
+        FROM split s
+        WHERE s.completion = FALSE
+    ), nonrankable AS (
+        SELECT
+            s.*,
+            NULL::integer AS rank
+        FROM split s
+        WHERE s.completion = TRUE
+    ), combined AS (
+        SELECT *
+        FROM rankable
+        UNION ALL
+        SELECT *
+        FROM nonrankable
+    ), with_map AS (
+        SELECT
+            tm.code,
+            tm.map_name,
+            tm.difficulty,
+            cb.user_id,
+            cb.time,
+            cb.completion,
+            cb.verified,
+            cb.screenshot,
+            cb.video,
+            cb.legacy,
+            cb.legacy_medal,
+            cb.inserted_at,
+            cb.rank,
+            cb.message_id,
+            (cb.rank IS NULL) AS is_nonrankable,
+            md.gold,
+            md.silver,
+            md.bronze
+        FROM combined cb
+        JOIN target_map tm ON tm.map_id = cb.map_id
+        LEFT JOIN maps.medals md ON md.map_id = cb.map_id
+    ), user_names AS (
+        SELECT
+            u.id AS user_id,
+            max(owu.username) FILTER (WHERE owu.is_primary) AS primary_ow,
+            array_remove(array_agg(owu.username), NULL) AS all_ow_names,
+            u.nickname,
+            u.global_name
+        FROM (
+            SELECT DISTINCT
+                user_id
+            FROM with_map
+        ) um
+        JOIN core.users u ON u.id = um.user_id
+        LEFT JOIN users.overwatch_usernames owu ON owu.user_id = u.id
+        GROUP BY u.id,
+            u.nickname,
+            u.global_name
+    ), name_split AS (
+        SELECT
+            un.user_id,
+            coalesce(nullif(un.primary_ow, ''), nullif(un.nickname, ''), nullif(un.global_name, ''),
+                     'Unknown User') AS name,
+            nullif(array_to_string(array(SELECT DISTINCT
+                                             x
+                                         FROM unnest(un.all_ow_names) x
+                                         WHERE x IS NOT NULL
+                                           AND x <> coalesce(un.primary_ow, '')), ', '), '') AS also_known_as
+        FROM user_names un
+    )
+    SELECT
+        wm.code AS code,
+        wm.user_id AS user_id,
+        ns.name AS name,
+        ns.also_known_as AS also_known_as,
+        wm.time AS time,
+        wm.screenshot AS screenshot,
+        wm.video AS video,
+        wm.completion AS completion,
+        wm.verified AS verified,
+        wm.message_id,
+        (SELECT COUNT(*) FROM completions.upvotes WHERE message_id=wm.message_id) AS upvotes,
+        wm.rank AS rank,
+        CASE
+            WHEN wm.rank IS NOT NULL AND wm.gold IS NOT NULL AND wm.time <= wm.gold
+                THEN 'Gold'
+            WHEN wm.rank IS NOT NULL AND wm.silver IS NOT NULL AND wm.time <= wm.silver
+                THEN 'Silver'
+            WHEN wm.rank IS NOT NULL AND wm.bronze IS NOT NULL AND wm.time <= wm.bronze
+                THEN 'Bronze'
+        END AS medal,
+        wm.map_name AS map_name,
+        wm.difficulty AS difficulty,
+        wm.legacy AS legacy,
+        wm.legacy_medal AS legacy_medal,
+        FALSE AS suspicious,
+        COUNT(*) OVER() AS total_results
+    FROM with_map wm
+    JOIN name_split ns ON ns.user_id = wm.user_id
+    ORDER BY wm.code,
+        CASE
+            WHEN wm.legacy = FALSE AND wm.rank IS NOT NULL THEN 0
+            WHEN wm.legacy = FALSE AND wm.rank IS NULL     THEN 1
+            WHEN wm.legacy = TRUE  AND wm.rank IS NOT NULL THEN 2
+            ELSE 3
+        END,
+        wm.time,
+        wm.inserted_at
+    LIMIT $2 OFFSET $3
+    """,
+    warm=True,
+)
 
 
 class CompletionsRepository(BaseRepository):
@@ -224,8 +383,8 @@ class CompletionsRepository(BaseRepository):
         """
         _conn = self._get_connection(conn)
         query = """
-        WITH latest_per_user_per_map AS (
-            SELECT DISTINCT ON (c.user_id, c.map_id)
+        WITH ranked AS (
+            SELECT
                 c.id,
                 c.user_id,
                 c.map_id,
@@ -237,24 +396,12 @@ class CompletionsRepository(BaseRepository):
                 c.legacy,
                 c.legacy_medal,
                 c.message_id,
-                c.inserted_at
-            FROM core.completions c
-            WHERE c.verified = TRUE AND c.legacy = FALSE
-            ORDER BY c.user_id, c.map_id, c.inserted_at DESC
+                c.inserted_at,
+                1 AS rank
+            FROM maps.world_records wr
+            JOIN core.completions c ON c.id = wr.completion_id
+            WHERE wr.user_id = $1
         ),
-            ranked AS (
-                SELECT
-                    l.*,
-                    CASE
-                        WHEN l.completion = FALSE THEN
-                                    RANK() OVER (
-                                PARTITION BY l.map_id
-                                ORDER BY l.time, l.inserted_at
-                                )
-                        ELSE NULL::int
-                    END AS rank
-                FROM latest_per_user_per_map l
-            ),
             with_map AS (
                 SELECT
                     r.id,
@@ -378,166 +525,13 @@ class CompletionsRepository(BaseRepository):
         Returns:
             List of completion records as dicts.
         """
-        _conn = self._get_connection(conn)
-        query_template = """
-        WITH target_map AS (
-            SELECT
-                id AS map_id,
-                code,
-                map_name,
-                difficulty
-            FROM core.maps
-            WHERE code = $1
-        ), latest_per_user_all AS (
-            SELECT DISTINCT ON (c.user_id)
-                c.user_id,
-                c.map_id,
-                c.time,
-                c.completion,
-                c.verified,
-                c.screenshot,
-                c.video,
-                c.legacy,
-                c.legacy_medal,
-                c.message_id,
-                c.inserted_at
-            FROM core.completions c
-            JOIN target_map tm ON tm.map_id = c.map_id
-            WHERE c.verified = TRUE
-            ORDER BY c.user_id,
-                c.inserted_at DESC
-        ), split AS (
-            SELECT
-                l.user_id,
-                l.map_id,
-                l.time,
-                l.completion,
-                l.verified,
-                l.screenshot,
-                l.video,
-                l.legacy,
-                l.legacy_medal,
-                l.message_id,
-                l.inserted_at
-            FROM latest_per_user_all l
-        ), rankable AS (
-            SELECT
-                s.*,
-                rank() OVER (ORDER BY s.time) AS rank
-            FROM split s
-            WHERE s.completion = FALSE
-        ), nonrankable AS (
-            SELECT
-                s.*,
-                NULL::integer AS rank
-            FROM split s
-            WHERE s.completion = TRUE
-        ), combined AS (
-            SELECT *
-            FROM rankable
-            UNION ALL
-            SELECT *
-            FROM nonrankable
-        ), with_map AS (
-            SELECT
-                tm.code,
-                tm.map_name,
-                tm.difficulty,
-                cb.user_id,
-                cb.time,
-                cb.completion,
-                cb.verified,
-                cb.screenshot,
-                cb.video,
-                cb.legacy,
-                cb.legacy_medal,
-                cb.inserted_at,
-                cb.rank,
-                cb.message_id,
-                (cb.rank IS NULL) AS is_nonrankable,
-                md.gold,
-                md.silver,
-                md.bronze
-            FROM combined cb
-            JOIN target_map tm ON tm.map_id = cb.map_id
-            LEFT JOIN maps.medals md ON md.map_id = cb.map_id
-        ), user_names AS (
-            SELECT
-                u.id AS user_id,
-                max(owu.username) FILTER (WHERE owu.is_primary) AS primary_ow,
-                array_remove(array_agg(owu.username), NULL) AS all_ow_names,
-                u.nickname,
-                u.global_name
-            FROM (
-                SELECT DISTINCT
-                    user_id
-                FROM with_map
-            ) um
-            JOIN core.users u ON u.id = um.user_id
-            LEFT JOIN users.overwatch_usernames owu ON owu.user_id = u.id
-            GROUP BY u.id,
-                u.nickname,
-                u.global_name
-        ), name_split AS (
-            SELECT
-                un.user_id,
-                coalesce(nullif(un.primary_ow, ''), nullif(un.nickname, ''), nullif(un.global_name, ''),
-                         'Unknown User') AS name,
-                nullif(array_to_string(array(SELECT DISTINCT
-                                                 x
-                                             FROM unnest(un.all_ow_names) x
-                                             WHERE x IS NOT NULL
-                                               AND x <> coalesce(un.primary_ow, '')), ', '), '') AS also_known_as
-            FROM user_names un
-        )
-        SELECT
-            wm.code AS code,
-            wm.user_id AS user_id,
-            ns.name AS name,
-            ns.also_known_as AS also_known_as,
-            wm.time AS time,
-            wm.screenshot AS screenshot,
-            wm.video AS video,
-            wm.completion AS completion,
-            wm.verified AS verified,
-            wm.message_id,
-            (SELECT COUNT(*) FROM completions.upvotes WHERE message_id=wm.message_id) AS upvotes,
-            wm.rank AS rank,
-            CASE
-                WHEN wm.rank IS NOT NULL AND wm.gold IS NOT NULL AND wm.time <= wm.gold
-                    THEN 'Gold'
-                WHEN wm.rank IS NOT NULL AND wm.silver IS NOT NULL AND wm.time <= wm.silver
-                    THEN 'Silver'
-                WHEN wm.rank IS NOT NULL AND wm.bronze IS NOT NULL AND wm.time <= wm.bronze
-                    THEN 'Bronze'
-            END AS medal,
-            wm.map_name AS map_name,
-            wm.difficulty AS difficulty,
-            wm.legacy AS legacy,
-            wm.legacy_medal AS legacy_medal,
-            FALSE AS suspicious,
-            COUNT(*) OVER() AS total_results
-        FROM with_map wm
-        JOIN name_split ns ON ns.user_id = wm.user_id
-        ORDER BY wm.code,
-            CASE
-                WHEN wm.legacy = FALSE AND wm.rank IS NOT NULL THEN 0
-                WHEN wm.legacy = FALSE AND wm.rank IS NULL     THEN 1
-                WHEN wm.legacy = TRUE  AND wm.rank IS NOT NULL THEN 2
-                ELSE 3
-            END,
-            wm.time,
-            wm.inserted_at
-        {limit_offset}
-        """
+        _conn = self._get_read_connection(conn)
 
         if page_size == 0:
-            query = query_template.format(limit_offset="")
-            rows = await _conn.fetch(query, code)
+            rows = await _conn.fetch(_MAP_LEADERBOARD_QUERY, code, None, 0)
         else:
-            query = query_template.format(limit_offset="LIMIT $2 OFFSET $3")
             offset = (page_number - 1) * page_size
-            rows = await _conn.fetch(query, code, page_size, offset)
+            rows = await _conn.fetch(_MAP_LEADERBOARD_QUERY, code, page_size, offset)
 
         return [dict(row) for row in rows]
 
@@ -704,6 +698,29 @@ class CompletionsRepository(BaseRepository):
         Returns:
             Submission details as dict.
         """
+        rows = await self.fetch_completion_submissions([record_id], conn=conn)
+        return rows[0] if rows else {}
+
+    async def fetch_completion_submissions(
+        self,
+        record_ids: Sequence[int],
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict]:
+        """Fetch detailed submission info for several completions in one query.
+
+        Each submission is ranked against the latest verified time of every
+        other runner on its map, as if it alone were verified.
+
+        Args:
+            record_ids: Completion record IDs; unknown IDs are skipped.
+            conn: Optional connection for transaction support.
+
+        Returns:
+            Submission details as dicts, ordered by ID.
+        """
+        if not record_ids:
+            return []
         _conn = self._get_connection(conn)
         query = """
         WITH hypothetical_target AS (
@@ -714,41 +731,18 @@ class CompletionsRepository(BaseRepository):
                 m.map_name
             FROM core.completions c
             JOIN core.maps m ON m.id = c.map_id AND m.code IS NOT NULL
-            WHERE c.id = $1
+            WHERE c.id = ANY($1::int[])
         ),
         latest_per_user AS (
-            SELECT DISTINCT ON (c.user_id)
+            SELECT DISTINCT ON (c.map_id, c.user_id)
+                c.map_id,
                 c.user_id,
-                c.time,
-                c.inserted_at
+                c.time
             FROM core.completions c
-            WHERE c.map_id = (SELECT map_id FROM hypothetical_target)
+            WHERE c.map_id IN (SELECT map_id FROM hypothetical_target)
               AND c.verified = TRUE
               AND c.completion = FALSE
-            ORDER BY c.user_id, c.inserted_at DESC
-        ),
-        eligible_ranked AS (
-            SELECT user_id, time
-            FROM latest_per_user
-
-            UNION ALL
-
-            SELECT ht.user_id, ht.time
-            FROM hypothetical_target ht
-            WHERE ht.completion = FALSE
-                AND NOT EXISTS (
-                SELECT 1
-                FROM latest_per_user l
-                WHERE l.user_id = ht.user_id
-                    AND l.time = ht.time
-                )
-        ),
-        ranked AS (
-            SELECT
-                user_id,
-                time,
-                RANK() OVER (ORDER BY time) AS rank
-            FROM eligible_ranked
+            ORDER BY c.map_id, c.user_id, c.inserted_at DESC
         ),
         final AS (
             SELECT
@@ -771,8 +765,15 @@ class CompletionsRepository(BaseRepository):
                 ht.verification_id,
                 ht.message_id
             FROM hypothetical_target ht
-            LEFT JOIN ranked r
-              ON r.user_id = ht.user_id AND r.time = ht.time
+            -- RANK() among the latest verified times plus this run. Completions
+            -- are unranked unless the same time is already on the board.
+            LEFT JOIN LATERAL (
+                SELECT 1 + count(*) FILTER (WHERE l.time < ht.time) AS rank
+                FROM latest_per_user l
+                WHERE l.map_id = ht.map_id
+                HAVING ht.completion = FALSE
+                    OR bool_or(l.user_id = ht.user_id AND l.time = ht.time)
+            ) r ON TRUE
             LEFT JOIN maps.medals md
               ON md.map_id = ht.map_id
         ),
@@ -787,9 +788,9 @@ class CompletionsRepository(BaseRepository):
                     || ARRAY[u.nickname, u.global_name],
                     NULL
                 ) AS all_usernames
-            FROM final f
-            JOIN core.users u ON u.id = f.user_id
+            FROM core.users u
             LEFT JOIN users.overwatch_usernames owu ON owu.user_id = u.id
+            WHERE u.id IN (SELECT user_id FROM final)
             GROUP BY u.id, u.nickname, u.global_name
         ),
         name_split AS (
@@ -848,10 +849,11 @@ class CompletionsRepository(BaseRepository):
                 ON c2.id = sf.completion_id
               WHERE c2.user_id = me.user_id
             ) AS suspicious
-        FROM medal_eval me;
+        FROM medal_eval me
+        ORDER BY id;
         """
-        row = await _conn.fetchrow(query, record_id)
-        return dict(row) if row else {}
+        rows = await _conn.fetch(query, list(record_ids))
+        return [dict(row) for row in rows]
 
     async def fetch_pending_verifications(
         self,
@@ -1226,17 +1228,49 @@ class CompletionsRepository(BaseRepository):
         """
         _conn = self._get_connection(conn)
         query = """
-        WITH target_map AS (
-            SELECT id AS map_id FROM core.maps WHERE code = $1
-        )
         SELECT EXISTS(
             SELECT 1 FROM core.completions c
-            INNER JOIN target_map tm ON c.map_id = tm.map_id
-            WHERE user_id=$2 AND NOT legacy AND wr_xp_check
+            JOIN core.maps m ON m.id = c.map_id
+            WHERE m.code = $1 AND c.user_id = $2 AND NOT c.legacy AND c.wr_xp_check
         )
         """
         return await _conn.fetchval(query, code, user_id)
 
+    async def fetch_world_record_drift(
+        self,
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict]:
+        """Fetch maps whose stored world record differs from a full recompute.
+
+        ``maps.world_records`` is kept current by triggers on ``core.completions``;
+        this is the consistency check against it.
+
+        Args:
+            conn: Optional connection for transaction support.
+
+        Returns:
+            List of dicts with map_id, expected_completion_id, stored_completion_id.
+        """
+        _conn = self._get_connection(conn)
+        rows = await _conn.fetch("SELECT * FROM maps.world_record_drift();")
+        return [dict(row) for row in rows]
+
+    async def refresh_world_records(
+        self,
+        map_ids: list[int],
+        *,
+        conn: Connection | None = None,
+    ) -> None:
+        """Recompute the stored world records of the given maps.
+
+        Args:
+            map_ids: Map IDs to refresh.
+            conn: Optional connection for transaction support.
+        """
+        _conn = self._get_connection(conn)
+        await _conn.execute("SELECT maps.refresh_world_records($1::int[]);", map_ids)
+
     async def check_completion_exists(
         self,
         completion_id: int,
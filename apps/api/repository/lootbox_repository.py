@@ -583,6 +583,69 @@ class LootboxRepository(BaseRepository):
         row = await _conn.fetchrow(query, user_id, xp_amount, multiplier)
         return dict(row) if row else {}
 
+    async def upsert_users_xp(
+        self,
+        user_ids: list[int],
+        xp_amounts: list[int],
+        multiplier: float,
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict]:
+        """Upsert XP for many grants in one statement, multiplier applied per grant.
+
+        Grants for the same user are summed into a single upsert; the running
+        totals for each grant are derived from the user's final amount, so they
+        stay consistent even if another write landed in between.
+
+        Args:
+            user_ids: Target user ID of each grant.
+            xp_amounts: Base XP amount of each grant, aligned with ``user_ids``.
+            multiplier: XP multiplier to apply.
+            conn: Optional connection for transaction participation.
+
+        Returns:
+            One dict per grant, in input order, with user_id, previous_amount
+            and new_amount.
+        """
+        _conn = self._get_connection(conn)
+
+        query = """
+                WITH grants AS (
+                    SELECT
+                        g.ord,
+                        g.user_id,
+                        floor(g.amount::numeric * $3::numeric)::bigint AS applied
+                    FROM unnest($1::bigint[], $2::int[]) WITH ORDINALITY AS g(user_id, amount, ord)
+                ), totals AS (
+                    SELECT user_id, sum(applied)::bigint AS applied
+                    FROM grants
+                    GROUP BY user_id
+                ), upsert_result AS (
+                    INSERT INTO lootbox.xp (user_id, amount)
+                        SELECT user_id, applied
+                        FROM totals
+                        ORDER BY user_id
+                        ON CONFLICT (user_id) DO UPDATE SET amount = lootbox.xp.amount + excluded.amount
+                        RETURNING lootbox.xp.user_id, lootbox.xp.amount
+                ), running AS (
+                    SELECT
+                        g.ord,
+                        g.user_id,
+                        u.amount - coalesce(sum(g.applied) OVER (
+                            PARTITION BY g.user_id ORDER BY g.ord
+                            ROWS BETWEEN 1 FOLLOWING AND UNBOUNDED FOLLOWING
+                        ), 0) AS new_amount,
+                        g.applied
+                    FROM grants g
+                    JOIN upsert_result u ON u.user_id = g.user_id
+                )
+                SELECT user_id, new_amount - applied AS previous_amount, new_amount
+                FROM running
+                ORDER BY ord \
+                """
+        rows = await _conn.fetch(query, user_ids, xp_amounts, multiplier)
+        return [dict(row) for row in rows]
+
     async def update_xp_multiplier(
         self,
         multiplier: float,
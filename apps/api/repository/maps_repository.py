@@ -45,7 +45,7 @@ class MapsRepository(BaseRepository):
         Returns:
             Single map dict if single=True, otherwise list of map dicts.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
 
         if code and not filters:
             filters = MapSearchFilters(code=code, return_all=True)
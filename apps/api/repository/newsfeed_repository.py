@@ -3,12 +3,57 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 
-from asyncpg import Connection, Pool
+import msgspec
+from asyncpg import Connection, Pool, Record
+from genjishimada_sdk.newsfeed import NewsfeedEvent, NewsfeedPayload
 from litestar.datastructures import State
 
 from repository.base import BaseRepository
+from repository.statements import STATEMENTS
+
+# public.newsfeed.payload is a json column, so asyncpg hands it over as text.
+_PAYLOAD_DECODER = msgspec.json.Decoder(NewsfeedPayload)
+
+
+def _decode_event(row: Record) -> NewsfeedEvent:
+    """Build a typed event from a newsfeed row, decoding the payload text once."""
+    return NewsfeedEvent(
+        id=row["id"],
+        timestamp=row["timestamp"],
+        payload=_PAYLOAD_DECODER.decode(row["payload"]),
+        event_type=row["event_type"],
+    )
+
+
+def _events_query(*, typed: bool, keyset: bool) -> str:
+    """Build the ``fetch_events`` statement for one filter and cursor combination."""
+    conditions: list[str] = []
+    if typed:
+        conditions.append("event_type = $3")
+    if keyset:
+        first = 4 if typed else 3
+        conditions.append(f"(timestamp, id) < (${first}, ${first + 1})")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"""
+    SELECT id, timestamp, payload, event_type
+    FROM public.newsfeed
+    {where}
+    ORDER BY timestamp DESC, id DESC
+    LIMIT $1 OFFSET $2
+    """
+
+
+# (typed, keyset) -> statement; the unfiltered first page is the one worth warming.
+_EVENTS_QUERIES = {
+    (typed, keyset): STATEMENTS.register(
+        "newsfeed.events" + ("_by_type" if typed else "") + ("_before" if keyset else ""),
+        _events_query(typed=typed, keyset=keyset),
+        warm=not typed and not keyset,
+    )
+    for typed in (False, True)
+    for keyset in (False, True)
+}
 
 
 class NewsfeedRepository(BaseRepository):
@@ -52,7 +97,7 @@ class NewsfeedRepository(BaseRepository):
         event_id: int,
         *,
         conn: Connection | None = None,
-    ) -> dict | None:
+    ) -> NewsfeedEvent | None:
         """Fetch a single newsfeed event by ID.
 
         Args:
@@ -60,8 +105,7 @@ class NewsfeedRepository(BaseRepository):
             conn: Optional connection for transaction support.
 
         Returns:
-            Event record as dict with keys: id, timestamp, payload, event_type.
-            Returns None if not found.
+            The decoded event, or None if not found.
         """
         _conn = self._get_connection(conn)
         query = """
@@ -70,12 +114,7 @@ class NewsfeedRepository(BaseRepository):
             WHERE id = $1
         """
         row = await _conn.fetchrow(query, event_id)
-        if not row:
-            return None
-        result = dict(row)
-        if isinstance(result["payload"], str):
-            result["payload"] = json.loads(result["payload"])
-        return result
+        return _decode_event(row) if row else None
 
     async def fetch_events(
         self,
@@ -83,35 +122,36 @@ class NewsfeedRepository(BaseRepository):
         offset: int,
         event_type: str | None = None,
         *,
+        before: tuple[dt.datetime, int] | None = None,
         conn: Connection | None = None,
-    ) -> list[dict]:
-        """Fetch newsfeed events with pagination and optional type filter.
+    ) -> list[NewsfeedEvent]:
+        """Fetch newsfeed events newest first, optionally of one type.
+
+        Pages continue either from a ``before`` cursor (keyset, preferred) or by
+        skipping ``offset`` rows. Each combination of filter and cursor is its own
+        statement, with no ``$n IS NULL OR …`` branches, so every prepared plan is
+        a range scan of the matching ``(…, timestamp DESC, id DESC)`` index.
 
         Args:
             limit: Maximum number of events to return.
             offset: Number of events to skip.
             event_type: Optional event type filter.
+            before: Optional ``(timestamp, id)`` of the last event already seen;
+                only strictly older events are returned.
             conn: Optional connection for transaction support.
 
         Returns:
-            List of event records as dicts, ordered by timestamp DESC, id DESC.
+            Decoded events, ordered by timestamp DESC, id DESC.
         """
         _conn = self._get_connection(conn)
-        query = """
-            SELECT id, timestamp, payload, event_type
-            FROM public.newsfeed
-            WHERE ($1::text IS NULL OR event_type = $1)
-            ORDER BY timestamp DESC, id DESC
-            LIMIT $2 OFFSET $3
-        """
-        rows = await _conn.fetch(query, event_type, limit, offset)
-        result = []
-        for row in rows:
-            row_dict = dict(row)
-            if isinstance(row_dict["payload"], str):
-                row_dict["payload"] = json.loads(row_dict["payload"])
-            result.append(row_dict)
-        return result
+        args: list[object] = [limit, offset]
+        if event_type is not None:
+            args.append(event_type)
+        if before is not None:
+            args.extend(before)
+        query = _EVENTS_QUERIES[event_type is not None, before is not None]
+        rows = await _conn.fetch(query, *args)
+        return [_decode_event(row) for row in rows]
 
 
 async def provide_newsfeed_repository(state: State) -> NewsfeedRepository:
@@ -8,6 +8,153 @@ from litestar.datastructures import State
 
 from .base import BaseRepository
 from .exceptions import ForeignKeyViolationError, extract_constraint_name
+from .statements import STATEMENTS
+
+_RANK_CARD_QUERY = STATEMENTS.register(
+    "rank_card.card",
+    r"""
+    WITH user_completions AS (
+        SELECT DISTINCT ON (c.map_id)
+            c.map_id,
+            c.time,
+            c.video,
+            c.legacy_medal AS medal
+        FROM core.completions c
+        WHERE c.verified
+          AND c.user_id = $1
+        ORDER BY c.map_id, c.inserted_at DESC
+    ),
+    thresholds AS (
+        SELECT * FROM (
+            VALUES
+                ('Easy', 10, 1),
+                ('Medium', 10, 2),
+                ('Hard', 10, 3),
+                ('Very Hard', 10, 4),
+                ('Extreme', 7, 5),
+                ('Hell', 3, 6)
+        ) AS t(name, threshold, position)
+    ),
+    map_data AS (
+        SELECT
+            regexp_replace(trim(m.difficulty), '\s*[+-]\s*$', '') AS difficulty,
+            uc.video IS NOT NULL AND (
+                uc.time <= mm.gold OR uc.medal LIKE 'Gold'
+            ) AS gold,
+            uc.video IS NOT NULL AND (
+                uc.time <= mm.silver AND uc.time > mm.gold OR uc.medal LIKE 'Silver'
+            ) AS silver,
+            uc.video IS NOT NULL AND (
+                uc.time <= mm.bronze AND uc.time > mm.silver OR uc.medal LIKE 'Bronze'
+            ) AS bronze
+        FROM user_completions uc
+        LEFT JOIN core.maps m ON uc.map_id = m.id
+        LEFT JOIN maps.medals mm ON uc.map_id = mm.map_id
+        WHERE m.official = $2
+          AND ($3::boolean IS FALSE OR m.archived = FALSE)
+          AND ($3::boolean IS FALSE OR m.playtesting = 'Approved')
+    ),
+    ranks AS (
+        SELECT
+            t.position,
+            t.name AS difficulty,
+            count(md.difficulty) AS completions,
+            count(*) FILTER (WHERE md.gold) AS gold,
+            count(*) FILTER (WHERE md.silver) AS silver,
+            count(*) FILTER (WHERE md.bronze) AS bronze,
+            count(md.difficulty) >= t.threshold AS rank_met,
+            count(*) FILTER (WHERE md.gold) >= t.threshold AS gold_rank_met,
+            count(*) FILTER (WHERE md.silver) >= t.threshold AS silver_rank_met,
+            count(*) FILTER (WHERE md.bronze) >= t.threshold AS bronze_rank_met
+        FROM thresholds t
+        LEFT JOIN map_data md ON md.difficulty = t.name
+        GROUP BY t.position, t.name, t.threshold
+    ),
+    map_totals AS (
+        SELECT
+            regexp_replace(m.difficulty::text, '\s*[-+]\s*$', '') AS base_difficulty,
+            count(*) AS total
+        FROM core.maps AS m
+        WHERE m.official = $2
+            AND ($3::boolean IS FALSE OR m.archived = FALSE)
+            AND ($3::boolean IS FALSE OR m.playtesting = 'Approved')
+        GROUP BY base_difficulty
+    )
+    SELECT
+        coalesce(own.username, u.nickname) AS nickname,
+        bg.name AS background,
+        av.skin AS avatar_skin,
+        av.pose AS avatar_pose,
+        to_jsonb(b) - 'user_id' AS badges,
+        (
+            SELECT jsonb_object_agg(amn.name, (
+                SELECT count(DISTINCT c.map_id)
+                FROM core.completions c
+                JOIN core.maps m ON c.map_id = m.id
+                WHERE c.user_id = u.id AND m.map_name = amn.name
+            ))
+            FROM maps.names amn
+            WHERE amn.name != 'Adlersbrunn'
+              AND amn.name IN (
+                SELECT badge.name
+                FROM (
+                    VALUES
+                        (b.badge_type1, b.badge_name1),
+                        (b.badge_type2, b.badge_name2),
+                        (b.badge_type3, b.badge_name3),
+                        (b.badge_type4, b.badge_name4),
+                        (b.badge_type5, b.badge_name5),
+                        (b.badge_type6, b.badge_name6)
+                ) AS badge(type, name)
+                WHERE badge.type = 'mastery'
+            )
+        ) AS mastery,
+        coalesce((
+            SELECT count(*)
+            FROM maps.creators c
+            LEFT JOIN core.maps m ON c.map_id = m.id
+            WHERE c.user_id = u.id AND m.official = TRUE AND m.archived = FALSE
+        ), 0) AS maps_created,
+        coalesce((
+            SELECT count(*) + coalesce(dc.count, 0)
+            FROM playtests.votes pv
+            LEFT JOIN playtests.deprecated_count dc ON pv.user_id = dc.user_id
+            WHERE pv.user_id = u.id
+            GROUP BY pv.user_id, dc.count
+        ), 0) AS playtests_voted,
+        (SELECT count(*) FROM maps.world_records wr WHERE wr.user_id = u.id) AS world_records,
+        (
+            SELECT jsonb_agg(to_jsonb(r) - 'position' ORDER BY r.position)
+            FROM ranks r
+        ) AS ranks,
+        coalesce(
+            (SELECT jsonb_object_agg(mt.base_difficulty, mt.total) FROM map_totals mt), '{}'
+        ) AS map_totals,
+        coalesce(xp.amount, 0) AS xp,
+        (coalesce(xp.amount, 0) / 100) / 100 AS prestige_level,
+        x.name || ' ' || s.name AS community_rank,
+        coalesce(ss.skill_score, 0) AS skill_score,
+        CASE WHEN coalesce(ss.skill_score, 0) <= 0 OR cardinality(tc.boundaries) = 0 THEN 0
+             ELSE width_bucket(ss.skill_score, tc.boundaries) + 1 END AS skill_tier,
+        coalesce(
+            (SELECT count(*) FROM skill.snapshot s2
+               WHERE s2.skill_score > 0 AND s2.skill_score <= ss.skill_score)::float8
+            / NULLIF((SELECT count(*) FROM skill.snapshot s3 WHERE s3.skill_score > 0), 0),
+            0.0) AS skill_percentile
+    FROM core.users u
+    LEFT JOIN users.overwatch_usernames own ON own.user_id = u.id AND own.is_primary = TRUE
+    LEFT JOIN rank_card.background bg ON bg.user_id = u.id
+    LEFT JOIN rank_card.avatar av ON av.user_id = u.id
+    LEFT JOIN rank_card.badges b ON b.user_id = u.id
+    LEFT JOIN lootbox.xp xp ON xp.user_id = u.id
+    LEFT JOIN lootbox.main_tiers x ON (((coalesce(xp.amount, 0) / 100) % 100)) / 5 = x.threshold
+    LEFT JOIN lootbox.sub_tiers s ON (coalesce(xp.amount, 0) / 100) % 5 = s.threshold
+    LEFT JOIN skill.snapshot ss ON ss.user_id = u.id
+    LEFT JOIN skill.tier_config tc ON TRUE
+    WHERE u.id = $1
+    """,
+    warm=True,
+)
 
 
 class RankCardRepository(BaseRepository):
@@ -269,231 +416,36 @@ class RankCardRepository(BaseRepository):
                 detail=str(e),
             ) from e
 
-    async def fetch_nickname(
+    async def fetch_rank_card(
         self,
         user_id: int,
         *,
-        conn: Connection | None = None,
-    ) -> str:
-        """Fetch user's nickname or primary Overwatch username.
-
-        Args:
-            user_id: User ID.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            User's nickname or primary username, or "Unknown User" if not found.
-        """
-        _conn = self._get_connection(conn)
-
-        query = """
-            WITH default_name AS (
-                SELECT nickname, id as user_id
-                FROM core.users
-            )
-            SELECT coalesce(own.username, dn.nickname) AS nickname
-            FROM default_name dn
-            LEFT JOIN users.overwatch_usernames own ON own.user_id = dn.user_id AND own.is_primary = TRUE
-            WHERE dn.user_id = $1
-        """
-        return await _conn.fetchval(query, user_id) or "Unknown User"
-
-    async def fetch_map_totals(
-        self,
-        *,
         official: bool = True,
         playable_only: bool = True,
         conn: Connection | None = None,
-    ) -> list[dict]:
-        """Get total count of maps by difficulty with configurable filters.
-
-        Args:
-            official: Whether to filter for official maps (True) or non-official (False).
-            playable_only: When True, exclude archived maps and require approved playtesting.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            List of dicts with base_difficulty and total.
-        """
-        _conn = self._get_connection(conn)
-
-        query = r"""
-            SELECT
-                regexp_replace(m.difficulty::text, '\s*[-+]\s*$', '') AS base_difficulty,
-                count(*) AS total
-            FROM core.maps AS m
-            WHERE m.official = $1
-                AND ($2::boolean IS FALSE OR m.archived = FALSE)
-                AND ($2::boolean IS FALSE OR m.playtesting = 'Approved')
-            GROUP BY base_difficulty
-            ORDER BY base_difficulty
-        """
-        rows = await _conn.fetch(query, official, playable_only)
-        return [dict(row) for row in rows]
-
-    async def fetch_world_record_count(
-        self,
-        user_id: int,
-        *,
-        conn: Connection | None = None,
-    ) -> int:
-        """Count how many world records a user currently holds.
-
-        Args:
-            user_id: User ID.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            Number of world records held.
-        """
-        _conn = self._get_connection(conn)
-
-        query = """
-            WITH ranks AS (
-                SELECT
-                    r.user_id,
-                    r.map_id,
-                    rank() OVER (PARTITION BY r.map_id ORDER BY time) AS rank_num
-                FROM core.completions r
-                JOIN core.users u ON r.user_id = u.id
-                WHERE u.id > 1000
-                  AND r.time < 99999999
-                  AND r.verified = TRUE
-            ), world_records AS (
-                SELECT r.user_id, count(r.user_id) AS amount FROM ranks r WHERE rank_num = 1 GROUP BY r.user_id
-            )
-            SELECT amount FROM world_records WHERE user_id=$1;
-        """
-        return await _conn.fetchval(query, user_id) or 0
-
-    async def fetch_maps_created_count(
-        self,
-        user_id: int,
-        *,
-        conn: Connection | None = None,
-    ) -> int:
-        """Count how many official maps a user has created.
-
-        Args:
-            user_id: User ID.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            Total maps created by the user.
-        """
-        _conn = self._get_connection(conn)
-
-        query = """
-            SELECT count(*)
-            FROM maps.creators c
-            LEFT JOIN core.maps m ON c.map_id = m.id
-            WHERE c.user_id = $1 AND m.official = TRUE and m.archived = FALSE
-            GROUP BY c.user_id;
-        """
-        return await _conn.fetchval(query, user_id) or 0
-
-    async def fetch_playtests_voted_count(
-        self,
-        user_id: int,
-        *,
-        conn: Connection | None = None,
-    ) -> int:
-        """Count how many playtests a user has voted in.
-
-        Args:
-            user_id: User ID.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            Number of playtest votes.
-        """
-        _conn = self._get_connection(conn)
-
-        query = """
-            SELECT count(*) + coalesce(dc.count, 0)
-            FROM playtests.votes pv
-            LEFT JOIN playtests.deprecated_count dc ON pv.user_id = dc.user_id
-            WHERE pv.user_id=$1
-            GROUP BY pv.user_id, dc.count;
-        """
-        return await _conn.fetchval(query, user_id) or 0
-
-    async def fetch_community_rank_xp(
-        self,
-        user_id: int,
-        *,
-        conn: Connection | None = None,
-    ) -> dict:
-        """Fetch XP and prestige data for a user.
-
-        Args:
-            user_id: User ID.
-            conn: Optional connection for transaction participation.
-
-        Returns:
-            Dict with xp, prestige_level, and community_rank.
-        """
-        _conn = self._get_connection(conn)
-
-        query = """
-            SELECT
-                coalesce(xp.amount, 0) AS xp,
-                (coalesce(xp.amount, 0) / 100) / 100 AS prestige_level,
-                x.name || ' ' || s.name AS community_rank
-            FROM core.users u
-            LEFT JOIN lootbox.xp xp ON u.id = xp.user_id
-            LEFT JOIN lootbox.main_tiers x ON (((coalesce(xp.amount, 0) / 100) % 100)) / 5 = x.threshold
-            LEFT JOIN lootbox.sub_tiers s ON (coalesce(xp.amount, 0) / 100) % 5 = s.threshold
-            WHERE u.id = $1
-        """
-        row = await _conn.fetchrow(query, user_id)
-        assert row, f"User {user_id} not found"
-        return dict(row)
-
-    async def fetch_skill_summary(
-        self,
-        user_id: int,
-        *,
-        conn: Connection | None = None,
-    ) -> dict:
-        """Fetch a single user's skill score, tier, and percentile.
+    ) -> dict | None:
+        """Fetch every rank card field for a user in one statement.
 
-        Mirrors the community leaderboard's skill projection
-        (``community_repository.fetch_community_leaderboard``) for one user: anchored on
-        ``core.users`` (guaranteeing a row even when the user has no snapshot) with the
-        same ``skill.snapshot`` + ``skill.tier_config`` joins and the same COALESCE/CASE
-        zero handling. Pure read — never recomputes or mutates snapshot/tier_config data.
+        Combines the user's per-difficulty ranks, nickname, background, avatar,
+        badges, maps created, playtests voted, world records, map totals,
+        community XP and skill summary, plus the mastery counts of the maps used
+        as mastery badges, so a rank card costs a single round trip.
 
         Args:
             user_id: User ID.
+            official: Whether to filter for official maps (True) or non-official (False).
+            playable_only: When True, exclude archived maps and require approved playtesting.
             conn: Optional connection for transaction participation.
 
         Returns:
-            Dict with ``skill_score`` (float), ``skill_tier`` (int), and
-            ``skill_percentile`` (float). A user with no ``skill.snapshot`` row gets
-            ``{"skill_score": 0.0, "skill_tier": 0, "skill_percentile": 0.0}`` (never None).
+            Dict with the scalar rank card fields; ``ranks`` (per-difficulty rows,
+            easiest first), ``map_totals`` (base difficulty -> map count),
+            ``badges`` (badge settings or None) and ``mastery`` (map name ->
+            mastery amount) are decoded JSON. None if the user does not exist.
         """
         _conn = self._get_connection(conn)
-
-        query = """
-            SELECT
-                coalesce(ss.skill_score, 0) AS skill_score,
-                CASE WHEN coalesce(ss.skill_score, 0) <= 0 OR cardinality(tc.boundaries) = 0 THEN 0
-                     ELSE width_bucket(ss.skill_score, tc.boundaries) + 1 END AS skill_tier,
-                coalesce(
-                    (SELECT count(*) FROM skill.snapshot s2
-                       WHERE s2.skill_score > 0 AND s2.skill_score <= ss.skill_score)::float8
-                    / NULLIF((SELECT count(*) FROM skill.snapshot s3 WHERE s3.skill_score > 0), 0),
-                    0.0) AS skill_percentile
-            FROM core.users u
-            LEFT JOIN skill.snapshot ss ON ss.user_id = u.id
-            LEFT JOIN skill.tier_config tc ON TRUE
-            WHERE u.id = $1
-        """
-        row = await _conn.fetchrow(query, user_id)
-        if row is None:
-            return {"skill_score": 0.0, "skill_tier": 0, "skill_percentile": 0.0}
-        return dict(row)
+        row = await _conn.fetchrow(_RANK_CARD_QUERY, user_id, official, playable_only)
+        return dict(row) if row else None
 
 
 async def provide_rank_card_repository(state: State) -> RankCardRepository:
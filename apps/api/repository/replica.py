@@ -0,0 +1,161 @@
+"""Routing of replica-safe reads to an optional streaming read replica.
+
+With ``POSTGRES_REPLICA_DSN`` set, the app opens a second pool on a hot standby
+(see the ``read_replica_pool`` lifespan) and attaches it to :data:`READ_REPLICA`.
+Repository methods opt in per read by taking their connection from
+``BaseRepository._get_read_connection`` instead of ``_get_connection``; those
+reads go to the replica only when all of these hold:
+
+- no connection was passed in, so the read is not part of a transaction;
+- the caller is inside :func:`replica_reads`. ``ReplicaRoutingMiddleware``
+  enters it for ``GET`` and ``HEAD`` requests from clients that have not written
+  in the last ``REPLICA_STICKY_SECONDS`` (read-your-writes), and the nightly
+  skill rebuild enters it for its input scan;
+- the replica's last measured lag is at most ``REPLICA_MAX_LAG_SECONDS``. The
+  lag is sampled every ``REPLICA_LAG_CHECK_SECONDS``; an unreachable replica,
+  or one whose WAL receiver is not streaming from the primary, counts as
+  lagging, so reads fall back to the primary.
+
+Everything else, including every write, uses the primary pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from asyncpg.exceptions import InterfaceError, PostgresError
+
+if TYPE_CHECKING:
+    from asyncpg import Pool
+
+log = logging.getLogger(__name__)
+
+POSTGRES_REPLICA_DSN = os.getenv("POSTGRES_REPLICA_DSN") or None
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "1"))
+
+# Seconds the standby is behind. A standby that has replayed everything it
+# received reports 0 even when the primary has been idle, and a server that is
+# not in recovery (a DSN pointing at the primary) has no lag at all. Received
+# equals replayed also once the WAL receiver has lost the primary, so a standby
+# that is not streaming reports NULL (unknown lag). Its status is only visible
+# to superusers and members of pg_read_all_stats.
+_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END::float8
+"""
+
+# A hung replica must not hold up the lag samples that would route reads away from it.
+_LAG_CHECK_TIMEOUT = 2.0
+
+_REPLICA_READS: contextvars.ContextVar[bool] = contextvars.ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Allow replica-safe reads in the block (and tasks it starts) to use the replica."""
+    token = _REPLICA_READS.set(True)
+    try:
+        yield
+    finally:
+        _REPLICA_READS.reset(token)
+
+
+class _ReadReplica:
+    """The replica pool, its last measured lag and the clients pinned to the primary."""
+
+    def __init__(self, max_lag: float, sticky_seconds: float, max_sticky_clients: int = 10_000) -> None:
+        self.max_lag = max_lag
+        self.sticky_seconds = sticky_seconds
+        self.max_sticky_clients = max_sticky_clients
+        self.pool: Pool | None = None
+        self.lag_seconds: float | None = None
+        self._sticky_until: dict[str, float] = {}
+
+    def attach(self, pool: Pool) -> None:
+        """Start routing to ``pool``; reads stay on the primary until the first lag check."""
+        self.pool = pool
+        self.lag_seconds = None
+
+    def detach(self) -> None:
+        """Stop routing to the replica."""
+        self.pool = None
+        self.lag_seconds = None
+
+    async def check_lag(self) -> float | None:
+        """Measure the replica's lag; None (primary only) if it cannot be measured or is not streaming."""
+        if self.pool is None:
+            return None
+        try:
+            # Bounds acquiring a connection too, which fetchval's own timeout does not.
+            self.lag_seconds = await asyncio.wait_for(self.pool.fetchval(_LAG_QUERY), _LAG_CHECK_TIMEOUT)
+        except (PostgresError, InterfaceError, OSError, TimeoutError):
+            if self.lag_seconds is not None:
+                log.warning("Read replica unreachable; reading from the primary", exc_info=True)
+            self.lag_seconds = None
+        return self.lag_seconds
+
+    def healthy(self) -> bool:
+        """Whether the replica is attached and within the lag threshold."""
+        return self.pool is not None and self.lag_seconds is not None and self.lag_seconds <= self.max_lag
+
+    def read_pool(self) -> Pool | None:
+        """Return the pool for a replica-safe read in the current context, or None for the primary."""
+        if _REPLICA_READS.get() and self.healthy():
+            return self.pool
+        return None
+
+    def note_write(self, client: str) -> None:
+        """Pin ``client``'s reads to the primary for the stickiness window."""
+        if self.sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._sticky_until) >= self.max_sticky_clients:
+            self._sticky_until = {key: until for key, until in self._sticky_until.items() if until > now}
+        self._sticky_until[client] = now + self.sticky_seconds
+
+    def is_sticky(self, client: str) -> bool:
+        """Whether ``client`` wrote recently enough that its reads must see the primary."""
+        until = self._sticky_until.get(client)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._sticky_until[client]
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Detach the replica and forget every pinned client."""
+        self.detach()
+        self._sticky_until.clear()
+
+
+# Single process-wide replica router shared by every repository.
+READ_REPLICA = _ReadReplica(REPLICA_MAX_LAG_SECONDS, REPLICA_STICKY_SECONDS)
+
+
+async def monitor_replica_lag(interval: float = REPLICA_LAG_CHECK_SECONDS) -> None:
+    """Refresh the replica's lag every ``interval`` seconds until cancelled.
+
+    An unexpected error fails one sample, not the monitor: the replica counts as
+    lagging until a later sample succeeds.
+    """
+    while True:
+        try:
+            await READ_REPLICA.check_lag()
+        except Exception:
+            log.exception("Read replica lag check failed; reading from the primary")
+            READ_REPLICA.lag_seconds = None
+        await asyncio.sleep(interval)
@@ -14,6 +14,7 @@ from asyncpg.pool import PoolConnectionProxy
 from litestar.datastructures import State
 
 from repository.base import BaseRepository
+from repository.statements import STATEMENTS
 from services.exceptions.skill import SkillConfigNotSeededError
 
 # Verbatim port of the spike input query (sources/001-skill-input-query/query.py:24-92).
@@ -28,7 +29,9 @@ from services.exceptions.skill import SkillConfigNotSeededError
 #   - `raw_difficulty::float8` (0-10 numeric), never the text tier.
 #   - `time_pct` (percent_rank, field-relative; 1.0 = fastest) — NEVER compare raw time across maps.
 #   - eligibility WHERE (SPEC req 3): verified, non-legacy, non-archived, code present.
-SKILL_INPUT_QUERY = """
+SKILL_INPUT_QUERY = STATEMENTS.register(
+    "skill.input",
+    """
 WITH best AS (
     -- fastest verified, non-legacy completion per (user, map), on non-archived maps
     SELECT DISTINCT ON (c.user_id, c.map_id)
@@ -96,7 +99,8 @@ GROUP BY f.user_id, f.map_id, m.code, m.map_name, m.difficulty, m.raw_difficulty
          f.completion, f.field_size, f.field_rank, f.video_rank, f.time_pct,
          md.gold, md.silver, md.bronze, md.map_id, f.completion_id, u.nickname, u.global_name
 ORDER BY f.user_id, m.raw_difficulty DESC
-"""
+""",
+)
 
 # Allow-list of the nine weight columns (D-09). A partial PATCH (D-10) may only set
 # these names — the UPDATE SET clause is built exclusively from this set, never from
@@ -147,7 +151,7 @@ class SkillRepository(BaseRepository):
         Returns:
             List of eligible skill-input rows as dicts, suspicious rows excluded.
         """
-        _conn = self._get_connection(conn)
+        _conn = self._get_read_connection(conn)
         rows = await _conn.fetch(SKILL_INPUT_QUERY)
         return [dict(row) for row in rows if not row["suspicious"]]
 
@@ -0,0 +1,138 @@
+"""Registry of named SQL statements and per-connection warmup.
+
+asyncpg keeps an LRU cache of prepared statements on every connection, keyed by
+the exact SQL text. A statement whose text is fixed is parsed and described once
+per connection and reused after that. A statement whose text is built per call,
+for example with an f-string sort column or a formatted ``LIMIT``, gets a new
+cache entry for every variant. Hot repository queries are therefore module
+constants with every variable part passed as a parameter, and each one is
+registered here under a ``<repository>.<query>`` name.
+
+Statements registered with ``warm=True`` are prepared by :meth:`StatementRegistry.warm`
+when a pool connection is opened (see ``_async_pg_init``). The first request on a
+new connection then skips the Parse/Describe round trip. Planning still happens
+at execution: Postgres builds a custom plan for each of the first executions of
+a prepared statement before it considers a generic one, so warmup does not save
+planning time. ``SQL_STATEMENT_CACHE_SIZE`` sets the per-connection cache size
+and must be larger than the warm set. ``SQL_WARM_STATEMENTS`` turns the warmup
+off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import msgspec
+from asyncpg.exceptions import PostgresError
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+
+log = logging.getLogger(__name__)
+
+SQL_STATEMENT_CACHE_SIZE = int(os.getenv("SQL_STATEMENT_CACHE_SIZE", "256"))
+SQL_WARM_STATEMENTS = os.getenv("SQL_WARM_STATEMENTS", "true").lower() in {"1", "true", "yes"}
+
+
+class Statement(msgspec.Struct, frozen=True):
+    """A named, parameterized SQL statement."""
+
+    name: str
+    sql: str
+    warm: bool = False
+
+
+class WarmupStats(msgspec.Struct):
+    """Totals of the warmups run in this process."""
+
+    connections: int = 0
+    prepared: int = 0
+    failed: int = 0
+    prepare_ms: float = 0.0
+
+
+class StatementRegistry:
+    """Named statements shared by the repositories."""
+
+    def __init__(self) -> None:
+        self._statements: dict[str, Statement] = {}
+        self._stats = WarmupStats()
+
+    def register(self, name: str, sql: str, *, warm: bool = False) -> str:
+        """Register a statement and return its SQL, so it can be assigned to a module constant.
+
+        Args:
+            name: Unique ``<repository>.<query>`` name.
+            sql: Statement text; variable parts must be parameters.
+            warm: Prepare the statement on every new pool connection.
+
+        Returns:
+            ``sql`` unchanged.
+
+        Raises:
+            ValueError: If ``name`` is already registered with different SQL.
+        """
+        existing = self._statements.get(name)
+        if existing is not None and existing.sql != sql:
+            raise ValueError(f"Statement {name!r} is already registered with different SQL")
+        self._statements[name] = Statement(name=name, sql=sql, warm=warm)
+        return sql
+
+    def get(self, name: str) -> Statement:
+        """Return the statement registered as ``name``."""
+        return self._statements[name]
+
+    def __iter__(self) -> Iterator[Statement]:
+        """Iterate over the registered statements in registration order."""
+        return iter(self._statements.values())
+
+    def __len__(self) -> int:
+        """Return the number of registered statements."""
+        return len(self._statements)
+
+    def warm_set(self) -> list[Statement]:
+        """Return the statements prepared on every new connection."""
+        return [stmt for stmt in self._statements.values() if stmt.warm]
+
+    async def warm(self, conn: Connection) -> int:
+        """Prepare the warm set into ``conn``'s statement cache.
+
+        A statement that fails to prepare (for example because a migration has
+        not run yet) is logged and skipped; the connection stays usable and the
+        statement is prepared on first use instead.
+
+        Args:
+            conn: A freshly opened connection, after its type codecs are set;
+                setting a codec clears the statement cache.
+
+        Returns:
+            Number of statements prepared.
+        """
+        prepared = 0
+        started = time.perf_counter()
+        for stmt in self.warm_set():
+            try:
+                # The private entry point fetch() itself uses, so the prepared
+                # statement lands in the same cache slot a later fetch() looks up.
+                await conn._get_statement(stmt.sql, None)  # noqa: SLF001
+            except PostgresError:
+                self._stats.failed += 1
+                log.warning("Could not prepare statement %s", stmt.name, exc_info=True)
+            else:
+                prepared += 1
+        self._stats.connections += 1
+        self._stats.prepared += prepared
+        self._stats.prepare_ms += (time.perf_counter() - started) * 1000
+        return prepared
+
+    def stats(self) -> WarmupStats:
+        """Return a copy of the warmup totals."""
+        return msgspec.structs.replace(self._stats)
+
+
+# Single process-wide registry shared by every repository.
+STATEMENTS = StatementRegistry()
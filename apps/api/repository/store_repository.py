@@ -113,16 +113,19 @@ class StoreRepository(BaseRepository):
 
     async def fetch_current_rotation(
         self,
+        user_id: int | None = None,
         *,
         conn: Connection | None = None,
     ) -> list[dict]:
-        """Fetch current rotation items.
+        """Fetch current rotation items with the user's ownership of each.
 
         Args:
+            user_id: Optional user whose rewards decide ``owned``; without one
+                every item is unowned.
             conn: Optional connection for transaction support.
 
         Returns:
-            List of rotation item dicts.
+            List of rotation item dicts, each with an ``owned`` flag.
         """
         _conn = self._get_connection(conn)
         query = """
@@ -134,13 +137,56 @@ class StoreRepository(BaseRepository):
                 ORDER BY max(available_from) DESC
                 LIMIT 1
             )
-            SELECT r.rotation_id, r.item_name, r.item_type, r.key_type, r.rarity, r.price, r.available_until
+            SELECT
+                r.rotation_id, r.item_name, r.item_type, r.key_type, r.rarity, r.price, r.available_until,
+                EXISTS (
+                    SELECT 1
+                    FROM lootbox.user_rewards ur
+                    WHERE ur.user_id = $1::bigint
+                      AND ur.reward_type = r.item_type
+                      AND ur.key_type = r.key_type
+                      AND ur.reward_name = r.item_name
+                ) AS owned
             FROM store.rotations r
             JOIN current_rotation c ON r.rotation_id = c.rotation_id
             WHERE r.available_from <= now() AND r.available_until > now()
             ORDER BY r.rarity DESC, r.item_name
         """
-        rows = await _conn.fetch(query)
+        rows = await _conn.fetch(query, user_id)
+        return [dict(row) for row in rows]
+
+    async def fetch_rotation_ownership(
+        self,
+        rotation_id: UUID,
+        user_id: int,
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict]:
+        """Fetch the items of a rotation that a user already owns.
+
+        Args:
+            rotation_id: Rotation UUID.
+            user_id: User whose rewards to check.
+            conn: Optional connection for transaction support.
+
+        Returns:
+            List of dicts with item_name, item_type and key_type.
+        """
+        _conn = self._get_connection(conn)
+        query = """
+            SELECT r.item_name, r.item_type, r.key_type
+            FROM store.rotations r
+            WHERE r.rotation_id = $1
+              AND EXISTS (
+                  SELECT 1
+                  FROM lootbox.user_rewards ur
+                  WHERE ur.user_id = $2::bigint
+                    AND ur.reward_type = r.item_type
+                    AND ur.key_type = r.key_type
+                    AND ur.reward_name = r.item_name
+              )
+        """
+        rows = await _conn.fetch(query, rotation_id, user_id)
         return [dict(row) for row in rows]
 
     async def get_rotation_window(
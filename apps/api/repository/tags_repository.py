@@ -11,6 +11,7 @@ from genjishimada_sdk.tags import (
     TagsAutocompleteResponse,
     TagsSearchFilters,
     TagsSearchResponse,
+    TagUsageIncrement,
 )
 from litestar.datastructures import State
 
@@ -598,6 +599,49 @@ class TagsRepository(BaseRepository):
             guild_id,
         )
 
+    async def increment_usage_many(
+        self,
+        items: list[TagUsageIncrement],
+        *,
+        conn: Connection | None = None,
+    ) -> int:
+        """Apply a batch of accumulated usage counters in one statement.
+
+        Names are resolved through tag_lookup (backed by ``tag_lookup_uniq_idx``),
+        so aliases credit their canonical tag. Counts for the same tag are summed
+        before the update so each tag row is written once.
+
+        Args:
+            items: Usage increments keyed by guild and tag name.
+            conn: Optional connection for transaction participation.
+
+        Returns:
+            Number of tag rows updated.
+        """
+        if not items:
+            return 0
+        _conn = self._get_connection(conn)
+        result = await _conn.execute(
+            """
+            UPDATE public.tags t
+            SET uses = t.uses + u.total
+            FROM (
+                SELECT tl.tag_id, sum(i.count) AS total
+                FROM unnest($1::bigint[], $2::text[], $3::int[]) AS i(guild_id, name, count)
+                JOIN public.tag_lookup tl
+                  ON lower(tl.name) = lower(i.name)
+                 AND tl.location_id = i.guild_id
+                GROUP BY tl.tag_id
+            ) u
+            WHERE t.id = u.tag_id
+            """,
+            [item.guild_id for item in items],
+            [item.name for item in items],
+            [item.count for item in items],
+        )
+        # result is like "UPDATE N"
+        return int(result.split(" ")[1])
+
     async def autocomplete_tags(
         self,
         filters: TagsAutocompleteRequest,
@@ -1933,6 +1933,78 @@ class TournamentRepository(BaseRepository):
         rows = await _conn.fetch(query, cycle_id)
         return [dict(row) for row in rows]
 
+    async def fetch_leaderboard_runs(
+        self,
+        cycle_id: int,
+        *,
+        conn: Connection | None = None,
+    ) -> list[dict]:
+        """Fetch every user's best run for a cycle, unranked, to seed a live leaderboard.
+
+        Uses the same best-per-user ordering as :meth:`fetch_leaderboard` but leaves
+        ranking to the caller and also returns ``inserted_at``, the tiebreak the live
+        board needs to reproduce ``RANK()`` exactly.
+
+        Args:
+            cycle_id: Cycle to fetch runs for.
+            conn: Optional connection for transaction support.
+
+        Returns:
+            List of best-run dicts (user_id, name, time, verified, completion, inserted_at).
+        """
+        _conn = self._get_connection(conn)
+        query = """
+            SELECT DISTINCT ON (tc.user_id)
+                tc.user_id,
+                COALESCE(u.global_name, u.nickname, 'Unknown') AS name,
+                tc.time::float AS time,
+                tc.verified,
+                tc.completion,
+                tc.inserted_at
+            FROM tournaments.completions tc
+            JOIN core.users u ON u.id = tc.user_id
+            WHERE tc.cycle_id = $1
+            ORDER BY tc.user_id, tc.verified DESC, tc.completion DESC, tc.time ASC, tc.inserted_at ASC
+        """
+        rows = await _conn.fetch(query, cycle_id)
+        return [dict(row) for row in rows]
+
+    async def fetch_leaderboard_run(
+        self,
+        cycle_id: int,
+        user_id: int,
+        *,
+        conn: Connection | None = None,
+    ) -> dict | None:
+        """Fetch one user's best run for a cycle in live-leaderboard shape.
+
+        Args:
+            cycle_id: Cycle to look up.
+            user_id: User to look up.
+            conn: Optional connection for transaction support.
+
+        Returns:
+            Best-run dict (see :meth:`fetch_leaderboard_runs`) or None if the user
+            has no runs in the cycle.
+        """
+        _conn = self._get_connection(conn)
+        query = """
+            SELECT
+                tc.user_id,
+                COALESCE(u.global_name, u.nickname, 'Unknown') AS name,
+                tc.time::float AS time,
+                tc.verified,
+                tc.completion,
+                tc.inserted_at
+            FROM tournaments.completions tc
+            JOIN core.users u ON u.id = tc.user_id
+            WHERE tc.cycle_id = $1 AND tc.user_id = $2
+            ORDER BY tc.verified DESC, tc.completion DESC, tc.time ASC, tc.inserted_at ASC
+            LIMIT 1
+        """
+        row = await _conn.fetchrow(query, cycle_id, user_id)
+        return dict(row) if row else None
+
     async def fetch_user_completion(
         self,
         cycle_id: int,
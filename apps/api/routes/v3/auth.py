@@ -42,6 +42,7 @@ from litestar.status_codes import (
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
     HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 from repository.auth_repository import provide_auth_repository
@@ -51,6 +52,7 @@ from services.exceptions.auth import (
     EmailAlreadyVerifiedError,
     EmailValidationError,
     InvalidCredentialsError,
+    PasswordHashingBusyError,
     PasswordValidationError,
     RateLimitExceededError,
     TokenAlreadyUsedError,
@@ -98,17 +100,16 @@ class AuthController(Controller):
         Args:
             data: Registration payload with email, password, and username.
             auth_service: Authentication service.
-            request: Current request (for client IP).
+            request: Current request (for emitting the email event).
 
         Returns:
             Response with user data and verification_email_sent flag with 201 status.
 
         Raises:
-            CustomHTTPException: On validation, rate limit, or duplicate email errors.
+            CustomHTTPException: On validation, rate limit, or duplicate email errors, or 503 when hashing is saturated.
         """
         try:
-            client_ip = self._safe_client_ip(request)
-            resp, event = await auth_service.register(data, client_ip=client_ip)
+            resp, event = await auth_service.register(data)
             try:
                 request.app.emit("auth.verification.requested", event)
                 resp.verification_email_sent = True
@@ -125,38 +126,55 @@ class AuthController(Controller):
         except EmailAlreadyExistsError as e:
             raise CustomHTTPException(detail=e.message, status_code=HTTP_400_BAD_REQUEST)
         except RateLimitExceededError as e:
-            raise CustomHTTPException(detail=e.message, status_code=HTTP_429_TOO_MANY_REQUESTS)
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
+        except PasswordHashingBusyError as e:
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
 
     @post("/login")
     async def login_endpoint(
         self,
         data: Annotated[EmailLoginRequest, Body(title="Login credentials")],
         auth_service: AuthService,
-        request: Request,
     ) -> Response[LoginResponse]:
         """Login with email and password.
 
         Args:
             data: Login payload with email and password.
             auth_service: Authentication service.
-            request: Current request (for client IP).
 
         Returns:
             AuthUserResponse with 200 status.
 
         Raises:
-            CustomHTTPException: On invalid credentials or rate limit errors.
+            CustomHTTPException: On invalid credentials or rate limit errors, or 503 when hashing is saturated.
         """
         try:
-            client_ip = self._safe_client_ip(request)
-            resp = await auth_service.login(data, client_ip=client_ip)
+            resp = await auth_service.login(data)
 
             return Response(resp, status_code=HTTP_200_OK)
 
         except InvalidCredentialsError as e:
             raise CustomHTTPException(detail=e.message, status_code=HTTP_401_UNAUTHORIZED)
         except RateLimitExceededError as e:
-            raise CustomHTTPException(detail=e.message, status_code=HTTP_429_TOO_MANY_REQUESTS)
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
+        except PasswordHashingBusyError as e:
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
 
     @post("/verify-email")
     async def verify_email_endpoint(
@@ -202,7 +220,7 @@ class AuthController(Controller):
         Args:
             data: Request containing email address.
             auth_service: Authentication service.
-            request: Current request (for client IP).
+            request: Current request (for emitting the email event).
 
         Returns:
             Success message with 200 status.
@@ -211,8 +229,7 @@ class AuthController(Controller):
             CustomHTTPException: On errors.
         """
         try:
-            client_ip = self._safe_client_ip(request)
-            resp, event = await auth_service.resend_verification(data.email, client_ip=client_ip)
+            resp, event = await auth_service.resend_verification(data.email)
             try:
                 request.app.emit("auth.verification.resend", event)
             except Exception as exc:
@@ -224,7 +241,11 @@ class AuthController(Controller):
         except EmailAlreadyVerifiedError as e:
             raise CustomHTTPException(detail=e.message, status_code=HTTP_400_BAD_REQUEST)
         except RateLimitExceededError as e:
-            raise CustomHTTPException(detail=e.message, status_code=HTTP_429_TOO_MANY_REQUESTS)
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
 
     @post("/forgot-password")
     async def request_password_reset_endpoint(
@@ -238,7 +259,7 @@ class AuthController(Controller):
         Args:
             data: Password reset request with email.
             auth_service: Authentication service.
-            request: Current request (for client IP).
+            request: Current request (for emitting the email event).
 
         Returns:
             Success message with 200 status (always, even if email not found for security).
@@ -247,8 +268,7 @@ class AuthController(Controller):
             CustomHTTPException: On rate limit errors.
         """
         try:
-            client_ip = self._safe_client_ip(request)
-            resp, event = await auth_service.request_password_reset(data, client_ip=client_ip)
+            resp, event = await auth_service.request_password_reset(data)
             if event:
                 try:
                     request.app.emit("auth.password_reset.requested", event)
@@ -257,7 +277,11 @@ class AuthController(Controller):
             return Response(resp, status_code=HTTP_200_OK)
 
         except RateLimitExceededError as e:
-            raise CustomHTTPException(detail=e.message, status_code=HTTP_429_TOO_MANY_REQUESTS)
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
 
     @post("/reset-password")
     async def reset_password_endpoint(
@@ -275,7 +299,7 @@ class AuthController(Controller):
             Response with message and user data with 200 status (matching v3 format).
 
         Raises:
-            CustomHTTPException: On validation or token errors.
+            CustomHTTPException: On validation or token errors, or 503 when hashing is saturated.
         """
         try:
             resp = await auth_service.confirm_password_reset(data)
@@ -290,6 +314,12 @@ class AuthController(Controller):
             raise CustomHTTPException(detail=e.message, status_code=HTTP_400_BAD_REQUEST)
         except TokenExpiredError as e:
             raise CustomHTTPException(detail=e.message, status_code=HTTP_400_BAD_REQUEST)
+        except PasswordHashingBusyError as e:
+            raise CustomHTTPException(
+                detail=e.message,
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.context["retry_after"])},
+            )
 
     @get("/status/{user_id:int}")
     async def get_auth_status_endpoint(
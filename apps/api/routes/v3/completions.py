@@ -11,6 +11,7 @@ from genjishimada_sdk.completions import (
     CompletionModerateRequest,
     CompletionPatchRequest,
     CompletionResponse,
+    CompletionSubmissionBatchRequest,
     CompletionSubmissionJobResponse,
     CompletionSubmissionResponse,
     CompletionVerificationUpdateRequest,
@@ -22,6 +23,7 @@ from genjishimada_sdk.completions import (
     SuspiciousCompletionResponse,
     UpvoteCreateRequest,
     UpvoteSubmissionJobResponse,
+    WorldRecordDriftResponse,
 )
 from genjishimada_sdk.difficulties import DifficultyTop
 from genjishimada_sdk.internal import JobStatusResponse
@@ -126,6 +128,24 @@ class CompletionsController(Controller):
         """Get completions for a specific user."""
         return await svc.get_world_records_per_user(user_id, archived)
 
+    @post(
+        path="/world-records/reconcile",
+        summary="Reconcile World Records",
+        description=(
+            "Compare the stored world record of every map with a recompute from its completions, "
+            "repair any drift, and return the maps that drifted. Requires the `maps:admin` scope."
+        ),
+        opt={"required_scopes": {"maps:admin"}},
+        include_in_schema=False,
+    )
+    async def reconcile_world_records(
+        self,
+        svc: CompletionsService,
+        repair: Annotated[bool, Parameter(description="Repair drifted maps; false only reports them.")] = True,
+    ) -> list[WorldRecordDriftResponse]:
+        """Check the stored world records against the completions and repair drift."""
+        return await svc.reconcile_world_records(repair=repair)
+
     @post(path="/", summary="Submit Completion", description="Submit a new completion record and publish an event.")
     async def submit_completion(
         self,
@@ -188,6 +208,22 @@ class CompletionsController(Controller):
         except CompletionNotFoundError as e:
             raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
 
+    @post(
+        path="/submissions/batch",
+        summary="Get Completion Submissions",
+        description=(
+            "Retrieve enriched submission details for up to 500 completions in one query. "
+            "Unknown IDs are skipped; results are ordered by ID."
+        ),
+    )
+    async def get_completion_submissions(
+        self,
+        svc: CompletionsService,
+        data: CompletionSubmissionBatchRequest,
+    ) -> list[CompletionSubmissionResponse]:
+        """Get detailed views of several completion submissions."""
+        return await svc.get_completion_submissions(data.ids)
+
     @get(
         path="/pending",
         summary="Get Pending Verifications",
@@ -228,7 +264,7 @@ class CompletionsController(Controller):
         path="/{code:str}",
         summary="Get Map Leaderboard",
         description="Retrieve the leaderboard for a given map, including ranks and medals.",
-        opt={"required_scopes": {"completions:read"}},
+        opt={"required_scopes": {"completions:read"}, "query_budget": 2},
     )
     async def get_completions_leaderboard(
         self,
@@ -202,10 +202,12 @@ class MapCreateResponse(msgspec.Struct, frozen=True):
     ``inserted`` reflects the idempotent ``ON CONFLICT DO NOTHING`` insert: it is
     ``True`` when a brand-new name was added and ``False`` when the name already
     existed (re-create / replace-banner path, D-03). Both cases return 201.
+    ``banner_variants`` lists the resized WebP banners stored with it.
     """
 
     name: str
     inserted: bool
+    banner_variants: list[str] = msgspec.field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -758,13 +760,13 @@ class MapContentController(Controller):
                 ``image_svc`` and ``map_content_repo``).
 
         Returns:
-            MapCreateResponse: The map name and whether a new row was inserted.
+            MapCreateResponse: The map name, whether a new row was inserted, and
+                the banner variant URLs.
 
         Raises:
             CustomHTTPException: 422 if the name is empty/blank or its stripped key
                 collides with a different existing map (raised inside the service).
         """
-        content = await data.banner.read()
         content_type = data.banner.content_type or "image/png"
-        row = await map_content_service.create_map(data.name, content, content_type)
+        row = await map_content_service.create_map(data.name, data.banner.file, content_type)
         return msgspec.convert(row, MapCreateResponse)
@@ -13,7 +13,14 @@ from genjishimada_sdk.lootbox import (
     UserRewardResponse,
 )
 from genjishimada_sdk.maps import XPMultiplierRequest
-from genjishimada_sdk.xp import TierChangeResponse, XpGrantRequest, XpGrantResponse, XpSummaryResponse
+from genjishimada_sdk.xp import (
+    TierChangeResponse,
+    XpGrantBatchRequest,
+    XpGrantBatchResponse,
+    XpGrantRequest,
+    XpGrantResponse,
+    XpSummaryResponse,
+)
 from litestar.di import Provide
 from litestar.params import Body
 from litestar.response import Response
@@ -400,6 +407,33 @@ class LootboxController(litestar.Controller):
         """
         return await lootbox_service.grant_user_xp(request.headers, user_id, data)
 
+    @litestar.post(
+        path="/xp/batch",
+        summary="Grant XP to Users",
+        description=(
+            "Grant XP to many users in one request. The multiplier is read once, every grant is applied in a "
+            "single write, and one batched event is published."
+        ),
+        status_code=HTTP_200_OK,
+    )
+    async def grant_users_xp(
+        self,
+        lootbox_service: LootboxService,
+        request: litestar.Request,
+        data: Annotated[XpGrantBatchRequest, Body(title="XP Grant Batch Request")],
+    ) -> XpGrantBatchResponse:
+        """Grant XP to many users.
+
+        Args:
+            lootbox_service: Lootbox service.
+            request: Request object.
+            data: Batch of XP grants.
+
+        Returns:
+            XpGrantBatchResponse with previous and new amounts for each grant.
+        """
+        return await lootbox_service.grant_users_xp(request.headers, data.grants)
+
     @litestar.get(
         path="/xp/tier",
         summary="Get XP Tier Change",
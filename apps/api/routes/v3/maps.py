@@ -95,7 +95,7 @@ class MapsController(Controller):
         "/",
         summary="Search Maps",
         description="Search and filter maps with comprehensive filtering options.",
-        opt={"required_scopes": {"maps:read"}},
+        opt={"required_scopes": {"maps:read"}, "query_budget": 2},
     )
     async def get_maps_endpoint(  # noqa: PLR0913
         self,
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import datetime as dt
 from typing import Annotated
 
 import litestar
 from genjishimada_sdk.newsfeed import NewsfeedEvent, NewsfeedEventType, PublishNewsfeedJobResponse
 from litestar.di import Provide
 from litestar.params import Parameter
-from litestar.status_codes import HTTP_201_CREATED
+from litestar.status_codes import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 
 from services.newsfeed_service import NewsfeedService, provide_newsfeed_service
+from utilities.errors import CustomHTTPException
 
 
 class NewsfeedController(litestar.Controller):
@@ -54,15 +56,20 @@ class NewsfeedController(litestar.Controller):
         summary="List Newsfeed Events",
         description=(
             "Return a paginated list of newsfeed events ordered by most recent first. "
-            'Supports an optional type filter via the "type" query parameter and fixed page sizes (10, 20, 25, 50).'
+            'Supports an optional type filter via the "type" query parameter and fixed page sizes (10, 20, 25, 50). '
+            "For deep pages, pass the timestamp and ID of the last event received as before_timestamp and before_id "
+            "to continue after it; page_number is then ignored."
         ),
+        opt={"query_budget": 2},
     )
-    async def get_newsfeed_events(
+    async def get_newsfeed_events(  # noqa: PLR0913
         self,
         newsfeed_service: NewsfeedService,
         page_size: int = 10,
         page_number: int = 1,
         event_type: Annotated[NewsfeedEventType | None, Parameter(query="type")] = None,
+        before_timestamp: dt.datetime | None = None,
+        before_id: int | None = None,
     ) -> list[NewsfeedEvent] | None:
         """List newsfeed events with pagination and optional type filter.
 
@@ -71,11 +78,27 @@ class NewsfeedController(litestar.Controller):
             page_size: Number of rows per page.
             page_number: 1-based page number (default 1).
             event_type: Optional event type filter.
+            before_timestamp: Timestamp of the last event of the previous page.
+            before_id: ID of the last event of the previous page.
 
         Returns:
             Events ordered by recency, or None if no events exist.
+
+        Raises:
+            CustomHTTPException: If only one of before_timestamp and before_id is given.
         """
-        return await newsfeed_service.list_events(limit=page_size, page_number=page_number, type_=event_type)
+        if (before_timestamp is None) != (before_id is None):
+            raise CustomHTTPException(
+                detail="before_timestamp and before_id must be given together.",
+                status_code=HTTP_400_BAD_REQUEST,
+            )
+        before = (before_timestamp, before_id) if before_timestamp is not None and before_id is not None else None
+        return await newsfeed_service.list_events(
+            limit=page_size,
+            page_number=page_number,
+            type_=event_type,
+            before=before,
+        )
 
     @litestar.get(
         path="/{newsfeed_id:int}",
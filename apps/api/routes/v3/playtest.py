@@ -29,6 +29,7 @@ from litestar.status_codes import (
 
 from repository.maps_repository import provide_maps_repository
 from repository.playtest_repository import provide_playtest_repository
+from services.exceptions.maps import MapValidationError, PlaytestPlotNotFoundError
 from services.exceptions.playtest import (
     InvalidPatchError,
     PlaytestNotFoundError,
@@ -106,6 +107,36 @@ class PlaytestController(Controller):
         """
         return await maps_service.get_playtest_plot(thread_id=thread_id)
 
+    @get(
+        "/plots/{digest:str}",
+        summary="Get Playtest Plot Image By Digest",
+        description="Serve a previously rendered playtest plot by its content digest with immutable caching headers.",
+        include_in_schema=False,
+    )
+    async def get_playtest_plot_by_digest_endpoint(
+        self,
+        digest: str,
+        maps_service: MapsService,
+    ) -> Stream:
+        """Get a rendered playtest plot by content digest.
+
+        Args:
+            digest: Plot digest from the ``x-plot-digest`` response header.
+            maps_service: Maps service.
+
+        Returns:
+            Plot image stream.
+
+        Raises:
+            CustomHTTPException: 400 if the digest is malformed, 404 if no plot with it exists.
+        """
+        try:
+            return await maps_service.get_playtest_plot_by_digest(digest)
+        except MapValidationError as e:
+            raise CustomHTTPException(detail=e.message, status_code=HTTP_400_BAD_REQUEST) from e
+        except PlaytestPlotNotFoundError as e:
+            raise CustomHTTPException(detail=e.message, status_code=HTTP_404_NOT_FOUND) from e
+
     @post(
         "/{thread_id:int}/vote/{user_id:int}",
         summary="Cast Playtest Vote",
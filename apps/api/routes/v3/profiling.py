@@ -0,0 +1,52 @@
+"""V3 local profiling routes — latency histograms and slowest-request profiles."""
+
+from __future__ import annotations
+
+from litestar import Controller, delete, get
+from litestar.exceptions import HTTPException
+from litestar.status_codes import HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND
+
+from middleware.profiling import LOCAL_PROFILE, ProfileSnapshotResponse, ProfilingReportResponse
+
+
+class ProfilingController(Controller):
+    """Superuser endpoints over data collected by ``LocalProfilingMiddleware``.
+
+    Nothing is collected unless the API runs with ``LOCAL_PROFILING=1``.
+    """
+
+    path = "/internal/profiling"
+    tags = ["Internal"]
+    include_in_schema = False
+
+    @get(path="/", summary="Get Profiling Report")
+    async def get_report(self) -> ProfilingReportResponse:
+        """Return per-route latency histograms and the slowest profiled requests.
+
+        Returns:
+            ProfilingReportResponse: Everything collected since the last reset.
+        """
+        return LOCAL_PROFILE.report()
+
+    @get(path="/slowest/{index:int}", summary="Get Slowest Request Profile")
+    async def get_slowest(self, index: int) -> ProfileSnapshotResponse:
+        """Return one kept profile, ``0`` being the slowest request.
+
+        Args:
+            index: Position in the slowest-first list.
+
+        Returns:
+            ProfileSnapshotResponse: The profiled request and its report.
+
+        Raises:
+            HTTPException: 404 if there is no profile at that position.
+        """
+        slowest = LOCAL_PROFILE.slowest()
+        if not 0 <= index < len(slowest):
+            raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="No profile at that position.")
+        return slowest[index]
+
+    @delete(path="/", summary="Reset Profiling Data", status_code=HTTP_204_NO_CONTENT)
+    async def reset(self) -> None:
+        """Drop all collected histograms and profiles."""
+        LOCAL_PROFILE.reset()
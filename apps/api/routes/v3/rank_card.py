@@ -56,6 +56,7 @@ class RankCardController(Controller):
         "/",
         summary="Get rank card data",
         description="Return full rank card payload including rank, avatar, badges, map totals, and XP.",
+        opt={"query_budget": 2},
     )
     async def get_rank_card(
         self,
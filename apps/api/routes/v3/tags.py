@@ -7,10 +7,12 @@ from genjishimada_sdk.tags import (
     TagsAutocompleteResponse,
     TagsMutateRequest,
     TagsMutateResponse,
+    TagsMutateResult,
     TagsSearchFilters,
     TagsSearchResponse,
+    TagsUsageIncrementRequest,
 )
-from litestar import Controller, post
+from litestar import Controller, Request, post
 from litestar.di import Provide
 
 from repository.tags_repository import provide_tags_repository
@@ -33,9 +35,23 @@ class TagsController(Controller):
         return await tags_service.search_tags(data)
 
     @post(path="/mutate")
-    async def mutate(self, tags_service: TagsService, data: TagsMutateRequest) -> TagsMutateResponse:
+    async def mutate(
+        self,
+        tags_service: TagsService,
+        data: TagsMutateRequest,
+        request: Request,
+    ) -> TagsMutateResponse:
         """Process a batch of tag mutation operations."""
-        return await tags_service.mutate_tags(data.ops)
+        return await tags_service.mutate_tags(data.ops, headers=request.headers)
+
+    @post(path="/usage")
+    async def increment_usage(
+        self,
+        tags_service: TagsService,
+        data: TagsUsageIncrementRequest,
+    ) -> TagsMutateResult:
+        """Apply a batch of accumulated tag usage counters."""
+        return await tags_service.increment_usage_many(data)
 
     @post(path="/autocomplete")
     async def autocomplete(
@@ -45,6 +45,7 @@ from services.exceptions.tournaments import (
     CycleAlreadyLiveError,
     DebugRouteDisabledError,
     InvalidTimezoneError,
+    LeaderboardEntryNotFoundError,
     MapNotEligibleError,
     NoActiveEditionError,
     NoAwaitingResultsEditionError,
@@ -792,17 +793,53 @@ class TournamentsController(litestar.Controller):
         self,
         tournament_service: TournamentService,
         cycle_id: Annotated[int, Parameter(description="Cycle ID")],
+        limit: Annotated[
+            int | None, Parameter(description="Only return the top N entries", ge=1, required=False)
+        ] = None,
     ) -> list[TournamentLeaderboardEntryResponse]:
         """Get the ranked leaderboard for a tournament cycle.
 
         Args:
             tournament_service: Tournament service.
             cycle_id: Cycle to fetch leaderboard for.
+            limit: Optional number of leading entries to return.
 
         Returns:
             List of ranked leaderboard entries.
         """
-        return await tournament_service.get_leaderboard(cycle_id)
+        return await tournament_service.get_leaderboard(cycle_id, limit=limit)
+
+    @litestar.get(
+        path="/cycles/{cycle_id:int}/leaderboard/{user_id:int}",
+        summary="Get Tournament Leaderboard Entry",
+        opt={"required_scopes": {"tournaments:read"}},
+    )
+    async def get_leaderboard_entry(
+        self,
+        tournament_service: TournamentService,
+        cycle_id: Annotated[int, Parameter(description="Cycle ID")],
+        user_id: Annotated[int, Parameter(description="User ID")],
+    ) -> TournamentLeaderboardEntryResponse:
+        """Get a single user's ranked entry for a tournament cycle.
+
+        Args:
+            tournament_service: Tournament service.
+            cycle_id: Cycle to look up.
+            user_id: User to look up.
+
+        Returns:
+            The user's ranked leaderboard entry.
+
+        Raises:
+            CustomHTTPException: 404 if the user has no run in the cycle.
+        """
+        try:
+            return await tournament_service.get_leaderboard_entry(cycle_id, user_id)
+        except LeaderboardEntryNotFoundError as e:
+            raise CustomHTTPException(
+                status_code=HTTP_404_NOT_FOUND,
+                detail=str(e),
+            ) from e
 
     @litestar.get(
         path="/cycles",
@@ -11,7 +11,9 @@ from genjishimada_sdk.users import (
     OverwatchUsernamesResponse,
     OverwatchUsernamesUpdateRequest,
     RankDetailResponse,
+    RankDetailsBatchRequest,
     UserCreateRequest,
+    UserRankDetailsResponse,
     UserResponse,
     UserUpdateRequest,
 )
@@ -248,6 +250,29 @@ class UsersController(litestar.Controller):
         """
         return await svc.get_user_rank_data(user_id, conn)
 
+    @litestar.post(
+        path="/ranks/batch",
+        summary="Get Rank Details For Users",
+        description=(
+            "Compute rank details for up to 1000 users in one query, as returned by "
+            "`/{user_id}/rank` for each. Results follow request order."
+        ),
+    )
+    async def get_users_rank_data(
+        self, svc: UsersService, data: RankDetailsBatchRequest, conn: Connection
+    ) -> list[UserRankDetailsResponse]:
+        """Get rank details for several users.
+
+        Args:
+            svc: The user service.
+            data: The user IDs to fetch.
+            conn: Database connection.
+
+        Returns:
+            Rank detail rows per user.
+        """
+        return await svc.get_users_rank_data(data.user_ids, conn)
+
     @litestar.post(
         "/fake",
         summary="Create fake member",
@@ -8,7 +8,7 @@ from genjishimada_sdk.logs import LogCreateRequest, MapClickCreateRequest
 from litestar import Controller, get, post
 from litestar.datastructures import UploadFile
 from litestar.di import Provide
-from litestar.enums import RequestEncodingType
+from litestar.enums import MediaType, RequestEncodingType
 from litestar.params import Body
 from litestar.response import Response
 from litestar.status_codes import HTTP_204_NO_CONTENT
@@ -32,28 +32,37 @@ class UtilitiesController(Controller):
         "/image",
         dependencies={"image_svc": Provide(provide_image_storage_service)},
         summary="Upload Image",
-        description="Upload an image or screenshot file to the CDN. The file must be sent as multipart/form-data.",
-        sync_to_thread=False,
+        description=(
+            "Upload an image or screenshot file to the CDN. The file must be sent as multipart/form-data. "
+            "The body is the URL of the original; the `X-Image-Variants` header lists the URLs of its "
+            "resized WebP variants, space-separated."
+        ),
         request_max_body_size=1024 * 1024 * 25,  # 25MB
     )
-    def upload_image(
+    async def upload_image(
         self,
         data: Annotated[UploadFile, Body(media_type=RequestEncodingType.MULTI_PART)],
         image_svc: ImageStorageService,
-    ) -> str:
+    ) -> Response[str]:
         """Upload an image/screenshot to CDN.
 
-        This is a synchronous endpoint that directly uploads to S3.
+        The spooled upload is streamed to storage off the event loop, along with
+        its resized variants.
 
         Args:
             data: Uploaded file received as multipart form-data.
             image_svc: Service responsible for handling CDN uploads.
 
         Returns:
-            The public CDN URL of the uploaded screenshot (200 OK).
+            The public CDN URL of the uploaded screenshot (200 OK), with the
+            variant URLs in the ``X-Image-Variants`` header.
         """
-        content = data.file.read()
-        return image_svc.upload_screenshot(content, data.content_type)
+        stored = await image_svc.put_screenshot(data.file, data.content_type)
+        return Response(
+            stored.url,
+            media_type=MediaType.TEXT,
+            headers={"X-Image-Variants": " ".join(stored.variants)},
+        )
 
     @post(
         "/log",
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import math
+import os
 import re
 import secrets
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 from asyncpg import Pool
 from genjishimada_sdk.auth import (
     AuthUserPublic,
@@ -46,6 +49,13 @@ from repository.exceptions import (
     ForeignKeyViolationError,
     UniqueConstraintViolationError,
 )
+from utilities.password_hashing import (
+    PASSWORD_HASHER,
+    HashingQueueFullError,
+    hash_password_sync,
+    verify_password_sync,
+)
+from utilities.rate_limiting import AUTH_RATE_LIMIT_BACKEND, MEMORY_RATE_LIMITS, RateLimit, RateLimitBackend
 
 from .base import BaseService
 from .exceptions.auth import (
@@ -53,6 +63,7 @@ from .exceptions.auth import (
     EmailAlreadyVerifiedError,
     EmailValidationError,
     InvalidCredentialsError,
+    PasswordHashingBusyError,
     PasswordValidationError,
     RateLimitExceededError,
     TokenAlreadyUsedError,
@@ -67,16 +78,24 @@ log = logging.getLogger(__name__)
 VERIFICATION_TOKEN_EXPIRY_HOURS = 24
 PASSWORD_RESET_TOKEN_EXPIRY_HOURS = 1
 SESSION_LIFETIME_MINUTES = 129600  # 90 days
-BCRYPT_ROUNDS = 12
 REMEMBER_TOKEN_LIFETIME_DAYS = 30
 
 RATE_LIMITS = {
-    "register": (5, 3600),
-    "login": (10, 900),
-    "password_reset": (3, 3600),
-    "verification_resend": (3, 3600),
+    "register": RateLimit(5, 3600),
+    "login": RateLimit(10, 900),
+    "password_reset": RateLimit(3, 3600),
+    "verification_resend": RateLimit(3, 3600),
 }
 
+AUTH_ATTEMPT_LOG_MAX_BUFFER = int(os.getenv("AUTH_ATTEMPT_LOG_MAX_BUFFER", "10000"))
+
+# With more than one API process, a session destroyed (logged out) through one
+# process can still be served from another's cache for up to this many seconds.
+# Set it to 0 when the API runs in several processes and that window matters.
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "5"))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+SESSION_TOUCH_GRANULARITY_SECONDS = float(os.getenv("SESSION_TOUCH_GRANULARITY_SECONDS", "60"))
+
 PASSWORD_MIN_LENGTH = 8
 PASSWORD_REQUIREMENTS = [
     (r"[a-z]", "at least one lowercase letter"),
@@ -105,6 +124,170 @@ FK_CONSTRAINT_MESSAGES = {
 }
 
 
+class _AuthAttemptLog:
+    """Buffer of authentication attempts, appended to the audit log in batches.
+
+    Rate limiting no longer reads the log, so rows are written by a background
+    flush instead of one INSERT per attempt. The buffer is bounded: under a flood
+    the oldest unflushed rows are dropped (and counted) rather than growing memory.
+    """
+
+    def __init__(self, max_buffer: int) -> None:
+        self._rows: deque[tuple[str, str, bool, datetime]] = deque(maxlen=max_buffer)
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append(self, identifier: str, action: str, success: bool) -> None:
+        """Queue one attempt."""
+        if len(self._rows) == self._rows.maxlen:
+            self.dropped += 1
+        self._rows.append((identifier, action, success, datetime.now(timezone.utc)))
+
+    async def flush(self, auth_repo: AuthRepository) -> int:
+        """Write every queued attempt in one statement.
+
+        Rows are put back if the write fails, so the next flush retries them.
+
+        Returns:
+            Number of rows written.
+        """
+        if self.dropped:
+            log.warning("Dropped %d auth attempt log rows; buffer was full.", self.dropped)
+            self.dropped = 0
+        rows = list(self._rows)
+        if not rows:
+            return 0
+        self._rows.clear()
+        try:
+            await auth_repo.insert_attempts(rows)
+        except Exception:
+            self._rows = deque([*rows, *self._rows], maxlen=self._rows.maxlen)
+            raise
+        return len(rows)
+
+    def clear(self) -> None:
+        """Drop every queued attempt."""
+        self._rows.clear()
+        self.dropped = 0
+
+
+# Single process-wide audit buffer shared by every AuthService.
+_ATTEMPT_LOG = _AuthAttemptLog(AUTH_ATTEMPT_LOG_MAX_BUFFER)
+
+
+async def flush_auth_attempt_log(state: State) -> int:
+    """Write queued auth attempts; called periodically from the app lifespan."""
+    return await _ATTEMPT_LOG.flush(AuthRepository(state.db_pool))
+
+
+class _SessionCache:
+    """Short-lived cache of session reads, plus coalesced last-activity touches.
+
+    The website reads its session on every request. Reads are served from here
+    for ``ttl`` seconds, and instead of rewriting ``last_activity`` each time, a
+    session is queued for a touch at most once per ``touch_granularity``. Queued
+    touches are applied in one batch by :func:`flush_session_touches`.
+
+    Writes and deletes through this process invalidate the entry; other API
+    processes may serve a payload up to ``ttl`` seconds stale, including a
+    session that has already been destroyed, so set
+    ``SESSION_CACHE_TTL_SECONDS=0`` when requests are not pinned to one process.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, touch_granularity: float) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.touch_granularity = touch_granularity
+        self._entries: OrderedDict[str, tuple[float, str, bool]] = OrderedDict()
+        self._touched: dict[str, float] = {}
+        self._pending: dict[str, datetime] = {}
+
+    def get(self, session_id: str) -> tuple[str, bool] | None:
+        """Return the cached ``(payload, is_mod)`` for a session, if still fresh."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        expires_at, payload, is_mod = entry
+        if expires_at <= time.monotonic():
+            del self._entries[session_id]
+            return None
+        return payload, is_mod
+
+    def put(self, session_id: str, payload: str, is_mod: bool) -> None:
+        """Cache a session read, evicting the oldest entry when full."""
+        if self.ttl <= 0:
+            return
+        self._entries[session_id] = (time.monotonic() + self.ttl, payload, is_mod)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def touch(self, session_id: str) -> None:
+        """Queue a last-activity refresh unless one was queued recently."""
+        now = time.monotonic()
+        last = self._touched.get(session_id)
+        if last is not None and now - last < self.touch_granularity:
+            return
+        self._touched[session_id] = now
+        self._pending[session_id] = datetime.now(timezone.utc)
+
+    def written(self, session_id: str) -> None:
+        """Forget a session's cached payload after it was written here.
+
+        The write itself refreshed ``last_activity``, so no touch is needed yet.
+        """
+        self._entries.pop(session_id, None)
+        self._pending.pop(session_id, None)
+        self._touched[session_id] = time.monotonic()
+
+    def invalidate(self, session_id: str) -> None:
+        """Forget everything about a deleted session."""
+        self._entries.pop(session_id, None)
+        self._pending.pop(session_id, None)
+        self._touched.pop(session_id, None)
+
+    async def flush(self, auth_repo: AuthRepository) -> int:
+        """Apply every queued touch in one statement.
+
+        Touches are put back if the write fails, so the next flush retries them.
+
+        Returns:
+            Number of sessions updated.
+        """
+        now = time.monotonic()
+        self._touched = {k: t for k, t in self._touched.items() if now - t < self.touch_granularity}
+        pending = self._pending
+        if not pending:
+            return 0
+        self._pending = {}
+        try:
+            return await auth_repo.touch_sessions(list(pending.items()), self.touch_granularity)
+        except Exception:
+            self._pending = {**pending, **self._pending}
+            raise
+
+    def forget_payloads(self) -> None:
+        """Drop every cached payload, keeping queued touches."""
+        self._entries.clear()
+
+    def clear(self) -> None:
+        """Drop every cached session and queued touch."""
+        self._entries.clear()
+        self._touched.clear()
+        self._pending.clear()
+
+
+# Single process-wide session cache shared by every AuthService.
+_SESSION_CACHE = _SessionCache(SESSION_CACHE_TTL_SECONDS, SESSION_CACHE_MAX_ENTRIES, SESSION_TOUCH_GRANULARITY_SECONDS)
+
+
+async def flush_session_touches(state: State) -> int:
+    """Apply queued session touches; called periodically from the app lifespan."""
+    return await _SESSION_CACHE.flush(AuthRepository(state.db_pool))
+
+
 class AuthService(BaseService):
     """Service for authentication business logic."""
 
@@ -118,6 +301,7 @@ class AuthService(BaseService):
         """
         super().__init__(pool, state)
         self._auth_repo = auth_repo
+        self._rate_limits: RateLimitBackend = auth_repo if AUTH_RATE_LIMIT_BACKEND == "postgres" else MEMORY_RATE_LIMITS
 
     @staticmethod
     def validate_email(email: str) -> None:
@@ -182,19 +366,22 @@ class AuthService(BaseService):
     def hash_password(password: str) -> str:
         """Hash a password using bcrypt.
 
+        Blocks for the full bcrypt cost; request paths use :meth:`hash_password_async`.
+
         Args:
             password: Plaintext password.
 
         Returns:
             Bcrypt hash string.
         """
-        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        return hash_password_sync(password)
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         """Verify a password against its hash.
 
+        Blocks for the full bcrypt cost; request paths use :meth:`verify_password_async`.
+
         Args:
             password: Plaintext password to verify.
             password_hash: Stored bcrypt hash.
@@ -202,7 +389,44 @@ class AuthService(BaseService):
         Returns:
             True if password matches, False otherwise.
         """
-        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+        return verify_password_sync(password, password_hash)
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password on the shared hashing pool.
+
+        Args:
+            password: Plaintext password.
+
+        Returns:
+            Bcrypt hash string.
+
+        Raises:
+            PasswordHashingBusyError: If the hashing queue is full.
+        """
+        try:
+            return await PASSWORD_HASHER.hash(password)
+        except HashingQueueFullError as e:
+            raise PasswordHashingBusyError(e.retry_after) from e
+
+    @staticmethod
+    async def verify_password_async(password: str, password_hash: str) -> bool:
+        """Verify a password against its hash on the shared hashing pool.
+
+        Args:
+            password: Plaintext password to verify.
+            password_hash: Stored bcrypt hash.
+
+        Returns:
+            True if password matches, False otherwise.
+
+        Raises:
+            PasswordHashingBusyError: If the hashing queue is full.
+        """
+        try:
+            return await PASSWORD_HASHER.verify(password, password_hash)
+        except HashingQueueFullError as e:
+            raise PasswordHashingBusyError(e.retry_after) from e
 
     @staticmethod
     def generate_token() -> tuple[str, str]:
@@ -237,27 +461,45 @@ class AuthService(BaseService):
         Raises:
             RateLimitExceededError: If rate limit exceeded.
         """
-        if action not in RATE_LIMITS:
+        limit = RATE_LIMITS.get(action)
+        if limit is None:
             return
 
-        max_attempts, window_seconds = RATE_LIMITS[action]
-        window_start = datetime.now(timezone.utc) - timedelta(seconds=window_seconds)
+        backlog = await self._rate_limits.rate_limit_backlog(identifier, action)
+        retry_after = limit.retry_after(backlog)
+        if retry_after > 0:
+            raise RateLimitExceededError(action, retry_after=math.ceil(retry_after))
+
+    async def record_attempt(
+        self,
+        identifier: str,
+        action: str,
+        *,
+        success: bool,
+    ) -> None:
+        """Count an attempt against the identifier's rate limit and queue it for the audit log.
 
-        count = await self._auth_repo.fetch_rate_limit_count(identifier, action, window_start)
+        The client IP is deliberately not counted: behind the website proxy every
+        user shares one address, so an IP bucket would throttle the whole site.
 
-        if count >= max_attempts:
-            raise RateLimitExceededError(action)
+        Args:
+            identifier: Email the attempt was made for.
+            action: The action being performed.
+            success: Whether the attempt succeeded.
+        """
+        limit = RATE_LIMITS.get(action)
+        if limit is not None:
+            await self._rate_limits.rate_limit_hit(identifier, action, limit.emission_interval)
+        _ATTEMPT_LOG.append(identifier, action, success)
 
     async def register(
         self,
         data: EmailRegisterRequest,
-        client_ip: str | None = None,
     ) -> tuple[RegisterResponse, VerificationEmailEvent]:
         """Register a new email-based user.
 
         Args:
             data: Registration payload.
-            client_ip: Client IP for rate limiting.
 
         Returns:
             Tuple of (RegisterResponse, VerificationEmailEvent).
@@ -268,22 +510,21 @@ class AuthService(BaseService):
             UsernameValidationError: If username is invalid.
             EmailAlreadyExistsError: If email is already registered.
             RateLimitExceededError: If rate limit exceeded.
+            PasswordHashingBusyError: If the hashing queue is full.
         """
         identifier = data.email.lower()
 
         await self.check_rate_limit(identifier, "register")
-        if client_ip:
-            await self.check_rate_limit(client_ip, "register")
 
         self.validate_email(data.email)
         self.validate_password(data.password)
         self.validate_username(data.username)
 
         if await self._auth_repo.check_email_exists(data.email):
-            await self._auth_repo.record_attempt(identifier, "register", success=False)
+            await self.record_attempt(identifier, "register", success=False)
             raise EmailAlreadyExistsError(data.email)
 
-        password_hash = self.hash_password(data.password)
+        password_hash = await self.hash_password_async(data.password)
         token, token_hash = self.generate_token()
         expires_at = datetime.now(timezone.utc) + timedelta(hours=VERIFICATION_TOKEN_EXPIRY_HOURS)
 
@@ -300,7 +541,7 @@ class AuthService(BaseService):
                 log.error(f"Foreign key violation during registration: {e.constraint_name}")
                 raise EmailAlreadyExistsError(data.email) from e
 
-        await self._auth_repo.record_attempt(identifier, "register", success=True)
+        await self.record_attempt(identifier, "register", success=True)
 
         return (
             RegisterResponse(
@@ -318,13 +559,11 @@ class AuthService(BaseService):
     async def login(
         self,
         data: EmailLoginRequest,
-        client_ip: str | None = None,
     ) -> LoginResponse:
         """Authenticate user with email and password.
 
         Args:
             data: Login payload.
-            client_ip: Client IP for rate limiting.
 
         Returns:
             LoginResponse with user data.
@@ -332,23 +571,22 @@ class AuthService(BaseService):
         Raises:
             InvalidCredentialsError: If credentials are invalid.
             RateLimitExceededError: If rate limit exceeded.
+            PasswordHashingBusyError: If the hashing queue is full.
         """
         identifier = data.email.lower()
 
         await self.check_rate_limit(identifier, "login")
-        if client_ip:
-            await self.check_rate_limit(client_ip, "login")
 
         user_data = await self._auth_repo.get_user_by_email(data.email)
         if not user_data:
-            await self._auth_repo.record_attempt(identifier, "login", success=False)
+            await self.record_attempt(identifier, "login", success=False)
             raise InvalidCredentialsError(identifier)
 
-        if not self.verify_password(data.password, user_data["password_hash"]):
-            await self._auth_repo.record_attempt(identifier, "login", success=False)
+        if not await self.verify_password_async(data.password, user_data["password_hash"]):
+            await self.record_attempt(identifier, "login", success=False)
             raise InvalidCredentialsError(identifier)
 
-        await self._auth_repo.record_attempt(identifier, "login", success=True)
+        await self.record_attempt(identifier, "login", success=True)
 
         return LoginResponse(
             user=AuthUserResponse(
@@ -407,14 +645,11 @@ class AuthService(BaseService):
             ),
         )
 
-    async def resend_verification(
-        self, email: str, client_ip: str | None = None
-    ) -> tuple[ResendVerificationResponse, VerificationEmailEvent]:
+    async def resend_verification(self, email: str) -> tuple[ResendVerificationResponse, VerificationEmailEvent]:
         """Resend email verification token.
 
         Args:
             email: User's email address.
-            client_ip: Client IP for rate limiting.
 
         Returns:
             Tuple of (ResendVerificationResponse, VerificationEmailEvent).
@@ -427,8 +662,6 @@ class AuthService(BaseService):
         identifier = email.lower()
 
         await self.check_rate_limit(identifier, "verification_resend")
-        if client_ip:
-            await self.check_rate_limit(client_ip, "verification_resend")
 
         user_data = await self._auth_repo.get_user_by_email(email)
         if not user_data:
@@ -450,7 +683,7 @@ class AuthService(BaseService):
                 conn=conn,  # type: ignore[arg-type]
             )
 
-        await self._auth_repo.record_attempt(identifier, "verification_resend", success=True)
+        await self.record_attempt(identifier, "verification_resend", success=True)
 
         return (
             ResendVerificationResponse(
@@ -460,13 +693,12 @@ class AuthService(BaseService):
         )
 
     async def request_password_reset(
-        self, data: PasswordResetRequest, client_ip: str | None = None
+        self, data: PasswordResetRequest
     ) -> tuple[PasswordResetRequestResponse, PasswordResetEmailEvent | None]:
         """Request a password reset token.
 
         Args:
             data: Password reset request with email.
-            client_ip: Client IP for rate limiting.
 
         Returns:
             Tuple of (PasswordResetRequestResponse, PasswordResetEmailEvent | None).
@@ -477,12 +709,10 @@ class AuthService(BaseService):
         identifier = data.email.lower()
 
         await self.check_rate_limit(identifier, "password_reset")
-        if client_ip:
-            await self.check_rate_limit(client_ip, "password_reset")
 
         user_data = await self._auth_repo.get_user_by_email(data.email)
         if not user_data:
-            await self._auth_repo.record_attempt(identifier, "password_reset", success=False)
+            await self.record_attempt(identifier, "password_reset", success=False)
             return (
                 PasswordResetRequestResponse(
                     message="If an account with that email exists, a password reset link has been sent."
@@ -503,7 +733,7 @@ class AuthService(BaseService):
                 conn=conn,  # type: ignore[arg-type]
             )
 
-        await self._auth_repo.record_attempt(identifier, "password_reset", success=True)
+        await self.record_attempt(identifier, "password_reset", success=True)
 
         return (
             PasswordResetRequestResponse(
@@ -530,6 +760,7 @@ class AuthService(BaseService):
             TokenExpiredError: If token has expired.
             TokenAlreadyUsedError: If token has already been used.
             PasswordValidationError: If new password doesn't meet requirements.
+            PasswordHashingBusyError: If the hashing queue is full.
         """
         self.validate_password(data.password)
 
@@ -545,7 +776,7 @@ class AuthService(BaseService):
         if token_data["expires_at"] < datetime.now(timezone.utc):
             raise TokenExpiredError("password_reset")
 
-        password_hash = self.hash_password(data.password)
+        password_hash = await self.hash_password_async(data.password)
 
         async with self._pool.acquire() as conn, conn.transaction():
             await self._auth_repo.mark_token_used(token_hash, conn=conn)  # type: ignore[arg-type]
@@ -573,10 +804,16 @@ class AuthService(BaseService):
         Returns:
             SessionReadResponse with payload and is_mod flag.
         """
-        payload = await self._auth_repo.read_session(session_id, SESSION_LIFETIME_MINUTES)
-        is_mod = False
-        if payload:
+        cached = _SESSION_CACHE.get(session_id)
+        if cached is not None:
+            payload, is_mod = cached
+        else:
+            payload = await self._auth_repo.read_session(session_id, SESSION_LIFETIME_MINUTES)
+            if not payload:
+                return SessionReadResponse(payload=payload, is_mod=False)
             is_mod = await self._auth_repo.check_is_mod(session_id)
+            _SESSION_CACHE.put(session_id, payload, is_mod)
+        _SESSION_CACHE.touch(session_id)
         return SessionReadResponse(payload=payload, is_mod=is_mod)
 
     async def session_write(
@@ -597,6 +834,7 @@ class AuthService(BaseService):
             user_agent: Client user agent.
         """
         await self._auth_repo.write_session(session_id, payload, user_id, ip_address, user_agent)
+        _SESSION_CACHE.written(session_id)
         return SessionWriteResponse(success=True)
 
     async def session_destroy(self, session_id: str) -> SessionDestroyResponse:
@@ -609,16 +847,21 @@ class AuthService(BaseService):
             SessionDestroyResponse indicating whether session was deleted.
         """
         deleted = await self._auth_repo.delete_session(session_id)
+        _SESSION_CACHE.invalidate(session_id)
         return SessionDestroyResponse(deleted=deleted)
 
     async def session_gc(self) -> SessionGcResponse:
         """Garbage collect expired sessions.
 
+        Whole months past the lifetime are dropped as partitions; only the month
+        straddling the cutoff is deleted row by row.
+
         Returns:
             SessionGcResponse with number of sessions deleted.
         """
-        count = await self._auth_repo.delete_expired_sessions(SESSION_LIFETIME_MINUTES)
-        return SessionGcResponse(deleted_count=count)
+        dropped = await self._auth_repo.drop_expired_session_partitions(SESSION_LIFETIME_MINUTES)
+        deleted = await self._auth_repo.delete_expired_sessions(SESSION_LIFETIME_MINUTES)
+        return SessionGcResponse(deleted_count=dropped + deleted)
 
     async def session_get_user_sessions(self, user_id: int) -> UserSessionsResponse:
         """Get all active sessions for a user.
@@ -646,6 +889,9 @@ class AuthService(BaseService):
             Number of sessions destroyed.
         """
         count = await self._auth_repo.delete_user_sessions(user_id, except_session_id)
+        # Cache entries are keyed by session ID, not user; this is rare enough to
+        # simply drop them all.
+        _SESSION_CACHE.forget_payloads()
         return DestroyUserSessionsResponse(destroyed_count=count)
 
     async def create_remember_token(
@@ -741,7 +987,9 @@ class AuthService(BaseService):
         Returns:
             Number of sessions deleted.
         """
-        return await self._auth_repo.delete_user_sessions(user_id, except_session_id)
+        count = await self._auth_repo.delete_user_sessions(user_id, except_session_id)
+        _SESSION_CACHE.forget_payloads()
+        return count
 
     async def revoke_all_remember_tokens(self, user_id: int) -> int:
         """Revoke all remember tokens for a user.
@@ -32,7 +32,10 @@ IGNORE_IDEMPOTENCY = {
     "api.playtest.vote.cast",
     "api.playtest.vote.remove",
     "api.xp.grant",
+    "api.xp.grant.batch",
     "api.completion.autoverification.failed",
+    "api.tournament.leaderboard.delta",
+    "api.tags.mutated",
 }
 
 
@@ -7,7 +7,6 @@ from collections.abc import Awaitable, Callable
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, cast
 
-import aiohttp
 import msgspec
 import sentry_sdk
 from asyncpg import Connection, Pool
@@ -34,6 +33,7 @@ from genjishimada_sdk.completions import (
     UpvoteUpdateEvent,
     VerificationChangedEvent,
     VerificationMessageDeleteEvent,
+    WorldRecordDriftResponse,
 )
 from genjishimada_sdk.difficulties import DifficultyTop, convert_extended_difficulty_to_top_level
 from genjishimada_sdk.internal import JobStatusResponse
@@ -73,7 +73,9 @@ from services.exceptions.completions import (
 
 from .base import BaseService
 from .lootbox_service import LootboxService
+from .rank_card_service import invalidate_rank_cards
 from .store_service import StoreService
+from .tournament_leaderboard_service import TournamentLeaderboardService
 from .tournament_reward_service import TournamentRewardService, provide_tournament_reward_service
 from .tournament_service import TournamentService
 from .users_service import UsersService
@@ -337,6 +339,8 @@ class CompletionsService(BaseService):
         """
         idempotency_key = f"completion:submission:{user_id}:{completion_id}"
 
+        import aiohttp  # noqa: PLC0415  # deferred heavy import
+
         try:
             hostname = "genjishimada-ocr" if os.getenv("APP_ENVIRONMENT") == "production" else "genjishimada-ocr-dev"
             user_name_response = await users.fetch_all_user_names(user_id)
@@ -486,6 +490,8 @@ class CompletionsService(BaseService):
         # fallback below and double-surface the run (auto-verified in the DB AND
         # queued for manual review).
         ocr_matched = False
+        import aiohttp  # noqa: PLC0415  # deferred heavy import
+
         try:
             hostname = "genjishimada-ocr" if os.getenv("APP_ENVIRONMENT") == "production" else "genjishimada-ocr-dev"
             user_name_response = await users.fetch_all_user_names(user_id)
@@ -640,7 +646,7 @@ class CompletionsService(BaseService):
         )
         await tournament_service.verify_tournament_completion(tournament_completion_id)
 
-    async def submit_completion(  # noqa: PLR0912
+    async def submit_completion(  # noqa: PLR0912, PLR0915
         self, data: CompletionCreateRequest, request: Request, notifications: NotificationsService, users: UsersService
     ) -> CompletionSubmissionJobResponse:
         """Submit a new completion record and publish an event.
@@ -665,6 +671,7 @@ class CompletionsService(BaseService):
             raise MapNotFoundError(data.code)
 
         completion_id: int | None = None
+        tournament_completion_id: int | None = None
         non_pb_tournament: tuple[int, dict] | None = None
         async with self._pool.acquire() as raw_conn, raw_conn.transaction():
             conn = cast("Connection", raw_conn)
@@ -728,6 +735,10 @@ class CompletionsService(BaseService):
                         completion_id, tournament_completion_id, conn=conn
                     )
 
+        # Transaction committed: patch the live cycle leaderboard with the new run.
+        if active_cycle is not None and (non_pb_tournament is not None or tournament_completion_id is not None):
+            await self._refresh_live_leaderboard(active_cycle["id"], data.user_id)
+
         if verification_id_to_delete:
             delete_event = VerificationMessageDeleteEvent(verification_id_to_delete)
             await self.publish_message(
@@ -803,6 +814,19 @@ class CompletionsService(BaseService):
             return None
         return await self._tournament_repo.get_active_cycle_by_map_id(map_meta["map_id"], conn=conn)
 
+    async def _refresh_live_leaderboard(self, cycle_id: int, user_id: int) -> None:
+        """Patch the live tournament leaderboard after a committed tournament write.
+
+        Args:
+            cycle_id: Cycle the write touched.
+            user_id: User whose run changed.
+        """
+        if self._tournament_repo is None:
+            return
+        await TournamentLeaderboardService(self._pool, self._state, self._tournament_repo).refresh_user(
+            cycle_id, user_id
+        )
+
     async def _record_tournament_completion(
         self,
         active_cycle: dict,
@@ -978,6 +1002,11 @@ class CompletionsService(BaseService):
             raise CompletionNotFoundError(record_id)
         return msgspec.convert(row, CompletionSubmissionResponse)
 
+    async def get_completion_submissions(self, record_ids: list[int]) -> list[CompletionSubmissionResponse]:
+        """Retrieve detailed submission info for several completions; unknown IDs are skipped."""
+        rows = await self._completions_repo.fetch_completion_submissions(record_ids)
+        return msgspec.convert(rows, list[CompletionSubmissionResponse])
+
     async def get_pending_verifications(self) -> list[PendingVerificationResponse]:
         """Retrieve completions awaiting verification."""
         rows = await self._completions_repo.fetch_pending_verifications()
@@ -1079,6 +1108,7 @@ class CompletionsService(BaseService):
             raise DuplicateVerificationError(record_id)
         except ForeignKeyViolationError:
             raise CompletionNotFoundError(record_id)
+        invalidate_rank_cards(completion_info["user_id"])
 
         if data.verified and not completion_info["old_verified"]:
             await self._update_quest_progress_for_completion(
@@ -1241,6 +1271,8 @@ class CompletionsService(BaseService):
         if verified and self._tournament_reward_service is not None and pending_events:
             await self._tournament_reward_service.publish_xp_events(pending_events)
 
+        await self._refresh_live_leaderboard(active_cycle["id"], completion_info["user_id"])
+
         event = TournamentVerificationChangedEvent(
             tournament_completion_id=tournament_completion_id,
             cycle_id=active_cycle["id"],
@@ -1289,6 +1321,29 @@ class CompletionsService(BaseService):
         rows = await self._completions_repo.fetch_world_records_per_user(user_id, archived=archived)
         return msgspec.convert(rows, list[CompletionResponse])
 
+    async def reconcile_world_records(self, *, repair: bool = True) -> list[WorldRecordDriftResponse]:
+        """Compare stored world records with a full recompute and optionally repair them.
+
+        Triggers keep ``maps.world_records`` current, so drift means a write
+        bypassed them (e.g. triggers disabled during a bulk load).
+
+        Args:
+            repair: Refresh the drifted maps in the same transaction.
+
+        Returns:
+            The maps that drifted.
+        """
+        async with self._pool.acquire() as conn, conn.transaction():
+            rows = await self._completions_repo.fetch_world_record_drift(conn=conn)  # type: ignore[arg-type]
+            if rows:
+                log.warning("World records drifted on %d maps: %s", len(rows), [r["map_id"] for r in rows])
+                if repair:
+                    await self._completions_repo.refresh_world_records(
+                        [r["map_id"] for r in rows],
+                        conn=conn,  # type: ignore[arg-type]
+                    )
+        return msgspec.convert(rows, list[WorldRecordDriftResponse])
+
     async def get_legacy_completions_per_map(
         self,
         code: OverwatchCode,
@@ -1544,6 +1599,7 @@ class CompletionsService(BaseService):
                 unique_error=DuplicateCompletionError(user_id, map_code),
                 fk_error=CompletionNotFoundError(completion_id),
             )
+            invalidate_rank_cards(user_id)
             notification_messages.append(
                 f"Your completion time on **{map_code}** was changed from **{old_time}s** to **{new_time}s**.\n"
                 f"Reason: {data.time_change_reason}"
@@ -1556,6 +1612,7 @@ class CompletionsService(BaseService):
                 unique_error=DuplicateCompletionError(user_id, map_code),
                 fk_error=CompletionNotFoundError(completion_id),
             )
+            invalidate_rank_cards(user_id)
 
             if verified != old_verified:
                 # Verified flag flipped -> changes the verified = TRUE eligibility
@@ -63,6 +63,7 @@ from .maps import (
     MapValidationError,
     MasteryUpdateFailedError,
     PendingEditRequestExistsError,
+    PlaytestPlotNotFoundError,
 )
 from .playtest import (
     InvalidPatchError,
@@ -166,6 +167,7 @@ __all__ = [
     "PendingEditRequestExistsError",
     "PlaytestError",
     "PlaytestNotFoundError",
+    "PlaytestPlotNotFoundError",
     "PlaytestStateError",
     "RateLimitExceededError",
     "RotationExpiredError",
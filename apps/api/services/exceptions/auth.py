@@ -98,3 +98,13 @@ class UserNotFoundError(AuthError):
 
     def __init__(self, identifier: str | int) -> None:
         super().__init__("No account found with this email.", identifier=identifier)
+
+
+class PasswordHashingBusyError(AuthError):
+    """Too many password hashing operations are already in flight."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(
+            "The server is busy. Please try again shortly.",
+            retry_after=retry_after,
+        )
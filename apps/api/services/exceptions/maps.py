@@ -43,6 +43,16 @@ class MapNotFoundError(MapsError):
         )
 
 
+class PlaytestPlotNotFoundError(MapsError):
+    """No rendered playtest plot with this digest."""
+
+    def __init__(self, digest: str) -> None:
+        super().__init__(
+            f"No plot found with digest: {digest}",
+            digest=digest,
+        )
+
+
 class DuplicateMechanicError(MapsError):
     """Duplicate mechanic in request."""
 
@@ -199,6 +199,13 @@ class TournamentCompletionNotFoundError(TournamentsError):
         )
 
 
+class LeaderboardEntryNotFoundError(TournamentsError):
+    """User has no run on the cycle leaderboard."""
+
+    def __init__(self, cycle_id: int, user_id: int) -> None:
+        super().__init__("User has no run on this cycle's leaderboard.", cycle_id=cycle_id, user_id=user_id)
+
+
 class AlreadyVerifiedError(TournamentsError):
     """A verified tournament completion cannot be rejected after the fact.
 
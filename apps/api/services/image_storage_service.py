@@ -1,12 +1,44 @@
+"""S3-compatible image storage.
+
+Building a boto3 client loads botocore's service metadata and takes tens of
+milliseconds, so one client is built per process (:data:`OBJECT_STORAGE`) and
+shared by every :class:`ImageStorageService`. boto3 clients are thread-safe; its
+blocking calls run on a bounded thread pool of ``STORAGE_WORKERS`` threads, and
+the ``put_*``/``get_*`` coroutines are what async handlers await.
+
+Uploads stream from a file object. Objects larger than ``STORAGE_MULTIPART_CHUNK_MB``
+go up as multipart uploads in chunks of that size, so a spooled request body is
+never copied into memory whole.
+
+Screenshots and banners also get resized WebP variants (see
+:mod:`utilities.image_variants`), stored next to the original under the same key
+with a ``_w{width}.{format}`` suffix. The original is stored untouched; variants
+are best effort and never fail an upload. An uploaded file is copied in chunks to
+a temporary path for the renderer, which decodes it from disk.
+"""
+
+from __future__ import annotations
+
+import asyncio
 import datetime as dt
 import hashlib
 import io
 import logging
 import os
 import re
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import IO, Any, TypeVar
+
+import msgspec
 
-import boto3
-from botocore.config import Config
+from utilities.image_variants import IMAGE_VARIANTS, ImageVariantRenderer, variant_content_type
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +47,13 @@ S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "genji-parkour-images")
 S3_PUBLIC_URL = os.getenv("S3_PUBLIC_URL", "https://cdn.genji.pk")
 
+STORAGE_WORKERS = int(os.getenv("STORAGE_WORKERS", "8"))
+STORAGE_MULTIPART_CHUNK_MB = int(os.getenv("STORAGE_MULTIPART_CHUNK_MB", "8"))
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
 
 _content_type_ext = {
     "image/jpeg": "jpg",
@@ -30,17 +69,212 @@ def _ext_from_content_type(ct: str) -> str:
     return _content_type_ext.get(ct.lower(), "bin")
 
 
-class ImageStorageService:
+def _build_client() -> Any:  # noqa: ANN401
+    """Build an S3 client for the configured endpoint.
+
+    boto3/botocore are imported here rather than at module scope; they are
+    the slowest imports in the API and only needed once a client is built.
+    """
+    import boto3  # noqa: PLC0415  # deferred heavy import
+    from botocore.config import Config  # noqa: PLC0415  # deferred heavy import
+
+    endpoint_url = S3_ENDPOINT_URL or f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com"
+
+    return boto3.client(
+        service_name="s3",
+        endpoint_url=endpoint_url,
+        region_name="auto",
+        config=Config(s3={"addressing_style": "path"}, max_pool_connections=max(STORAGE_WORKERS, 10)),
+    )
+
+
+def _transfer_config() -> Any:  # noqa: ANN401
+    from boto3.s3.transfer import TransferConfig  # noqa: PLC0415  # deferred heavy import
+
+    chunk = STORAGE_MULTIPART_CHUNK_MB * 1024 * 1024
+    # Parts go up sequentially on the calling pool thread; concurrency comes from
+    # the pool, which bounds how many uploads (and connections) run at once.
+    return TransferConfig(multipart_threshold=chunk, multipart_chunksize=chunk, use_threads=False)
+
+
+def _hash_fileobj(fileobj: IO[bytes]) -> tuple[str, int]:
+    """Return the blake2b digest and size of a seekable file, rewinding it afterwards."""
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    fileobj.seek(0)
+    while chunk := fileobj.read(_HASH_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
+
+
+def _spool_to_disk(fileobj: IO[bytes]) -> tuple[str, int]:
+    """Copy a seekable file to a named temporary file, rewinding it afterwards.
+
+    Returns:
+        The copy's path, which the caller deletes, and its size in bytes.
+    """
+    fileobj.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="image-variant-", delete=False) as copy:
+        shutil.copyfileobj(fileobj, copy, _HASH_CHUNK_SIZE)
+        size = copy.tell()
+    fileobj.seek(0)
+    return copy.name, size
+
+
+@asynccontextmanager
+async def _render_source(content: bytes | IO[bytes]) -> AsyncIterator[tuple[bytes | str, int]]:
+    """Yield what the variant renderer should read ``content`` from, and its size.
+
+    A file is passed by the path of a temporary copy, deleted on exit, so the
+    upload is neither read into memory whole nor pickled to a worker process.
+    """
+    if isinstance(content, bytes):
+        yield content, len(content)
+        return
+    path, size = await asyncio.to_thread(_spool_to_disk, content)
+    try:
+        yield path, size
+    finally:
+        os.unlink(path)
+
+
+class StoredImage(msgspec.Struct, frozen=True):
+    """Public URLs of an uploaded image and of the resized variants stored with it."""
+
+    url: str
+    variants: list[str] = msgspec.field(default_factory=list)
+
+
+class _OperationStats:
+    __slots__ = ("bytes", "count", "errors", "max_ms", "total_ms")
+
     def __init__(self) -> None:
-        """Initialize the ImageStorageService."""
-        endpoint_url = S3_ENDPOINT_URL or f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com"
-
-        self.client = boto3.client(
-            service_name="s3",
-            endpoint_url=endpoint_url,
-            region_name="auto",
-            config=Config(s3={"addressing_style": "path"}),
-        )
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class ObjectStorage:
+    """Process-wide S3 client and the bounded thread pool its blocking calls run on."""
+
+    def __init__(self, workers: int) -> None:
+        """Initialize the storage; the client and pool are built lazily.
+
+        Args:
+            workers: Maximum storage calls running at once.
+        """
+        self.workers = workers
+        self._client: Any = None
+        self._transfer_config: Any = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._stats: dict[str, _OperationStats] = {}
+
+    @property
+    def client(self) -> Any:  # noqa: ANN401
+        """The shared boto3 S3 client, built on first use."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = _build_client()
+        return self._client
+
+    @property
+    def transfer_config(self) -> Any:  # noqa: ANN401
+        """Multipart settings for ``upload_fileobj``."""
+        if self._transfer_config is None:
+            self._transfer_config = _transfer_config()
+        return self._transfer_config
+
+    def start(self) -> None:
+        """Build the client and thread pool, so the first upload does not pay for it."""
+        _ = self.client
+        _ = self.executor
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool storage calls run on, started on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="object-storage")
+        return self._executor
+
+    def close(self) -> None:
+        """Wait for running calls, then shut the thread pool down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, operation: str, fn: Callable[..., T], *args: Any, size: int = 0) -> T:  # noqa: ANN401
+        """Run a blocking storage call on the pool and record its latency.
+
+        Args:
+            operation: Label the call is counted under in :meth:`stats`.
+            fn: The blocking call.
+            *args: Arguments for ``fn``.
+            size: Bytes moved by the call, for throughput.
+
+        Returns:
+            Whatever ``fn`` returns.
+        """
+        stats = self._stats.get(operation)
+        if stats is None:
+            stats = self._stats[operation] = _OperationStats()
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, partial(fn, *args))
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats.count += 1
+            stats.bytes += size
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Return call counts, latency and throughput per operation."""
+        return {
+            operation: {
+                "count": s.count,
+                "errors": s.errors,
+                "bytes": s.bytes,
+                "mean_ms": s.total_ms / s.count if s.count else 0.0,
+                "max_ms": s.max_ms,
+                "mib_per_s": s.bytes / 1024 / 1024 / (s.total_ms / 1000) if s.total_ms else 0.0,
+            }
+            for operation, s in self._stats.items()
+        }
+
+
+# Single process-wide storage client shared by every ImageStorageService.
+OBJECT_STORAGE = ObjectStorage(STORAGE_WORKERS)
+
+
+class ImageStorageService:
+    def __init__(
+        self,
+        client: Any = None,  # noqa: ANN401
+        storage: ObjectStorage | None = None,
+        variants: ImageVariantRenderer | None = None,
+    ) -> None:
+        """Initialize the ImageStorageService.
+
+        Args:
+            client: S3 client to use. Defaults to ``storage``'s shared client when
+                ``storage`` is given, otherwise a new client is built.
+            storage: Pool the ``put_*``/``get_*`` coroutines run on.
+            variants: Renderer for the resized variants of uploaded images.
+        """
+        if client is None:
+            client = storage.client if storage is not None else _build_client()
+        self.client = client
+        self._storage = storage or OBJECT_STORAGE
+        self._variants = variants or IMAGE_VARIANTS
 
     def upload_screenshot(self, image: bytes, content_type: str) -> str:
         """Upload image to S3-compatible stroage.
@@ -49,12 +283,26 @@ class ImageStorageService:
             image (bytes): THe image in bytes form.
             content_type (str): The content type of the image.
         """
-        digest = hashlib.blake2b(image, digest_size=16).hexdigest()
+        return self.upload_screenshot_file(io.BytesIO(image), content_type)
+
+    def upload_screenshot_file(self, fileobj: IO[bytes], content_type: str) -> str:
+        """Upload a screenshot from a seekable file, keyed by its content digest.
+
+        The file is hashed in chunks and then streamed to storage, multipart when
+        it is large, so it is never read into memory whole.
+
+        Args:
+            fileobj: The image file, positioned anywhere; it is rewound.
+            content_type: The content type of the image.
+
+        Returns:
+            str: The public CDN URL of the stored screenshot.
+        """
+        digest, _ = _hash_fileobj(fileobj)
         today = dt.datetime.now(dt.timezone.utc).strftime("%Y/%m/%d")
         ext = _ext_from_content_type(content_type)
         key = f"screenshots/{today}/{digest}.{ext}"
 
-        fileobj = io.BytesIO(image)
         self.client.upload_fileobj(
             fileobj,
             S3_BUCKET_NAME,
@@ -63,10 +311,28 @@ class ImageStorageService:
                 "ContentType": content_type,
                 "CacheControl": "public, max-age=31536000, immutable",
             },
+            Config=self._storage.transfer_config,
         )
         return f"{S3_PUBLIC_URL}/{key}"
 
-    def upload_map_banner(self, content: bytes, content_type: str, map_name: str) -> str:
+    async def put_screenshot(self, fileobj: IO[bytes], content_type: str) -> StoredImage:
+        """Upload a screenshot and its resized variants off the event loop.
+
+        The original is uploaded as in :meth:`upload_screenshot_file` while the
+        variants render; they are stored as immutable next to it.
+
+        Returns:
+            StoredImage: The URL of the original and of each stored variant.
+        """
+        async with _render_source(fileobj) as (source, size):
+            url, rendered = await asyncio.gather(
+                self._storage.run("screenshot", self.upload_screenshot_file, fileobj, content_type, size=size),
+                self._variants.render(source),
+            )
+        variants = await self._put_variants("screenshot_variant", url, rendered, "public, max-age=31536000, immutable")
+        return StoredImage(url, variants)
+
+    def upload_map_banner(self, content: bytes | IO[bytes], content_type: str, map_name: str) -> str:
         """Upload a map banner keyed by the stripped map name.
 
         The object key MUST match ``get_map_banner()``'s read path byte-for-byte
@@ -77,7 +343,7 @@ class ImageStorageService:
         extension would produce an unresolvable banner URL.
 
         Args:
-            content (bytes): The banner image bytes.
+            content (bytes | IO[bytes]): The banner image, as bytes or a file.
             content_type (str): The source content type (passed through as ``ContentType``).
             map_name (str): The map name; reduced to the stripped key for the object path.
 
@@ -87,7 +353,7 @@ class ImageStorageService:
         stripped = re.sub(r"[^a-zA-Z0-9]", "", map_name).lower().strip().replace(" ", "")
         key = f"assets/map_banners/{stripped}.png"
 
-        fileobj = io.BytesIO(content)
+        fileobj = io.BytesIO(content) if isinstance(content, bytes) else content
         self.client.upload_fileobj(
             fileobj,
             S3_BUCKET_NAME,
@@ -99,15 +365,135 @@ class ImageStorageService:
                 # staleness is accepted as eventual (Open Q1).
                 "CacheControl": "public, max-age=3600, must-revalidate",
             },
+            Config=self._storage.transfer_config,
+        )
+        return f"{S3_PUBLIC_URL}/{key}"
+
+    async def put_map_banner(self, content: bytes | IO[bytes], content_type: str, map_name: str) -> StoredImage:
+        """Upload a map banner and its resized variants off the event loop.
+
+        See :meth:`upload_map_banner`. Replacing a banner overwrites its variants
+        too, since their keys derive from the same stripped map name.
+
+        Returns:
+            StoredImage: The URL of the banner and of each stored variant.
+        """
+        async with _render_source(content) as (source, size):
+            url, rendered = await asyncio.gather(
+                self._storage.run("map_banner", self.upload_map_banner, content, content_type, map_name, size=size),
+                self._variants.render(source),
+            )
+        variants = await self._put_variants(
+            "map_banner_variant", url, rendered, "public, max-age=3600, must-revalidate"
+        )
+        return StoredImage(url, variants)
+
+    def upload_variant(self, key: str, image: bytes, content_type: str, cache_control: str) -> str:
+        """Upload a rendered image variant under ``key``.
+
+        Args:
+            key (str): The object key, the original's key with a variant suffix.
+            image (bytes): The encoded variant.
+            content_type (str): The variant's content type.
+            cache_control (str): The original's ``CacheControl``, so both expire together.
+
+        Returns:
+            str: The public CDN URL of the stored variant.
+        """
+        self.client.upload_fileobj(
+            io.BytesIO(image),
+            S3_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": cache_control},
+        )
+        return f"{S3_PUBLIC_URL}/{key}"
+
+    async def _put_variants(
+        self, operation: str, url: str, rendered: list[tuple[str, bytes]], cache_control: str
+    ) -> list[str]:
+        """Store rendered variants next to the original at ``url``, skipping any that fail."""
+        base_key = url.removeprefix(f"{S3_PUBLIC_URL}/").rsplit(".", 1)[0]
+        results = await asyncio.gather(
+            *(
+                self._storage.run(
+                    operation,
+                    self.upload_variant,
+                    base_key + suffix,
+                    image,
+                    variant_content_type(suffix.rsplit(".", 1)[1]),
+                    cache_control,
+                    size=len(image),
+                )
+                for suffix, image in rendered
+            ),
+            return_exceptions=True,
+        )
+        variants = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Failed to store an image variant of %s.", url, exc_info=result)
+            else:
+                variants.append(result)
+        return variants
+
+    def upload_playtest_plot(self, digest: str, image: bytes) -> str:
+        """Upload a rendered playtest plot under its content digest.
+
+        The key is derived solely from the normalized vote histogram digest, so an
+        object never changes once written and can be served as immutable.
+
+        Args:
+            digest (str): The vote histogram digest from ``playtest_plot_digest``.
+            image (bytes): The rendered WebP plot.
+
+        Returns:
+            str: The public CDN URL of the stored plot.
+        """
+        key = f"plots/playtests/{digest}.webp"
+        self.client.upload_fileobj(
+            io.BytesIO(image),
+            S3_BUCKET_NAME,
+            key,
+            ExtraArgs={
+                "ContentType": "image/webp",
+                "CacheControl": "public, max-age=31536000, immutable",
+            },
         )
         return f"{S3_PUBLIC_URL}/{key}"
 
+    async def put_playtest_plot(self, digest: str, image: bytes) -> str:
+        """Upload a rendered playtest plot off the event loop; see :meth:`upload_playtest_plot`."""
+        return await self._storage.run("playtest_plot", self.upload_playtest_plot, digest, image, size=len(image))
+
+    def fetch_playtest_plot(self, digest: str) -> bytes | None:
+        """Fetch a previously persisted playtest plot.
+
+        Args:
+            digest (str): The vote histogram digest from ``playtest_plot_digest``.
+
+        Returns:
+            bytes | None: The stored WebP plot, or None if it was never persisted.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415  # deferred heavy import
+
+        try:
+            obj = self.client.get_object(Bucket=S3_BUCKET_NAME, Key=f"plots/playtests/{digest}.webp")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+                return None
+            raise
+        return obj["Body"].read()
+
+    async def get_playtest_plot(self, digest: str) -> bytes | None:
+        """Fetch a persisted playtest plot off the event loop; see :meth:`fetch_playtest_plot`."""
+        return await self._storage.run("get_playtest_plot", self.fetch_playtest_plot, digest)
+
 
 async def provide_image_storage_service() -> ImageStorageService:
     """Litestar DI provider for `ImageStorageService`.
 
     Returns:
-        ImageStorageService: Service instance.
+        ImageStorageService: Service instance backed by the shared client.
 
     """
-    return ImageStorageService()
+    return ImageStorageService(storage=OBJECT_STORAGE)
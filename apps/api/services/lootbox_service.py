@@ -18,6 +18,9 @@ from genjishimada_sdk.lootbox import (
 from genjishimada_sdk.xp import (
     XP_TYPES,
     TierChangeResponse,
+    XpGrantBatchEvent,
+    XpGrantBatchItem,
+    XpGrantBatchResponse,
     XpGrantEvent,
     XpGrantRequest,
     XpGrantResponse,
@@ -29,6 +32,7 @@ from litestar.datastructures.headers import Headers
 from repository.lootbox_repository import LootboxRepository
 from services.base import BaseService
 from services.exceptions.lootbox import InsufficientKeysError
+from services.rank_card_service import invalidate_rank_cards
 
 if TYPE_CHECKING:
     from asyncpg import Connection
@@ -429,6 +433,7 @@ class LootboxService(BaseService):
             multiplier=float(multiplier),
             conn=conn,
         )
+        invalidate_rank_cards(user_id)
 
         response = XpGrantResponse(
             previous_amount=result["previous_amount"],
@@ -458,38 +463,115 @@ class LootboxService(BaseService):
 
         return response
 
+    async def grant_xp_many(
+        self,
+        headers: Headers,
+        grants: list[XpGrantBatchItem],
+        *,
+        conn: Connection | None = None,
+        pending_events: list[XpGrantEvent] | None = None,
+    ) -> list[XpGrantEvent]:
+        """Grant XP to many users with one multiplier read and one upsert.
+
+        Batched counterpart of :meth:`grant_xp`: every grant lands in a single
+        ``lootbox.xp`` statement and the bot is notified with one
+        ``api.xp.grant.batch`` event instead of one message per recipient.
+        ``conn`` and ``pending_events`` behave as they do for :meth:`grant_xp`.
+
+        Args:
+            headers: Request headers for idempotency.
+            grants: Grants to apply, in order. A user may appear more than once.
+            conn: Optional connection for transaction participation.
+            pending_events: Optional collector for post-commit publishing (see
+                :meth:`publish_xp_events`).
+
+        Returns:
+            One event per grant, in request order, with the recipient's
+            previous/new totals around that grant.
+        """
+        if not grants:
+            return []
+
+        multiplier = await self._lootbox_repo.fetch_xp_multiplier(conn=conn)
+        rows = await self._lootbox_repo.upsert_users_xp(
+            user_ids=[grant.user_id for grant in grants],
+            xp_amounts=[grant.amount for grant in grants],
+            multiplier=float(multiplier),
+            conn=conn,
+        )
+        invalidate_rank_cards(*(grant.user_id for grant in grants))
+
+        events = [
+            XpGrantEvent(
+                user_id=grant.user_id,
+                amount=grant.amount,
+                type=grant.type,
+                previous_amount=row["previous_amount"],
+                new_amount=row["new_amount"],
+                reason=grant.reason,
+            )
+            for grant, row in zip(grants, rows, strict=True)
+        ]
+
+        if pending_events is not None:
+            pending_events.extend(events)
+            return events
+
+        await self.publish_xp_events(events, headers)
+        return events
+
+    async def grant_users_xp(self, headers: Headers, grants: list[XpGrantBatchItem]) -> XpGrantBatchResponse:
+        """Grant XP to many users and publish one batched event.
+
+        Request-driven entry point over :meth:`grant_xp_many`.
+
+        Args:
+            headers: Request headers for idempotency.
+            grants: Grants to apply, in order.
+
+        Returns:
+            Batch response with one entry per grant.
+        """
+        return XpGrantBatchResponse(grants=await self.grant_xp_many(headers, grants))
+
     async def publish_xp_events(self, events: list[XpGrantEvent], headers: Headers | None = None) -> None:
-        """Publish deferred ``api.xp.grant`` events after their transaction commits.
+        """Publish deferred XP grant events after their transaction commits.
 
-        Used with :meth:`grant_xp`'s ``pending_events`` collector. Each publish is
-        a post-write notification, so a broker failure is logged and skipped
-        rather than raised — the XP is already durably committed, and re-raising
-        here cannot un-commit it. Callers invoke this only AFTER the transaction
-        that produced ``events`` has committed.
+        Used with the ``pending_events`` collector of :meth:`grant_xp` and
+        :meth:`grant_xp_many`. A single event goes out on ``api.xp.grant``;
+        several go out together as one ``api.xp.grant.batch`` message. Each
+        publish is a post-write notification, so a broker failure is logged and
+        skipped rather than raised — the XP is already durably committed, and
+        re-raising here cannot un-commit it. Callers invoke this only AFTER the
+        transaction that produced ``events`` has committed.
 
         Args:
             events: Deferred XP grant events to publish.
             headers: Optional request headers for idempotency.
         """
-        for event in events:
-            log.debug(
-                "[→] Publishing deferred XP grant for user %s (type=%s, amount=%s)",
-                event.user_id,
-                event.type,
-                event.amount,
+        if not events:
+            return
+
+        if len(events) == 1:
+            routing_key = "api.xp.grant"
+            data: XpGrantEvent | XpGrantBatchEvent = events[0]
+        else:
+            routing_key = "api.xp.grant.batch"
+            data = XpGrantBatchEvent(grants=events)
+
+        log.debug("[→] Publishing %s deferred XP grant(s) to %s", len(events), routing_key)
+        try:
+            await self.publish_message(
+                routing_key=routing_key,
+                data=data,
+                headers=headers or Headers({}),
+            )
+        except Exception:  # notification is best-effort post-commit; XP already persisted
+            log.exception(
+                "[!] Failed to publish %s committed XP grant(s) for users %s — XP persisted; notice dropped",
+                len(events),
+                sorted({event.user_id for event in events}),
             )
-            try:
-                await self.publish_message(
-                    routing_key="api.xp.grant",
-                    data=event,
-                    headers=headers or Headers({}),
-                )
-            except Exception:  # notification is best-effort post-commit; XP already persisted
-                log.exception(
-                    "[!] Failed to publish committed XP grant for user %s (type=%s) — XP persisted; notice dropped",
-                    event.user_id,
-                    event.type,
-                )
 
     async def grant_user_xp(
         self,
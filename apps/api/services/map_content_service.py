@@ -23,6 +23,8 @@ from utilities.errors import CustomHTTPException
 from .base import BaseService
 
 if TYPE_CHECKING:
+    from typing import IO
+
     from asyncpg import Pool
 
 
@@ -64,7 +66,7 @@ class MapContentService(BaseService):
         self._map_content_repo = map_content_repo
         self._image_svc = image_svc
 
-    async def create_map(self, name: str, banner: bytes, content_type: str) -> dict:
+    async def create_map(self, name: str, banner: bytes | IO[bytes], content_type: str) -> dict:
         """Add a new Overwatch map: guard, upload its banner, insert idempotently.
 
         Ordering matters (RESEARCH Pitfall 1 — transaction-abort): all fallible
@@ -74,11 +76,12 @@ class MapContentService(BaseService):
 
         Args:
             name: The new map name.
-            banner: The banner image bytes.
+            banner: The banner image, as bytes or a seekable file.
             content_type: The banner content type.
 
         Returns:
-            dict: `{"name": name, "inserted": bool}` from the idempotent insert.
+            dict: `{"name": name, "inserted": bool}` from the idempotent insert,
+                plus the stored banner variant URLs under `"banner_variants"`.
 
         Raises:
             CustomHTTPException: 422 if the name is empty/blank (REQ-05) or its
@@ -107,11 +110,12 @@ class MapContentService(BaseService):
                 )
 
         # (3) Upload the banner (REQ-07) — still BEFORE the DB insert.
-        self._image_svc.upload_map_banner(banner, content_type, name)
+        stored = await self._image_svc.put_map_banner(banner, content_type, name)
 
         # (4) Idempotent insert — the only fallible DB statement, single-statement
         # so no explicit transaction needed.
-        return await self._map_content_repo.insert_map_name(name)
+        row = await self._map_content_repo.insert_map_name(name)
+        return {**row, "banner_variants": stored.variants}
 
     async def validate_map_name(self, name: str) -> str:
         """Validate a map name against `maps.names`, suggesting near matches (REQ-02).
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import hashlib
 import inspect
 import logging
+import os
+import re
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Iterable, Literal, overload
 from uuid import UUID
 
-import aiohttp
 import msgspec
 from asyncpg import Pool
 from genjishimada_sdk.difficulties import DIFFICULTY_MIDPOINTS, convert_raw_difficulty_to_difficulty_all
@@ -83,14 +86,18 @@ from services.exceptions.maps import (
     MapNotFoundError,
     MapValidationError,
     PendingEditRequestExistsError,
+    PlaytestPlotNotFoundError,
     UnresolvedChangeRequestsError,
 )
+from services.image_storage_service import OBJECT_STORAGE, ImageStorageService
 from utilities.jobs import wait_for_job_completion
 from utilities.map_search import MapSearchFilters
 
 from .base import BaseService
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from services.lootbox_service import LootboxService
     from services.newsfeed_service import NewsfeedService
     from services.notifications_service import NotificationsService
@@ -102,6 +109,110 @@ ARCHIVE_PLAYTEST_CANCEL_REASON = "This map has been archived so the playtest has
 ARCHIVE_FORCE_DENY_VERIFIER_ID = 969632729643753482
 log = logging.getLogger(__name__)
 
+PLAYTEST_PLOTTER_URL = os.getenv("PLAYTEST_PLOTTER_URL", "http://genjishimada-playtest-plotter:8080/chart")
+PLAYTEST_PLOT_CACHE_SIZE = int(os.getenv("PLAYTEST_PLOT_CACHE_SIZE", "256"))
+PLAYTEST_PLOT_PERSIST = os.getenv("PLAYTEST_PLOT_PERSIST", "false").lower() in {"1", "true", "yes"}
+
+# Shape of playtest_plot_digest(); digests come from URLs and become object storage keys.
+_PLOT_DIGEST_RE = re.compile(r"[0-9a-f]{32}")
+
+
+def playtest_plot_digest(votes: dict[str, int]) -> str:
+    """Return the content address of a vote histogram.
+
+    Zero-count buckets are dropped and keys sorted so that equivalent histograms
+    always hash to the same digest regardless of query row order.
+
+    Args:
+        votes: Difficulty label to vote count.
+
+    Returns:
+        str: Hex blake2b digest of the normalized histogram.
+    """
+    normalized = sorted((label, amount) for label, amount in votes.items() if amount)
+    return hashlib.blake2b(msgspec.json.encode(normalized), digest_size=16).hexdigest()
+
+
+class _PlaytestPlotCache:
+    """Process-wide content-addressed cache of rendered playtest plots.
+
+    Litestar constructs a fresh MapsService per request via DI, so the cache, the
+    keep-alive plotter session and the in-flight render table MUST live at module
+    scope to be shared across requests. Entries are keyed by ``playtest_plot_digest``
+    and evicted least-recently-used once ``max_entries`` is exceeded. Concurrent
+    requests for the same digest await one shared render task.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._storage: ImageStorageService | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        import aiohttp  # noqa: PLC0415  # deferred heavy import
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    @property
+    def storage(self) -> ImageStorageService:
+        if self._storage is None:
+            self._storage = ImageStorageService(storage=OBJECT_STORAGE)
+        return self._storage
+
+    def get(self, digest: str) -> bytes | None:
+        image = self._entries.get(digest)
+        if image is not None:
+            self._entries.move_to_end(digest)
+        return image
+
+    def put(self, digest: str, image: bytes) -> None:
+        self._entries[digest] = image
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_render(self, digest: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return the cached plot for ``digest``, rendering it at most once concurrently."""
+        cached = self.get(digest)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(digest)
+        if task is None:
+            task = asyncio.ensure_future(render())
+            self._inflight[digest] = task
+
+            def _done(t: asyncio.Task[bytes]) -> None:
+                self._inflight.pop(digest, None)
+                if not t.cancelled() and t.exception() is None:
+                    self.put(digest, t.result())
+
+            task.add_done_callback(_done)
+        # Shield so one cancelled waiter does not abort the render the others share.
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Single process-wide plot cache shared by every MapsService.
+_PLOT_CACHE = _PlaytestPlotCache(PLAYTEST_PLOT_CACHE_SIZE)
+
+
+async def close_playtest_plot_cache() -> None:
+    """Close the shared plotter session; called from the app lifespan on shutdown."""
+    await _PLOT_CACHE.close()
+
 
 def _normalize_custom_banner(url: str | None) -> str | None:
     """Return None if the URL is a generated asset banner rather than a truly custom one."""
@@ -1334,16 +1445,81 @@ class MapsService(BaseService):
                 str(convert_raw_difficulty_to_difficulty_all(row["difficulty"])): row["amount"] for row in rows
             }
 
-        plotter_url = "http://genjishimada-playtest-plotter:8080/chart"
+        digest = playtest_plot_digest(votes)
+        image_bytes = await _PLOT_CACHE.get_or_render(digest, lambda: self._render_playtest_plot(votes, digest))
+
+        return Stream(
+            iter([image_bytes]),
+            headers={
+                "content-type": "image/webp",
+                "content-disposition": 'attachment; filename="playtest.webp"',
+                # The thread/code URL changes content as votes arrive, so clients must
+                # revalidate; the digest route serves the same bytes as immutable.
+                "cache-control": "no-cache",
+                "etag": f'"{digest}"',
+                "x-plot-digest": digest,
+            },
+        )
+
+    async def get_playtest_plot_by_digest(self, digest: str) -> Stream:
+        """Get a previously rendered playtest plot by its content digest.
+
+        Args:
+            digest: Vote histogram digest returned in the ``x-plot-digest`` header.
+
+        Returns:
+            Stream with WebP image and immutable caching headers.
+
+        Raises:
+            MapValidationError: If ``digest`` is not a plot digest.
+            PlaytestPlotNotFoundError: If no plot with this digest is cached or persisted.
+        """
+        if not _PLOT_DIGEST_RE.fullmatch(digest):
+            raise MapValidationError(f"Invalid plot digest: {digest}", field="digest")
+        image_bytes = _PLOT_CACHE.get(digest)
+        if image_bytes is None and PLAYTEST_PLOT_PERSIST:
+            image_bytes = await _PLOT_CACHE.storage.get_playtest_plot(digest)
+            if image_bytes is not None:
+                _PLOT_CACHE.put(digest, image_bytes)
+        if image_bytes is None:
+            raise PlaytestPlotNotFoundError(digest)
+
+        return Stream(
+            iter([image_bytes]),
+            headers={
+                "content-type": "image/webp",
+                "content-disposition": 'attachment; filename="playtest.webp"',
+                "cache-control": "public, max-age=31536000, immutable",
+                "etag": f'"{digest}"',
+            },
+        )
+
+    async def _render_playtest_plot(self, votes: dict[str, int], digest: str) -> bytes:
+        """Render a plot via the plotter service, consulting object storage first when persistence is on.
+
+        Args:
+            votes: Difficulty label to vote count.
+            digest: Content digest of ``votes``.
+
+        Returns:
+            bytes: The rendered WebP image.
+
+        Raises:
+            HTTPException: 503 if plotter service unavailable.
+        """
+        import aiohttp  # noqa: PLC0415  # deferred heavy import
+
+        if PLAYTEST_PLOT_PERSIST:
+            try:
+                stored = await _PLOT_CACHE.storage.get_playtest_plot(digest)
+            except Exception:
+                log.exception("Failed to read persisted playtest plot %s", digest)
+                stored = None
+            if stored is not None:
+                return stored
+
         try:
-            async with (
-                aiohttp.ClientSession() as session,
-                session.post(
-                    plotter_url,
-                    json={"votes": votes},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp,
-            ):
+            async with _PLOT_CACHE.session.post(PLAYTEST_PLOTTER_URL, json={"votes": votes}) as resp:
                 if resp.status != HTTP_200_OK:
                     log.error(f"Plotter service returned {resp.status}: {await resp.text()}")
                     raise HTTPException(
@@ -1358,13 +1534,13 @@ class MapsService(BaseService):
                 detail="Chart generation service unavailable",
             ) from e
 
-        return Stream(
-            iter([image_bytes]),
-            headers={
-                "content-type": "image/webp",
-                "content-disposition": 'attachment; filename="playtest.webp"',
-            },
-        )
+        if PLAYTEST_PLOT_PERSIST:
+            try:
+                await _PLOT_CACHE.storage.put_playtest_plot(digest, image_bytes)
+            except Exception:
+                log.exception("Failed to persist playtest plot %s", digest)
+
+        return image_bytes
 
     async def create_edit_request(
         self,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import datetime as dt
 import inspect
 import logging
+import os
+import time
 from typing import Any, Awaitable, Callable, Iterable
 
 import msgspec
@@ -30,6 +33,80 @@ _EXCLUDED_FIELDS = {"hidden", "official", "archived", "playtesting"}
 
 _LIST_FIELDS = {"creators", "mechanics", "restrictions", "tags"}
 
+NEWSFEED_HEAD_SIZE = int(os.getenv("NEWSFEED_HEAD_SIZE", "50"))
+NEWSFEED_HEAD_TTL_SECONDS = float(os.getenv("NEWSFEED_HEAD_TTL_SECONDS", "30"))
+
+
+def _feed_key(event: NewsfeedEvent) -> tuple[dt.datetime, int]:
+    """Return the (timestamp, id) sort key of an event, treating naive timestamps as UTC."""
+    timestamp = event.timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=dt.timezone.utc)
+    return timestamp, event.id or 0
+
+
+class _NewsfeedHead:
+    """Bounded in-memory copy of the newest newsfeed events.
+
+    Holds the ``size`` newest events, newest first, so first pages (any type
+    filter) are served without a query. It is filled by an unfiltered
+    first-page read and kept current by ``create_and_publish`` in this process;
+    after ``ttl`` seconds it is refilled, which bounds how long events created
+    through other replicas go unseen.
+    """
+
+    def __init__(self, size: int, ttl: float) -> None:
+        self.size = size
+        self.ttl = ttl
+        self._events: list[NewsfeedEvent] = []
+        self._complete = False
+        self._expires_at = 0.0
+
+    def _fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    def page(self, limit: int, event_type: str | None) -> list[NewsfeedEvent] | None:
+        """Return the first page for ``event_type``, or None if it must be read from the database."""
+        if not self._fresh():
+            return None
+        events = self._events if event_type is None else [e for e in self._events if e.event_type == event_type]
+        if len(events) >= limit:
+            return events[:limit]
+        # Fewer matches than asked for are only the whole answer if nothing older exists.
+        return events if self._complete else None
+
+    def fill(self, events: list[NewsfeedEvent], limit: int) -> None:
+        """Replace the buffer with an unfiltered first page of ``limit`` events."""
+        if self.ttl <= 0 or self.size <= 0:
+            return
+        self._events = list(events[: self.size])
+        self._complete = len(events) < limit
+        self._expires_at = time.monotonic() + self.ttl
+
+    def append(self, event: NewsfeedEvent) -> None:
+        """Insert a newly created event in feed order, dropping the oldest beyond ``size``."""
+        if not self._fresh():
+            return
+        keys = [_feed_key(e) for e in reversed(self._events)]
+        position = len(self._events) - bisect.bisect(keys, _feed_key(event))
+        if position == len(self._events) and not self._complete:
+            # Older than everything held, and older events exist: not in the window.
+            return
+        self._events.insert(position, event)
+        if len(self._events) > self.size:
+            del self._events[self.size :]
+            self._complete = False
+
+    def clear(self) -> None:
+        """Forget the buffered events."""
+        self._events = []
+        self._complete = False
+        self._expires_at = 0.0
+
+
+# Single process-wide newest-events buffer shared by every NewsfeedService.
+_NEWSFEED_HEAD = _NewsfeedHead(NEWSFEED_HEAD_SIZE, NEWSFEED_HEAD_TTL_SECONDS)
+
 
 def _labelize(field: str) -> str:
     """Convert a snake_case field name into a human-friendly label.
@@ -261,6 +338,9 @@ class NewsfeedService(BaseService):
             timestamp=event.timestamp,
             payload=payload_obj,
         )
+        _NEWSFEED_HEAD.append(
+            NewsfeedEvent(id=new_id, timestamp=event.timestamp, payload=event.payload, event_type=payload_obj["type"])
+        )
 
         idempotency_key = f"newsfeed:create:{new_id}"
         job_status = await self.publish_message(
@@ -281,10 +361,7 @@ class NewsfeedService(BaseService):
         Returns:
             The resolved event or None if not found.
         """
-        row = await self._newsfeed_repo.fetch_event_by_id(id_)
-        if not row:
-            return None
-        return msgspec.convert(row, NewsfeedEvent)
+        return await self._newsfeed_repo.fetch_event_by_id(id_)
 
     async def list_events(
         self,
@@ -292,29 +369,40 @@ class NewsfeedService(BaseService):
         limit: int,
         page_number: int,
         type_: str | None,
+        before: tuple[dt.datetime, int] | None = None,
     ) -> list[NewsfeedEvent] | None:
-        """List newsfeed events with offset/limit pagination and optional type filter.
+        """List newsfeed events with cursor or offset/limit pagination and optional type filter.
+
+        The first page is served from the in-memory buffer of newest events when
+        it can answer it.
 
         Args:
             limit: Page size to return (e.g., 10, 20, 25, 50).
-            page_number: 1-based page number.
+            page_number: 1-based page number; ignored when ``before`` is given.
             type_: Optional event type filter.
+            before: Optional ``(timestamp, id)`` of the last event of the previous
+                page; the page holds the events after it.
 
         Returns:
             Events ordered by most recent first (timestamp DESC, id DESC), or None if empty.
         """
-        offset = max(page_number - 1, 0) * limit
-        rows = await self._newsfeed_repo.fetch_events(
+        first_page = before is None and page_number <= 1
+        if first_page:
+            cached = _NEWSFEED_HEAD.page(limit, type_)
+            if cached is not None:
+                return cached or None
+
+        offset = 0 if before is not None else max(page_number - 1, 0) * limit
+        events = await self._newsfeed_repo.fetch_events(
             limit=limit,
             offset=offset,
             event_type=type_,
+            before=before,
         )
+        if first_page and type_ is None:
+            _NEWSFEED_HEAD.fill(events, limit)
 
-        if not rows:
-            return None
-
-        log.debug(rows)
-        return msgspec.convert(rows, list[NewsfeedEvent])
+        return events or None
 
     async def generate_map_edit_newsfeed(
         self,
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+import msgspec
 from asyncpg import Pool
 from genjishimada_sdk.difficulties import DIFFICULTY_TO_RANK_MAP, Rank
 from genjishimada_sdk.helpers import sanitize_string
+from genjishimada_sdk.maps import MapMasteryResponse
 from genjishimada_sdk.rank_card import (
     RANK_CARD_FILTER_MAP,
     AvatarResponse,
@@ -18,11 +25,74 @@ from genjishimada_sdk.users import RankDetailResponse
 from litestar.datastructures import State
 
 from repository.rank_card_repository import RankCardRepository
-from utilities.shared_queries import get_map_mastery_data, get_user_rank_data
+from utilities.shared_queries import get_map_mastery_data
 
 from .base import BaseService
 from .exceptions.users import UserNotFoundError
 
+RANK_CARD_CACHE_TTL_SECONDS = float(os.getenv("RANK_CARD_CACHE_TTL_SECONDS", "60"))
+RANK_CARD_CACHE_MAX_ENTRIES = int(os.getenv("RANK_CARD_CACHE_MAX_ENTRIES", "4096"))
+
+
+class _RankCardCache:
+    """Process-local cache of assembled rank cards, keyed by ``(user_id, map_filter)``.
+
+    Writes to a user's own rank card fields through this process (nickname and
+    Overwatch usernames, background, avatar, badges, XP, verification of their
+    completions) invalidate every filter of that user immediately. Changes that
+    reach a card indirectly (another user taking a world record, new maps in
+    the totals, the skill snapshot, playtest votes) and writes made on other
+    replicas go unseen for at most ``ttl`` seconds; ``0`` disables the cache.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, RankCardFilter], tuple[float, RankCardResponse]] = OrderedDict()
+
+    def get(self, user_id: int, map_filter: RankCardFilter) -> RankCardResponse | None:
+        """Return the cached rank card, if still fresh."""
+        key = (user_id, map_filter)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, card = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return card
+
+    def put(self, user_id: int, map_filter: RankCardFilter, card: RankCardResponse) -> None:
+        """Cache a rank card, evicting the oldest entry when full."""
+        if self.ttl <= 0:
+            return
+        key = (user_id, map_filter)
+        self._entries[key] = (time.monotonic() + self.ttl, card)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """Forget every cached filter of the given users."""
+        targets = set(user_ids)
+        if not targets or not self._entries:
+            return
+        for key in [key for key in self._entries if key[0] in targets]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached rank card."""
+        self._entries.clear()
+
+
+# Single process-wide rank card cache shared by every RankCardService.
+_RANK_CARD_CACHE = _RankCardCache(RANK_CARD_CACHE_TTL_SECONDS, RANK_CARD_CACHE_MAX_ENTRIES)
+
+
+def invalidate_rank_cards(*user_ids: int) -> None:
+    """Drop the cached rank cards of ``user_ids``; called by write paths that change them."""
+    _RANK_CARD_CACHE.invalidate(user_ids)
+
 
 class RankCardService(BaseService):
     """Service for rank_card business logic."""
@@ -83,6 +153,7 @@ class RankCardService(BaseService):
         """
         await self._ensure_user_exists(user_id)
         await self._rank_card_repo.upsert_background(user_id, background)
+        invalidate_rank_cards(user_id)
         return BackgroundResponse(name=background)
 
     async def get_avatar_skin(self, user_id: int) -> AvatarResponse:
@@ -113,6 +184,7 @@ class RankCardService(BaseService):
         """
         await self._ensure_user_exists(user_id)
         await self._rank_card_repo.upsert_avatar_skin(user_id, skin)
+        invalidate_rank_cards(user_id)
         return AvatarResponse(skin=skin)
 
     async def get_avatar_pose(self, user_id: int) -> AvatarResponse:
@@ -143,6 +215,7 @@ class RankCardService(BaseService):
         """
         await self._ensure_user_exists(user_id)
         await self._rank_card_repo.upsert_avatar_pose(user_id, pose)
+        invalidate_rank_cards(user_id)
         return AvatarResponse(pose=pose)
 
     async def get_badges(self, user_id: int) -> RankCardBadgeSettings:
@@ -200,6 +273,7 @@ class RankCardService(BaseService):
             data.badge_name6,
             data.badge_type6,
         )
+        invalidate_rank_cards(user_id)
 
     @staticmethod
     def _find_highest_rank(data: list[RankDetailResponse]) -> Rank:
@@ -217,11 +291,38 @@ class RankCardService(BaseService):
                 highest = DIFFICULTY_TO_RANK_MAP[row.difficulty]
         return highest
 
+    @staticmethod
+    def _resolve_badge_urls(badges: dict | None, mastery: dict[str, int] | None) -> RankCardBadgeSettings:
+        """Build badge settings, filling in mastery and spray badge URLs.
+
+        Args:
+            badges: Stored badge settings, or None if the user never set any.
+            mastery: Mastery amount per map name used as a mastery badge.
+
+        Returns:
+            Badge settings with resolved URLs.
+        """
+        if not badges:
+            return RankCardBadgeSettings()
+        mastery = mastery or {}
+        for num in range(1, 7):
+            name = badges[f"badge_name{num}"]
+            if badges[f"badge_type{num}"] == "mastery":
+                if name in mastery:
+                    badges[f"badge_url{num}"] = MapMasteryResponse(map_name=name, amount=mastery[name]).icon_url  # type: ignore[arg-type]
+            elif badges[f"badge_type{num}"] == "spray":
+                badges[f"badge_url{num}"] = f"https://cdn.genji.pk/assets/rank_card/spray/{sanitize_string(name)}.webp"
+        return RankCardBadgeSettings(**badges)
+
     async def get_rank_card_data(
         self, user_id: int, *, map_filter: RankCardFilter = "official_playable"
     ) -> RankCardResponse:
         """Assemble all rank card data for a user.
 
+        Every field comes from one query (``RankCardRepository.fetch_rank_card``)
+        and the assembled card is cached per ``(user_id, map_filter)``; see
+        ``_RankCardCache`` for how it is invalidated.
+
         Args:
             user_id: User ID.
             map_filter: Filter preset controlling which maps are included in stats.
@@ -233,64 +334,53 @@ class RankCardService(BaseService):
         Raises:
             UserNotFoundError: If user does not exist.
         """
-        await self._ensure_user_exists(user_id)
-        official, playable_only = RANK_CARD_FILTER_MAP[map_filter]
+        cached = _RANK_CARD_CACHE.get(user_id, map_filter)
+        if cached is not None:
+            return cached
 
-        async with self._pool.acquire() as conn:
-            rank_data = await get_user_rank_data(conn, user_id, official=official, playable_only=playable_only)  # type: ignore[arg-type]
-            nickname = await self._rank_card_repo.fetch_nickname(user_id, conn=conn)  # type: ignore[arg-type]
-            background_row = await self._rank_card_repo.fetch_background(user_id, conn=conn)  # type: ignore[arg-type]
-            maps_count = await self._rank_card_repo.fetch_maps_created_count(user_id, conn=conn)  # type: ignore[arg-type]
-            playtests_count = await self._rank_card_repo.fetch_playtests_voted_count(user_id, conn=conn)  # type: ignore[arg-type]
-            world_records = await self._rank_card_repo.fetch_world_record_count(user_id, conn=conn)  # type: ignore[arg-type]
-            avatar_row = await self._rank_card_repo.fetch_avatar(user_id, conn=conn)  # type: ignore[arg-type]
-            totals = await self._rank_card_repo.fetch_map_totals(
-                official=official,
-                playable_only=playable_only,
-                conn=conn,  # type: ignore[arg-type]
-            )
-            xp_data = await self._rank_card_repo.fetch_community_rank_xp(user_id, conn=conn)  # type: ignore[arg-type]
-            skill = await self._rank_card_repo.fetch_skill_summary(user_id, conn=conn)  # type: ignore[arg-type]
-
-        badges = await self.get_badges(user_id)
+        official, playable_only = RANK_CARD_FILTER_MAP[map_filter]
+        row = await self._rank_card_repo.fetch_rank_card(user_id, official=official, playable_only=playable_only)
+        if row is None:
+            raise UserNotFoundError(user_id)
 
-        background = background_row["name"] if background_row else "placeholder"
-        avatar_skin = avatar_row["skin"] if avatar_row else "Overwatch 1"
-        avatar_pose = avatar_row["pose"] if avatar_row else "Heroic"
+        rank_data = msgspec.convert(row["ranks"], list[RankDetailResponse])
         rank = self._find_highest_rank(rank_data)
 
         difficulties = {}
-        for row in rank_data:
-            difficulties[row.difficulty] = {
-                "completed": row.completions,
-                "gold": row.gold,
-                "silver": row.silver,
-                "bronze": row.bronze,
+        for detail in rank_data:
+            difficulties[detail.difficulty] = {
+                "completed": detail.completions,
+                "gold": detail.gold,
+                "silver": detail.silver,
+                "bronze": detail.bronze,
             }
 
-        for total in totals:
-            if total["base_difficulty"] in difficulties:
-                difficulties[total["base_difficulty"]]["total"] = total["total"]
+        for base_difficulty, total in row["map_totals"].items():
+            if base_difficulty in difficulties:
+                difficulties[base_difficulty]["total"] = total
 
-        return RankCardResponse(
+        skill_tier = int(row["skill_tier"])
+        card = RankCardResponse(
             rank_name=rank,
-            nickname=nickname,
-            background=background,
-            total_maps_created=maps_count,
-            total_playtests=playtests_count,
-            world_records=world_records,
+            nickname=row["nickname"] or "Unknown User",
+            background=row["background"] or "placeholder",
+            total_maps_created=row["maps_created"],
+            total_playtests=row["playtests_voted"],
+            world_records=row["world_records"],
             difficulties=difficulties,
-            avatar_skin=avatar_skin,
-            avatar_pose=avatar_pose,
-            badges=badges,
-            xp=xp_data["xp"],
-            prestige_level=xp_data["prestige_level"],
-            community_rank=xp_data["community_rank"],
-            skill_score=float(skill["skill_score"]),
-            skill_tier=int(skill["skill_tier"]),
-            skill_percentile=float(skill["skill_percentile"]),
-            skill_tier_name=skill_tier_name(int(skill["skill_tier"])),
+            avatar_skin=row["avatar_skin"] or "Overwatch 1",
+            avatar_pose=row["avatar_pose"] or "Heroic",
+            badges=self._resolve_badge_urls(row["badges"], row["mastery"]),
+            xp=row["xp"],
+            prestige_level=row["prestige_level"],
+            community_rank=row["community_rank"],
+            skill_score=float(row["skill_score"]),
+            skill_tier=skill_tier,
+            skill_percentile=float(row["skill_percentile"]),
+            skill_tier_name=skill_tier_name(skill_tier),
         )
+        _RANK_CARD_CACHE.put(user_id, map_filter, card)
+        return card
 
 
 async def provide_rank_card_service(
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import datetime
 import logging
+import os
 import random
+import time
 from typing import cast
 from uuid import UUID
 
@@ -74,6 +76,59 @@ BULK_QUANTITY_5X = 5
 ROTATION_ITEM_MIN = 3
 ROTATION_ITEM_MAX = 5
 
+STORE_CACHE_TTL_SECONDS = float(os.getenv("STORE_CACHE_TTL_SECONDS", "60"))
+
+
+class _StoreCache:
+    """Process-local copy of the current rotation and key pricing.
+
+    The rotation is kept until it expires or ``STORE_CACHE_TTL_SECONDS`` pass,
+    whichever comes first; pricing until the TTL passes. Config updates and
+    rotations generated through this process invalidate both immediately, and
+    the TTL bounds how long writes made elsewhere (other replicas) go unseen.
+    """
+
+    def __init__(self) -> None:
+        self._rotation: list[dict] | None = None
+        self._rotation_expires_at = 0.0
+        self._pricing: list[KeyPricingResponse] | None = None
+        self._pricing_expires_at = 0.0
+
+    def rotation(self) -> list[dict] | None:
+        """Return the cached rotation items, or None if absent or stale."""
+        if self._rotation is None or time.monotonic() >= self._rotation_expires_at:
+            return None
+        return self._rotation
+
+    def put_rotation(self, items: list[dict]) -> None:
+        """Cache rotation items until they expire or the TTL passes."""
+        if not items:
+            # The next rotation can be generated at any moment; keep asking.
+            return
+        remaining = (items[0]["available_until"] - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        self._rotation = items
+        self._rotation_expires_at = time.monotonic() + min(STORE_CACHE_TTL_SECONDS, remaining)
+
+    def pricing(self) -> list[KeyPricingResponse] | None:
+        """Return the cached key pricing, or None if absent or stale."""
+        if self._pricing is None or time.monotonic() >= self._pricing_expires_at:
+            return None
+        return self._pricing
+
+    def put_pricing(self, pricing: list[KeyPricingResponse]) -> None:
+        """Cache key pricing for the TTL."""
+        self._pricing = pricing
+        self._pricing_expires_at = time.monotonic() + STORE_CACHE_TTL_SECONDS
+
+    def invalidate(self) -> None:
+        """Forget the cached rotation and pricing."""
+        self._rotation = None
+        self._pricing = None
+
+
+# Single process-wide store cache shared by every StoreService.
+_STORE_CACHE = _StoreCache()
+
 
 class StoreService(BaseService):
     """Service for store domain business logic."""
@@ -146,19 +201,35 @@ class StoreService(BaseService):
         config = await self._store_repo.fetch_config()
         return msgspec.convert(config, StoreConfigResponse)
 
+    @staticmethod
+    def _rotation_item_key(item: dict) -> tuple[str, str, str]:
+        return item["item_type"], item["key_type"], item["item_name"]
+
     async def get_current_rotation(
         self,
         user_id: int | None = None,
     ) -> RotationResponse:
         """Get current rotation items.
 
+        The rotation itself is served from the process cache when fresh, so a
+        cached read costs at most one ownership query for the user.
+
         Args:
             user_id: Optional user ID to check ownership.
 
         Returns:
             Current rotation with ownership flags.
         """
-        items = await self._store_repo.fetch_current_rotation()
+        items = _STORE_CACHE.rotation()
+        if items is None:
+            items = await self._store_repo.fetch_current_rotation(user_id or None)
+            _STORE_CACHE.put_rotation(items)
+            owned = {self._rotation_item_key(item) for item in items if item["owned"]}
+        elif user_id:
+            rows = await self._store_repo.fetch_rotation_ownership(items[0]["rotation_id"], user_id)
+            owned = {self._rotation_item_key(row) for row in rows}
+        else:
+            owned = set()
 
         if not items:
             return RotationResponse(
@@ -170,29 +241,17 @@ class StoreService(BaseService):
         rotation_id = items[0]["rotation_id"]
         available_until = items[0]["available_until"]
 
-        # Check ownership for each item if user_id provided
-        rotation_items = []
-        for item in items:
-            owned = False
-            if user_id:
-                rarity = await self._lootbox_repo.check_user_has_reward(
-                    user_id=user_id,
-                    reward_type=item["item_type"],
-                    key_type=item["key_type"],
-                    reward_name=item["item_name"],
-                )
-                owned = rarity is not None
-
-            rotation_items.append(
-                RotationItemResponse(
-                    item_name=item["item_name"],
-                    item_type=item["item_type"],
-                    key_type=item["key_type"],
-                    rarity=item["rarity"],
-                    price=item["price"],
-                    owned=owned,
-                )
+        rotation_items = [
+            RotationItemResponse(
+                item_name=item["item_name"],
+                item_type=item["item_type"],
+                key_type=item["key_type"],
+                rarity=item["rarity"],
+                price=item["price"],
+                owned=self._rotation_item_key(item) in owned,
             )
+            for item in items
+        ]
 
         return RotationResponse(
             rotation_id=rotation_id,
@@ -203,9 +262,15 @@ class StoreService(BaseService):
     async def get_key_pricing(self) -> list[KeyPricingResponse]:
         """Get key pricing for all key types.
 
+        Served from the process cache when fresh.
+
         Returns:
             List of key pricing info.
         """
+        cached = _STORE_CACHE.pricing()
+        if cached is not None:
+            return cached
+
         config = await self._store_repo.fetch_config()
         active_key_type = config["active_key_type"]
 
@@ -243,6 +308,7 @@ class StoreService(BaseService):
                 )
             )
 
+        _STORE_CACHE.put_pricing(pricing_list)
         return pricing_list
 
     async def purchase_keys(
@@ -587,6 +653,7 @@ class StoreService(BaseService):
         """
         self._validate_rotation_item_count(item_count)
         result = await self._store_repo.generate_rotation(item_count)
+        _STORE_CACHE.invalidate()
         return msgspec.convert(result, GenerateRotationResponse)
 
     async def ensure_user_quests_for_rotation(self, user_id: int) -> UUID:
@@ -1379,6 +1446,7 @@ class StoreService(BaseService):
             rotation_period_days=rotation_period_days,
             active_key_type=active_key_type,
         )
+        _STORE_CACHE.invalidate()
 
     async def get_quest_config(self) -> QuestConfigResponse:
         """Get quest configuration."""
@@ -18,12 +18,14 @@ from genjishimada_sdk.tags import (
     TagOp,
     TagsAutocompleteRequest,
     TagsAutocompleteResponse,
+    TagsMutatedEvent,
     TagsMutateResponse,
     TagsMutateResult,
     TagsSearchFilters,
     TagsSearchResponse,
+    TagsUsageIncrementRequest,
 )
-from litestar.datastructures import State
+from litestar.datastructures import Headers, State
 
 from repository.tags_repository import TagsRepository
 from services.base import BaseService
@@ -49,24 +51,66 @@ class TagsService(BaseService):
         """
         return await self._tags_repo.search_tags(filters)
 
-    async def mutate_tags(self, ops: list[TagOp]) -> TagsMutateResponse:
+    async def mutate_tags(self, ops: list[TagOp], *, headers: Headers | None = None) -> TagsMutateResponse:
         """Execute a batch of tag mutation operations.
 
         Each operation is dispatched independently; a failure in one does not
-        block subsequent operations.
+        block subsequent operations. Every guild with at least one successful
+        content-changing op gets a single ``api.tags.mutated`` event so bot-side
+        tag caches can drop their copy.
 
         Args:
             ops: Ordered list of tag operations to perform.
+            headers: Request headers forwarded to the invalidation event.
 
         Returns:
             TagsMutateResponse with a result for each operation.
         """
         results: list[TagsMutateResult] = []
+        changed_guilds: set[int] = set()
         for op in ops:
             result = await self._execute_op(op)
             results.append(result)
+            if result.ok and not isinstance(op, OpIncrementUsage):
+                changed_guilds.add(op.guild_id)
+        for guild_id in sorted(changed_guilds):
+            await self._publish_tags_mutated(guild_id, headers or Headers())
         return TagsMutateResponse(results=results)
 
+    async def increment_usage_many(self, data: TagsUsageIncrementRequest) -> TagsMutateResult:
+        """Apply a batch of usage counters accumulated by the bot.
+
+        Usage is not part of the cached tag content, so no invalidation event
+        is published.
+
+        Args:
+            data: Usage increments to apply.
+
+        Returns:
+            TagsMutateResult with the number of tag rows updated.
+        """
+        affected = await self._tags_repo.increment_usage_many(data.items)
+        return TagsMutateResult(ok=True, affected=affected, message="Usage incremented")
+
+    async def _publish_tags_mutated(self, guild_id: int, headers: Headers) -> None:
+        """Publish a cache invalidation event for a guild.
+
+        The mutation is already committed, so a publish failure is logged and
+        swallowed; bot caches also expire on their own.
+
+        Args:
+            guild_id: Guild whose tags changed.
+            headers: Request headers.
+        """
+        try:
+            await self.publish_message(
+                routing_key="api.tags.mutated",
+                data=TagsMutatedEvent(guild_id=guild_id),
+                headers=headers,
+            )
+        except Exception:
+            log.exception("Failed to publish tag invalidation (guild_id=%s)", guild_id)
+
     async def autocomplete_tags(self, filters: TagsAutocompleteRequest) -> TagsAutocompleteResponse:
         """Provide tag name suggestions for autocomplete.
 
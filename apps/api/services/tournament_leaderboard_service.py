@@ -0,0 +1,322 @@
+"""Live in-memory leaderboards for active tournament cycles.
+
+:meth:`TournamentRepository.fetch_leaderboard` re-ranks the whole cycle with
+``DISTINCT ON`` + ``RANK()`` on every call. While a cycle is active the board is
+polled constantly and changes only one user at a time, so this module keeps one
+ordered structure per active cycle and patches it from the submit and verdict
+write paths instead.
+
+Each board holds every user's best run under the sort key
+``(not verified, not completion, time, inserted_at, user_id)`` — exactly the
+``ORDER BY`` the SQL ranks by. ``user_id`` makes every key unique, so ``RANK()``
+never ties and a user's rank is their bisect position plus one. Rank and top-N
+reads are bisect/slice operations; a patch is one removal and one ``insort``.
+
+Every applied change publishes a compact :class:`TournamentLeaderboardDeltaEvent`
+on ``api.tournament.leaderboard.delta`` so the bot can patch a cached board
+instead of refetching it. A write that lands on a missing or stale board seeds
+it with the write already included, so it publishes the user's seeded placement.
+
+Boards are only built for cycles whose status is ``active`` and are re-seeded
+from SQL once older than ``TOURNAMENT_LIVE_LEADERBOARD_MAX_AGE`` seconds. The
+re-seed both self-heals writes made by another API replica and drops the board
+once the pg_cron transition moves the cycle out of ``active``; non-active
+cycles always read through to SQL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import datetime as dt
+import os
+import time
+from logging import getLogger
+
+import msgspec
+from asyncpg import Pool
+from genjishimada_sdk.tournaments import TournamentLeaderboardDeltaEvent, TournamentLeaderboardEntryResponse
+from litestar.datastructures import Headers, State
+
+from repository.tournaments_repository import TournamentRepository
+from services.base import BaseService
+
+log = getLogger(__name__)
+
+TOURNAMENT_LIVE_LEADERBOARD_MAX_AGE = float(os.getenv("TOURNAMENT_LIVE_LEADERBOARD_MAX_AGE", "300"))
+
+type _BoardKey = tuple[bool, bool, float, dt.datetime, int]
+
+
+def _board_key(run: dict) -> _BoardKey:
+    """Return the sort key reproducing ``fetch_leaderboard``'s ranking order."""
+    return (not run["verified"], not run["completion"], float(run["time"]), run["inserted_at"], run["user_id"])
+
+
+class LiveCycleLeaderboard:
+    """Ordered best-run-per-user structure for one tournament cycle."""
+
+    def __init__(self, cycle_id: int, runs: list[dict], *, loaded_at: float) -> None:
+        """Seed the board from :meth:`TournamentRepository.fetch_leaderboard_runs` rows.
+
+        Args:
+            cycle_id: Cycle the board belongs to.
+            runs: One best-run dict per user.
+            loaded_at: Monotonic timestamp of the seeding read.
+        """
+        self.cycle_id = cycle_id
+        self.loaded_at = loaded_at
+        self._runs: dict[int, dict] = {run["user_id"]: run for run in runs}
+        self._keys: list[_BoardKey] = sorted(_board_key(run) for run in runs)
+
+    def __len__(self) -> int:
+        """Return the number of ranked users."""
+        return len(self._keys)
+
+    def _entry(self, rank: int, run: dict) -> TournamentLeaderboardEntryResponse:
+        return TournamentLeaderboardEntryResponse(
+            rank=rank,
+            user_id=run["user_id"],
+            name=run["name"],
+            time=float(run["time"]),
+            verified=run["verified"],
+            completion=run["completion"],
+        )
+
+    def rank_of(self, user_id: int) -> int | None:
+        """Return the user's 1-based rank, or None if they have no run."""
+        run = self._runs.get(user_id)
+        if run is None:
+            return None
+        return bisect.bisect_left(self._keys, _board_key(run)) + 1
+
+    def entry_for(self, user_id: int) -> TournamentLeaderboardEntryResponse | None:
+        """Return the user's ranked entry, or None if they have no run."""
+        rank = self.rank_of(user_id)
+        if rank is None:
+            return None
+        return self._entry(rank, self._runs[user_id])
+
+    def top(self, limit: int | None = None) -> list[TournamentLeaderboardEntryResponse]:
+        """Return the first ``limit`` ranked entries (all entries when None)."""
+        keys = self._keys if limit is None else self._keys[:limit]
+        return [self._entry(index + 1, self._runs[key[-1]]) for index, key in enumerate(keys)]
+
+    def apply(self, user_id: int, run: dict | None) -> TournamentLeaderboardDeltaEvent | None:
+        """Replace a user's best run and return the resulting rank delta.
+
+        Args:
+            user_id: User whose best run changed.
+            run: The user's new best run, or None if they no longer have one.
+
+        Returns:
+            The delta event, or None if neither the rank nor the entry changed.
+        """
+        previous = self._runs.get(user_id)
+        if previous == run:
+            return None
+
+        previous_rank: int | None = None
+        if previous is not None:
+            index = bisect.bisect_left(self._keys, _board_key(previous))
+            del self._keys[index]
+            del self._runs[user_id]
+            previous_rank = index + 1
+
+        rank: int | None = None
+        entry: TournamentLeaderboardEntryResponse | None = None
+        if run is not None:
+            key = _board_key(run)
+            index = bisect.bisect_left(self._keys, key)
+            self._keys.insert(index, key)
+            self._runs[user_id] = run
+            rank = index + 1
+            entry = self._entry(rank, run)
+
+        return TournamentLeaderboardDeltaEvent(
+            cycle_id=self.cycle_id,
+            user_id=user_id,
+            previous_rank=previous_rank,
+            rank=rank,
+            entry=entry,
+            total=len(self._keys),
+        )
+
+    def placement(self, user_id: int) -> TournamentLeaderboardDeltaEvent:
+        """Return a delta placing the user where the board currently ranks them.
+
+        Used when the board was seeded after the user's write, so the change is
+        already in it and the previous rank is unknown (reported as None). A
+        consumer that re-inserts the user at ``rank`` still ends up in sync.
+        """
+        entry = self.entry_for(user_id)
+        return TournamentLeaderboardDeltaEvent(
+            cycle_id=self.cycle_id,
+            user_id=user_id,
+            previous_rank=None,
+            rank=entry.rank if entry is not None else None,
+            entry=entry,
+            total=len(self._keys),
+        )
+
+
+class _LiveLeaderboardRegistry:
+    """Process-wide registry of live cycle boards.
+
+    Litestar constructs services per request via DI, so the boards MUST live at
+    module scope to be shared. The lock serializes seeding so a burst of reads on
+    a cold cycle runs one seeding query; it is created lazily to bind to the
+    running loop.
+    """
+
+    def __init__(self) -> None:
+        self.boards: dict[int, LiveCycleLeaderboard] = {}
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def fresh(self, cycle_id: int) -> LiveCycleLeaderboard | None:
+        board = self.boards.get(cycle_id)
+        if board is None or time.monotonic() - board.loaded_at > TOURNAMENT_LIVE_LEADERBOARD_MAX_AGE:
+            return None
+        return board
+
+
+# Single process-wide registry shared by every TournamentLeaderboardService.
+_BOARDS = _LiveLeaderboardRegistry()
+
+
+class TournamentLeaderboardService(BaseService):
+    """Serve and patch live leaderboards for active tournament cycles."""
+
+    def __init__(self, pool: Pool, state: State, tournament_repo: TournamentRepository) -> None:
+        """Initialize service.
+
+        Args:
+            pool: AsyncPG connection pool.
+            state: Application state.
+            tournament_repo: Tournament repository instance.
+        """
+        super().__init__(pool, state)
+        self._tournament_repo = tournament_repo
+
+    async def _board(self, cycle_id: int) -> LiveCycleLeaderboard | None:
+        """Return the live board for an active cycle, seeding it when missing or stale.
+
+        Returns None (and drops any stale board) when the cycle is not active.
+        """
+        board, _ = await self._seeded_board(cycle_id)
+        return board
+
+    async def _seeded_board(self, cycle_id: int) -> tuple[LiveCycleLeaderboard | None, bool]:
+        """Return :meth:`_board`'s result and whether this call seeded it from SQL."""
+        board = _BOARDS.fresh(cycle_id)
+        if board is not None:
+            return board, False
+
+        async with _BOARDS.lock:
+            board = _BOARDS.fresh(cycle_id)
+            if board is not None:
+                return board, False
+            cycle = await self._tournament_repo.fetch_cycle(cycle_id)
+            if cycle is None or cycle["status"] != "active":
+                _BOARDS.boards.pop(cycle_id, None)
+                return None, False
+            loaded_at = time.monotonic()
+            runs = await self._tournament_repo.fetch_leaderboard_runs(cycle_id)
+            board = LiveCycleLeaderboard(cycle_id, runs, loaded_at=loaded_at)
+            _BOARDS.boards[cycle_id] = board
+            return board, True
+
+    async def get_leaderboard(
+        self, cycle_id: int, *, limit: int | None = None
+    ) -> list[TournamentLeaderboardEntryResponse]:
+        """Get the ranked leaderboard (or its top ``limit`` entries) for a cycle.
+
+        Args:
+            cycle_id: Cycle to fetch leaderboard for.
+            limit: Optional number of leading entries to return.
+
+        Returns:
+            List of ranked leaderboard entries.
+        """
+        board = await self._board(cycle_id)
+        if board is not None:
+            return board.top(limit)
+        rows = await self._tournament_repo.fetch_leaderboard(cycle_id)
+        if limit is not None:
+            rows = rows[:limit]
+        return [msgspec.convert(row, TournamentLeaderboardEntryResponse) for row in rows]
+
+    async def get_user_entry(self, cycle_id: int, user_id: int) -> TournamentLeaderboardEntryResponse | None:
+        """Get a single user's ranked entry for a cycle.
+
+        Args:
+            cycle_id: Cycle to look up.
+            user_id: User to look up.
+
+        Returns:
+            The user's ranked entry, or None if they have no run in the cycle.
+        """
+        board = await self._board(cycle_id)
+        if board is not None:
+            return board.entry_for(user_id)
+        rows = await self._tournament_repo.fetch_leaderboard(cycle_id)
+        row = next((r for r in rows if r["user_id"] == user_id), None)
+        return msgspec.convert(row, TournamentLeaderboardEntryResponse) if row else None
+
+    async def refresh_user(self, cycle_id: int, user_id: int) -> None:
+        """Re-read one user's best run after a committed write and publish the rank delta.
+
+        Called AFTER the submit/verdict transaction commits, so the board never
+        reflects a write that rolled back. A failure is logged, never raised: the
+        write it follows is already committed and the board self-heals on re-seed.
+
+        Args:
+            cycle_id: Cycle the write touched.
+            user_id: User whose run changed.
+        """
+        try:
+            board, seeded = await self._seeded_board(cycle_id)
+            if board is None:
+                return
+            if seeded:
+                # The seeding read already saw the committed write, so apply()
+                # would find nothing to change; publish the user's placement instead.
+                delta = board.placement(user_id)
+            else:
+                run = await self._tournament_repo.fetch_leaderboard_run(cycle_id, user_id)
+                delta = board.apply(user_id, run)
+            if delta is None:
+                return
+            await self.publish_message(
+                routing_key="api.tournament.leaderboard.delta",
+                data=delta,
+                headers=Headers(),
+            )
+        except Exception:
+            log.exception(
+                "Failed to refresh live tournament leaderboard (cycle_id=%s, user_id=%s)",
+                cycle_id,
+                user_id,
+            )
+
+
+async def provide_tournament_leaderboard_service(
+    state: State,
+    tournament_repo: TournamentRepository,
+) -> TournamentLeaderboardService:
+    """Litestar DI provider for the live tournament leaderboard service.
+
+    Args:
+        state: Application state containing the database pool.
+        tournament_repo: Tournament repository instance.
+
+    Returns:
+        TournamentLeaderboardService instance.
+    """
+    return TournamentLeaderboardService(state.db_pool, state, tournament_repo)
@@ -42,6 +42,7 @@ from services.exceptions.tournaments import (
     CycleAlreadyLiveError,
     DebugRouteDisabledError,
     InvalidTimezoneError,
+    LeaderboardEntryNotFoundError,
     MapNotEligibleError,
     NoAwaitingResultsEditionError,
     NoCycleActiveError,
@@ -50,6 +51,7 @@ from services.exceptions.tournaments import (
     PendingCycleNotFoundError,
     TournamentCompletionNotFoundError,
 )
+from services.tournament_leaderboard_service import TournamentLeaderboardService
 from services.tournament_outbox_service import _write_drained_results_row
 from services.tournament_reward_service import TournamentRewardService
 
@@ -1173,6 +1175,8 @@ class TournamentService(BaseService):
         if pending_xp_events and self._reward_service is not None:
             await self._reward_service.publish_xp_events(pending_xp_events)
 
+        await self._live_leaderboard().refresh_user(updated["cycle_id"], updated["user_id"])
+
         event = TournamentVerificationChangedEvent(
             tournament_completion_id=tournament_completion_id,
             cycle_id=updated["cycle_id"],
@@ -1243,17 +1247,43 @@ class TournamentService(BaseService):
             idempotency_key=idempotency_key,
         )
 
-    async def get_leaderboard(self, cycle_id: int) -> list[TournamentLeaderboardEntryResponse]:
+    def _live_leaderboard(self) -> TournamentLeaderboardService:
+        return TournamentLeaderboardService(self._pool, self._state, self._tournament_repo)
+
+    async def get_leaderboard(
+        self, cycle_id: int, *, limit: int | None = None
+    ) -> list[TournamentLeaderboardEntryResponse]:
         """Get the ranked leaderboard for a tournament cycle.
 
+        Active cycles are served from the live in-memory board; other cycles read
+        through to :meth:`TournamentRepository.fetch_leaderboard`.
+
         Args:
             cycle_id: Cycle to fetch leaderboard for.
+            limit: Optional number of leading entries to return.
 
         Returns:
             List of ranked leaderboard entries.
         """
-        rows = await self._tournament_repo.fetch_leaderboard(cycle_id)
-        return [msgspec.convert(row, TournamentLeaderboardEntryResponse) for row in rows]
+        return await self._live_leaderboard().get_leaderboard(cycle_id, limit=limit)
+
+    async def get_leaderboard_entry(self, cycle_id: int, user_id: int) -> TournamentLeaderboardEntryResponse:
+        """Get a single user's ranked entry for a tournament cycle.
+
+        Args:
+            cycle_id: Cycle to look up.
+            user_id: User to look up.
+
+        Returns:
+            The user's ranked entry.
+
+        Raises:
+            LeaderboardEntryNotFoundError: If the user has no run in the cycle.
+        """
+        entry = await self._live_leaderboard().get_user_entry(cycle_id, user_id)
+        if entry is None:
+            raise LeaderboardEntryNotFoundError(cycle_id, user_id)
+        return entry
 
     async def list_cycles(
         self,
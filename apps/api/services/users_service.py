@@ -11,6 +11,7 @@ from genjishimada_sdk.users import (
     OverwatchUsernamesResponse,
     RankDetailResponse,
     UserCreateRequest,
+    UserRankDetailsResponse,
     UserResponse,
     UserUpdateRequest,
 )
@@ -25,7 +26,8 @@ from services.exceptions.users import (
     UserAlreadyExistsError,
     UserNotFoundError,
 )
-from utilities.shared_queries import get_user_rank_data
+from services.rank_card_service import invalidate_rank_cards
+from utilities.shared_queries import get_user_rank_data, get_users_rank_data
 
 log = logging.getLogger(__name__)
 
@@ -82,6 +84,7 @@ class UsersService(BaseService):
             update_nickname=is_nick_set,
             update_global_name=is_glob_set,
         )
+        invalidate_rank_cards(user_id)
 
     async def list_users(self) -> list[UserResponse] | None:
         """List all users with aggregated Overwatch usernames.
@@ -172,19 +175,22 @@ class UsersService(BaseService):
             UserNotFoundError: If user does not exist.
             DuplicateOverwatchUsernameError: If duplicate usernames are provided.
         """
-        await self._users_repo.delete_overwatch_usernames(user_id)
-
-        for item in new_usernames:
-            try:
-                await self._users_repo.insert_overwatch_username(
-                    user_id=user_id,
-                    username=item.username,
-                    is_primary=item.is_primary,
-                )
-            except ForeignKeyViolationError:
-                raise UserNotFoundError(user_id)
-            except UniqueConstraintViolationError as e:
-                raise DuplicateOverwatchUsernameError(user_id, item.username) from e
+        try:
+            await self._users_repo.delete_overwatch_usernames(user_id)
+            for item in new_usernames:
+                try:
+                    await self._users_repo.insert_overwatch_username(
+                        user_id=user_id,
+                        username=item.username,
+                        is_primary=item.is_primary,
+                    )
+                except ForeignKeyViolationError:
+                    raise UserNotFoundError(user_id)
+                except UniqueConstraintViolationError as e:
+                    raise DuplicateOverwatchUsernameError(user_id, item.username) from e
+        finally:
+            # After the inserts, so a rank card rebuilt meanwhile cannot cache a partial list.
+            invalidate_rank_cards(user_id)
 
     async def fetch_overwatch_usernames(self, user_id: int) -> list[OverwatchUsernameItem]:
         """Fetch Overwatch usernames for a user.
@@ -242,6 +248,19 @@ class UsersService(BaseService):
         """
         return await get_user_rank_data(conn, user_id)
 
+    async def get_users_rank_data(self, user_ids: list[int], conn: Connection) -> list[UserRankDetailsResponse]:
+        """Get rank details for several users in one query.
+
+        Args:
+            user_ids: The user IDs.
+            conn: Database connection.
+
+        Returns:
+            Rank details per requested user, in request order.
+        """
+        ranks = await get_users_rank_data(conn, user_ids)
+        return [UserRankDetailsResponse(user_id=user_id, ranks=rows) for user_id, rows in ranks.items()]
+
     async def create_fake_member(self, name: str) -> int:
         """Create a fake member and return the new ID.
 
@@ -0,0 +1,131 @@
+"""Fixtures and reporting for the API benchmarks.
+
+The benchmarks only run with ``BENCH_API=1`` (``just bench-api``); otherwise
+this directory is not collected, so the regular suite never pays for the
+synthetic dataset. They reuse the root conftest's Docker Postgres, migrations
+and seeds, load a synthetic dataset once per session, and time requests
+sequentially through the real app.
+
+Each scenario is compared with ``baseline.json`` when that file exists and was
+recorded at the same dataset scale. ``BENCH_UPDATE_BASELINE=1``
+(``just bench-api-baseline``) rewrites it from the current run instead. The
+latest results are always written to ``results.json``.
+"""
+
+import os
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from pytest_databases.docker.postgres import PostgresService
+
+import app as app_module
+from repository.statements import STATEMENTS
+from tests.benchmarks.datagen import Dataset, DatasetScale, generate
+from tests.benchmarks.harness import QueryCounter, ScenarioResult, compare, load_baseline, write_results
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = Path(os.getenv("BENCH_BASELINE", BENCH_DIR / "baseline.json"))
+RESULTS_PATH = BENCH_DIR / "results.json"
+
+ENABLED = os.getenv("BENCH_API") == "1"
+UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE") == "1"
+TOLERANCE = float(os.getenv("BENCH_TOLERANCE", "0.25"))
+
+if not ENABLED:
+    collect_ignore_glob = ["test_*.py"]
+
+_SCALE = DatasetScale.from_env()
+_RESULTS: dict[str, ScenarioResult] = {}
+_REGRESSIONS: list[str] = []
+
+
+def _baseline_scenarios() -> dict[str, Any] | None:
+    """Return the baseline scenarios, or None if there is no comparable baseline."""
+    baseline = load_baseline(BASELINE_PATH)
+    if UPDATE_BASELINE or baseline is None or baseline.get("dataset") != _SCALE.to_json():
+        return None
+    return baseline["scenarios"]
+
+
+_BASELINE = _baseline_scenarios() if ENABLED else None
+
+
+@pytest.fixture(scope="session")
+def bench_dataset(setup_test_db: None, postgres_connection: Any) -> Dataset:
+    """Load the synthetic dataset once per session."""
+    return generate(postgres_connection, _SCALE)
+
+
+@pytest.fixture
+def query_counter(monkeypatch: pytest.MonkeyPatch) -> QueryCounter:
+    """Count the statements sent by every pool created after this fixture, including the app's."""
+    counter = QueryCounter()
+    monkeypatch.setattr(app_module, "_async_pg_init", counter.pool_init())
+    return counter
+
+
+@pytest.fixture
+async def bench_client(
+    postgres_service: PostgresService, query_counter: QueryCounter
+) -> AsyncIterator[AsyncTestClient[Litestar]]:
+    """Yield an authenticated test client whose pool reports to ``query_counter``."""
+    app = app_module.create_app(
+        psql_dsn=f"postgresql://{postgres_service.user}:{postgres_service.password}@{postgres_service.host}:{postgres_service.port}/{postgres_service.database}"
+    )
+    async with AsyncTestClient(app=app) as client:
+        client.headers.update({"x-pytest-enabled": "1", "X-API-KEY": "testing"})
+        yield client
+
+
+@pytest.fixture
+def record_scenario() -> Callable[[ScenarioResult], None]:
+    """Store a scenario result and fail the test if it regressed against the baseline."""
+
+    def _record(result: ScenarioResult) -> None:
+        _RESULTS[result.name] = result
+        problems = compare(result, (_BASELINE or {}).get(result.name), TOLERANCE)
+        _REGRESSIONS.extend(problems)
+        assert not problems, "\n".join(problems)
+
+    return _record
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write the results, and the baseline when asked to."""
+    if not _RESULTS:
+        return
+    write_results(RESULTS_PATH, _SCALE.to_json(), _RESULTS)
+    if UPDATE_BASELINE:
+        write_results(BASELINE_PATH, _SCALE.to_json(), _RESULTS)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print one line per scenario and how it compared with the baseline."""
+    if not _RESULTS:
+        return
+    terminalreporter.section("API benchmarks")
+    scale = _SCALE
+    terminalreporter.write_line(f"dataset: {scale.users} users, {scale.maps} maps, {scale.completions} completions")
+    for name, result in sorted(_RESULTS.items()):
+        terminalreporter.write_line(
+            f"{name:<24} p50 {result.p50_ms:8.2f} ms  p95 {result.p95_ms:8.2f} ms  "
+            f"p99 {result.p99_ms:8.2f} ms  {result.queries_per_request:5.1f} queries/request"
+        )
+    warmup = STATEMENTS.stats()
+    if warmup.connections:
+        terminalreporter.write_line(
+            f"statement warmup: {warmup.prepared / warmup.connections:.1f} statements, "
+            f"{warmup.prepare_ms / warmup.connections:.2f} ms per connection, {warmup.failed} failed"
+        )
+    if UPDATE_BASELINE:
+        terminalreporter.write_line(f"baseline written to {BASELINE_PATH}")
+    elif _BASELINE is None:
+        terminalreporter.write_line(
+            f"no baseline at this dataset scale in {BASELINE_PATH}; record one with just bench-api-baseline"
+        )
+    elif not _REGRESSIONS:
+        terminalreporter.write_line(f"no regressions against {BASELINE_PATH} (p95 tolerance {TOLERANCE:.0%})")
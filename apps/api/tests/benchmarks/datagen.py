@@ -0,0 +1,162 @@
+"""Synthetic dataset for the API benchmarks.
+
+Loads ``users`` users, ``maps`` approved maps (each with a primary creator and
+medals) and ``completions`` completions into the migrated test database with
+``COPY``. Everything is drawn from a seeded RNG, so the same scale always
+produces the same data and results stay comparable with the stored baseline.
+Completions are skewed towards a few popular maps, like real traffic, so the
+busiest leaderboard is large.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import random
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from genjishimada_sdk import difficulties
+
+# Well above any snowflake the other fixtures hand out.
+BENCH_USER_ID_BASE = 800_000_000_000_000_000
+
+# Codes are "BN" plus four hex digits: valid Overwatch codes no other fixture generates.
+_CODE_PATTERN = "^BN[0-9A-F]{4}$"
+_MAX_MAPS = 0x10000
+
+_MAP_NAMES = ["Hanamura", "Busan", "Ilios", "Nepal", "Oasis"]
+_CATEGORIES = ["Classic", "Increasing Difficulty", "Other"]
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    """Size of the synthetic dataset."""
+
+    users: int
+    maps: int
+    completions: int
+
+    @classmethod
+    def from_env(cls) -> DatasetScale:
+        """Read the scale from ``BENCH_USERS``, ``BENCH_MAPS`` and ``BENCH_COMPLETIONS``."""
+        return cls(
+            users=int(os.getenv("BENCH_USERS", "2000")),
+            maps=int(os.getenv("BENCH_MAPS", "400")),
+            completions=int(os.getenv("BENCH_COMPLETIONS", "40000")),
+        )
+
+    def to_json(self) -> dict[str, int]:
+        """Return the scale as a JSON-ready dict."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """What the scenarios need to know about the loaded data."""
+
+    scale: DatasetScale
+    busiest_code: str
+    top_user_ids: list[int]
+
+
+def generate(conn: Any, scale: DatasetScale, *, seed: int = 0) -> Dataset:
+    """Replace any previous synthetic data with a fresh dataset of ``scale``.
+
+    Args:
+        conn: Synchronous psycopg connection to the migrated test database.
+        scale: Number of users, maps and completions to load.
+        seed: RNG seed.
+
+    Returns:
+        The busiest map and the users with the most completions.
+    """
+    if not 0 < scale.maps <= _MAX_MAPS or scale.users <= 0:
+        raise ValueError(f"Unsupported benchmark scale: {scale}")
+    rng = random.Random(seed)
+    user_ids = [BENCH_USER_ID_BASE + i for i in range(scale.users)]
+    codes = [f"BN{i:04X}" for i in range(scale.maps)]
+    ranges = list(difficulties.DIFFICULTY_RANGES_ALL.items())
+
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM core.maps WHERE code ~ %s", (_CODE_PATTERN,))
+        cur.execute("DELETE FROM core.users WHERE id >= %s", (BENCH_USER_ID_BASE,))
+
+        with cur.copy("COPY core.users (id, nickname, global_name) FROM STDIN") as copy:
+            for user_id in user_ids:
+                name = f"bench{user_id - BENCH_USER_ID_BASE}"
+                copy.write_row((user_id, name, name))
+
+        with cur.copy(
+            "COPY core.maps (code, map_name, category, checkpoints, official, playtesting, hidden, archived, "
+            "difficulty, raw_difficulty) FROM STDIN"
+        ) as copy:
+            for code in codes:
+                difficulty, (low, high) = rng.choice(ranges)
+                copy.write_row(
+                    (
+                        code,
+                        rng.choice(_MAP_NAMES),
+                        rng.choice(_CATEGORIES),
+                        rng.randint(5, 60),
+                        rng.random() < 0.9,
+                        "Approved",
+                        False,
+                        rng.random() < 0.05,
+                        difficulty,
+                        round(rng.uniform(low, high - 0.01), 2),
+                    )
+                )
+
+        cur.execute("SELECT code, id FROM core.maps WHERE code ~ %s", (_CODE_PATTERN,))
+        id_by_code = dict(cur.fetchall())
+        map_ids = [id_by_code[code] for code in codes]
+        code_by_map = dict(zip(map_ids, codes, strict=True))
+        par_times = {map_id: rng.uniform(60, 900) for map_id in map_ids}
+
+        with cur.copy("COPY maps.creators (map_id, user_id, is_primary) FROM STDIN") as copy:
+            for map_id in map_ids:
+                copy.write_row((map_id, rng.choice(user_ids), True))
+
+        with cur.copy("COPY maps.medals (map_id, gold, silver, bronze) FROM STDIN") as copy:
+            for map_id, par in par_times.items():
+                copy.write_row((map_id, round(par * 0.8, 2), round(par, 2), round(par * 1.3, 2)))
+
+        # Map popularity falls off with rank, so a handful of maps carry most runs.
+        weights = [1 / (rank + 1) for rank in range(len(map_ids))]
+        picked = rng.choices(map_ids, weights=weights, k=scale.completions)
+        started = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+        per_map: Counter[int] = Counter()
+        per_user: Counter[int] = Counter()
+        with cur.copy(
+            "COPY core.completions (map_id, user_id, time, screenshot, verified, completion, legacy, inserted_at) "
+            "FROM STDIN"
+        ) as copy:
+            for index, map_id in enumerate(picked):
+                user_id = rng.choice(user_ids)
+                verified = rng.random() < 0.9
+                per_map[map_id] += verified
+                per_user[user_id] += verified
+                copy.write_row(
+                    (
+                        map_id,
+                        user_id,
+                        round(par_times[map_id] * rng.uniform(0.7, 1.6), 2),
+                        "https://example.com/screenshot.png",
+                        verified,
+                        rng.random() < 0.1,
+                        False,
+                        started + dt.timedelta(seconds=index),
+                    )
+                )
+
+        for table in ("core.users", "core.maps", "maps.creators", "maps.medals", "core.completions"):
+            cur.execute(f"ANALYZE {table}")
+    conn.commit()
+
+    return Dataset(
+        scale=scale,
+        busiest_code=code_by_map[per_map.most_common(1)[0][0]],
+        top_user_ids=[user_id for user_id, _ in per_user.most_common(50)],
+    )
@@ -0,0 +1,140 @@
+"""Timing, query counting and baseline comparison for the API benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from asyncpg.connection import LoggedQuery
+
+from app import _async_pg_init
+
+
+class QueryCounter:
+    """asyncpg query logger that counts every statement sent on a connection."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, record: LoggedQuery) -> None:
+        self.count += 1
+
+    def pool_init(self) -> Callable[[Any], Awaitable[None]]:
+        """Return a pool ``init`` that sets up the API codecs and this counter on each connection."""
+
+        async def init(conn: Any) -> None:
+            await _async_pg_init(conn)
+            conn.add_query_logger(self)
+
+        return init
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """Latency percentiles and queries per request of one scenario."""
+
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the result as a JSON-ready dict, without the name."""
+        data = asdict(self)
+        del data["name"]
+        return data
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[object]],
+    counter: QueryCounter,
+    *,
+    iterations: int,
+    warmup: int,
+) -> ScenarioResult:
+    """Run ``call`` sequentially and record its latency and query count.
+
+    Args:
+        name: Scenario name, the key in the baseline file.
+        call: One request or operation.
+        counter: Counter installed on every connection ``call`` uses.
+        iterations: Timed runs.
+        warmup: Untimed runs first, to warm connections, plans and caches.
+
+    Returns:
+        The scenario result.
+    """
+    for _ in range(warmup):
+        await call()
+    samples: list[float] = []
+    queries = 0
+    for _ in range(iterations):
+        before = counter.count
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+        # asyncpg runs query loggers with call_soon; let them land before reading the count.
+        await asyncio.sleep(0)
+        queries += counter.count - before
+    return summarize(name, samples, queries)
+
+
+def summarize(name: str, samples: list[float], queries: int) -> ScenarioResult:
+    """Build a scenario result from per-request latencies in ms and the total statements sent."""
+    quantiles = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return ScenarioResult(
+        name=name,
+        iterations=len(samples),
+        p50_ms=round(quantiles[49], 3),
+        p95_ms=round(quantiles[94], 3),
+        p99_ms=round(quantiles[98], 3),
+        queries_per_request=round(queries / len(samples), 2),
+    )
+
+
+def compare(result: ScenarioResult, baseline: dict[str, Any] | None, tolerance: float) -> list[str]:
+    """Return the ways ``result`` regressed against its baseline entry.
+
+    p95 latency may exceed the baseline by ``tolerance`` (a fraction) to absorb
+    noise; queries per request are deterministic and may not grow at all.
+    """
+    if baseline is None:
+        return []
+    problems = []
+    allowed_ms = baseline["p95_ms"] * (1 + tolerance)
+    if result.p95_ms > allowed_ms:
+        problems.append(
+            f"{result.name}: p95 {result.p95_ms:.2f} ms exceeds {allowed_ms:.2f} ms "
+            f"(baseline {baseline['p95_ms']:.2f} ms + {tolerance:.0%})"
+        )
+    if result.queries_per_request > baseline["queries_per_request"]:
+        problems.append(
+            f"{result.name}: {result.queries_per_request:g} queries per request, "
+            f"baseline {baseline['queries_per_request']:g}"
+        )
+    return problems
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    """Read a baseline file, or None if there is none yet."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_results(path: Path, dataset: dict[str, int], results: dict[str, ScenarioResult]) -> None:
+    """Write results in the baseline file format."""
+    data = {
+        "dataset": dataset,
+        "scenarios": {name: result.to_json() for name, result in sorted(results.items())},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,105 @@
+"""Latency and query-count benchmarks for the hot v3 API paths.
+
+Each test drives one scenario sequentially against the synthetic dataset and
+records p50/p95/p99 latency and queries per request; ``record_scenario`` fails
+it when it regressed against the stored baseline. Run with ``just bench-api``.
+"""
+
+import itertools
+import os
+
+import asyncpg
+from pytest_databases.docker.postgres import PostgresService
+
+from repository.skill_repository import SkillRepository
+from services.rank_card_service import invalidate_rank_cards
+from services.skill_service import SkillService
+from tests.benchmarks.harness import measure
+
+MAPS = "/api/v3/maps/"
+COMPLETIONS = "/api/v3/completions"
+USERS = "/api/v3/users"
+
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "200"))
+WARMUP = int(os.getenv("BENCH_WARMUP", "20"))
+RECOMPUTE_ITERATIONS = int(os.getenv("BENCH_RECOMPUTE_ITERATIONS", "5"))
+
+
+async def test_map_search_default(bench_client, bench_dataset, query_counter, record_scenario):
+    """Unfiltered first page of the map search."""
+
+    async def call() -> None:
+        response = await bench_client.get(MAPS, params={"page_size": 20})
+        assert response.status_code == 200
+
+    record_scenario(await measure("map_search_default", call, query_counter, iterations=ITERATIONS, warmup=WARMUP))
+
+
+async def test_map_search_filtered(bench_client, bench_dataset, query_counter, record_scenario):
+    """Map search with category, difficulty range and per-user completion filters."""
+    users = itertools.cycle(bench_dataset.top_user_ids)
+
+    async def call() -> None:
+        response = await bench_client.get(
+            MAPS,
+            params={
+                "category": "Classic",
+                "difficulty_range_min": "Medium",
+                "difficulty_range_max": "Extreme",
+                "official": True,
+                "user_id": next(users),
+                "completion_filter": "Without",
+                "page_size": 20,
+            },
+        )
+        assert response.status_code == 200
+
+    record_scenario(await measure("map_search_filtered", call, query_counter, iterations=ITERATIONS, warmup=WARMUP))
+
+
+async def test_map_leaderboard(bench_client, bench_dataset, query_counter, record_scenario):
+    """First leaderboard page of the map with the most verified completions."""
+
+    async def call() -> None:
+        response = await bench_client.get(f"{COMPLETIONS}/{bench_dataset.busiest_code}", params={"page_size": 50})
+        assert response.status_code == 200
+
+    record_scenario(await measure("map_leaderboard", call, query_counter, iterations=ITERATIONS, warmup=WARMUP))
+
+
+async def test_rank_card(bench_client, bench_dataset, query_counter, record_scenario):
+    """Rank card of the most active users, built from the database every time."""
+    users = itertools.cycle(bench_dataset.top_user_ids)
+
+    async def call() -> None:
+        user_id = next(users)
+        invalidate_rank_cards(user_id)
+        response = await bench_client.get(f"{USERS}/{user_id}/rank-card/")
+        assert response.status_code == 200
+
+    record_scenario(await measure("rank_card", call, query_counter, iterations=ITERATIONS, warmup=WARMUP))
+
+
+async def test_skill_recompute(postgres_service: PostgresService, bench_dataset, query_counter, record_scenario):
+    """Full skill snapshot rebuild over every synthetic completion."""
+    pool = await asyncpg.create_pool(
+        user=postgres_service.user,
+        password=postgres_service.password,
+        host=postgres_service.host,
+        port=postgres_service.port,
+        database=postgres_service.database,
+        min_size=1,
+        max_size=3,
+        init=query_counter.pool_init(),
+    )
+    try:
+        state = type("S", (), {"db_pool": pool})()
+        service = SkillService(pool, state, SkillRepository(pool))
+
+        record_scenario(
+            await measure(
+                "skill_recompute", service.recompute_all, query_counter, iterations=RECOMPUTE_ITERATIONS, warmup=1
+            )
+        )
+    finally:
+        await pool.close()
@@ -0,0 +1,50 @@
+"""First-query latency on a new pool connection, with and without statement warmup.
+
+asyncpg exposes no statement cache hit counter, so the saving is measured where
+it happens: each iteration opens a connection, runs the app's connection init
+and times the first map leaderboard fetch. Without warmup that fetch first
+prepares the statement (a Parse/Describe round trip); with warmup it was prepared
+during init and is a cache hit. Both still plan at execution. The time init spends preparing the warm set is printed in the summary.
+"""
+
+import os
+import time
+
+import asyncpg
+import pytest
+from pytest_databases.docker.postgres import PostgresService
+
+import app as app_module
+from repository.statements import STATEMENTS
+from tests.benchmarks.harness import summarize
+
+CONNECTIONS = int(os.getenv("BENCH_WARMUP_CONNECTIONS", "50"))
+
+
+async def _first_fetch_ms(postgres_service: PostgresService, code: str) -> float:
+    conn = await asyncpg.connect(
+        user=postgres_service.user,
+        password=postgres_service.password,
+        host=postgres_service.host,
+        port=postgres_service.port,
+        database=postgres_service.database,
+        statement_cache_size=app_module.SQL_STATEMENT_CACHE_SIZE,
+    )
+    try:
+        await app_module._async_pg_init(conn)
+        started = time.perf_counter()
+        await conn.fetch(STATEMENTS.get("completions.map_leaderboard").sql, code, 50, 0)
+        return (time.perf_counter() - started) * 1000
+    finally:
+        await conn.close()
+
+
+@pytest.mark.parametrize("warm", [False, True], ids=["cold", "warm"])
+async def test_first_leaderboard_fetch(
+    postgres_service: PostgresService, bench_dataset, monkeypatch, record_scenario, warm
+):
+    """First leaderboard fetch on a new connection."""
+    monkeypatch.setattr(app_module, "SQL_WARM_STATEMENTS", warm)
+    samples = [await _first_fetch_ms(postgres_service, bench_dataset.busiest_code) for _ in range(CONNECTIONS)]
+
+    record_scenario(summarize(f"first_leaderboard_fetch_{'warm' if warm else 'cold'}", samples, len(samples)))
@@ -0,0 +1,151 @@
+"""Unit tests for the bot-side guild tag cache and write-behind usage counters.
+
+``apps/bot/extensions/tags/cache.py`` is loaded by path with the real bot
+``utilities`` graph; only ``extensions._queue_registry.queue_consumer`` is stubbed
+so the consumer body can be invoked with an already-decoded event.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from genjishimada_sdk.tags import TagRowDTO, TagsMutatedEvent, TagsSearchResponse
+
+GUILD_ID = 100000000000000001
+
+
+def _load_cache_module() -> ModuleType:
+    module_name = "bot_extensions_tags_cache"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    bot_root = pathlib.Path(__file__).resolve().parents[4] / "apps" / "bot"
+    snapshot = {
+        k: v
+        for k, v in sys.modules.items()
+        if k in ("utilities", "extensions") or k.startswith(("utilities.", "extensions."))
+    }
+    try:
+        for key in snapshot:
+            del sys.modules[key]
+        # apps/api has its own ``utilities`` package, so apps/bot must come first.
+        if str(bot_root) in sys.path:
+            sys.path.remove(str(bot_root))
+        sys.path.insert(0, str(bot_root))
+
+        extensions_pkg = ModuleType("extensions")
+        extensions_pkg.__path__ = []  # type: ignore[attr-defined]
+        sys.modules["extensions"] = extensions_pkg
+        qr_mod = ModuleType("extensions._queue_registry")
+
+        def _queue_consumer(queue_name: str, *, struct_type: Any, idempotent: bool = False, **_: Any):  # noqa: ANN202
+            def decorator(fn):  # noqa: ANN001, ANN202
+                fn._queue_name = queue_name
+                return fn
+
+            return decorator
+
+        qr_mod.queue_consumer = _queue_consumer  # type: ignore[attr-defined]
+        sys.modules["extensions._queue_registry"] = qr_mod
+
+        spec = importlib.util.spec_from_file_location(module_name, bot_root / "extensions" / "tags" / "cache.py")
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        for key in list(sys.modules):
+            if key in ("utilities", "extensions") or key.startswith(("utilities.", "extensions.")):
+                del sys.modules[key]
+        sys.modules.update(snapshot)
+
+
+def _row(tag_id: int, name: str, content: str, *, is_alias: bool = False) -> TagRowDTO:
+    return TagRowDTO(
+        id=tag_id,
+        guild_id=GUILD_ID,
+        name=name,
+        owner_id=1,
+        is_alias=is_alias,
+        canonical_name=name,
+        uses=0,
+        content=content,
+    )
+
+
+@pytest.fixture
+def api() -> SimpleNamespace:
+    return SimpleNamespace(
+        search_tags=AsyncMock(
+            return_value=TagsSearchResponse(
+                items=[_row(1, "Rules", "Be nice."), _row(2, "regs", "Be nice.", is_alias=True)]
+            )
+        ),
+        increment_tag_usage=AsyncMock(),
+    )
+
+
+@pytest.fixture
+async def cache(api: SimpleNamespace):
+    module = _load_cache_module()
+    bot = SimpleNamespace(
+        api=api,
+        wait_until_ready=AsyncMock(),
+        get_guild=lambda _: object(),
+        config=SimpleNamespace(guild=GUILD_ID),
+    )
+    handler = module.TagCacheHandler(bot)
+    yield handler
+    handler._set_attrs_task.cancel()
+
+
+async def test_lookups_resolve_aliases_from_one_load(cache, api: SimpleNamespace) -> None:
+    """Names and aliases resolve case-insensitively after a single search."""
+    tags = await cache.get_guild(GUILD_ID)
+    assert tags.get("rules")["content"] == "Be nice."
+    assert tags.get("REGS")["id"] == 2
+    assert tags.get("missing") is None
+
+    await cache.get_guild(GUILD_ID)
+    api.search_tags.assert_awaited_once()
+
+
+async def test_mutated_event_invalidates_guild(cache, api: SimpleNamespace) -> None:
+    """An ``api.tags.mutated`` event forces the next lookup to reload."""
+    await cache.get_guild(GUILD_ID)
+    await cache._on_tags_mutated(TagsMutatedEvent(guild_id=GUILD_ID), None)
+    await cache.get_guild(GUILD_ID)
+    assert api.search_tags.await_count == 2
+
+
+async def test_usage_is_flushed_as_one_batch(cache, api: SimpleNamespace) -> None:
+    """Uses accumulate per name and are sent in a single request."""
+    cache.record_use(GUILD_ID, "Rules")
+    cache.record_use(GUILD_ID, "rules")
+    cache.record_use(GUILD_ID, "regs")
+
+    await cache.flush_usage()
+
+    api.increment_tag_usage.assert_awaited_once()
+    items = api.increment_tag_usage.call_args.args[0].items
+    assert {(i.name, i.count) for i in items} == {("rules", 2), ("regs", 1)}
+
+
+async def test_failed_flush_keeps_counts(cache, api: SimpleNamespace) -> None:
+    """A failed flush merges its counts back for the next attempt."""
+    api.increment_tag_usage.side_effect = [RuntimeError("down"), None]
+    cache.record_use(GUILD_ID, "rules")
+
+    await cache.flush_usage()
+    cache.record_use(GUILD_ID, "rules")
+    await cache.flush_usage()
+
+    items = api.increment_tag_usage.call_args.args[0].items
+    assert [(i.name, i.count) for i in items] == [("rules", 2)]
@@ -200,7 +200,10 @@ def _make_itx(*, user_id: int = 500, roles: set[int] | None = None) -> SimpleNam
     user.id = user_id
     user.get_role = MagicMock(side_effect=lambda rid: object() if rid in roles else None)
 
-    client = SimpleNamespace(api=api, config=config)
+    # The leaderboard command reads through the handler's per-cycle cache; with no
+    # cache populated it falls through to the API wrapper.
+    tournaments = SimpleNamespace(get_leaderboard=lambda cycle_id: api.get_tournament_leaderboard(cycle_id))
+    client = SimpleNamespace(api=api, config=config, tournaments=tournaments)
     itx = SimpleNamespace(
         response=response,
         edit_original_response=edit,
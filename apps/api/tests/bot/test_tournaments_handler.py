@@ -31,6 +31,7 @@ from genjishimada_sdk.tournaments import (
     TournamentCycleCompletedEvent,
     TournamentCycleStartedEvent,
     TournamentEditionResultsEvent,
+    TournamentLeaderboardDeltaEvent,
     TournamentLeaderboardEntryResponse,
     TournamentRolloverEvent,
     TournamentVerificationChangedEvent,
@@ -864,3 +865,69 @@ async def test_verification_changed_posts_no_per_run_message() -> None:
     await handler._on_verification_changed(event, None)
 
     assert channel.send_calls == []
+
+
+# ---------------------------------------------------------------------------
+# Live leaderboard delta patching
+# ---------------------------------------------------------------------------
+
+
+def _lb_entry(user_id: int, rank: int, time: float) -> TournamentLeaderboardEntryResponse:
+    return TournamentLeaderboardEntryResponse(
+        rank=rank, user_id=user_id, name=f"U{user_id}", time=time, verified=False, completion=False
+    )
+
+
+def _make_leaderboard_handler(bot_api: AsyncMock) -> Any:
+    handler = object.__new__(TournamentHandler)
+    handler.bot = SimpleNamespace(api=bot_api)
+    handler.leaderboards = {}
+    handler._leaderboard_fetched_at = {}
+    return handler
+
+
+def test_apply_leaderboard_delta_moves_user_and_renumbers() -> None:
+    """A delta re-inserts the user at the new rank and renumbers everyone else."""
+    board = [_lb_entry(1, 1, 10.0), _lb_entry(2, 2, 20.0), _lb_entry(3, 3, 30.0)]
+    event = TournamentLeaderboardDeltaEvent(
+        cycle_id=42, user_id=3, previous_rank=3, rank=1, entry=_lb_entry(3, 1, 5.0), total=3
+    )
+
+    patched = _tournaments.apply_leaderboard_delta(board, event)
+
+    assert [(e.user_id, e.rank) for e in patched] == [(3, 1), (1, 2), (2, 3)]
+    assert _tournaments.apply_leaderboard_delta(patched, event) == patched
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_delta_patches_cache_without_refetch() -> None:
+    """A cached board is patched from the delta and served without another API call."""
+    api = AsyncMock()
+    api.get_tournament_leaderboard.return_value = [_lb_entry(1, 1, 10.0)]
+    handler = _make_leaderboard_handler(api)
+
+    await handler.get_leaderboard(42)
+    event = TournamentLeaderboardDeltaEvent(
+        cycle_id=42, user_id=2, previous_rank=None, rank=1, entry=_lb_entry(2, 1, 5.0), total=2
+    )
+    await handler._on_leaderboard_delta(event, None)
+    entries = await handler.get_leaderboard(42)
+
+    assert [(e.user_id, e.rank) for e in entries] == [(2, 1), (1, 2)]
+    api.get_tournament_leaderboard.assert_awaited_once_with(42)
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_delta_out_of_sync_drops_cache() -> None:
+    """A delta whose total disagrees with the patched board drops the cache."""
+    api = AsyncMock()
+    api.get_tournament_leaderboard.return_value = [_lb_entry(1, 1, 10.0)]
+    handler = _make_leaderboard_handler(api)
+
+    await handler.get_leaderboard(42)
+    event = TournamentLeaderboardDeltaEvent(
+        cycle_id=42, user_id=2, previous_rank=None, rank=1, entry=_lb_entry(2, 1, 5.0), total=5
+    )
+    await handler._on_leaderboard_delta(event, None)
+
+    assert 42 not in handler.leaderboards
@@ -14,6 +14,7 @@ from pytest_databases.docker.postgres import PostgresService
 
 from app import _async_pg_init, create_app
 from genjishimada_sdk import difficulties
+from middleware.sql_instrumentation import budget_violations, clear_budget_violations
 
 pytest_plugins = [
     "pytest_databases.docker.postgres",
@@ -133,6 +134,22 @@ async def test_client(postgres_service: PostgresService) -> AsyncIterator[AsyncT
         yield client
 
 
+@pytest.fixture(autouse=True)
+def enforce_query_budgets() -> Generator[None, Any, None]:
+    """Fail any test whose requests sent more queries than their route's ``query_budget``."""
+    clear_budget_violations()
+    yield
+    violations = budget_violations()
+    clear_budget_violations()
+    if violations:
+        pytest.fail(
+            "\n".join(
+                f"{v.route} ({v.path}) sent {v.queries} queries, budget {v.budget}; top statements: {v.top_statements}"
+                for v in violations
+            )
+        )
+
+
 # ==============================================================================
 # GLOBAL TRACKING FIXTURES
 # ==============================================================================
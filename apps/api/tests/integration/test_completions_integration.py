@@ -719,6 +719,52 @@ class TestGetCompletionSubmission:
         assert response.status_code == 404
 
 
+class TestGetCompletionSubmissions:
+    """POST /api/v3/completions/submissions/batch"""
+
+    async def test_matches_single_submission_lookup(
+        self, test_client, create_test_user, create_test_map, unique_map_code, unique_message_id
+    ):
+        """Batch lookup returns the same rows as one-by-one lookups and skips unknown IDs."""
+        user_id = await create_test_user()
+        code = unique_map_code
+        await create_test_map(code=code, checkpoints=10)
+
+        completion_ids = []
+        for i, time in enumerate((45.5, 40.25)):
+            submit_response = await test_client.post(
+                "/api/v3/completions/",
+                json={
+                    "user_id": user_id if i == 0 else await create_test_user(),
+                    "code": code,
+                    "time": time,
+                    "screenshot": "https://example.com/screenshot.png",
+                    "message_id": unique_message_id + i,
+                },
+            )
+            assert submit_response.status_code == 201
+            completion_ids.append(submit_response.json()["completion_id"])
+
+        response = await test_client.post(
+            "/api/v3/completions/submissions/batch",
+            json={"ids": [*reversed(completion_ids), 999999999]},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [row["id"] for row in data] == sorted(completion_ids)
+        for row in data:
+            single = await test_client.get(f"/api/v3/completions/{row['id']}/submission")
+            assert single.json() == row
+
+    async def test_empty_batch_returns_empty_list(self, test_client):
+        """An empty batch returns no rows."""
+        response = await test_client.post("/api/v3/completions/submissions/batch", json={"ids": []})
+
+        assert response.status_code == 201
+        assert response.json() == []
+
+
 class TestVerifyCompletion:
     """PUT /api/v3/completions/{record_id}/verification"""
 
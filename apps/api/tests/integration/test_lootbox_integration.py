@@ -558,6 +558,43 @@ class TestGrantUserXp:
         assert response.status_code == 400
 
 
+class TestGrantUsersXp:
+    """POST /api/v3/lootbox/xp/batch"""
+
+    async def test_grant_xp_to_many_users(self, test_client, create_test_user):
+        """Batch grant returns running totals per grant in request order."""
+        first = await create_test_user()
+        second = await create_test_user()
+
+        payload = {
+            "grants": [
+                {"user_id": first, "amount": 30, "type": "Map Submission"},
+                {"user_id": second, "amount": 35, "type": "Playtest"},
+                {"user_id": first, "amount": 35, "type": "Playtest"},
+            ]
+        }
+        response = await test_client.post("/api/v3/lootbox/xp/batch", json=payload)
+
+        assert response.status_code == 200
+        grants = response.json()["grants"]
+        assert [g["user_id"] for g in grants] == [first, second, first]
+        assert grants[0]["previous_amount"] == 0
+        assert grants[2]["previous_amount"] == grants[0]["new_amount"]
+        assert grants[2]["new_amount"] > grants[2]["previous_amount"]
+
+        summary = await test_client.get(f"/api/v3/lootbox/users/{first}/xp-summary")
+        assert summary.json()["xp"] == grants[2]["new_amount"]
+
+    async def test_invalid_xp_type_returns_400(self, test_client, create_test_user):
+        """Batch grant with an invalid type returns 400."""
+        user_id = await create_test_user()
+
+        payload = {"grants": [{"user_id": user_id, "amount": 10, "type": "invalid"}]}
+        response = await test_client.post("/api/v3/lootbox/xp/batch", json=payload)
+
+        assert response.status_code == 400
+
+
 class TestGetXpTierChange:
     """GET /api/v3/lootbox/xp/tier"""
 
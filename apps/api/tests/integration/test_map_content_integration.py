@@ -14,6 +14,8 @@ assert the stripped-key overwrite.
 
 from __future__ import annotations
 
+from typing import IO
+
 import pytest
 
 import services.image_storage_service as image_storage_module
@@ -39,12 +41,15 @@ def banner_spy(monkeypatch):
     """
     calls: list[tuple[bytes, str, str]] = []
 
-    def _fake_init(self) -> None:
+    def _fake_init(self, *_args, **_kwargs) -> None:
         # Skip the real boto3 client construction (no valid S3 endpoint in tests).
         self.client = None
+        self._storage = image_storage_module.OBJECT_STORAGE
+        self._variants = image_storage_module.IMAGE_VARIANTS
 
-    def _fake_upload(self, content: bytes, content_type: str, map_name: str) -> str:
-        calls.append((content, content_type, map_name))
+    def _fake_upload(self, content: bytes | IO[bytes], content_type: str, map_name: str) -> str:
+        # The route streams the spooled banner file rather than its bytes.
+        calls.append((content if isinstance(content, bytes) else content.read(), content_type, map_name))
         import re
 
         stripped = re.sub(r"[^a-zA-Z0-9]", "", map_name).lower().strip().replace(" ", "")
@@ -434,6 +434,29 @@ class TestGetUserRankData:
         assert response.status_code == 401
 
 
+class TestGetUsersRankData:
+    """POST /api/v3/users/ranks/batch"""
+
+    async def test_matches_single_user_lookup(self, test_client, create_test_user):
+        """Batch rank data matches per-user lookups, in request order."""
+        user_ids = [await create_test_user(), await create_test_user()]
+
+        response = await test_client.post("/api/v3/users/ranks/batch", json={"user_ids": user_ids[::-1]})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [row["user_id"] for row in data] == user_ids[::-1]
+        for row in data:
+            single = await test_client.get(f"/api/v3/users/{row['user_id']}/rank")
+            assert row["ranks"] == single.json()
+
+    async def test_requires_auth(self, unauthenticated_client):
+        """Batch rank data without auth returns 401."""
+        response = await unauthenticated_client.post("/api/v3/users/ranks/batch", json={"user_ids": [1]})
+
+        assert response.status_code == 401
+
+
 class TestCreateFakeMember:
     """POST /api/v3/users/fake"""
 
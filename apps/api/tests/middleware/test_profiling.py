@@ -0,0 +1,82 @@
+"""Tests for the local profiling collector and middleware."""
+
+from litestar import Litestar, get
+from litestar.testing import TestClient
+
+from middleware.profiling import LocalProfile, LocalProfilingMiddleware
+
+# ruff: noqa: ANN201
+
+
+class TestLocalProfile:
+    """Tests for LocalProfile histograms and slowest-request retention."""
+
+    def test_histogram_buckets(self):
+        """Test that durations land in the right bucket, overflow included."""
+        profile = LocalProfile(keep=0)
+        profile.record("GET /a", "/a", 200, 3.0, None)
+        profile.record("GET /a", "/a", 200, 5.0, None)
+        profile.record("GET /a", "/a", 500, 9000.0, None)
+
+        (route,) = profile.report().routes
+        assert route.count == 3
+        assert route.max_ms == 9000.0
+        assert route.buckets[0] == 2
+        assert route.buckets[-1] == 1
+        assert route.status_codes == {200: 2, 500: 1}
+
+    def test_keeps_only_slowest(self):
+        """Test that only the N slowest profiles are kept, slowest first."""
+        profile = LocalProfile(keep=2)
+        for duration in (10.0, 30.0, 20.0, 5.0):
+            profiler = profile.start_profile()
+            assert profiler is not None
+            profile.finish_profile(profiler)
+            profile.record("GET /a", f"/a/{duration}", 200, duration, profiler)
+
+        assert [s.duration_ms for s in profile.slowest()] == [30.0, 20.0]
+        assert all(s.report for s in profile.slowest())
+
+    def test_one_profiler_at_a_time(self):
+        """Test that overlapping requests are not profiled concurrently."""
+        profile = LocalProfile(keep=5)
+        first = profile.start_profile()
+        assert first is not None
+        assert profile.start_profile() is None
+        profile.finish_profile(first)
+        second = profile.start_profile()
+        assert second is not None
+        profile.finish_profile(second)
+
+    def test_reset(self):
+        """Test that reset drops histograms and profiles."""
+        profile = LocalProfile(keep=1)
+        profiler = profile.start_profile()
+        profile.finish_profile(profiler)
+        profile.record("GET /a", "/a", 200, 1.0, profiler)
+        profile.reset()
+        report = profile.report()
+        assert report.routes == []
+        assert report.slowest == []
+
+
+def test_middleware_records_path_template(monkeypatch):
+    """Test that the middleware keys histograms by method and path template."""
+    import middleware.profiling as profiling
+
+    profile = LocalProfile(keep=1)
+    monkeypatch.setattr(profiling, "LOCAL_PROFILE", profile)
+
+    @get("/items/{item_id:int}")
+    async def handler(item_id: int) -> int:
+        return item_id
+
+    app = Litestar(route_handlers=[handler], middleware=[LocalProfilingMiddleware()])
+    with TestClient(app) as client:
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+
+    (route,) = profile.report().routes
+    assert route.route == "GET /items/{item_id}"
+    assert route.count == 2
+    assert len(profile.slowest()) == 1
@@ -0,0 +1,150 @@
+"""Tests for read replica routing and read-your-writes stickiness."""
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import Litestar, get, post
+from litestar.testing import TestClient
+
+from middleware.replica_routing import ReplicaRoutingMiddleware
+from repository.base import BaseRepository
+from repository.replica import READ_REPLICA, _ReadReplica, monitor_replica_lag, replica_reads
+
+# ruff: noqa: ANN201
+
+
+@pytest.fixture(autouse=True)
+def clear_read_replica():
+    """Reset the process-wide replica router around every test."""
+    READ_REPLICA.clear()
+    yield
+    READ_REPLICA.clear()
+
+
+def _replica_pool(lag: float | Exception) -> MagicMock:
+    pool = MagicMock()
+    pool.fetchval = AsyncMock(side_effect=[lag] if isinstance(lag, Exception) else None, return_value=lag)
+    return pool
+
+
+class TestReadReplica:
+    """Tests for the replica router."""
+
+    async def test_routes_only_inside_replica_reads_when_within_lag(self):
+        """Test that the replica is used inside replica_reads and only while its lag is acceptable."""
+        router = _ReadReplica(max_lag=5, sticky_seconds=5)
+        pool = _replica_pool(1.0)
+        router.attach(pool)
+
+        with replica_reads():
+            assert router.read_pool() is None  # not measured yet
+        await router.check_lag()
+        assert router.read_pool() is None
+        with replica_reads():
+            assert router.read_pool() is pool
+
+        pool.fetchval.return_value = 30.0
+        await router.check_lag()
+        with replica_reads():
+            assert router.read_pool() is None
+
+    async def test_unreachable_replica_falls_back_to_primary(self):
+        """Test that a failed lag check marks the replica unusable."""
+        router = _ReadReplica(max_lag=5, sticky_seconds=5)
+        router.attach(_replica_pool(OSError("connection refused")))
+
+        assert await router.check_lag() is None
+        with replica_reads():
+            assert router.read_pool() is None
+
+    async def test_replica_that_stopped_streaming_falls_back_to_primary(self):
+        """Test that a standby reporting no lag because its WAL receiver is down is not used."""
+        router = _ReadReplica(max_lag=5, sticky_seconds=5)
+        pool = _replica_pool(0.0)
+        router.attach(pool)
+        await router.check_lag()
+
+        pool.fetchval.return_value = None  # _LAG_QUERY once pg_stat_wal_receiver is not streaming
+        assert await router.check_lag() is None
+        with replica_reads():
+            assert router.read_pool() is None
+        assert "status = 'streaming'" in pool.fetchval.call_args.args[0]
+
+    async def test_hung_replica_times_out(self, mocker):
+        """Test that a lag check stuck acquiring a connection is abandoned and counts as lagging."""
+        mocker.patch("repository.replica._LAG_CHECK_TIMEOUT", 0.01)
+
+        async def hang(*_: object) -> None:
+            await asyncio.Event().wait()
+
+        router = _ReadReplica(max_lag=5, sticky_seconds=5)
+        router.attach(MagicMock(fetchval=AsyncMock(side_effect=hang)))
+        router.lag_seconds = 0.0
+
+        assert await router.check_lag() is None
+        assert not router.healthy()
+
+    def test_note_write_pins_client(self):
+        """Test that a client that wrote is sticky and other clients are not."""
+        router = _ReadReplica(max_lag=5, sticky_seconds=5)
+        router.note_write("key-a")
+
+        assert router.is_sticky("key-a")
+        assert not router.is_sticky("key-b")
+
+
+async def test_monitor_survives_unexpected_errors():
+    """Test that a failed sample marks the replica lagging and the monitor keeps sampling."""
+    pool = MagicMock(fetchval=AsyncMock(side_effect=[RuntimeError("boom"), 1.0, 1.0, 1.0]))
+    READ_REPLICA.attach(pool)
+    READ_REPLICA.lag_seconds = 0.0
+
+    async def sampled_twice() -> None:
+        while pool.fetchval.await_count < 2:
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(monitor_replica_lag(interval=0))
+    try:
+        await asyncio.wait_for(sampled_twice(), 1)
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    assert READ_REPLICA.lag_seconds == 1.0
+
+
+async def test_transaction_connection_is_never_rerouted():
+    """Test that _get_read_connection keeps a passed connection and otherwise prefers the replica."""
+    primary, replica, conn = MagicMock(), _replica_pool(0.0), MagicMock()
+    repository = BaseRepository(primary)
+    READ_REPLICA.attach(replica)
+    await READ_REPLICA.check_lag()
+
+    with replica_reads():
+        assert repository._get_read_connection(conn) is conn
+        assert repository._get_read_connection() is replica
+    assert repository._get_read_connection() is primary
+
+
+def test_middleware_routes_reads_until_the_client_writes():
+    """Test that GETs may use the replica until the same client sends a write."""
+    READ_REPLICA.attach(MagicMock())
+    READ_REPLICA.lag_seconds = 0.0
+
+    @get("/items")
+    async def read_items() -> bool:
+        return READ_REPLICA.read_pool() is not None
+
+    @post("/items")
+    async def write_item() -> None:
+        return None
+
+    app = Litestar(route_handlers=[read_items, write_item], middleware=[ReplicaRoutingMiddleware()])
+    with TestClient(app) as client:
+        assert client.get("/items", headers={"X-API-KEY": "a"}).json() is True
+        client.post("/items", headers={"X-API-KEY": "a"})
+        assert client.get("/items", headers={"X-API-KEY": "a"}).json() is False
+        assert client.get("/items", headers={"X-API-KEY": "b"}).json() is True
@@ -0,0 +1,111 @@
+"""Tests for per-request SQL statistics and query budgets."""
+
+import asyncio
+import logging
+
+from asyncpg import introspection
+from asyncpg.connection import LoggedQuery
+from litestar import Litestar, get
+from litestar.testing import TestClient
+
+import middleware.sql_instrumentation as sql_instrumentation
+from middleware.sql_instrumentation import (
+    RequestQueryStats,
+    SqlInstrumentationMiddleware,
+    budget_violations,
+    clear_budget_violations,
+    log_query,
+    track_queries,
+)
+
+# ruff: noqa: ANN201
+
+
+def _record(query: str, elapsed: float = 0.001) -> LoggedQuery:
+    return LoggedQuery(query, (), None, elapsed, None, None, None)
+
+
+def _send_queries(*queries: str) -> None:
+    """Log statements the way asyncpg does, with call_soon."""
+    loop = asyncio.get_running_loop()
+    for query in queries:
+        loop.call_soon(log_query, _record(query))
+
+
+class TestRequestQueryStats:
+    """Tests for RequestQueryStats aggregation."""
+
+    def test_counts_time_and_slowest(self):
+        """Test that count, total time and the slowest statement are tracked."""
+        stats = RequestQueryStats()
+        stats.add("SELECT 1", 2.0)
+        stats.add("SELECT 2", 5.0)
+        stats.add("SELECT 1", 1.0)
+
+        assert stats.count == 3
+        assert stats.total_ms == 8.0
+        assert stats.slowest_query == "SELECT 2"
+        assert stats.repeated(2) == [("SELECT 1", 2)]
+        assert stats.server_timing() == 'db;dur=8.00;desc="3 queries", db-slowest;dur=5.00'
+
+    def test_log_query_only_counts_inside_tracking(self):
+        """Test that statements outside a tracked block and driver introspection are ignored."""
+        log_query(_record("SELECT 1"))
+        with track_queries() as stats:
+            log_query(_record("SELECT 1"))
+            log_query(_record(introspection.INTRO_LOOKUP_TYPES_13))
+
+        assert stats.count == 1
+
+
+def test_middleware_adds_server_timing():
+    """Test that statements logged right before the response are still in the header."""
+
+    @get("/items")
+    async def handler() -> int:
+        _send_queries("SELECT 1", "SELECT 2")
+        return 1
+
+    app = Litestar(route_handlers=[handler], middleware=[SqlInstrumentationMiddleware()])
+    with TestClient(app) as client:
+        response = client.get("/items")
+
+    assert response.headers["server-timing"].startswith('db;dur=2.00;desc="2 queries"')
+
+
+def test_budget_violation_is_recorded():
+    """Test that a request over its route's query_budget is recorded."""
+
+    @get("/items", opt={"query_budget": 1})
+    async def handler() -> int:
+        _send_queries("SELECT 1", "SELECT 1")
+        return 1
+
+    app = Litestar(route_handlers=[handler], middleware=[SqlInstrumentationMiddleware()])
+    with TestClient(app) as client:
+        assert client.get("/items").status_code == 200
+
+    (violation,) = budget_violations()
+    clear_budget_violations()
+    assert violation.route == "GET /items"
+    assert violation.budget == 1
+    assert violation.queries == 2
+    assert violation.top_statements == [("SELECT 1", 2)]
+
+
+def test_repeated_statement_warns(monkeypatch, caplog):
+    """Test that a statement repeated past the threshold is logged as a possible N+1."""
+    monkeypatch.setattr(sql_instrumentation, "SQL_REPEAT_THRESHOLD", 3)
+
+    @get("/items")
+    async def handler() -> int:
+        _send_queries(*["SELECT * FROM core.users WHERE id = $1"] * 3, "SELECT 1")
+        return 1
+
+    # Litestar's default logging config would replace the root handler caplog listens on.
+    app = Litestar(route_handlers=[handler], middleware=[SqlInstrumentationMiddleware()], logging_config=None)
+    with caplog.at_level(logging.WARNING, logger="middleware.sql_instrumentation"), TestClient(app) as client:
+        client.get("/items")
+
+    (message,) = [r.getMessage() for r in caplog.records if "N+1" in r.getMessage()]
+    assert "3 runs of SELECT * FROM core.users WHERE id = $1" in message
@@ -254,30 +254,6 @@ class TestCaseSensitivity:
             exists = await repository.check_email_exists(variation)
             assert exists is True, f"Failed for variation: {variation}"
 
-    async def test_rate_limit_identifier_case_variations(
-        self,
-        repository: AuthRepository,
-    ):
-        """Test rate limiting with case variations of identifier."""
-        # Arrange
-        base_identifier = fake.email()
-        identifier_lower = base_identifier.lower()
-        identifier_upper = base_identifier.upper()
-        identifier_mixed = base_identifier.title()
-        action = "login"
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
-
-        # Act - Record with lowercase
-        await repository.record_attempt(identifier_lower, action, success=False)
-        await repository.record_attempt(identifier_upper, action, success=False)
-        await repository.record_attempt(identifier_mixed, action, success=False)
-
-        # Assert - All count as same identifier (case-insensitive)
-        count = await repository.fetch_rate_limit_count(
-            identifier_lower, action, window_start
-        )
-        assert count == 3
-
 
 # ==============================================================================
 # BOUNDARY TESTS
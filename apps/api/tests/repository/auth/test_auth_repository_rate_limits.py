@@ -1,8 +1,8 @@
 """Tests for AuthRepository rate limit and utility operations.
 
 Test Coverage:
-- record_attempt: success/failure, case insensitive identifier, timestamp
-- fetch_rate_limit_count: counts in window, excludes old, case insensitive, filters by action
+- insert_attempts: batch insert, lowercases identifiers, keeps attempt timestamps
+- rate_limit_hit / rate_limit_backlog: bucket advances atomically, idle buckets report 0
 - check_is_mod: moderator, non-moderator, anonymous session, invalid session
 """
 
@@ -28,267 +28,78 @@ async def repository(asyncpg_conn):
 
 
 # ==============================================================================
-# record_attempt TESTS
+# insert_attempts TESTS
 # ==============================================================================
 
 
-class TestRecordAttempt:
-    """Test record_attempt method."""
+class TestInsertAttempts:
+    """Test insert_attempts method."""
 
-    async def test_records_successful_attempt(
+    async def test_inserts_batch(
         self,
         repository: AuthRepository,
         asyncpg_conn,
     ):
-        """Test recording successful attempt."""
+        """Test that a batch is written with lowercased identifiers and original timestamps."""
         # Arrange
-        identifier = fake.email()
-        action = "login"
-
-        # Act
-        await repository.record_attempt(identifier, action, success=True)
-
-        # Assert - Verify recorded
-        row = await asyncpg_conn.fetchrow(
-            "SELECT identifier, action, success FROM users.auth_rate_limits WHERE identifier = LOWER($1) AND action = $2 ORDER BY attempt_at DESC LIMIT 1",
-            identifier,
-            action,
-        )
-        assert row is not None
-        assert row["identifier"] == identifier.lower()
-        assert row["action"] == action
-        assert row["success"] is True
-
-    async def test_records_failed_attempt(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test recording failed attempt."""
-        # Arrange
-        identifier = fake.email()
-        action = "login"
+        identifier = fake.email().upper()
+        attempted_at = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=3)
 
         # Act
-        await repository.record_attempt(identifier, action, success=False)
-
-        # Assert - Verify recorded
-        row = await asyncpg_conn.fetchrow(
-            "SELECT identifier, action, success FROM users.auth_rate_limits WHERE identifier = LOWER($1) AND action = $2 ORDER BY attempt_at DESC LIMIT 1",
-            identifier,
-            action,
-        )
-        assert row is not None
-        assert row["success"] is False
-
-    async def test_identifier_stored_lowercase(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test that identifier is stored in lowercase."""
-        # Arrange
-        identifier = fake.email().title()
-        action = "login"
-
-        # Act
-        await repository.record_attempt(identifier, action, success=True)
-
-        # Assert - Stored as lowercase
-        row = await asyncpg_conn.fetchrow(
-            "SELECT identifier FROM users.auth_rate_limits WHERE identifier = $1 AND action = $2",
-            identifier.lower(),
-            action,
+        await repository.insert_attempts(
+            [
+                (identifier, "login", False, attempted_at),
+                (identifier, "login", True, attempted_at + dt.timedelta(seconds=1)),
+            ]
         )
-        assert row is not None
-        assert row["identifier"] == identifier.lower()
 
-    async def test_timestamp_recorded(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test that attempt_at timestamp is recorded."""
-        # Arrange
-        identifier = fake.email()
-        action = "login"
-        before = dt.datetime.now(dt.timezone.utc)
-
-        # Act
-        await repository.record_attempt(identifier, action, success=True)
-
-        # Assert - Timestamp within reasonable range
-        row = await asyncpg_conn.fetchrow(
-            "SELECT attempt_at FROM users.auth_rate_limits WHERE identifier = LOWER($1) AND action = $2 ORDER BY attempt_at DESC LIMIT 1",
+        # Assert
+        rows = await asyncpg_conn.fetch(
+            "SELECT identifier, success, attempt_at FROM users.auth_rate_limits "
+            "WHERE identifier = LOWER($1) ORDER BY attempt_at",
             identifier,
-            action,
         )
-        assert row is not None
-        after = dt.datetime.now(dt.timezone.utc)
-
-        # Timestamp should exist and be a datetime
-        assert isinstance(row["attempt_at"], dt.datetime)
-        # Just verify timestamp is within a reasonable range (within last minute)
-        assert (after - before).total_seconds() < 60
-
-    async def test_multiple_attempts_recorded(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test that multiple attempts are recorded."""
-        # Arrange
-        identifier = fake.email()
-        action = "login"
+        assert [r["success"] for r in rows] == [False, True]
+        assert rows[0]["identifier"] == identifier.lower()
+        assert rows[0]["attempt_at"] == attempted_at
 
-        # Act - Record 3 attempts
-        await repository.record_attempt(identifier, action, success=False)
-        await repository.record_attempt(identifier, action, success=False)
-        await repository.record_attempt(identifier, action, success=True)
-
-        # Assert - All 3 recorded
-        count = await asyncpg_conn.fetchval(
-            "SELECT COUNT(*) FROM users.auth_rate_limits WHERE identifier = LOWER($1) AND action = $2",
-            identifier,
-            action,
-        )
-        assert count >= 3
+    async def test_empty_batch_is_noop(self, repository: AuthRepository):
+        """Test that an empty batch does not query."""
+        await repository.insert_attempts([])
 
 
 # ==============================================================================
-# fetch_rate_limit_count TESTS
+# rate limit bucket TESTS
 # ==============================================================================
 
 
-class TestFetchRateLimitCount:
-    """Test fetch_rate_limit_count method."""
+class TestRateLimitBuckets:
+    """Test rate_limit_hit and rate_limit_backlog methods."""
 
-    async def test_counts_attempts_in_window(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test that attempts within window are counted."""
-        # Arrange
-        identifier = fake.email()
-        action = "login"
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
-
-        # Record 3 attempts in the last 5 minutes
-        await repository.record_attempt(identifier, action, success=False)
-        await repository.record_attempt(identifier, action, success=False)
-        await repository.record_attempt(identifier, action, success=False)
-
-        # Act
-        count = await repository.fetch_rate_limit_count(identifier, action, window_start)
-
-        # Assert
-        assert count >= 3
-
-    async def test_excludes_old_attempts(
-        self,
-        repository: AuthRepository,
-        asyncpg_conn,
-    ):
-        """Test that attempts outside window are excluded."""
-        # Arrange
-        identifier = fake.email()
-        action = "login"
-
-        # Record an old attempt (1 hour ago)
-        await repository.record_attempt(identifier, action, success=False)
-        await asyncpg_conn.execute(
-            "UPDATE users.auth_rate_limits SET attempt_at = now() - INTERVAL '1 hour' WHERE identifier = LOWER($1)",
-            identifier,
-        )
-
-        # Record a recent attempt
-        await repository.record_attempt(identifier, action, success=False)
-
-        # Act - Count only last 5 minutes
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
-        count = await repository.fetch_rate_limit_count(identifier, action, window_start)
-
-        # Assert - Only the recent one counted
-        assert count == 1
-
-    async def test_case_insensitive_identifier_matching(
-        self,
-        repository: AuthRepository,
-    ):
-        """Test that identifier matching is case-insensitive."""
-        # Arrange
-        base_identifier = fake.email()
-        identifier_lower = base_identifier.lower()
-        identifier_upper = base_identifier.upper()
-        action = "login"
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
-
-        # Record with lowercase
-        await repository.record_attempt(identifier_lower, action, success=False)
-
-        # Act - Query with uppercase
-        count = await repository.fetch_rate_limit_count(identifier_upper, action, window_start)
-
-        # Assert - Found the attempt
-        assert count >= 1
-
-    async def test_filters_by_action(
-        self,
-        repository: AuthRepository,
-    ):
-        """Test that count filters by action."""
-        # Arrange
-        identifier = fake.email()
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
+    async def test_missing_bucket_has_no_backlog(self, repository: AuthRepository):
+        """Test that an unknown identifier reports zero backlog."""
+        assert await repository.rate_limit_backlog(fake.email(), "login") == 0.0
 
-        # Record different actions
-        await repository.record_attempt(identifier, "login", success=False)
-        await repository.record_attempt(identifier, "register", success=False)
-        await repository.record_attempt(identifier, "login", success=False)
-
-        # Act - Count only login attempts
-        count = await repository.fetch_rate_limit_count(identifier, "login", window_start)
-
-        # Assert - Only 2 login attempts counted
-        assert count == 2
-
-    async def test_no_attempts_returns_zero(
-        self,
-        repository: AuthRepository,
-    ):
-        """Test that no attempts returns 0."""
+    async def test_hits_accumulate(self, repository: AuthRepository):
+        """Test that each hit pushes the bucket forward by the emission interval."""
         # Arrange
         identifier = fake.email()
-        action = "login"
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
 
         # Act
-        count = await repository.fetch_rate_limit_count(identifier, action, window_start)
+        await repository.rate_limit_hit(identifier, "login", 90.0)
+        await repository.rate_limit_hit(identifier.upper(), "login", 90.0)
 
         # Assert
-        assert count == 0
+        backlog = await repository.rate_limit_backlog(identifier, "login")
+        assert 170.0 < backlog <= 180.0
 
-    async def test_counts_both_success_and_failure(
-        self,
-        repository: AuthRepository,
-    ):
-        """Test that both successful and failed attempts are counted."""
-        # Arrange
+    async def test_buckets_are_per_action(self, repository: AuthRepository):
+        """Test that actions do not share a bucket."""
         identifier = fake.email()
-        action = "login"
-        window_start = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)
-
-        # Record mix of success and failure
-        await repository.record_attempt(identifier, action, success=False)
-        await repository.record_attempt(identifier, action, success=True)
-        await repository.record_attempt(identifier, action, success=False)
 
-        # Act
-        count = await repository.fetch_rate_limit_count(identifier, action, window_start)
+        await repository.rate_limit_hit(identifier, "login", 90.0)
 
-        # Assert - All 3 counted
-        assert count == 3
+        assert await repository.rate_limit_backlog(identifier, "register") == 0.0
 
 
 # ==============================================================================
@@ -2,9 +2,11 @@
 
 Test Coverage:
 - write_session: create new, update existing, with/without user_id, upsert behavior
-- read_session: valid, expired, not found, expiration boundary
+- read_session: valid, expired, not found, expiration boundary, no write
+- touch_sessions: refreshes stale sessions, skips recent and unknown ones
 - delete_session: exists, not exists, returns correct boolean
 - delete_expired_sessions: deletes expired only, returns count, preserves active
+- drop_expired_session_partitions: drops whole expired months, keeps live ones
 - get_user_sessions: returns active only, ordered by activity, filters by user
 - delete_user_sessions: all, except specific session, returns count
 """
@@ -240,14 +242,14 @@ class TestReadSession:
         # Assert - Not expired yet
         assert result is not None
 
-    async def test_read_session_refreshes_last_activity(
+    async def test_read_session_does_not_write(
         self,
         repository: AuthRepository,
         create_test_session,
         create_test_user,
         asyncpg_conn,
     ):
-        """Test that reading an active session refreshes last_activity timestamp."""
+        """Test that reading a session leaves last_activity for a batched touch."""
         user_id = await create_test_user()
         session_id = await create_test_session(user_id=user_id)
 
@@ -267,7 +269,7 @@ class TestReadSession:
             "SELECT last_activity FROM users.sessions WHERE id = $1",
             session_id,
         )
-        assert new_activity > old_activity
+        assert new_activity == old_activity
 
     async def test_read_session_does_not_refresh_expired_session(
         self,
@@ -299,6 +301,71 @@ class TestReadSession:
         assert new_activity == old_activity
 
 
+# ==============================================================================
+# touch_sessions TESTS
+# ==============================================================================
+
+
+class TestTouchSessions:
+    """Test touch_sessions method."""
+
+    async def test_refreshes_stale_sessions(
+        self,
+        repository: AuthRepository,
+        create_test_session,
+        create_test_user,
+        asyncpg_conn,
+    ):
+        """Test that sessions older than the granularity get the touch time."""
+        user_id = await create_test_user()
+        session_ids = [await create_test_session(user_id=user_id) for _ in range(2)]
+        await asyncpg_conn.execute(
+            "UPDATE users.sessions SET last_activity = now() - INTERVAL '20 minutes' WHERE id = ANY($1::text[])",
+            session_ids,
+        )
+        seen_at = dt.datetime.now(dt.timezone.utc)
+
+        count = await repository.touch_sessions([(sid, seen_at) for sid in session_ids], 60)
+
+        assert count == 2
+        activity = await asyncpg_conn.fetch(
+            "SELECT last_activity FROM users.sessions WHERE id = ANY($1::text[])",
+            session_ids,
+        )
+        assert all(row["last_activity"] == seen_at for row in activity)
+
+    async def test_skips_recently_active_sessions(
+        self,
+        repository: AuthRepository,
+        create_test_session,
+        create_test_user,
+        asyncpg_conn,
+    ):
+        """Test that sessions active within the granularity are not rewritten."""
+        user_id = await create_test_user()
+        session_id = await create_test_session(user_id=user_id)
+        old_activity = await asyncpg_conn.fetchval(
+            "SELECT last_activity FROM users.sessions WHERE id = $1",
+            session_id,
+        )
+
+        count = await repository.touch_sessions([(session_id, old_activity + dt.timedelta(seconds=10))], 60)
+
+        assert count == 0
+        new_activity = await asyncpg_conn.fetchval(
+            "SELECT last_activity FROM users.sessions WHERE id = $1",
+            session_id,
+        )
+        assert new_activity == old_activity
+
+    async def test_unknown_and_empty_batches(self, repository: AuthRepository):
+        """Test that unknown session IDs and empty batches update nothing."""
+        seen_at = dt.datetime.now(dt.timezone.utc)
+
+        assert await repository.touch_sessions([(uuid4().hex, seen_at)], 60) == 0
+        assert await repository.touch_sessions([], 60) == 0
+
+
 # ==============================================================================
 # delete_session TESTS
 # ==============================================================================
@@ -446,6 +513,57 @@ class TestDeleteExpiredSessions:
         assert isinstance(count, int)
 
 
+# ==============================================================================
+# drop_expired_session_partitions TESTS
+# ==============================================================================
+
+
+class TestDropExpiredSessionPartitions:
+    """Test drop_expired_session_partitions method."""
+
+    async def test_drops_expired_months_only(
+        self,
+        repository: AuthRepository,
+        create_test_session,
+        create_test_user,
+        asyncpg_conn,
+    ):
+        """Test that months past the lifetime are dropped and live sessions kept."""
+        user_id = await create_test_user()
+        active_session = await create_test_session(user_id=user_id)
+        old_session = await create_test_session(user_id=user_id)
+        await asyncpg_conn.execute(
+            "UPDATE users.sessions SET last_activity = now() - INTERVAL '60 days' WHERE id = $1",
+            old_session,
+        )
+
+        # Dropping partitions is not row-scoped; keep it from leaking into other tests.
+        transaction = asyncpg_conn.transaction()
+        await transaction.start()
+        try:
+            tx_repository = AuthRepository(asyncpg_conn)
+            dropped = await tx_repository.drop_expired_session_partitions(session_lifetime_minutes=30)
+
+            assert dropped >= 1
+            remaining = await asyncpg_conn.fetchval(
+                "SELECT count(*) FROM users.sessions WHERE id = ANY($1::text[])",
+                [active_session, old_session],
+            )
+            assert remaining == 1
+            assert await tx_repository.read_session(active_session, session_lifetime_minutes=30) is not None
+        finally:
+            await transaction.rollback()
+
+    async def test_creates_upcoming_partitions(self, repository: AuthRepository, asyncpg_conn):
+        """Test that next month's partition exists after maintenance."""
+        await repository.drop_expired_session_partitions(session_lifetime_minutes=129600)
+
+        next_month = await asyncpg_conn.fetchval(
+            "SELECT to_regclass('users.sessions_' || to_char(now() + INTERVAL '1 month', 'YYYYMM'))"
+        )
+        assert next_month is not None
+
+
 # ==============================================================================
 # get_user_sessions TESTS
 # ==============================================================================
@@ -0,0 +1,63 @@
+"""Tests for CommunityRepository.fetch_community_leaderboard sorting.
+
+Test Coverage:
+- numeric and text sort columns in both directions
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from repository.community_repository import CommunityRepository
+
+pytestmark = [
+    pytest.mark.domain_community,
+]
+
+
+@pytest.fixture
+async def repository(asyncpg_pool):
+    """Provide community repository instance."""
+    return CommunityRepository(asyncpg_pool)
+
+
+@pytest.fixture
+async def ranked_users(asyncpg_pool, create_test_user) -> tuple[str, list[int]]:
+    """Create three users sharing a unique name prefix, with increasing XP and reversed nicknames."""
+    prefix = f"lb{uuid4().hex[:8]}"
+    user_ids = []
+    for xp, suffix in ((100, "c"), (200, "b"), (300, "a")):
+        user_id = await create_test_user(nickname=f"{prefix}{suffix}")
+        await asyncpg_pool.execute("INSERT INTO lootbox.xp (user_id, amount) VALUES ($1, $2)", user_id, xp)
+        user_ids.append(user_id)
+    return prefix, user_ids
+
+
+class TestFetchCommunityLeaderboardSorting:
+    """Test that the sort column and direction parameters order the page."""
+
+    @pytest.mark.parametrize(
+        ("sort_column", "sort_direction", "expected"),
+        [
+            ("xp_amount", "asc", [0, 1, 2]),
+            ("xp_amount", "desc", [2, 1, 0]),
+            ("nickname", "asc", [2, 1, 0]),
+            ("nickname", "desc", [0, 1, 2]),
+        ],
+    )
+    async def test_orders_by_sort_column(
+        self,
+        repository: CommunityRepository,
+        ranked_users: tuple[str, list[int]],
+        sort_column,
+        sort_direction,
+        expected,
+    ) -> None:
+        """Test that every sort column and direction share one statement and order correctly."""
+        prefix, user_ids = ranked_users
+
+        rows = await repository.fetch_community_leaderboard(
+            name=prefix, sort_column=sort_column, sort_direction=sort_direction, page_size=10
+        )
+
+        assert [row["user_id"] for row in rows] == [user_ids[i] for i in expected]
@@ -0,0 +1,156 @@
+"""Tests for the trigger-maintained maps.world_records table.
+
+Test Coverage:
+- A verified record run becomes the map's world record (1 test)
+- A faster run takes the record over and closes the previous holder's history (1 test)
+- Pending and completion-only runs never hold the record (1 test)
+- System users never hold the record (1 test)
+- Rejecting the holder hands the record back to the next fastest run (1 test)
+- Legacy conversion clears the record (1 test)
+- The drift check is empty while the triggers keep the table current (1 test)
+- refresh_world_records repairs a tampered row (1 test)
+
+Total: 8 tests
+"""
+
+import asyncpg
+import pytest
+
+from repository.completions_repository import CompletionsRepository
+
+pytestmark = [
+    pytest.mark.domain_completions,
+]
+
+
+@pytest.fixture
+async def completions_repo(asyncpg_pool: asyncpg.Pool) -> CompletionsRepository:
+    """Create repository instance."""
+    return CompletionsRepository(asyncpg_pool)
+
+
+async def _record(pool: asyncpg.Pool, map_id: int) -> asyncpg.Record | None:
+    async with pool.acquire() as conn:
+        return await conn.fetchrow("SELECT * FROM maps.world_records WHERE map_id = $1", map_id)
+
+
+async def _history(pool: asyncpg.Pool, map_id: int) -> list[asyncpg.Record]:
+    async with pool.acquire() as conn:
+        return await conn.fetch(
+            "SELECT * FROM maps.world_record_history WHERE map_id = $1 ORDER BY id",
+            map_id,
+        )
+
+
+class TestWorldRecordTriggers:
+    """maps.world_records follows writes to core.completions."""
+
+    @pytest.mark.asyncio
+    async def test_verified_record_run_holds_the_record(
+        self, asyncpg_pool, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        user_id = await create_test_user()
+
+        completion_id = await create_test_completion(user_id, map_id, completion=False, time=30.0)
+
+        record = await _record(asyncpg_pool, map_id)
+        assert record["completion_id"] == completion_id
+        assert record["user_id"] == user_id
+        assert [h["completion_id"] for h in await _history(asyncpg_pool, map_id)] == [completion_id]
+
+    @pytest.mark.asyncio
+    async def test_faster_run_takes_the_record_over(
+        self, asyncpg_pool, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        first = await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+        second = await create_test_completion(await create_test_user(), map_id, completion=False, time=25.0)
+
+        assert (await _record(asyncpg_pool, map_id))["completion_id"] == second
+        history = await _history(asyncpg_pool, map_id)
+        assert [h["completion_id"] for h in history] == [first, second]
+        assert history[0]["ended_at"] is not None
+        assert history[1]["ended_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_pending_and_completion_runs_never_hold_the_record(
+        self, asyncpg_pool, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        await create_test_completion(await create_test_user(), map_id, completion=False, time=10.0, verified=False)
+        await create_test_completion(await create_test_user(), map_id, completion=True, time=5.0)
+
+        assert await _record(asyncpg_pool, map_id) is None
+
+    @pytest.mark.asyncio
+    async def test_system_users_never_hold_the_record(
+        self, asyncpg_pool, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        async with asyncpg_pool.acquire() as conn:
+            await conn.execute(
+                "INSERT INTO core.users (id, nickname, global_name) VALUES (53, 'System', 'System') "
+                "ON CONFLICT (id) DO NOTHING"
+            )
+        await create_test_completion(53, map_id, completion=False, time=5.0)
+        holder = await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+
+        assert (await _record(asyncpg_pool, map_id))["completion_id"] == holder
+
+    @pytest.mark.asyncio
+    async def test_rejecting_the_holder_restores_the_previous_record(
+        self, asyncpg_pool, completions_repo, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        slower = await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+        faster = await create_test_completion(await create_test_user(), map_id, completion=False, time=20.0)
+
+        await completions_repo.update_verification(faster, False, await create_test_user(), "Bad screenshot")
+
+        assert (await _record(asyncpg_pool, map_id))["completion_id"] == slower
+
+    @pytest.mark.asyncio
+    async def test_legacy_conversion_clears_the_record(
+        self, asyncpg_pool, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+
+        async with asyncpg_pool.acquire() as conn:
+            await conn.execute("UPDATE core.completions SET legacy = TRUE WHERE map_id = $1", map_id)
+
+        assert await _record(asyncpg_pool, map_id) is None
+        assert all(h["ended_at"] is not None for h in await _history(asyncpg_pool, map_id))
+
+
+class TestWorldRecordDrift:
+    """The consistency check and repair."""
+
+    @pytest.mark.asyncio
+    async def test_no_drift_while_triggers_run(
+        self, completions_repo, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+
+        drift = await completions_repo.fetch_world_record_drift()
+
+        assert map_id not in {d["map_id"] for d in drift}
+
+    @pytest.mark.asyncio
+    async def test_refresh_repairs_a_tampered_row(
+        self, asyncpg_pool, completions_repo, create_test_map, create_test_user, create_test_completion
+    ):
+        map_id = await create_test_map()
+        completion_id = await create_test_completion(await create_test_user(), map_id, completion=False, time=30.0)
+        async with asyncpg_pool.acquire() as conn:
+            await conn.execute("DELETE FROM maps.world_records WHERE map_id = $1", map_id)
+
+        drift = await completions_repo.fetch_world_record_drift()
+        assert {"map_id": map_id, "expected_completion_id": completion_id, "stored_completion_id": None} in drift
+
+        await completions_repo.refresh_world_records([map_id])
+
+        assert (await _record(asyncpg_pool, map_id))["completion_id"] == completion_id
+        assert map_id not in {d["map_id"] for d in await completions_repo.fetch_world_record_drift()}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from genjishimada_sdk.tags import TagUsageIncrement
 
 from repository.tags_repository import TagsRepository
 
@@ -102,3 +103,21 @@ class TestIncrementUsage:
             GUILD_ID,
         )
         assert row["uses"] == 1
+
+    async def test_increment_many_sums_aliases(self, repository: TagsRepository, create_test_tag, asyncpg_conn) -> None:
+        await create_test_tag("bulk-usage-tag", "usage content", owner_id=OWNER_ID)
+        await repository.create_alias(GUILD_ID, "bulk-usage-alias", "bulk-usage-tag", OWNER_ID)
+        updated = await repository.increment_usage_many(
+            [
+                TagUsageIncrement(guild_id=GUILD_ID, name="BULK-USAGE-TAG", count=3),
+                TagUsageIncrement(guild_id=GUILD_ID, name="bulk-usage-alias", count=2),
+                TagUsageIncrement(guild_id=GUILD_ID, name="no-such-tag", count=5),
+            ]
+        )
+        assert updated == 1
+        row = await asyncpg_conn.fetchrow(
+            "SELECT uses FROM tags WHERE LOWER(name) = LOWER($1) AND location_id = $2",
+            "bulk-usage-tag",
+            GUILD_ID,
+        )
+        assert row["uses"] == 5
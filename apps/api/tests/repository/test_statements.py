@@ -0,0 +1,51 @@
+"""Tests for the named statement registry and per-connection warmup."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg.exceptions import UndefinedTableError
+
+from repository.statements import StatementRegistry
+
+# ruff: noqa: ANN201
+
+
+class TestStatementRegistry:
+    """Tests for StatementRegistry registration and warmup."""
+
+    def test_register_returns_sql_and_rejects_conflicts(self):
+        """Test that register hands back the SQL and refuses a reused name with other SQL."""
+        registry = StatementRegistry()
+
+        assert registry.register("users.one", "SELECT 1", warm=True) == "SELECT 1"
+        assert registry.register("users.one", "SELECT 1", warm=True) == "SELECT 1"
+        with pytest.raises(ValueError, match="users.one"):
+            registry.register("users.one", "SELECT 2")
+
+        assert len(registry) == 1
+        assert registry.get("users.one").warm is True
+
+    async def test_warm_prepares_only_the_warm_set(self):
+        """Test that warm prepares each warm statement once and skips the rest."""
+        registry = StatementRegistry()
+        registry.register("a.hot", "SELECT 1", warm=True)
+        registry.register("a.cold", "SELECT 2")
+        conn = MagicMock()
+        conn._get_statement = AsyncMock()
+
+        assert await registry.warm(conn) == 1
+
+        conn._get_statement.assert_awaited_once_with("SELECT 1", None)
+        stats = registry.stats()
+        assert (stats.connections, stats.prepared, stats.failed) == (1, 1, 0)
+
+    async def test_warm_skips_statements_that_fail_to_prepare(self):
+        """Test that a statement the database rejects is counted and does not stop the warmup."""
+        registry = StatementRegistry()
+        registry.register("a.missing", "SELECT * FROM nowhere", warm=True)
+        registry.register("a.hot", "SELECT 1", warm=True)
+        conn = MagicMock()
+        conn._get_statement = AsyncMock(side_effect=[UndefinedTableError("nowhere"), None])
+
+        assert await registry.warm(conn) == 1
+        assert registry.stats().failed == 1
@@ -71,6 +71,20 @@ class TestMutateRoute:
         assert len(data["results"]) == 2
 
 
+class TestUsageRoute:
+    """Test POST /api/v3/tags/usage."""
+
+    async def test_unknown_names_update_nothing(self, test_client) -> None:
+        response = await test_client.post(
+            "/api/v3/tags/usage",
+            json={"items": [{"guild_id": GUILD_ID, "name": "no-such-usage-tag", "count": 4}]},
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["ok"] is True
+        assert data["affected"] == 0
+
+
 class TestAutocompleteRoute:
     """Test POST /api/v3/tags/autocomplete."""
 
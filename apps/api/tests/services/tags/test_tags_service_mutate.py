@@ -8,6 +8,8 @@ from genjishimada_sdk.tags import (
     OpEdit,
     OpIncrementUsage,
     OpRemove,
+    TagsUsageIncrementRequest,
+    TagUsageIncrement,
 )
 
 from repository.tags_repository import TagsRepository
@@ -82,3 +84,43 @@ class TestMutateDispatch:
         assert len(result.results) == 2
         assert result.results[0].ok is False
         assert result.results[1].ok is True
+
+
+class TestMutateInvalidation:
+    async def test_publishes_once_per_changed_guild(self, service: TagsService, mock_tags_repo, mocker) -> None:
+        """Successful content-changing ops publish one invalidation per guild."""
+        publish = mocker.patch.object(service, "publish_message", new_callable=mocker.AsyncMock)
+        mock_tags_repo.create_tag.return_value = 1
+        ops = [
+            OpCreate(guild_id=GUILD_ID, name="a", content="x", owner_id=OWNER_ID),
+            OpCreate(guild_id=GUILD_ID, name="b", content="x", owner_id=OWNER_ID),
+        ]
+        await service.mutate_tags(ops)
+        publish.assert_awaited_once()
+        assert publish.call_args.kwargs["routing_key"] == "api.tags.mutated"
+        assert publish.call_args.kwargs["data"].guild_id == GUILD_ID
+
+    async def test_failed_and_usage_ops_do_not_publish(self, service: TagsService, mock_tags_repo, mocker) -> None:
+        """Failed ops and usage increments leave caches alone."""
+        publish = mocker.patch.object(service, "publish_message", new_callable=mocker.AsyncMock)
+        mock_tags_repo.remove_tag_by_name.return_value = False
+        ops = [
+            OpRemove(guild_id=GUILD_ID, name="ghost", requester_id=OWNER_ID),
+            OpIncrementUsage(guild_id=GUILD_ID, name="used"),
+        ]
+        await service.mutate_tags(ops)
+        publish.assert_not_awaited()
+
+
+class TestIncrementUsageMany:
+    async def test_forwards_batch_to_repository(self, service: TagsService, mock_tags_repo) -> None:
+        """The batch is applied with one repository call."""
+        mock_tags_repo.increment_usage_many.return_value = 2
+        items = [
+            TagUsageIncrement(guild_id=GUILD_ID, name="a", count=3),
+            TagUsageIncrement(guild_id=GUILD_ID, name="b"),
+        ]
+        result = await service.increment_usage_many(TagsUsageIncrementRequest(items=items))
+        assert result.ok is True
+        assert result.affected == 2
+        mock_tags_repo.increment_usage_many.assert_awaited_once_with(items)
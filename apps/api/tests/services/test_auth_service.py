@@ -15,12 +15,15 @@ from repository.exceptions import (
     ForeignKeyViolationError,
     UniqueConstraintViolationError,
 )
-from services.auth_service import AuthService
+from services.auth_service import _ATTEMPT_LOG, _SESSION_CACHE, RATE_LIMITS, AuthService
+from utilities.password_hashing import PASSWORD_HASHER
+from utilities.rate_limiting import MEMORY_RATE_LIMITS
 from services.exceptions.auth import (
     EmailAlreadyExistsError,
     EmailAlreadyVerifiedError,
     EmailValidationError,
     InvalidCredentialsError,
+    PasswordHashingBusyError,
     PasswordValidationError,
     RateLimitExceededError,
     TokenAlreadyUsedError,
@@ -35,6 +38,30 @@ pytestmark = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def _reset_rate_limits():
+    """Start every test with empty in-memory buckets, audit buffer and session cache."""
+    MEMORY_RATE_LIMITS.clear()
+    _ATTEMPT_LOG.clear()
+    _SESSION_CACHE.clear()
+    yield
+    MEMORY_RATE_LIMITS.clear()
+    _ATTEMPT_LOG.clear()
+    _SESSION_CACHE.clear()
+
+
+def _last_attempt():
+    """Return (identifier, action, success) of the most recently queued audit row."""
+    identifier, action, success, _ = list(_ATTEMPT_LOG._rows)[-1]
+    return identifier, action, success
+
+
+async def _exhaust(service, identifier, action):
+    """Record attempts until ``identifier`` has used its whole limit for ``action``."""
+    for _ in range(RATE_LIMITS[action].max_attempts):
+        await service.record_attempt(identifier, action, success=False)
+
+
 class TestAuthServiceValidation:
     """Test validation methods."""
 
@@ -185,19 +212,43 @@ class TestAuthServiceRateLimiting:
     ):
         """check_rate_limit passes when under limit."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
-        mock_auth_repo.fetch_rate_limit_count.return_value = 2  # Under limit of 5
+        for _ in range(RATE_LIMITS["register"].max_attempts - 1):
+            await service.record_attempt("test@example.com", "register", success=False)
 
         await service.check_rate_limit("test@example.com", "register")
 
-        mock_auth_repo.fetch_rate_limit_count.assert_called_once()
-
     async def test_check_rate_limit_exceeded(self, mock_pool, mock_state, mock_auth_repo):
         """check_rate_limit raises RateLimitExceededError when exceeded."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
-        mock_auth_repo.fetch_rate_limit_count.return_value = 10  # At limit of 10
+        await _exhaust(service, "test@example.com", "login")
 
-        with pytest.raises(RateLimitExceededError):
-            await service.check_rate_limit("test@example.com", "login")
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await service.check_rate_limit("TEST@example.com", "login")
+        assert 0 < exc_info.value.context["retry_after"] <= RATE_LIMITS["login"].emission_interval + 1
+
+    async def test_check_rate_limit_per_action(self, mock_pool, mock_state, mock_auth_repo):
+        """Exhausting one action does not limit another."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+        await _exhaust(service, "test@example.com", "login")
+
+        await service.check_rate_limit("test@example.com", "register")
+
+    async def test_record_attempt_does_not_count_client_ip(self, mock_pool, mock_state, mock_auth_repo):
+        """Attempts for many identifiers from one shared proxy IP do not limit that IP."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+        for i in range(RATE_LIMITS["login"].max_attempts + 1):
+            await service.record_attempt(f"user{i}@example.com", "login", success=False)
+
+        await service.check_rate_limit("203.0.113.7", "login")
+
+    async def test_record_attempt_is_buffered(self, mock_pool, mock_state, mock_auth_repo):
+        """Attempts are queued for the audit log, not inserted one by one."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+
+        await service.record_attempt("test@example.com", "login", success=True)
+
+        mock_auth_repo.insert_attempts.assert_not_called()
+        assert _last_attempt() == ("test@example.com", "login", True)
 
     async def test_check_rate_limit_unknown_action(
         self, mock_pool, mock_state, mock_auth_repo
@@ -207,8 +258,35 @@ class TestAuthServiceRateLimiting:
 
         await service.check_rate_limit("test@example.com", "unknown_action")
 
-        # Should not call repository at all
-        mock_auth_repo.fetch_rate_limit_count.assert_not_called()
+        # Should not touch the database at all
+        mock_auth_repo.rate_limit_backlog.assert_not_called()
+
+
+class TestAuthAttemptLog:
+    """Test batched audit log flushing."""
+
+    async def test_flush_writes_one_batch(self, mock_auth_repo):
+        """Queued attempts are written in a single call and the buffer empties."""
+        _ATTEMPT_LOG.append("a@example.com", "login", False)
+        _ATTEMPT_LOG.append("b@example.com", "login", True)
+
+        assert await _ATTEMPT_LOG.flush(mock_auth_repo) == 2
+
+        mock_auth_repo.insert_attempts.assert_awaited_once()
+        rows = mock_auth_repo.insert_attempts.call_args.args[0]
+        assert [row[:3] for row in rows] == [("a@example.com", "login", False), ("b@example.com", "login", True)]
+        assert len(_ATTEMPT_LOG) == 0
+
+    async def test_failed_flush_keeps_rows(self, mock_auth_repo):
+        """Rows survive a failed write and are retried on the next flush."""
+        mock_auth_repo.insert_attempts.side_effect = [RuntimeError("down"), None]
+        _ATTEMPT_LOG.append("a@example.com", "login", False)
+
+        with pytest.raises(RuntimeError):
+            await _ATTEMPT_LOG.flush(mock_auth_repo)
+        _ATTEMPT_LOG.append("b@example.com", "login", False)
+
+        assert await _ATTEMPT_LOG.flush(mock_auth_repo) == 2
 
 
 class TestAuthServiceRegistration:
@@ -219,7 +297,6 @@ class TestAuthServiceRegistration:
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
         # Setup mocks
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.check_email_exists.return_value = False
         mock_auth_repo.generate_next_user_id.return_value = 123456789
 
@@ -247,13 +324,12 @@ class TestAuthServiceRegistration:
         mock_auth_repo.create_core_user.assert_called_once()
         mock_auth_repo.create_email_auth.assert_called_once()
         mock_auth_repo.insert_email_token.assert_called_once()
-        mock_auth_repo.record_attempt.assert_called_with("test@example.com", "register", success=True)
+        assert _last_attempt() == ("test@example.com", "register", True)
 
     async def test_register_duplicate_email(self, mock_pool, mock_state, mock_auth_repo):
         """Registration with duplicate email raises EmailAlreadyExistsError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.check_email_exists.return_value = True
 
         data = EmailRegisterRequest(
@@ -265,15 +341,13 @@ class TestAuthServiceRegistration:
         with pytest.raises(EmailAlreadyExistsError):
             await service.register(data)
 
-        mock_auth_repo.record_attempt.assert_called_with(
-            "existing@example.com", "register", success=False
-        )
+        assert _last_attempt() == ("existing@example.com", "register", False)
 
     async def test_register_rate_limited(self, mock_pool, mock_state, mock_auth_repo):
         """Registration when rate limited raises RateLimitExceededError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 10  # Over limit
+        await _exhaust(service, "test@example.com", "register")
 
         data = EmailRegisterRequest(
             email="test@example.com",
@@ -288,7 +362,6 @@ class TestAuthServiceRegistration:
         """Registration with invalid email raises EmailValidationError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
 
         data = EmailRegisterRequest(
             email="not-an-email",
@@ -303,7 +376,6 @@ class TestAuthServiceRegistration:
         """Registration with invalid password raises PasswordValidationError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
 
         data = EmailRegisterRequest(
             email="test@example.com",
@@ -318,7 +390,6 @@ class TestAuthServiceRegistration:
         """Registration with invalid username raises UsernameValidationError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
 
         data = EmailRegisterRequest(
             email="test@example.com",
@@ -340,7 +411,6 @@ class TestAuthServiceLogin:
         # Create a valid bcrypt hash for "ValidPass123!"
         password_hash = AuthService.hash_password("ValidPass123!")
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = {
             "user_id": 1,
             "email": "test@example.com",
@@ -361,13 +431,12 @@ class TestAuthServiceLogin:
         assert result.user.coins == 100
         assert result.user.is_mod is False
 
-        mock_auth_repo.record_attempt.assert_called_with("test@example.com", "login", success=True)
+        assert _last_attempt() == ("test@example.com", "login", True)
 
     async def test_login_user_not_found(self, mock_pool, mock_state, mock_auth_repo):
         """Login with non-existent email raises InvalidCredentialsError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = None
 
         data = EmailLoginRequest(email="wrong@example.com", password="ValidPass123!")
@@ -375,7 +444,7 @@ class TestAuthServiceLogin:
         with pytest.raises(InvalidCredentialsError):
             await service.login(data)
 
-        mock_auth_repo.record_attempt.assert_called_with("wrong@example.com", "login", success=False)
+        assert _last_attempt() == ("wrong@example.com", "login", False)
 
     async def test_login_wrong_password(self, mock_pool, mock_state, mock_auth_repo):
         """Login with wrong password raises InvalidCredentialsError."""
@@ -383,7 +452,6 @@ class TestAuthServiceLogin:
 
         password_hash = AuthService.hash_password("CorrectPass123!")
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = {
             "user_id": 1,
             "email": "test@example.com",
@@ -399,13 +467,34 @@ class TestAuthServiceLogin:
         with pytest.raises(InvalidCredentialsError):
             await service.login(data)
 
-        mock_auth_repo.record_attempt.assert_called_with("test@example.com", "login", success=False)
+        assert _last_attempt() == ("test@example.com", "login", False)
+
+    async def test_login_hashing_saturated(self, mock_pool, mock_state, mock_auth_repo, monkeypatch):
+        """Login when the hashing queue is full raises PasswordHashingBusyError."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+        monkeypatch.setattr(PASSWORD_HASHER, "max_pending", 0)
+
+        mock_auth_repo.get_user_by_email.return_value = {
+            "user_id": 1,
+            "email": "test@example.com",
+            "password_hash": "$2b$12$invalidinvalidinvalidinvalidinvalidinvalidinvalidinva",
+            "nickname": "testuser",
+            "email_verified_at": None,
+            "coins": 0,
+            "is_mod": False,
+        }
+
+        data = EmailLoginRequest(email="test@example.com", password="ValidPass123!")
+
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            await service.login(data)
+        assert exc_info.value.context["retry_after"] == PASSWORD_HASHER.retry_after
 
     async def test_login_rate_limited(self, mock_pool, mock_state, mock_auth_repo):
         """Login when rate limited raises RateLimitExceededError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 15  # Over limit
+        await _exhaust(service, "test@example.com", "login")
 
         data = EmailLoginRequest(email="test@example.com", password="ValidPass123!")
 
@@ -516,7 +605,6 @@ class TestAuthServiceEmailVerification:
         """Resend verification creates new token."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = {
             "user_id": 1,
             "email": "test@example.com",
@@ -540,7 +628,6 @@ class TestAuthServiceEmailVerification:
         """Resend verification for non-existent user raises UserNotFoundError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = None
 
         with pytest.raises(UserNotFoundError):
@@ -552,7 +639,6 @@ class TestAuthServiceEmailVerification:
         """Resend verification for already verified email raises EmailAlreadyVerifiedError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = {
             "user_id": 1,
             "email": "test@example.com",
@@ -573,7 +659,6 @@ class TestAuthServicePasswordReset:
         """Request password reset creates token and returns event."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = {
             "user_id": 1,
             "email": "test@example.com",
@@ -598,7 +683,6 @@ class TestAuthServicePasswordReset:
         """Request password reset for non-existent user returns generic response."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.get_user_by_email.return_value = None
 
         data = PasswordResetRequest(email="nonexistent@example.com")
@@ -608,9 +692,7 @@ class TestAuthServicePasswordReset:
         assert "password reset link" in response.message.lower()
         assert event is None
 
-        mock_auth_repo.record_attempt.assert_called_with(
-            "nonexistent@example.com", "password_reset", success=False
-        )
+        assert _last_attempt() == ("nonexistent@example.com", "password_reset", False)
 
     async def test_confirm_password_reset_success(
         self, mock_pool, mock_state, mock_auth_repo
@@ -728,6 +810,66 @@ class TestAuthServiceSessionManagement:
 
         mock_auth_repo.check_is_mod.assert_not_called()
 
+    async def test_session_read_served_from_cache(self, mock_pool, mock_state, mock_auth_repo):
+        """Repeated reads hit the database once and queue a single touch."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+
+        mock_auth_repo.read_session.return_value = "session_payload_data"
+        mock_auth_repo.check_is_mod.return_value = False
+        mock_auth_repo.touch_sessions.return_value = 1
+
+        for _ in range(3):
+            result = await service.session_read("session123")
+            assert result.payload == "session_payload_data"
+
+        mock_auth_repo.read_session.assert_called_once()
+        mock_auth_repo.check_is_mod.assert_called_once()
+
+        assert await _SESSION_CACHE.flush(mock_auth_repo) == 1
+        touches = mock_auth_repo.touch_sessions.call_args.args[0]
+        assert [session_id for session_id, _ in touches] == ["session123"]
+
+        await service.session_read("session123")
+        assert await _SESSION_CACHE.flush(mock_auth_repo) == 0
+
+    async def test_session_read_missing_is_not_cached(self, mock_pool, mock_state, mock_auth_repo):
+        """A session that does not exist yet is looked up again on the next read."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+
+        mock_auth_repo.read_session.return_value = None
+
+        await service.session_read("session123")
+        await service.session_read("session123")
+
+        assert mock_auth_repo.read_session.call_count == 2
+        assert await _SESSION_CACHE.flush(mock_auth_repo) == 0
+
+    async def test_session_write_invalidates_cache(self, mock_pool, mock_state, mock_auth_repo):
+        """A write drops the cached payload so the next read sees it."""
+        service = AuthService(mock_pool, mock_state, mock_auth_repo)
+
+        mock_auth_repo.read_session.side_effect = ["old_payload", "new_payload"]
+        mock_auth_repo.check_is_mod.return_value = False
+
+        await service.session_read("session123")
+        await service.session_write("session123", "new_payload", None, None, None)
+        result = await service.session_read("session123")
+
+        assert result.payload == "new_payload"
+
+    async def test_failed_touch_flush_keeps_touches(self, mock_auth_repo):
+        """Touches survive a failed write and are retried on the next flush."""
+        mock_auth_repo.touch_sessions.side_effect = [RuntimeError("down"), 2]
+        _SESSION_CACHE.touch("a")
+
+        with pytest.raises(RuntimeError):
+            await _SESSION_CACHE.flush(mock_auth_repo)
+        _SESSION_CACHE.touch("b")
+
+        assert await _SESSION_CACHE.flush(mock_auth_repo) == 2
+        touches = mock_auth_repo.touch_sessions.call_args.args[0]
+        assert sorted(session_id for session_id, _ in touches) == ["a", "b"]
+
     async def test_session_write(self, mock_pool, mock_state, mock_auth_repo):
         """session_write calls repository method."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
@@ -759,15 +901,17 @@ class TestAuthServiceSessionManagement:
         mock_auth_repo.delete_session.assert_called_once_with("session123")
 
     async def test_session_gc(self, mock_pool, mock_state, mock_auth_repo):
-        """session_gc deletes expired sessions and returns count."""
+        """session_gc drops expired partitions, deletes the remainder and returns the total."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.delete_expired_sessions.return_value = 42
+        mock_auth_repo.drop_expired_session_partitions.return_value = 40
+        mock_auth_repo.delete_expired_sessions.return_value = 2
 
         result = await service.session_gc()
 
         assert result.deleted_count == 42
 
+        mock_auth_repo.drop_expired_session_partitions.assert_called_once_with(129600)
         mock_auth_repo.delete_expired_sessions.assert_called_once_with(129600)
 
     async def test_session_get_user_sessions(self, mock_pool, mock_state, mock_auth_repo):
@@ -924,7 +1068,6 @@ class TestAuthServiceErrorTranslation:
         """UniqueConstraintViolationError on email raises EmailAlreadyExistsError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.check_email_exists.return_value = False
         mock_auth_repo.generate_next_user_id.return_value = 123456789
         mock_auth_repo.create_email_auth.side_effect = UniqueConstraintViolationError(
@@ -947,7 +1090,6 @@ class TestAuthServiceErrorTranslation:
         """ForeignKeyViolationError during registration raises EmailAlreadyExistsError."""
         service = AuthService(mock_pool, mock_state, mock_auth_repo)
 
-        mock_auth_repo.fetch_rate_limit_count.return_value = 0
         mock_auth_repo.check_email_exists.return_value = False
         mock_auth_repo.generate_next_user_id.return_value = 123456789
         mock_auth_repo.create_core_user.side_effect = ForeignKeyViolationError(
@@ -1219,6 +1219,44 @@ class TestCompletionsServiceUpvotes:
     pass
 
 
+class TestReconcileWorldRecords:
+    """Test the world record consistency check."""
+
+    async def test_drifted_maps_are_refreshed(self, mock_pool, mock_state, mock_completions_repo):
+        """Drifted maps are reported and refreshed in one call."""
+        service = CompletionsService(mock_pool, mock_state, mock_completions_repo)
+        mock_completions_repo.fetch_world_record_drift.return_value = [
+            {"map_id": 4, "expected_completion_id": 10, "stored_completion_id": 7},
+            {"map_id": 9, "expected_completion_id": None, "stored_completion_id": 3},
+        ]
+
+        result = await service.reconcile_world_records()
+
+        assert [r.map_id for r in result] == [4, 9]
+        assert result[1].expected_completion_id is None
+        assert mock_completions_repo.refresh_world_records.call_args.args == ([4, 9],)
+
+    async def test_report_only_does_not_refresh(self, mock_pool, mock_state, mock_completions_repo):
+        """repair=False only reports the drift."""
+        service = CompletionsService(mock_pool, mock_state, mock_completions_repo)
+        mock_completions_repo.fetch_world_record_drift.return_value = [
+            {"map_id": 4, "expected_completion_id": 10, "stored_completion_id": 7},
+        ]
+
+        result = await service.reconcile_world_records(repair=False)
+
+        assert len(result) == 1
+        mock_completions_repo.refresh_world_records.assert_not_called()
+
+    async def test_consistent_records_are_left_alone(self, mock_pool, mock_state, mock_completions_repo):
+        """No drift means no refresh."""
+        service = CompletionsService(mock_pool, mock_state, mock_completions_repo)
+        mock_completions_repo.fetch_world_record_drift.return_value = []
+
+        assert await service.reconcile_world_records() == []
+        mock_completions_repo.refresh_world_records.assert_not_called()
+
+
 class TestCompletionsServiceQualityVotes:
     """Test quality vote logic."""
 
@@ -1,12 +1,16 @@
 """Unit tests for ImageStorageService."""
 
 import hashlib
+import io
+import os
+import tempfile
 from datetime import datetime, timezone
 from unittest.mock import ANY, patch
 
 import pytest
 
-from services.image_storage_service import ImageStorageService, _ext_from_content_type
+from services.image_storage_service import ImageStorageService, ObjectStorage, _ext_from_content_type
+from utilities.image_variants import ImageVariantRenderer
 
 # No domain marker - this is an infrastructure service
 
@@ -52,7 +56,7 @@ class TestUploadScreenshot:
     """Test upload_screenshot business logic."""
 
     @patch("services.image_storage_service.S3_PUBLIC_URL", "https://cdn.example.com")
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_upload_screenshot_generates_correct_key(self, mock_boto3_client, mocker):
         """upload_screenshot generates key with hash, date, and extension."""
         mock_s3 = mocker.Mock()
@@ -81,7 +85,7 @@ class TestUploadScreenshot:
         # Verify URL uses the patched public URL
         assert result == f"https://cdn.example.com/{expected_key}"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_upload_screenshot_sets_content_type(self, mock_boto3_client, mocker):
         """upload_screenshot sets correct Content-Type header."""
         mock_s3 = mocker.Mock()
@@ -98,7 +102,7 @@ class TestUploadScreenshot:
         extra_args = call_args[1]["ExtraArgs"]
         assert extra_args["ContentType"] == "image/webp"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_upload_screenshot_sets_cache_control(self, mock_boto3_client, mocker):
         """upload_screenshot sets immutable cache control header."""
         mock_s3 = mocker.Mock()
@@ -114,7 +118,7 @@ class TestUploadScreenshot:
         extra_args = call_args[1]["ExtraArgs"]
         assert extra_args["CacheControl"] == "public, max-age=31536000, immutable"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_upload_screenshot_different_content_types(self, mock_boto3_client, mocker):
         """upload_screenshot uses correct extension for different content types."""
         mock_s3 = mocker.Mock()
@@ -140,7 +144,7 @@ class TestUploadScreenshot:
 
             assert key.endswith(expected_ext), f"Expected {expected_ext} for {content_type}, got {key}"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_upload_screenshot_same_image_same_key(self, mock_boto3_client, mocker):
         """Same image content produces same key (deterministic hash)."""
         mock_s3 = mocker.Mock()
@@ -162,3 +166,171 @@ class TestUploadScreenshot:
 
         # Same content = same key = same URL
         assert result1 == result2
+
+
+class TestPutScreenshot:
+    """Test streamed screenshot uploads on the shared storage pool."""
+
+    @patch("services.image_storage_service.S3_PUBLIC_URL", "https://cdn.example.com")
+    async def test_put_screenshot_streams_file_keyed_by_digest(self, mocker):
+        """put_screenshot uploads the file object itself, keyed by its blake2b digest."""
+        mock_s3 = mocker.Mock()
+        storage = ObjectStorage(workers=1)
+        service = ImageStorageService(mock_s3, storage, ImageVariantRenderer(workers=0))
+        image_data = b"x" * (3 * 1024 * 1024 + 7)
+        fileobj = tempfile.SpooledTemporaryFile(max_size=1024)
+        fileobj.write(image_data)
+
+        try:
+            result = await service.put_screenshot(fileobj, "image/png")
+        finally:
+            storage.close()
+
+        expected_hash = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        call_args = mock_s3.upload_fileobj.call_args
+        assert call_args[0][0] is fileobj
+        assert call_args[0][2].endswith(f"/{expected_hash}.png")
+        assert call_args[1]["Config"] is storage.transfer_config
+        assert result.url == f"https://cdn.example.com/{call_args[0][2]}"
+        assert result.variants == []
+
+    async def test_put_screenshot_rewinds_before_upload(self, mocker):
+        """The file is rewound after hashing so the upload sends every byte."""
+        positions = []
+        mock_s3 = mocker.Mock()
+        mock_s3.upload_fileobj.side_effect = lambda f, *_, **__: positions.append(f.tell())
+        storage = ObjectStorage(workers=1)
+        service = ImageStorageService(mock_s3, storage, ImageVariantRenderer(workers=0))
+
+        try:
+            await service.put_screenshot(io.BytesIO(b"image"), "image/png")
+        finally:
+            storage.close()
+
+        assert positions == [0]
+
+
+class TestImageVariants:
+    """Test that resized variants are stored next to the original."""
+
+    @patch("services.image_storage_service.S3_PUBLIC_URL", "https://cdn.example.com")
+    async def test_screenshot_variants_share_the_digest_key(self, mocker):
+        """Variants are stored under the original's key with a width suffix, as immutable."""
+        mock_s3 = mocker.Mock()
+        renderer = mocker.Mock(spec=ImageVariantRenderer)
+        renderer.render.return_value = [("_w320.webp", b"small"), ("_w640.webp", b"medium")]
+        storage = ObjectStorage(workers=2)
+        service = ImageStorageService(mock_s3, storage, renderer)
+
+        try:
+            result = await service.put_screenshot(io.BytesIO(b"image"), "image/png")
+        finally:
+            storage.close()
+
+        renderer.render.assert_awaited_once()
+        base = result.url.removesuffix(".png")
+        assert result.variants == [f"{base}_w320.webp", f"{base}_w640.webp"]
+        variant_call = next(c for c in mock_s3.upload_fileobj.call_args_list if c[0][2].endswith("_w320.webp"))
+        assert variant_call[0][0].getvalue() == b"small"
+        assert variant_call[1]["ExtraArgs"] == {
+            "ContentType": "image/webp",
+            "CacheControl": "public, max-age=31536000, immutable",
+        }
+
+    async def test_uploaded_file_is_rendered_from_a_temporary_copy(self, mocker):
+        """The renderer gets the path of a copy of the upload, deleted once the variants are stored."""
+        rendered_from = []
+
+        async def _render(source):
+            with open(source, "rb") as copy:
+                rendered_from.append((source, copy.read()))
+            return []
+
+        renderer = mocker.Mock(spec=ImageVariantRenderer)
+        renderer.render.side_effect = _render
+        storage = ObjectStorage(workers=1)
+        service = ImageStorageService(mocker.Mock(), storage, renderer)
+
+        try:
+            await service.put_screenshot(io.BytesIO(b"image"), "image/png")
+        finally:
+            storage.close()
+
+        [(path, data)] = rendered_from
+        assert data == b"image"
+        assert not os.path.exists(path)
+
+    @patch("services.image_storage_service.S3_PUBLIC_URL", "https://cdn.example.com")
+    async def test_banner_variants_match_get_map_banner(self, mocker):
+        """Banner variant URLs are what get_map_banner(width=...) resolves to."""
+        from genjishimada_sdk.maps import get_map_banner
+
+        mock_s3 = mocker.Mock()
+        renderer = mocker.Mock(spec=ImageVariantRenderer)
+        renderer.render.return_value = [("_w640.webp", b"medium")]
+        storage = ObjectStorage(workers=1)
+        service = ImageStorageService(mock_s3, storage, renderer)
+
+        try:
+            result = await service.put_map_banner(b"banner", "image/png", "King's Row")
+        finally:
+            storage.close()
+
+        assert result.variants == [
+            get_map_banner("King's Row", width=640).replace("https://cdn.genji.pk", "https://cdn.example.com")
+        ]
+
+    async def test_failed_variant_upload_keeps_the_original(self, mocker):
+        """A variant that fails to store is dropped without failing the upload."""
+        mock_s3 = mocker.Mock()
+
+        def _upload(fileobj, bucket, key, **kwargs):
+            if key.endswith("_w320.webp"):
+                raise OSError("connection reset")
+
+        mock_s3.upload_fileobj.side_effect = _upload
+        renderer = mocker.Mock(spec=ImageVariantRenderer)
+        renderer.render.return_value = [("_w320.webp", b"small"), ("_w640.webp", b"medium")]
+        storage = ObjectStorage(workers=1)
+        service = ImageStorageService(mock_s3, storage, renderer)
+
+        try:
+            result = await service.put_screenshot(io.BytesIO(b"image"), "image/png")
+        finally:
+            storage.close()
+
+        assert result.url.endswith(".png")
+        assert [v.rsplit("_", 1)[1] for v in result.variants] == ["w640.webp"]
+
+
+class TestObjectStorage:
+    """Test the shared storage pool's call accounting."""
+
+    async def test_run_records_latency_and_bytes(self):
+        """Each call is counted with its bytes under its operation label."""
+        storage = ObjectStorage(workers=2)
+        try:
+            assert await storage.run("op", lambda a, b: a + b, 1, 2, size=10) == 3
+            await storage.run("op", lambda: None, size=5)
+        finally:
+            storage.close()
+
+        stats = storage.stats()["op"]
+        assert stats["count"] == 2
+        assert stats["bytes"] == 15
+        assert stats["errors"] == 0
+
+    async def test_run_counts_errors(self):
+        """A failing call is re-raised and counted as an error."""
+        storage = ObjectStorage(workers=1)
+
+        def boom() -> None:
+            raise RuntimeError("storage down")
+
+        try:
+            with pytest.raises(RuntimeError):
+                await storage.run("op", boom)
+        finally:
+            storage.close()
+
+        assert storage.stats()["op"]["errors"] == 1
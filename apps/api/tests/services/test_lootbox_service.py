@@ -3,7 +3,7 @@
 from unittest.mock import ANY, AsyncMock
 
 import pytest
-from genjishimada_sdk.xp import XpGrantEvent, XpGrantRequest
+from genjishimada_sdk.xp import XpGrantBatchEvent, XpGrantBatchItem, XpGrantEvent, XpGrantRequest
 
 from services.exceptions.lootbox import InsufficientKeysError
 from services.lootbox_service import DUPLICATE_COIN_VALUES, GACHA_WEIGHTS, LootboxService
@@ -564,3 +564,97 @@ class TestGrantXpConnHelper:
         assert response.new_amount == 60
         # delegation path acquires no caller connection
         assert mock_lootbox_repo.upsert_user_xp.call_args.kwargs.get("conn") is None
+
+
+class TestGrantXpMany:
+    """Verify batched XP grants."""
+
+    async def test_grant_xp_many_reads_multiplier_once_and_upserts_once(
+        self, mock_pool, mock_state, mock_lootbox_repo, mocker
+    ):
+        """All grants share one multiplier read and one upsert, results in request order."""
+        service = LootboxService(mock_pool, mock_state, mock_lootbox_repo)
+
+        mock_lootbox_repo.fetch_xp_multiplier.return_value = 2.0
+        mock_lootbox_repo.upsert_users_xp.return_value = [
+            {"user_id": 1, "previous_amount": 0, "new_amount": 60},
+            {"user_id": 2, "previous_amount": 10, "new_amount": 80},
+            {"user_id": 1, "previous_amount": 60, "new_amount": 130},
+        ]
+        mock_publish = mocker.patch.object(service, "publish_message", new_callable=AsyncMock)
+
+        events = await service.grant_xp_many(
+            headers={},
+            grants=[
+                XpGrantBatchItem(user_id=1, amount=30, type="Map Submission"),
+                XpGrantBatchItem(user_id=2, amount=35, type="Playtest"),
+                XpGrantBatchItem(user_id=1, amount=35, type="Playtest"),
+            ],
+        )
+
+        mock_lootbox_repo.fetch_xp_multiplier.assert_awaited_once()
+        mock_lootbox_repo.upsert_users_xp.assert_awaited_once()
+        kwargs = mock_lootbox_repo.upsert_users_xp.call_args.kwargs
+        assert kwargs["user_ids"] == [1, 2, 1]
+        assert kwargs["xp_amounts"] == [30, 35, 35]
+        assert kwargs["multiplier"] == 2.0
+        assert [(e.user_id, e.type, e.previous_amount, e.new_amount) for e in events] == [
+            (1, "Map Submission", 0, 60),
+            (2, "Playtest", 10, 80),
+            (1, "Playtest", 60, 130),
+        ]
+
+        mock_publish.assert_awaited_once()
+        assert mock_publish.call_args.kwargs["routing_key"] == "api.xp.grant.batch"
+        batch = mock_publish.call_args.kwargs["data"]
+        assert isinstance(batch, XpGrantBatchEvent)
+        assert batch.grants == events
+
+    async def test_grant_xp_many_defers_publish_to_pending_events(
+        self, mock_pool, mock_state, mock_lootbox_repo, mocker
+    ):
+        """With a pending_events collector nothing is published inline."""
+        service = LootboxService(mock_pool, mock_state, mock_lootbox_repo)
+
+        mock_lootbox_repo.fetch_xp_multiplier.return_value = 1.0
+        mock_lootbox_repo.upsert_users_xp.return_value = [
+            {"user_id": 1, "previous_amount": 0, "new_amount": 50},
+        ]
+        mock_publish = mocker.patch.object(service, "publish_message", new_callable=AsyncMock)
+
+        pending: list[XpGrantEvent] = []
+        sentinel_conn = object()
+        await service.grant_xp_many(
+            headers={},
+            grants=[XpGrantBatchItem(user_id=1, amount=50, type="Tournament")],
+            conn=sentinel_conn,
+            pending_events=pending,
+        )
+
+        mock_publish.assert_not_awaited()
+        assert len(pending) == 1
+        assert mock_lootbox_repo.upsert_users_xp.call_args.kwargs["conn"] is sentinel_conn
+
+    async def test_grant_xp_many_empty_is_noop(self, mock_pool, mock_state, mock_lootbox_repo, mocker):
+        """An empty batch touches neither the database nor the broker."""
+        service = LootboxService(mock_pool, mock_state, mock_lootbox_repo)
+        mock_publish = mocker.patch.object(service, "publish_message", new_callable=AsyncMock)
+
+        assert await service.grant_xp_many(headers={}, grants=[]) == []
+
+        mock_lootbox_repo.upsert_users_xp.assert_not_awaited()
+        mock_publish.assert_not_awaited()
+
+    async def test_publish_xp_events_single_event_uses_grant_queue(
+        self, mock_pool, mock_state, mock_lootbox_repo, mocker
+    ):
+        """A lone deferred event still goes out on api.xp.grant."""
+        service = LootboxService(mock_pool, mock_state, mock_lootbox_repo)
+        mock_publish = mocker.patch.object(service, "publish_message", new_callable=AsyncMock)
+
+        event = XpGrantEvent(user_id=1, amount=5, type="Tournament", previous_amount=0, new_amount=5)
+        await service.publish_xp_events([event])
+
+        mock_publish.assert_awaited_once()
+        assert mock_publish.call_args.kwargs["routing_key"] == "api.xp.grant"
+        assert mock_publish.call_args.kwargs["data"] is event
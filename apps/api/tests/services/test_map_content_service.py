@@ -10,7 +10,7 @@ import pytest
 from litestar.status_codes import HTTP_422_UNPROCESSABLE_ENTITY
 
 from repository.map_content_repository import MapContentRepository
-from services.image_storage_service import ImageStorageService
+from services.image_storage_service import ImageStorageService, StoredImage
 from services.map_content_service import MapContentService, _strip_key
 from utilities.errors import CustomHTTPException
 
@@ -22,6 +22,7 @@ def service(mock_pool, mock_state, mocker):
     """MapContentService with mocked repo + mocked image storage service."""
     repo = mocker.AsyncMock(spec=MapContentRepository)
     image_svc = mocker.Mock(spec=ImageStorageService)
+    image_svc.put_map_banner.return_value = StoredImage("https://cdn.genji.pk/assets/map_banners/map.png")
     svc = MapContentService(mock_pool, mock_state, repo, image_svc)
     return svc, repo, image_svc
 
@@ -48,7 +49,7 @@ class TestCreateMapEmptyName:
         assert exc.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
         # Guard fires before any insert/upload.
         repo.insert_map_name.assert_not_called()
-        image_svc.upload_map_banner.assert_not_called()
+        image_svc.put_map_banner.assert_not_called()
 
     async def test_blank_name_raises_422(self, service):
         svc, repo, image_svc = service
@@ -56,7 +57,7 @@ class TestCreateMapEmptyName:
             await svc.create_map("   ", b"banner", "image/png")
         assert exc.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
         repo.insert_map_name.assert_not_called()
-        image_svc.upload_map_banner.assert_not_called()
+        image_svc.put_map_banner.assert_not_called()
 
 
 class TestCreateMapCollision:
@@ -73,7 +74,7 @@ class TestCreateMapCollision:
         # Error names the colliding existing map.
         assert "King's Row" in exc.value.detail
         repo.insert_map_name.assert_not_called()
-        image_svc.upload_map_banner.assert_not_called()
+        image_svc.put_map_banner.assert_not_called()
 
     async def test_whitespace_collision_raises_422(self, service):
         """Extra internal whitespace strips to the same key -> 422.
@@ -104,8 +105,8 @@ class TestCreateMapCollision:
         # Different stripped keys (chteauguillard vs chateauguillard) -> allowed.
         result = await svc.create_map("Chateau Guillard", b"banner", "image/png")
 
-        assert result == {"name": "Chateau Guillard", "inserted": True}
-        image_svc.upload_map_banner.assert_called_once()
+        assert result == {"name": "Chateau Guillard", "inserted": True, "banner_variants": []}
+        image_svc.put_map_banner.assert_called_once()
 
     async def test_same_name_is_not_a_collision(self, service):
         """An exact-match existing name is idempotent insert, NOT a 422 collision."""
@@ -115,8 +116,8 @@ class TestCreateMapCollision:
 
         result = await svc.create_map("Hanamura", b"banner", "image/png")
 
-        assert result == {"name": "Hanamura", "inserted": False}
-        image_svc.upload_map_banner.assert_called_once()
+        assert result == {"name": "Hanamura", "inserted": False, "banner_variants": []}
+        image_svc.put_map_banner.assert_called_once()
 
 
 class TestCreateMapHappyPath:
@@ -126,12 +127,19 @@ class TestCreateMapHappyPath:
         svc, repo, image_svc = service
         repo.fetch_all_map_names.return_value = ["Hanamura", "Busan"]
         repo.insert_map_name.return_value = {"name": "Brand New Map", "inserted": True}
-        image_svc.upload_map_banner.return_value = "https://cdn.genji.pk/assets/map_banners/brandnewmap.png"
+        image_svc.put_map_banner.return_value = StoredImage(
+            "https://cdn.genji.pk/assets/map_banners/brandnewmap.png",
+            ["https://cdn.genji.pk/assets/map_banners/brandnewmap_w640.webp"],
+        )
 
         result = await svc.create_map("Brand New Map", b"banner-bytes", "image/png")
 
-        assert result == {"name": "Brand New Map", "inserted": True}
-        image_svc.upload_map_banner.assert_called_once_with(b"banner-bytes", "image/png", "Brand New Map")
+        assert result == {
+            "name": "Brand New Map",
+            "inserted": True,
+            "banner_variants": ["https://cdn.genji.pk/assets/map_banners/brandnewmap_w640.webp"],
+        }
+        image_svc.put_map_banner.assert_called_once_with(b"banner-bytes", "image/png", "Brand New Map")
         repo.insert_map_name.assert_called_once_with("Brand New Map")
 
     async def test_upload_precedes_insert(self, service, mocker):
@@ -141,7 +149,7 @@ class TestCreateMapHappyPath:
         repo.insert_map_name.return_value = {"name": "Order Map", "inserted": True}
 
         manager = mocker.Mock()
-        manager.attach_mock(image_svc.upload_map_banner, "upload")
+        manager.attach_mock(image_svc.put_map_banner, "upload")
         manager.attach_mock(repo.insert_map_name, "insert")
 
         await svc.create_map("Order Map", b"banner", "image/png")
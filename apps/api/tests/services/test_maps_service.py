@@ -29,7 +29,9 @@ from services.exceptions.maps import (
     LinkedMapError,
     MapCodeExistsError,
     MapNotFoundError,
+    MapValidationError,
     PendingEditRequestExistsError,
+    PlaytestPlotNotFoundError,
 )
 from services.maps_service import MapsService
 
@@ -684,3 +686,87 @@ class TestSetArchiveStatusForceDeny:
         await service.set_archive_status(data, mock_headers, mock_newsfeed_service)
 
         service.publish_message.assert_not_called()
+
+
+class TestPlaytestPlotCache:
+    """Test the content-addressed playtest plot cache."""
+
+    def test_digest_ignores_order_and_zero_buckets(self):
+        """Equivalent histograms hash to the same digest."""
+        from services.maps_service import playtest_plot_digest
+
+        a = playtest_plot_digest({"Easy": 2, "Hard": 1, "Medium": 0})
+        b = playtest_plot_digest({"Hard": 1, "Easy": 2})
+
+        assert a == b
+        assert a != playtest_plot_digest({"Hard": 2, "Easy": 2})
+
+    async def test_identical_concurrent_renders_are_deduplicated(self):
+        """Concurrent misses for one digest share a single render."""
+        import asyncio
+
+        from services.maps_service import _PlaytestPlotCache
+
+        cache = _PlaytestPlotCache(max_entries=4)
+        calls = 0
+
+        async def render() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return b"webp"
+
+        results = await asyncio.gather(*(cache.get_or_render("abc", render) for _ in range(5)))
+
+        assert results == [b"webp"] * 5
+        assert calls == 1
+        assert await cache.get_or_render("abc", render) == b"webp"
+        assert calls == 1
+
+    async def test_failed_render_is_not_cached(self):
+        """A render error propagates and the next request retries."""
+        from services.maps_service import _PlaytestPlotCache
+
+        cache = _PlaytestPlotCache(max_entries=4)
+
+        async def fail() -> bytes:
+            raise RuntimeError("plotter down")
+
+        async def ok() -> bytes:
+            return b"webp"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_render("abc", fail)
+
+        assert cache.get("abc") is None
+        assert await cache.get_or_render("abc", ok) == b"webp"
+
+    @pytest.mark.parametrize("digest", ["../../etc/passwd", "ABCDEF0123456789ABCDEF0123456789", "abc"])
+    async def test_malformed_digest_is_rejected(self, mock_pool, mock_state, mock_maps_repo, digest):
+        """Anything but 32 lowercase hex characters is rejected before the storage key is built."""
+        service = MapsService(mock_pool, mock_state, mock_maps_repo)
+
+        with pytest.raises(MapValidationError):
+            await service.get_playtest_plot_by_digest(digest)
+
+    async def test_unknown_digest_raises_plot_not_found(self, mock_pool, mock_state, mock_maps_repo, mocker):
+        """A well-formed digest with no cached or persisted plot raises PlaytestPlotNotFoundError."""
+        mocker.patch("services.maps_service.PLAYTEST_PLOT_PERSIST", False)
+        service = MapsService(mock_pool, mock_state, mock_maps_repo)
+
+        with pytest.raises(PlaytestPlotNotFoundError):
+            await service.get_playtest_plot_by_digest("0" * 32)
+
+    def test_lru_eviction_bounds_size(self):
+        """The least recently used entry is evicted past max_entries."""
+        from services.maps_service import _PlaytestPlotCache
+
+        cache = _PlaytestPlotCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
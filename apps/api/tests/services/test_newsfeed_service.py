@@ -15,6 +15,7 @@ from genjishimada_sdk.users import Creator, CreatorFull
 from litestar.datastructures import Headers
 
 from services.newsfeed_service import (
+    _NEWSFEED_HEAD,
     NewsfeedService,
     _friendly_value,
     _labelize,
@@ -29,6 +30,24 @@ pytestmark = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_newsfeed_head():
+    """Isolate tests from the process-wide newest-events buffer."""
+    _NEWSFEED_HEAD.clear()
+    yield
+    _NEWSFEED_HEAD.clear()
+
+
+def _event(event_id: int, timestamp: dt.datetime | None = None, *, code: str = "TEST") -> NewsfeedEvent:
+    """Helper to create a stored map_edit NewsfeedEvent."""
+    return NewsfeedEvent(
+        id=event_id,
+        timestamp=timestamp or dt.datetime.now(dt.timezone.utc),
+        payload=NewsfeedMapEdit(code=code, changes=[], reason="Test"),
+        event_type="map_edit",
+    )
+
+
 def _create_test_map(**overrides):
     """Helper to create a test MapResponse with sensible defaults."""
     defaults = {
@@ -246,27 +265,19 @@ class TestNewsfeedServiceListEvents:
         """list_events calculates correct offset for pagination."""
         service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
 
-        mock_newsfeed_repo.fetch_events.return_value = [
-            {
-                "id": 1,
-                "timestamp": dt.datetime.now(dt.timezone.utc),
-                "payload": {"type": "map_edit", "code": "TEST", "changes": [], "reason": "Test"},
-                "event_type": "map_edit",
-                "total_results": None,
-            }
-        ]
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1)]
 
         # Page 1 with limit 10 -> offset 0
         await service.list_events(limit=10, page_number=1, type_=None)
-        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type=None)
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type=None, before=None)
 
         # Page 2 with limit 10 -> offset 10
         await service.list_events(limit=10, page_number=2, type_=None)
-        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=10, event_type=None)
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=10, event_type=None, before=None)
 
         # Page 3 with limit 25 -> offset 50
         await service.list_events(limit=25, page_number=3, type_=None)
-        mock_newsfeed_repo.fetch_events.assert_called_with(limit=25, offset=50, event_type=None)
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=25, offset=50, event_type=None, before=None)
 
     async def test_list_events_handles_zero_page_number(
         self, mock_pool, mock_state, mock_newsfeed_repo
@@ -274,19 +285,11 @@ class TestNewsfeedServiceListEvents:
         """list_events treats page 0 as page 1 (offset 0)."""
         service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
 
-        mock_newsfeed_repo.fetch_events.return_value = [
-            {
-                "id": 1,
-                "timestamp": dt.datetime.now(dt.timezone.utc),
-                "payload": {"type": "map_edit", "code": "TEST", "changes": [], "reason": "Test"},
-                "event_type": "map_edit",
-                "total_results": None,
-            }
-        ]
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1)]
 
         await service.list_events(limit=10, page_number=0, type_=None)
         # max(0 - 1, 0) * 10 = 0
-        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type=None)
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type=None, before=None)
 
     async def test_list_events_returns_none_when_empty(
         self, mock_pool, mock_state, mock_newsfeed_repo
@@ -305,35 +308,19 @@ class TestNewsfeedServiceListEvents:
         """list_events passes event_type filter to repository."""
         service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
 
-        mock_newsfeed_repo.fetch_events.return_value = [
-            {
-                "id": 1,
-                "timestamp": dt.datetime.now(dt.timezone.utc),
-                "payload": {"type": "map_edit", "code": "TEST", "changes": [], "reason": "Test"},
-                "event_type": "map_edit",
-                "total_results": None,
-            }
-        ]
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1)]
 
         await service.list_events(limit=10, page_number=1, type_="map_edit")
-        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type="map_edit")
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type="map_edit", before=None)
 
     async def test_list_events_converts_to_newsfeed_events(
         self, mock_pool, mock_state, mock_newsfeed_repo
     ):
-        """list_events converts repository rows to NewsfeedEvent objects."""
+        """list_events returns the repository's NewsfeedEvent objects."""
         service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
 
         timestamp = dt.datetime.now(dt.timezone.utc)
-        mock_newsfeed_repo.fetch_events.return_value = [
-            {
-                "id": 1,
-                "timestamp": timestamp,
-                "payload": {"type": "map_edit", "code": "TEST", "changes": [], "reason": "Test"},
-                "event_type": "map_edit",
-                "total_results": None,
-            }
-        ]
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1, timestamp)]
 
         result = await service.list_events(limit=10, page_number=1, type_=None)
         assert result is not None
@@ -341,6 +328,74 @@ class TestNewsfeedServiceListEvents:
         assert isinstance(result[0], NewsfeedEvent)
         assert result[0].id == 1
 
+    async def test_list_events_passes_cursor_and_ignores_page_number(self, mock_pool, mock_state, mock_newsfeed_repo):
+        """A (timestamp, id) cursor is passed through with offset 0 whatever the page number."""
+        service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1)]
+        before = (dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc), 42)
+
+        await service.list_events(limit=10, page_number=3, type_="map_edit", before=before)
+
+        mock_newsfeed_repo.fetch_events.assert_called_with(limit=10, offset=0, event_type="map_edit", before=before)
+
+
+class TestNewsfeedServiceHead:
+    """Test first pages served from the newest-events buffer."""
+
+    async def test_first_page_is_served_from_buffer(self, mock_pool, mock_state, mock_newsfeed_repo):
+        """After one unfiltered first-page read, first pages of any size up to it skip the database."""
+        service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
+        now = dt.datetime.now(dt.timezone.utc)
+        events = [_event(i, now - dt.timedelta(minutes=i)) for i in range(1, 21)]
+        mock_newsfeed_repo.fetch_events.return_value = events
+
+        await service.list_events(limit=20, page_number=1, type_=None)
+        result = await service.list_events(limit=10, page_number=1, type_=None)
+
+        assert result == events[:10]
+        assert mock_newsfeed_repo.fetch_events.await_count == 1
+
+    async def test_larger_or_filtered_pages_fall_through(self, mock_pool, mock_state, mock_newsfeed_repo):
+        """A full buffer cannot answer a bigger page or a type filter it has too few matches for."""
+        service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
+        mock_newsfeed_repo.fetch_events.return_value = [_event(i) for i in range(10)]
+
+        await service.list_events(limit=10, page_number=1, type_=None)
+        await service.list_events(limit=10, page_number=1, type_="record")
+        await service.list_events(limit=20, page_number=1, type_=None)
+
+        assert mock_newsfeed_repo.fetch_events.await_count == 3
+
+    async def test_short_feed_answers_filters_from_buffer(self, mock_pool, mock_state, mock_newsfeed_repo):
+        """When the whole feed fits in the buffer, filtered first pages come from it too."""
+        service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1)]
+
+        await service.list_events(limit=10, page_number=1, type_=None)
+        edits = await service.list_events(limit=10, page_number=1, type_="map_edit")
+        records = await service.list_events(limit=10, page_number=1, type_="record")
+
+        assert edits is not None and [e.id for e in edits] == [1]
+        assert records is None
+        assert mock_newsfeed_repo.fetch_events.await_count == 1
+
+    async def test_created_events_join_the_buffer(self, mock_pool, mock_state, mock_newsfeed_repo, mocker):
+        """create_and_publish puts the new event at the head without another read."""
+        service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
+        mocker.patch.object(service, "publish_message", return_value={"status": "pending", "id": "job-1"})
+        now = dt.datetime.now(dt.timezone.utc)
+        mock_newsfeed_repo.fetch_events.return_value = [_event(1, now - dt.timedelta(minutes=1))]
+        mock_newsfeed_repo.insert_event.return_value = 2
+        await service.list_events(limit=10, page_number=1, type_=None)
+
+        new = NewsfeedEvent(id=None, timestamp=now, payload=NewsfeedMapEdit(code="NEW", changes=[], reason="Test"))
+        await service.create_and_publish(event=new, headers=Headers({"x-pytest-enabled": "1"}))
+        result = await service.list_events(limit=10, page_number=1, type_=None)
+
+        assert result is not None
+        assert [(e.id, e.event_type) for e in result] == [(2, "map_edit"), (1, "map_edit")]
+        assert mock_newsfeed_repo.fetch_events.await_count == 1
+
 
 class TestNewsfeedServiceGetEvent:
     """Test get_event retrieval."""
@@ -360,17 +415,11 @@ class TestNewsfeedServiceGetEvent:
     async def test_get_event_converts_to_newsfeed_event(
         self, mock_pool, mock_state, mock_newsfeed_repo
     ):
-        """get_event converts repository row to NewsfeedEvent."""
+        """get_event returns the repository's NewsfeedEvent."""
         service = NewsfeedService(mock_pool, mock_state, mock_newsfeed_repo)
 
         timestamp = dt.datetime.now(dt.timezone.utc)
-        mock_newsfeed_repo.fetch_event_by_id.return_value = {
-            "id": 1,
-            "timestamp": timestamp,
-            "payload": {"type": "map_edit", "code": "TEST", "changes": [], "reason": "Test"},
-            "event_type": "map_edit",
-            "total_results": None,
-        }
+        mock_newsfeed_repo.fetch_event_by_id.return_value = _event(1, timestamp)
 
         result = await service.get_event(1)
         assert result is not None
@@ -0,0 +1,142 @@
+"""Unit tests for RankCardService rank card assembly and caching."""
+
+import pytest
+
+from services.exceptions.users import UserNotFoundError
+from services.rank_card_service import _RANK_CARD_CACHE, RankCardService, invalidate_rank_cards
+
+pytestmark = [
+    pytest.mark.domain_rank_card,
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_rank_card_cache():
+    """Isolate tests from the process-wide rank card cache."""
+    _RANK_CARD_CACHE.clear()
+    yield
+    _RANK_CARD_CACHE.clear()
+
+
+def _rank(difficulty: str, completions: int, *, rank_met: bool = False) -> dict:
+    return {
+        "difficulty": difficulty,
+        "completions": completions,
+        "gold": 0,
+        "silver": 0,
+        "bronze": 0,
+        "rank_met": rank_met,
+        "gold_rank_met": False,
+        "silver_rank_met": False,
+        "bronze_rank_met": False,
+    }
+
+
+def _row(**overrides) -> dict:
+    row = {
+        "nickname": "Genji",
+        "background": None,
+        "avatar_skin": None,
+        "avatar_pose": None,
+        "badges": None,
+        "mastery": None,
+        "maps_created": 2,
+        "playtests_voted": 5,
+        "world_records": 1,
+        "ranks": [_rank("Easy", 12, rank_met=True), _rank("Medium", 3)],
+        "map_totals": {"Easy": 40, "Medium": 30, "Hell": 2},
+        "xp": 2500,
+        "prestige_level": 0,
+        "community_rank": "Recruit I",
+        "skill_score": 0,
+        "skill_tier": 0,
+        "skill_percentile": 0.0,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestGetRankCardData:
+    """Test rank card assembly from the single-row read."""
+
+    async def test_assembles_card_from_one_query(self, mock_pool, mock_state, mock_rank_card_repo):
+        """Every field comes from fetch_rank_card, with defaults for unset customisation."""
+        mock_rank_card_repo.fetch_rank_card.return_value = _row()
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+
+        card = await service.get_rank_card_data(1, map_filter="official_all")
+
+        mock_rank_card_repo.fetch_rank_card.assert_awaited_once_with(1, official=True, playable_only=False)
+        mock_pool.acquire.assert_not_called()
+        assert card.rank_name == "Jumper"
+        assert card.background == "placeholder"
+        assert card.avatar_skin == "Overwatch 1"
+        assert card.avatar_pose == "Heroic"
+        assert card.difficulties["Easy"]["completed"] == 12
+        assert card.difficulties["Easy"]["total"] == 40
+        assert "Hell" not in card.difficulties
+        assert card.skill_tier_name == "Unranked"
+
+    async def test_resolves_badge_urls(self, mock_pool, mock_state, mock_rank_card_repo):
+        """Mastery badges use the mastery amount from the same row; sprays get their CDN URL."""
+        badges = {f"badge_{field}{num}": None for num in range(1, 7) for field in ("name", "type")}
+        badges |= {"badge_name1": "Hanamura", "badge_type1": "mastery", "badge_name2": "Sakura", "badge_type2": "spray"}
+        mock_rank_card_repo.fetch_rank_card.return_value = _row(badges=badges, mastery={"Hanamura": 12})
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+
+        card = await service.get_rank_card_data(1)
+
+        assert card.badges.badge_url1 is not None
+        assert "hanamura" in card.badges.badge_url1.lower()
+        assert card.badges.badge_url2 == "https://cdn.genji.pk/assets/rank_card/spray/sakura.webp"
+
+    async def test_unknown_user_raises(self, mock_pool, mock_state, mock_rank_card_repo):
+        """A missing user row means the user does not exist."""
+        mock_rank_card_repo.fetch_rank_card.return_value = None
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+
+        with pytest.raises(UserNotFoundError):
+            await service.get_rank_card_data(404)
+
+
+class TestRankCardCache:
+    """Test the per-(user, filter) rank card cache."""
+
+    async def test_repeat_reads_hit_the_cache(self, mock_pool, mock_state, mock_rank_card_repo):
+        """A second read of the same user and filter does not query again."""
+        mock_rank_card_repo.fetch_rank_card.return_value = _row()
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+
+        first = await service.get_rank_card_data(1)
+        second = await service.get_rank_card_data(1)
+        await service.get_rank_card_data(1, map_filter="unofficial_all")
+
+        assert first is second
+        assert mock_rank_card_repo.fetch_rank_card.await_count == 2
+
+    async def test_invalidation_drops_every_filter_of_the_user(self, mock_pool, mock_state, mock_rank_card_repo):
+        """invalidate_rank_cards forgets the user's cards and keeps other users'."""
+        mock_rank_card_repo.fetch_rank_card.return_value = _row()
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+        await service.get_rank_card_data(1)
+        await service.get_rank_card_data(1, map_filter="unofficial_all")
+        await service.get_rank_card_data(2)
+
+        invalidate_rank_cards(1)
+
+        assert _RANK_CARD_CACHE.get(1, "official_playable") is None
+        assert _RANK_CARD_CACHE.get(1, "unofficial_all") is None
+        assert _RANK_CARD_CACHE.get(2, "official_playable") is not None
+
+    async def test_setters_invalidate(self, mock_pool, mock_state, mock_rank_card_repo, mocker):
+        """Changing the background shows on the next rank card read."""
+        mock_rank_card_repo.fetch_rank_card.return_value = _row()
+        service = RankCardService(mock_pool, mock_state, mock_rank_card_repo)
+        service._ensure_user_exists = mocker.AsyncMock()
+        await service.get_rank_card_data(1)
+
+        await service.set_background(1, "Sunset")
+        mock_rank_card_repo.fetch_rank_card.return_value = _row(background="Sunset")
+        card = await service.get_rank_card_data(1)
+
+        assert card.background == "Sunset"
@@ -1,5 +1,8 @@
 """Unit tests for StoreService quest behavior."""
 
+import datetime
+from uuid import uuid4
+
 import pytest
 from genjishimada_sdk.store import (
     AdminUpdateUserQuestRequest,
@@ -7,7 +10,7 @@ from genjishimada_sdk.store import (
 )
 
 from services.exceptions.store import InvalidQuestPatchError, QuestNotFoundError
-from services.store_service import StoreService
+from services.store_service import _STORE_CACHE, StoreService
 
 
 pytestmark = [
@@ -15,6 +18,14 @@ pytestmark = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_store_cache():
+    """Isolate tests from the process-wide rotation/pricing cache."""
+    _STORE_CACHE.invalidate()
+    yield
+    _STORE_CACHE.invalidate()
+
+
 class TestStoreServiceRevertQuestProgress:
     """Test quest progress reversion logic."""
 
@@ -234,3 +245,110 @@ class TestClaimQuestXpGrant:
         mock_lootbox_service.grant_user_xp.assert_not_called()
         assert result.xp_earned == 0
         assert result.new_xp == 0
+
+
+def _rotation_rows(*owned: bool) -> list[dict]:
+    rotation_id = uuid4()
+    available_until = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=3)
+    return [
+        {
+            "rotation_id": rotation_id,
+            "item_name": f"Item {i}",
+            "item_type": "spray",
+            "key_type": "Classic",
+            "rarity": "rare",
+            "price": 750,
+            "available_until": available_until,
+            "owned": is_owned,
+        }
+        for i, is_owned in enumerate(owned)
+    ]
+
+
+class TestGetCurrentRotation:
+    """Tests for the cached, set-based rotation read."""
+
+    async def test_ownership_comes_from_the_rotation_query(
+        self, mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service
+    ):
+        """A cold read is one query; no per-item ownership lookups."""
+        service = StoreService(mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service)
+        mock_store_repo.fetch_current_rotation.return_value = _rotation_rows(True, False)
+
+        result = await service.get_current_rotation(user_id=42)
+
+        mock_store_repo.fetch_current_rotation.assert_awaited_once_with(42)
+        mock_lootbox_repo.check_user_has_reward.assert_not_called()
+        assert [item.owned for item in result.items] == [True, False]
+
+    async def test_cached_rotation_checks_ownership_in_one_query(
+        self, mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service
+    ):
+        """A warm read skips the rotation query and asks only for the user's owned items."""
+        service = StoreService(mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service)
+        rows = _rotation_rows(False, False)
+        mock_store_repo.fetch_current_rotation.return_value = rows
+        mock_store_repo.fetch_rotation_ownership.return_value = [
+            {"item_name": "Item 1", "item_type": "spray", "key_type": "Classic"}
+        ]
+
+        await service.get_current_rotation()
+        result = await service.get_current_rotation(user_id=42)
+
+        mock_store_repo.fetch_current_rotation.assert_awaited_once()
+        mock_store_repo.fetch_rotation_ownership.assert_awaited_once_with(rows[0]["rotation_id"], 42)
+        assert [item.owned for item in result.items] == [False, True]
+
+    async def test_empty_rotation_is_not_cached(
+        self, mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service
+    ):
+        """With no live rotation every read asks the database again."""
+        service = StoreService(mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service)
+        mock_store_repo.fetch_current_rotation.return_value = []
+
+        await service.get_current_rotation()
+        result = await service.get_current_rotation()
+
+        assert mock_store_repo.fetch_current_rotation.await_count == 2
+        assert result.items == []
+
+    async def test_generate_rotation_invalidates_cache(
+        self, mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service
+    ):
+        """A rotation generated through this process is served immediately."""
+        service = StoreService(mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service)
+        mock_store_repo.fetch_current_rotation.return_value = _rotation_rows(False)
+        mock_store_repo.generate_rotation.return_value = {
+            "rotation_id": uuid4(),
+            "items_generated": 5,
+            "available_until": datetime.datetime.now(datetime.timezone.utc),
+        }
+
+        await service.get_current_rotation()
+        await service.generate_rotation(5)
+        await service.get_current_rotation()
+
+        assert mock_store_repo.fetch_current_rotation.await_count == 2
+
+
+class TestGetKeyPricing:
+    """Tests for cached key pricing."""
+
+    async def test_pricing_is_cached_until_config_changes(
+        self, mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service
+    ):
+        """Repeated reads hit the cache; a config update forces a reload."""
+        service = StoreService(mock_pool, mock_state, mock_store_repo, mock_lootbox_repo, mock_lootbox_service)
+        mock_store_repo.fetch_config.return_value = {"active_key_type": "Classic"}
+        mock_lootbox_repo.fetch_all_key_types.return_value = [{"name": "Classic"}, {"name": "Winter"}]
+
+        first = await service.get_key_pricing()
+        second = await service.get_key_pricing()
+
+        assert second is first
+        mock_store_repo.fetch_config.assert_awaited_once()
+
+        await service.update_config(rotation_period_days=7)
+        await service.get_key_pricing()
+
+        assert mock_store_repo.fetch_config.await_count == 2
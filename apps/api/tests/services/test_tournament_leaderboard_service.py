@@ -0,0 +1,140 @@
+"""Unit tests for the live tournament cycle leaderboard."""
+
+import datetime as dt
+
+import pytest
+
+from services import tournament_leaderboard_service
+from services.tournament_leaderboard_service import LiveCycleLeaderboard, TournamentLeaderboardService
+
+pytestmark = [pytest.mark.domain_tournaments]
+
+_T0 = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+_run = lambda user_id, time, **kw: {
+    "user_id": user_id,
+    "name": f"User{user_id}",
+    "time": time,
+    "verified": False,
+    "completion": False,
+    "inserted_at": _T0,
+    **kw,
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_boards():
+    tournament_leaderboard_service._BOARDS.boards.clear()
+    yield
+    tournament_leaderboard_service._BOARDS.boards.clear()
+
+
+class TestLiveCycleLeaderboard:
+    """Ordering and delta behaviour of the in-memory board."""
+
+    def test_orders_like_fetch_leaderboard(self):
+        """Verified outranks unverified, then completion, then time, then inserted_at, then user_id."""
+        board = LiveCycleLeaderboard(
+            1,
+            [
+                _run(1, 10.0),
+                _run(2, 50.0, verified=True),
+                _run(3, 40.0, verified=True, completion=True),
+                _run(4, 10.0, inserted_at=_T0 - dt.timedelta(minutes=1)),
+                _run(5, 10.0, inserted_at=_T0 - dt.timedelta(minutes=1)),
+            ],
+            loaded_at=0.0,
+        )
+
+        assert [e.user_id for e in board.top()] == [3, 2, 4, 5, 1]
+        assert [e.rank for e in board.top()] == [1, 2, 3, 4, 5]
+        assert [e.user_id for e in board.top(2)] == [3, 2]
+        assert board.rank_of(1) == 5
+        assert board.rank_of(99) is None
+
+    def test_apply_moves_user_and_reports_delta(self):
+        """An improved run moves the user and reports old/new rank."""
+        board = LiveCycleLeaderboard(1, [_run(1, 10.0), _run(2, 20.0), _run(3, 30.0)], loaded_at=0.0)
+
+        delta = board.apply(3, _run(3, 5.0))
+
+        assert delta is not None
+        assert (delta.previous_rank, delta.rank, delta.total) == (3, 1, 3)
+        assert delta.entry is not None and delta.entry.time == 5.0
+        assert [e.user_id for e in board.top()] == [3, 1, 2]
+
+    def test_apply_new_user_and_noop(self):
+        """A first run inserts with no previous rank; re-applying the same run is a no-op."""
+        board = LiveCycleLeaderboard(1, [_run(1, 10.0)], loaded_at=0.0)
+
+        delta = board.apply(2, _run(2, 15.0))
+        assert delta is not None
+        assert (delta.previous_rank, delta.rank, delta.total) == (None, 2, 2)
+        assert board.apply(2, _run(2, 15.0)) is None
+
+
+class TestTournamentLeaderboardService:
+    """Seeding, fallback and refresh wiring."""
+
+    async def test_active_cycle_is_seeded_once(self, mock_pool, mock_state, mock_tournament_repo):
+        """Reads on an active cycle seed the board once and then skip SQL."""
+        mock_tournament_repo.fetch_cycle.return_value = {"id": 1, "status": "active"}
+        mock_tournament_repo.fetch_leaderboard_runs.return_value = [_run(1, 10.0), _run(2, 5.0)]
+        service = TournamentLeaderboardService(mock_pool, mock_state, mock_tournament_repo)
+
+        first = await service.get_leaderboard(1)
+        second = await service.get_leaderboard(1, limit=1)
+
+        assert [e.user_id for e in first] == [2, 1]
+        assert [e.user_id for e in second] == [2]
+        mock_tournament_repo.fetch_leaderboard_runs.assert_awaited_once_with(1)
+        mock_tournament_repo.fetch_leaderboard.assert_not_called()
+
+    async def test_inactive_cycle_reads_through(self, mock_pool, mock_state, mock_tournament_repo):
+        """Non-active cycles are served from fetch_leaderboard."""
+        mock_tournament_repo.fetch_cycle.return_value = {"id": 1, "status": "completed"}
+        mock_tournament_repo.fetch_leaderboard.return_value = [
+            {"rank": 1, "user_id": 1, "name": "User1", "time": 10.0, "verified": True, "completion": True},
+        ]
+        service = TournamentLeaderboardService(mock_pool, mock_state, mock_tournament_repo)
+
+        result = await service.get_leaderboard(1)
+
+        assert [e.user_id for e in result] == [1]
+        mock_tournament_repo.fetch_leaderboard_runs.assert_not_called()
+
+    async def test_refresh_user_patches_board_and_publishes_delta(
+        self, mock_pool, mock_state, mock_tournament_repo, mocker
+    ):
+        """A refresh re-reads one user's run, patches the board and publishes the delta."""
+        mock_tournament_repo.fetch_cycle.return_value = {"id": 1, "status": "active"}
+        mock_tournament_repo.fetch_leaderboard_runs.return_value = [_run(1, 10.0)]
+        mock_tournament_repo.fetch_leaderboard_run.return_value = _run(2, 5.0)
+        service = TournamentLeaderboardService(mock_pool, mock_state, mock_tournament_repo)
+        publish = mocker.patch.object(service, "publish_message", new_callable=mocker.AsyncMock)
+        await service.get_leaderboard(1)
+
+        await service.refresh_user(1, 2)
+
+        publish.assert_awaited_once()
+        assert publish.call_args.kwargs["routing_key"] == "api.tournament.leaderboard.delta"
+        delta = publish.call_args.kwargs["data"]
+        assert (delta.user_id, delta.previous_rank, delta.rank) == (2, None, 1)
+        assert [e.user_id for e in await service.get_leaderboard(1)] == [2, 1]
+
+    async def test_refresh_user_on_cold_board_publishes_seeded_placement(
+        self, mock_pool, mock_state, mock_tournament_repo, mocker
+    ):
+        """A refresh that seeds the board (which already holds the write) still publishes the user's entry."""
+        mock_tournament_repo.fetch_cycle.return_value = {"id": 1, "status": "active"}
+        mock_tournament_repo.fetch_leaderboard_runs.return_value = [_run(1, 10.0), _run(2, 5.0)]
+        service = TournamentLeaderboardService(mock_pool, mock_state, mock_tournament_repo)
+        publish = mocker.patch.object(service, "publish_message", new_callable=mocker.AsyncMock)
+
+        await service.refresh_user(1, 2)
+
+        publish.assert_awaited_once()
+        delta = publish.call_args.kwargs["data"]
+        assert (delta.user_id, delta.previous_rank, delta.rank, delta.total) == (2, None, 1, 2)
+        assert delta.entry is not None and delta.entry.time == 5.0
+        mock_tournament_repo.fetch_leaderboard_run.assert_not_called()
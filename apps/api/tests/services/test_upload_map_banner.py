@@ -27,7 +27,7 @@ class TestUploadMapBanner:
     """Test upload_map_banner key derivation and return URL."""
 
     @patch("services.image_storage_service.S3_PUBLIC_URL", "https://cdn.example.com")
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_kings_row_stripped_key(self, mock_boto3_client, mocker):
         """upload_map_banner keys 'King's Row' at assets/map_banners/kingsrow.png."""
         mock_s3 = mocker.Mock()
@@ -41,7 +41,7 @@ class TestUploadMapBanner:
         assert call_args[0][2] == expected_key
         assert result == f"https://cdn.example.com/{expected_key}"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_non_png_content_type_still_png_key(self, mock_boto3_client, mocker):
         """A non-png content-type still produces a .png key; ContentType is the real type."""
         mock_s3 = mocker.Mock()
@@ -58,7 +58,7 @@ class TestUploadMapBanner:
         assert key.endswith(".png")
         assert extra_args["ContentType"] == "image/webp"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_accented_name_matches_get_map_banner(self, mock_boto3_client, mocker):
         """The produced key matches get_map_banner()'s path component for an accented name."""
         mock_s3 = mocker.Mock()
@@ -78,7 +78,7 @@ class TestUploadMapBanner:
         # And it MUST equal get_map_banner's path component byte-for-byte.
         assert key == f"assets/{_banner_path_component(name)}"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_key_matches_get_map_banner_for_kings_row(self, mock_boto3_client, mocker):
         """Cross-check the key against get_map_banner for a punctuated name."""
         mock_s3 = mocker.Mock()
@@ -92,7 +92,7 @@ class TestUploadMapBanner:
         key = call_args[0][2]
         assert key == f"assets/{_banner_path_component(name)}"
 
-    @patch("services.image_storage_service.boto3.client")
+    @patch("boto3.client")
     def test_sets_cache_control(self, mock_boto3_client, mocker):
         """upload_map_banner sets a CacheControl header on the object."""
         mock_s3 = mocker.Mock()
@@ -2,12 +2,13 @@
 
 import pytest
 from genjishimada_sdk.users import (
+    OverwatchUsernameItem,
     UserCreateRequest,
     UserUpdateRequest,
 )
 
 from repository.exceptions import UniqueConstraintViolationError
-from services.exceptions.users import InvalidUserIdError, UserAlreadyExistsError
+from services.exceptions.users import DuplicateOverwatchUsernameError, InvalidUserIdError, UserAlreadyExistsError
 from services.users_service import UsersService
 
 pytestmark = [
@@ -186,6 +187,34 @@ class TestUsersServiceOverwatchUsernames:
         assert result.secondary == "Player2"
         assert result.tertiary == "Player3"
 
+    async def test_set_overwatch_usernames_invalidates_rank_cards_after_inserts(
+        self, mock_pool, mock_state, mock_users_repo, mocker
+    ):
+        """Rank cards are invalidated once the new usernames are written."""
+        service = UsersService(mock_pool, mock_state, mock_users_repo)
+        calls = mocker.Mock()
+        mock_users_repo.insert_overwatch_username.side_effect = lambda **_: calls.insert()
+        mocker.patch("services.users_service.invalidate_rank_cards", side_effect=lambda _: calls.invalidate())
+
+        await service.set_overwatch_usernames(123, [OverwatchUsernameItem(username="Player1", is_primary=True)])
+
+        assert [c[0] for c in calls.mock_calls] == ["insert", "invalidate"]
+
+    async def test_set_overwatch_usernames_invalidates_rank_cards_on_failure(
+        self, mock_pool, mock_state, mock_users_repo, mocker
+    ):
+        """Rank cards are invalidated even when an insert fails part way."""
+        service = UsersService(mock_pool, mock_state, mock_users_repo)
+        mock_users_repo.insert_overwatch_username.side_effect = UniqueConstraintViolationError(
+            constraint_name="overwatch_usernames_pkey", table="users.overwatch_usernames"
+        )
+        invalidate = mocker.patch("services.users_service.invalidate_rank_cards")
+
+        with pytest.raises(DuplicateOverwatchUsernameError):
+            await service.set_overwatch_usernames(123, [OverwatchUsernameItem(username="Player1", is_primary=True)])
+
+        invalidate.assert_called_once_with(123)
+
 
 class TestUsersServiceUpdateNames:
     """Test user name update logic with msgspec.UNSET handling."""
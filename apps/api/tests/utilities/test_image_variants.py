@@ -0,0 +1,92 @@
+"""Tests for the image variant renderer."""
+
+import io
+
+from PIL import Image
+
+from utilities.image_variants import ImageVariantRenderer, render_variants_sync
+
+# ruff: noqa: ANN201
+
+
+def _png(width: int, height: int, mode: str = "RGB", *, exif: bool = False) -> bytes:
+    image = Image.new(mode, (width, height), (255, 0, 0, 128) if mode == "RGBA" else "red")
+    out = io.BytesIO()
+    if exif:
+        metadata = Image.Exif()
+        metadata[0x010F] = "Camera Maker"
+        image.save(out, format="PNG", exif=metadata)
+    else:
+        image.save(out, format="PNG")
+    return out.getvalue()
+
+
+class TestRenderVariants:
+    """Tests for render_variants_sync."""
+
+    def test_downscales_to_each_width_keeping_aspect(self):
+        """Test that each width gets a WebP scaled to that width."""
+        variants = dict(render_variants_sync(_png(2000, 1000), widths=(320, 640), formats=("webp",)))
+
+        assert list(variants) == ["_w320.webp", "_w640.webp"]
+        with Image.open(io.BytesIO(variants["_w320.webp"])) as image:
+            assert image.format == "WEBP"
+            assert image.size == (320, 160)
+
+    def test_never_upscales(self):
+        """Test that widths above the original keep the original size."""
+        variants = dict(render_variants_sync(_png(200, 100), widths=(320,), formats=("webp",)))
+
+        with Image.open(io.BytesIO(variants["_w320.webp"])) as image:
+            assert image.size == (200, 100)
+
+    def test_strips_metadata(self):
+        """Test that EXIF metadata is not carried into variants."""
+        variants = render_variants_sync(_png(400, 200, exif=True), widths=(320,), formats=("webp",))
+
+        with Image.open(io.BytesIO(variants[0][1])) as image:
+            assert not image.getexif()
+            assert "icc_profile" not in image.info
+
+    def test_keeps_transparency(self):
+        """Test that images with alpha keep it."""
+        variants = render_variants_sync(_png(400, 200, "RGBA"), widths=(320,), formats=("webp",))
+
+        with Image.open(io.BytesIO(variants[0][1])) as image:
+            assert image.mode == "RGBA"
+
+    def test_decodes_from_a_path(self, tmp_path):
+        """Test that a file path renders the same variants as its bytes."""
+        image = _png(400, 200)
+        path = tmp_path / "upload.png"
+        path.write_bytes(image)
+
+        from_path = render_variants_sync(str(path), widths=(320,), formats=("webp",))
+
+        assert from_path == render_variants_sync(image, widths=(320,), formats=("webp",))
+
+    def test_undecodable_image_has_no_variants(self):
+        """Test that bytes Pillow cannot decode yield no variants instead of raising."""
+        assert render_variants_sync(b"not an image", widths=(320,), formats=("webp",)) == []
+
+
+class TestImageVariantRenderer:
+    """Tests for the renderer pool."""
+
+    async def test_process_pool_renders(self):
+        """Test that the worker processes return the rendered variants."""
+        renderer = ImageVariantRenderer(workers=1)
+        try:
+            variants = await renderer.render(_png(800, 400))
+        finally:
+            renderer.close()
+
+        assert variants
+        assert all(suffix.startswith("_w") for suffix, _ in variants)
+
+    async def test_failure_yields_no_variants(self, mocker):
+        """Test that a rendering error is swallowed so the upload can proceed."""
+        mocker.patch("utilities.image_variants.render_variants_sync", side_effect=MemoryError)
+        renderer = ImageVariantRenderer(workers=0)
+
+        assert await renderer.render(_png(800, 400)) == []
@@ -0,0 +1,44 @@
+"""Tests for the off-loop password hashing pool."""
+
+import asyncio
+
+import pytest
+
+from utilities.password_hashing import HashingQueueFullError, PasswordHasher, verify_password_sync
+
+# ruff: noqa: ANN201
+
+
+class TestPasswordHasher:
+    """Tests for PasswordHasher bounds and round trips."""
+
+    async def test_process_pool_round_trip(self):
+        """Test that hashes made by the worker processes verify."""
+        hasher = PasswordHasher(workers=1, max_pending=4)
+        try:
+            password_hash = await hasher.hash("ValidPass123!")
+            assert verify_password_sync("ValidPass123!", password_hash)
+            assert await hasher.verify("ValidPass123!", password_hash) is True
+            assert await hasher.verify("WrongPass123!", password_hash) is False
+        finally:
+            hasher.close()
+
+    async def test_thread_mode_round_trip(self):
+        """Test that workers=0 hashes on threads instead of processes."""
+        hasher = PasswordHasher(workers=0, max_pending=4)
+        password_hash = await hasher.hash("ValidPass123!")
+        assert await hasher.verify("ValidPass123!", password_hash) is True
+
+    async def test_sheds_when_queue_full(self):
+        """Test that calls past max_pending fail fast instead of queueing."""
+        hasher = PasswordHasher(workers=0, max_pending=2, retry_after=7)
+        in_flight = [asyncio.create_task(hasher.hash("ValidPass123!")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingQueueFullError) as exc_info:
+            await hasher.hash("ValidPass123!")
+        assert exc_info.value.retry_after == 7
+
+        await asyncio.gather(*in_flight)
+        assert hasher.pending == 0
+        await hasher.hash("ValidPass123!")
@@ -0,0 +1,67 @@
+"""Tests for GCRA rate limit math and the in-memory bucket store."""
+
+import pytest
+
+import utilities.rate_limiting as rate_limiting
+from utilities.rate_limiting import MemoryRateLimitBackend, RateLimit
+
+# ruff: noqa: ANN201
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic at a controllable value."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiting.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def _allowed(backend, limit):
+    return limit.retry_after(await backend.rate_limit_backlog("a@example.com", "login")) == 0
+
+
+class TestGcra:
+    """Tests for RateLimit with MemoryRateLimitBackend."""
+
+    async def test_burst_then_refill(self, clock):
+        """Test that max_attempts fit at once and one more fits per emission interval."""
+        limit = RateLimit(max_attempts=5, window_seconds=100)
+        backend = MemoryRateLimitBackend()
+
+        for _ in range(5):
+            assert await _allowed(backend, limit)
+            await backend.rate_limit_hit("a@example.com", "login", limit.emission_interval)
+        assert not await _allowed(backend, limit)
+
+        clock[0] += limit.emission_interval
+        assert await _allowed(backend, limit)
+
+    async def test_retry_after(self, clock):
+        """Test that retry_after reports the wait until the next attempt fits."""
+        limit = RateLimit(max_attempts=2, window_seconds=60)
+        backend = MemoryRateLimitBackend()
+        for _ in range(2):
+            await backend.rate_limit_hit("a@example.com", "login", limit.emission_interval)
+
+        backlog = await backend.rate_limit_backlog("a@example.com", "login")
+        assert limit.retry_after(backlog) == pytest.approx(30)
+
+        clock[0] += 10
+        backlog = await backend.rate_limit_backlog("a@example.com", "login")
+        assert limit.retry_after(backlog) == pytest.approx(20)
+
+    async def test_identifiers_are_case_insensitive(self, clock):
+        """Test that identifiers differing only in case share a bucket."""
+        backend = MemoryRateLimitBackend()
+        await backend.rate_limit_hit("A@Example.com", "login", 10)
+        assert await backend.rate_limit_backlog("a@example.com", "login") == pytest.approx(10)
+
+    async def test_idle_buckets_are_pruned(self, clock, monkeypatch):
+        """Test that expired buckets are dropped as hits arrive."""
+        monkeypatch.setattr(rate_limiting, "_PRUNE_EVERY", 2)
+        backend = MemoryRateLimitBackend()
+        await backend.rate_limit_hit("old@example.com", "login", 1)
+        clock[0] += 10
+        await backend.rate_limit_hit("new@example.com", "login", 1)
+
+        assert set(backend._tat) == {("new@example.com", "login")}
@@ -0,0 +1,43 @@
+"""Tests for per-route Sentry trace sampling."""
+
+import pytest
+
+from utilities.tracing import SENTRY_TRACES_SAMPLE_RATE, sample_rate_for_path, traces_sampler
+
+# ruff: noqa: ANN201
+
+
+class TestTracesSampler:
+    """Tests for traces_sampler and its path rules."""
+
+    @pytest.mark.parametrize(
+        ("path", "rate"),
+        [
+            ("/healthcheck", 0.0),
+            ("/docs/openapi.json", 0.0),
+            ("/api/v3/utilities/autocomplete/map-codes", 0.01),
+            ("/api/v3/tags/autocomplete", 0.01),
+            ("/api/v3/completions/42/verification", 1.0),
+            ("/api/v3/skill/config", 1.0),
+        ],
+    )
+    def test_path_rules(self, path, rate):
+        """Test that known routes get their configured rate."""
+        assert sample_rate_for_path(path) == rate
+
+    def test_unmatched_path_uses_default(self):
+        """Test that routes without a rule use the default rate."""
+        assert sample_rate_for_path("/api/v3/maps") == SENTRY_TRACES_SAMPLE_RATE
+
+    def test_parent_decision_is_honoured(self):
+        """Test that an upstream sampling decision overrides the path rule."""
+        context = {"parent_sampled": True, "asgi_scope": {"path": "/healthcheck"}}
+        assert traces_sampler(context) == 1.0
+
+    def test_without_asgi_scope_uses_default(self):
+        """Test that non-HTTP transactions use the default rate."""
+        assert traces_sampler({"transaction_context": {"op": "queue.task"}}) == SENTRY_TRACES_SAMPLE_RATE
+
+    def test_asgi_scope_path_is_used(self):
+        """Test that the ASGI path selects the rule."""
+        assert traces_sampler({"asgi_scope": {"path": "/healthcheck"}}) == 0.0
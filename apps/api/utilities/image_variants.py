@@ -0,0 +1,140 @@
+"""Off-loop rendering of resized image variants.
+
+Screenshots and map banners are stored at their original size, often
+multi-megabyte PNGs, while embeds and previews only need a small image. At
+upload time each image is decoded once and re-encoded at every width in
+``IMAGE_VARIANT_WIDTHS`` (never upscaled) in each of ``IMAGE_VARIANT_FORMATS``.
+EXIF, ICC and text chunks are not carried over.
+
+Decoding and encoding are CPU-bound, so they run in a small process pool
+(``IMAGE_VARIANT_WORKERS``; ``0`` renders on threads instead), like bcrypt
+hashing in :mod:`utilities.password_hashing`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from genjishimada_sdk.maps import IMAGE_VARIANT_WIDTHS
+
+log = logging.getLogger(__name__)
+
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", str(min(2, os.cpu_count() or 1))))
+IMAGE_VARIANT_FORMATS = tuple(
+    f.strip().lower() for f in os.getenv("IMAGE_VARIANT_FORMATS", "webp").split(",") if f.strip()
+)
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", "80"))
+
+_CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def variant_suffix(width: int, fmt: str) -> str:
+    """Return the key suffix of a variant, e.g. ``_w640.webp``."""
+    return f"_w{width}.{fmt}"
+
+
+def variant_content_type(fmt: str) -> str:
+    """Return the content type a variant format is stored with."""
+    return _CONTENT_TYPES[fmt]
+
+
+def render_variants_sync(
+    image: bytes | str,
+    widths: tuple[int, ...] = IMAGE_VARIANT_WIDTHS,
+    formats: tuple[str, ...] = IMAGE_VARIANT_FORMATS,
+    quality: int = IMAGE_VARIANT_QUALITY,
+) -> list[tuple[str, bytes]]:
+    """Decode ``image`` once and encode it at each width and format (runs in a worker process).
+
+    ``image`` is the encoded image or the path of a file holding it; a path is
+    decoded straight from disk. Widths at or above the original are encoded at
+    the original size, so every variant key exists for every decodable image.
+
+    Returns:
+        ``(suffix, data)`` pairs, or an empty list when ``image`` cannot be decoded.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError  # noqa: PLC0415  # deferred heavy import
+
+    try:
+        with Image.open(io.BytesIO(image) if isinstance(image, bytes) else image) as opened:
+            opened.seek(0)  # first frame of animated images
+            decoded = ImageOps.exif_transpose(opened)
+            decoded.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return []
+
+    has_alpha = decoded.mode in {"RGBA", "LA", "PA"} or "transparency" in decoded.info
+    decoded = decoded.convert("RGBA" if has_alpha else "RGB")
+
+    variants: list[tuple[str, bytes]] = []
+    for width in widths:
+        resized = decoded
+        if decoded.width > width:
+            height = max(1, round(decoded.height * width / decoded.width))
+            resized = decoded.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        for fmt in formats:
+            out = io.BytesIO()
+            resized.save(out, format=fmt.upper(), quality=quality)
+            variants.append((variant_suffix(width, fmt), out.getvalue()))
+    return variants
+
+
+class ImageVariantRenderer:
+    """Bounded process pool that renders image variants.
+
+    With ``workers=0`` the work runs on the default thread pool instead; Pillow
+    releases the GIL while resampling and encoding.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Initialize the renderer; worker processes start lazily.
+
+        Args:
+            workers: Number of worker processes, or 0 to use threads.
+        """
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Start the worker processes, so the first upload does not pay for it."""
+        if self._executor is None and self.workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def close(self) -> None:
+        """Shut the worker processes down, cancelling queued work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def render(self, image: bytes | str) -> list[tuple[str, bytes]]:
+        """Render the variants of ``image``, encoded bytes or a file path, off the event loop.
+
+        Rendering is best effort: a failure is logged and yields no variants, so
+        it never fails the upload of the original.
+
+        Returns:
+            ``(suffix, data)`` pairs as from :func:`render_variants_sync`.
+        """
+        if not IMAGE_VARIANT_FORMATS or not IMAGE_VARIANT_WIDTHS:
+            return []
+        loop = asyncio.get_running_loop()
+        try:
+            if self.workers <= 0:
+                return await loop.run_in_executor(None, render_variants_sync, image)
+            self.start()
+            return await loop.run_in_executor(self._executor, render_variants_sync, image)
+        except Exception:
+            log.exception("Failed to render image variants.")
+            return []
+
+
+# Single process-wide renderer shared by every ImageStorageService.
+IMAGE_VARIANTS = ImageVariantRenderer(IMAGE_VARIANT_WORKERS)
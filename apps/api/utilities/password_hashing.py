@@ -0,0 +1,122 @@
+"""Off-loop bcrypt hashing.
+
+A bcrypt round at cost 12 burns a few hundred milliseconds of CPU. Run inline in
+an async handler it stalls every other request on the event loop, so hashing and
+verification are sent to a small dedicated process pool instead.
+
+The pool is bounded twice: ``PASSWORD_HASH_WORKERS`` processes do the work, and
+at most ``PASSWORD_HASH_MAX_PENDING`` operations may be queued or running at
+once. Past that, :class:`PasswordHasher` raises :class:`HashingQueueFullError`
+immediately instead of queueing, so a credential-stuffing flood is shed with a
+503 rather than growing an unbounded backlog of logins that will time out anyway.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+import bcrypt
+
+BCRYPT_ROUNDS = 12
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 16)))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "5"))
+
+T = TypeVar("T")
+
+
+class HashingQueueFullError(RuntimeError):
+    """Raised when too many password hashing operations are already pending."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Password hashing queue is full.")
+        self.retry_after = retry_after
+
+
+def hash_password_sync(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Hash ``password`` with a fresh bcrypt salt (runs in a worker process)."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password_sync(password: str, password_hash: str) -> bool:
+    """Check ``password`` against a bcrypt hash (runs in a worker process)."""
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+class PasswordHasher:
+    """Bounded process pool for bcrypt hashing and verification.
+
+    With ``workers=0`` the work runs on the default thread pool instead; bcrypt
+    releases the GIL, so this still keeps the loop free, just without the
+    isolation of separate processes.
+    """
+
+    def __init__(self, workers: int, max_pending: int, retry_after: int = PASSWORD_HASH_RETRY_AFTER) -> None:
+        """Initialize the hasher; worker processes start lazily.
+
+        Args:
+            workers: Number of worker processes, or 0 to use threads.
+            max_pending: Maximum operations queued or running before shedding.
+            retry_after: Seconds advertised to callers that are shed.
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Start the worker processes, so the first login does not pay for it."""
+        if self._executor is None and self.workers > 0:
+            # Spawned workers only import this module, and do not inherit the
+            # parent's threads or sockets as forked ones would.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def close(self) -> None:
+        """Shut the worker processes down, cancelling queued work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn: Callable[..., T], *args: str) -> T:
+        if self.pending >= self.max_pending:
+            raise HashingQueueFullError(self.retry_after)
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            if self.workers <= 0:
+                return await loop.run_in_executor(None, fn, *args)
+            self.start()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop.
+
+        Raises:
+            HashingQueueFullError: If ``max_pending`` operations are already in flight.
+        """
+        return await self._run(hash_password_sync, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Verify a password against its hash off the event loop.
+
+        Raises:
+            HashingQueueFullError: If ``max_pending`` operations are already in flight.
+        """
+        return await self._run(verify_password_sync, password, password_hash)
+
+
+# Single process-wide hasher shared by every AuthService.
+PASSWORD_HASHER = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
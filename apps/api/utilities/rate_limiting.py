@@ -0,0 +1,92 @@
+"""GCRA rate limiting with pluggable bucket storage.
+
+Each ``(identifier, action)`` pair is one bucket holding a single timestamp, its
+theoretical arrival time (TAT). An attempt pushes the TAT forward by the
+emission interval ``window / max_attempts``; a new attempt is allowed while the
+TAT it would produce stays within ``window`` of now. This admits bursts of up to
+``max_attempts`` and then one attempt per emission interval, like a sliding
+window, without keeping a row per attempt.
+
+Backends only store and advance the TAT:
+
+* :class:`MemoryRateLimitBackend` (default) keeps buckets in this process. With
+  several API replicas, each enforces its own limit.
+* ``AuthRepository`` implements the same protocol on the UNLOGGED
+  ``users.auth_rate_limit_buckets`` table, so replicas share one limit. Select it
+  with ``AUTH_RATE_LIMIT_BACKEND=postgres``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import NamedTuple, Protocol
+
+AUTH_RATE_LIMIT_BACKEND = os.getenv("AUTH_RATE_LIMIT_BACKEND", "memory")
+
+_PRUNE_EVERY = 1024
+
+
+class RateLimit(NamedTuple):
+    """Allow ``max_attempts`` per ``window_seconds``."""
+
+    max_attempts: int
+    window_seconds: int
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds each attempt adds to the bucket."""
+        return self.window_seconds / self.max_attempts
+
+    def retry_after(self, backlog: float) -> float:
+        """Return how long until one more attempt fits, or 0 if it fits now.
+
+        Args:
+            backlog: Seconds the bucket's TAT is ahead of now.
+        """
+        return max(backlog + self.emission_interval - self.window_seconds, 0.0)
+
+
+class RateLimitBackend(Protocol):
+    """Storage for GCRA buckets."""
+
+    async def rate_limit_backlog(self, identifier: str, action: str) -> float:
+        """Return how many seconds the bucket's TAT is ahead of now (0 if idle)."""
+        ...
+
+    async def rate_limit_hit(self, identifier: str, action: str, emission_interval: float) -> None:
+        """Atomically advance the bucket's TAT by one attempt."""
+        ...
+
+
+class MemoryRateLimitBackend:
+    """In-process bucket store; idle buckets are pruned as hits arrive."""
+
+    def __init__(self) -> None:
+        self._tat: dict[tuple[str, str], float] = {}
+        self._hits = 0
+
+    async def rate_limit_backlog(self, identifier: str, action: str) -> float:
+        """Return how many seconds the bucket's TAT is ahead of now (0 if idle)."""
+        tat = self._tat.get((identifier.lower(), action))
+        if tat is None:
+            return 0.0
+        return max(tat - time.monotonic(), 0.0)
+
+    async def rate_limit_hit(self, identifier: str, action: str, emission_interval: float) -> None:
+        """Advance the bucket's TAT by one attempt."""
+        now = time.monotonic()
+        key = (identifier.lower(), action)
+        self._tat[key] = max(self._tat.get(key, now), now) + emission_interval
+
+        self._hits += 1
+        if self._hits % _PRUNE_EVERY == 0:
+            self._tat = {k: tat for k, tat in self._tat.items() if tat > now}
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        self._tat.clear()
+
+
+# Single process-wide bucket store shared by every AuthService.
+MEMORY_RATE_LIMITS = MemoryRateLimitBackend()
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 import msgspec
 from asyncpg import Connection, Pool
 from genjishimada_sdk.maps import MapMasteryResponse, OverwatchMap
@@ -97,21 +99,45 @@ async def get_user_rank_data(
     Returns:
         list[RankDetailResponse]: Per-difficulty counts and rank-met flags.
 
+    """
+    ranks = await get_users_rank_data(conn, [user_id], official=official, playable_only=playable_only)
+    return ranks[user_id]
+
+
+async def get_users_rank_data(
+    conn: Connection | Pool,
+    user_ids: Sequence[int],
+    *,
+    official: bool = True,
+    playable_only: bool = True,
+) -> dict[int, list[RankDetailResponse]]:
+    """Compute rank details for several users in one query.
+
+    Args:
+        conn (Connection | Pool): Asyncpg connection or pool.
+        user_ids (Sequence[int]): The IDs of the users.
+        official: Whether to filter for official maps (True) or non-official (False).
+        playable_only: When True, exclude archived maps and require approved playtesting.
+
+    Returns:
+        dict[int, list[RankDetailResponse]]: Per-difficulty counts and rank-met flags for
+            every requested user, easiest difficulty first.
+
     """
     query = r"""
-    WITH user_completions AS (
+    WITH requested AS (
+        SELECT DISTINCT unnest($1::bigint[]) AS user_id
+    ),
+    user_completions AS (
         SELECT DISTINCT ON (map_id, user_id)
             map_id,
             user_id,
             time,
-            screenshot,
             video,
-            verified,
-            message_id,
-            completion,
             legacy_medal AS medal
         FROM core.completions
         WHERE verified
+          AND user_id = ANY($1::bigint[])
         ORDER BY map_id, user_id, inserted_at DESC
     ),
     thresholds AS (
@@ -127,6 +153,7 @@ async def get_user_rank_data(
     ),
     map_data AS (
         SELECT
+            uc.user_id,
             regexp_replace(trim(m.difficulty), '\s*[+-]\s*$', '') AS difficulty,
             uc.video IS NOT NULL AND (
                 time <= gold OR medal LIKE 'Gold'
@@ -140,13 +167,13 @@ async def get_user_rank_data(
             FROM user_completions uc
             LEFT JOIN core.maps m ON uc.map_id = m.id
             LEFT JOIN maps.medals mm ON uc.map_id = mm.map_id
-            WHERE uc.user_id = $1
-              AND m.official = $2
+            WHERE m.official = $2
               AND ($3::boolean IS FALSE OR m.archived = FALSE)
               AND ($3::boolean IS FALSE OR m.playtesting = 'Approved')
     ),
     counts_data AS (
         SELECT
+            user_id,
             difficulty,
             count(difficulty) AS completions,
             count(CASE WHEN gold THEN 1 END) AS gold,
@@ -159,9 +186,10 @@ async def get_user_rank_data(
             count(CASE WHEN bronze THEN 1 END) >= t.threshold AS bronze_rank_met
         FROM map_data md
         INNER JOIN thresholds t ON difficulty = t.name
-        GROUP BY difficulty, t.threshold
+        GROUP BY user_id, difficulty, t.threshold
     )
     SELECT
+        r.user_id,
         name AS difficulty,
         coalesce(completions, 0) AS completions,
         coalesce(gold, 0) AS gold,
@@ -171,9 +199,11 @@ async def get_user_rank_data(
         coalesce(gold_rank_met, FALSE) AS gold_rank_met,
         coalesce(silver_rank_met, FALSE) AS silver_rank_met,
         coalesce(bronze_rank_met, FALSE) AS bronze_rank_met
-    FROM thresholds t
-    LEFT JOIN counts_data cd ON t.name = cd.difficulty
+    FROM requested r
+    CROSS JOIN thresholds t
+    LEFT JOIN counts_data cd ON cd.user_id = r.user_id AND t.name = cd.difficulty
     ORDER BY
+        r.user_id,
         CASE name
             WHEN 'Easy' THEN 1
             WHEN 'Medium' THEN 2
@@ -183,5 +213,9 @@ async def get_user_rank_data(
             WHEN 'Hell' THEN 6
         END;
     """
-    rows = await conn.fetch(query, user_id, official, playable_only)
-    return msgspec.convert(rows, list[RankDetailResponse])
+    rows = await conn.fetch(query, list(user_ids), official, playable_only)
+    ranks: dict[int, list[RankDetailResponse]] = {user_id: [] for user_id in user_ids}
+    for row in rows:
+        data = dict(row)
+        ranks[data.pop("user_id")].append(msgspec.convert(data, RankDetailResponse))
+    return ranks
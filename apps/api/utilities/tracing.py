@@ -0,0 +1,82 @@
+"""Per-route Sentry trace sampling.
+
+``traces_sample_rate=1.0`` traced (and, with ``profile_lifecycle="trace"``,
+profiled) every request, including autocomplete keystrokes and healthchecks.
+:func:`traces_sampler` instead picks a rate from the request path: the first
+matching glob in :data:`TRACE_SAMPLE_RULES` wins, and anything unmatched uses
+``SENTRY_TRACES_SAMPLE_RATE``. Profiles follow the trace decision, so cheap,
+chatty routes stop paying for the profiler as well.
+
+Error events are not affected: they are governed by Sentry's ``sample_rate``
+(default 1.0) and are always sent, sampled trace or not.
+
+Extra rules can be supplied without a deploy through
+``SENTRY_TRACES_SAMPLE_RULES``, a JSON list of ``[glob, rate]`` pairs that is
+checked before the defaults, e.g. ``[["/api/v3/maps/*", 0.5]]``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from typing import Any
+
+import msgspec
+
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.1"))
+SENTRY_PROFILE_SESSION_SAMPLE_RATE = float(os.getenv("SENTRY_PROFILE_SESSION_SAMPLE_RATE", "1.0"))
+
+DEFAULT_TRACE_SAMPLE_RULES: tuple[tuple[str, float], ...] = (
+    ("/healthcheck", 0.0),
+    ("/docs*", 0.0),
+    ("/api/v3/utilities/autocomplete/*", 0.01),
+    ("/api/v3/utilities/map-names", 0.01),
+    ("/api/v3/tags/autocomplete", 0.01),
+    ("/api/v3/completions/*/verification", 1.0),
+    ("/api/v3/tournaments/completions/*/verify", 1.0),
+    ("/api/v3/skill/config", 1.0),
+    ("/api/v3/skill/tiers", 1.0),
+)
+
+TRACE_SAMPLE_RULES: tuple[tuple[str, float], ...] = (
+    *msgspec.json.decode(os.getenv("SENTRY_TRACES_SAMPLE_RULES", "[]"), type=list[tuple[str, float]]),
+    *DEFAULT_TRACE_SAMPLE_RULES,
+)
+
+
+def sample_rate_for_path(path: str) -> float:
+    """Return the trace sample rate for a request path.
+
+    Args:
+        path: The ASGI request path.
+
+    Returns:
+        The rate of the first matching rule, or ``SENTRY_TRACES_SAMPLE_RATE``.
+    """
+    for pattern, rate in TRACE_SAMPLE_RULES:
+        if fnmatch.fnmatchcase(path, pattern):
+            return rate
+    return SENTRY_TRACES_SAMPLE_RATE
+
+
+def traces_sampler(sampling_context: dict[str, Any]) -> float:
+    """Sentry ``traces_sampler`` choosing a rate per route.
+
+    A sampling decision inherited from an upstream trace is honoured so
+    distributed traces stay complete. Transactions without an ASGI scope
+    (background tasks) use the default rate.
+
+    Args:
+        sampling_context: Context Sentry passes to the sampler.
+
+    Returns:
+        The probability of sampling this transaction.
+    """
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+    scope = sampling_context.get("asgi_scope") or {}
+    path = scope.get("path")
+    if path is None:
+        return SENTRY_TRACES_SAMPLE_RATE
+    return sample_rate_for_path(path)
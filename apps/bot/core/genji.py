@@ -14,6 +14,7 @@ from extensions.newsfeed import NewsfeedHandler
 from extensions.notifications import NotificationHandler
 from extensions.playtest import PlaytestHandler
 from extensions.rabbit import RabbitHandler
+from extensions.tags.cache import TagCacheHandler
 from extensions.tournaments import TournamentHandler
 from extensions.video_thumbnail import VideoThumbnailHandler
 from extensions.xp import XPHandler
@@ -46,6 +47,7 @@ class Genji(commands.Bot):
     _xp_manager: XPHandler
     _thumbnail_service: VideoThumbnailHandler
     _map_editor_service: MapEditHandler
+    _tag_cache: TagCacheHandler
 
     def __init__(self, *, prefix: str, session: aiohttp.ClientSession) -> None:
         """Initialize Bot instance.
@@ -174,3 +176,12 @@ class Genji(commands.Bot):
     @map_editor.setter
     def map_editor(self, service: MapEditHandler) -> None:
         self._map_editor_service = service
+
+    @property
+    def tag_cache(self) -> TagCacheHandler:
+        """Return the TagCacheHandler."""
+        return self._tag_cache
+
+    @tag_cache.setter
+    def tag_cache(self, service: TagCacheHandler) -> None:
+        self._tag_cache = service
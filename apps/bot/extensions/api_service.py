@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import json
 import mimetypes
 import os
+import statistics
+import time
+from collections import deque
 from functools import lru_cache
 from http import HTTPStatus
 from io import BytesIO
@@ -32,6 +34,7 @@ from genjishimada_sdk.completions import (
     CompletionCreateRequest,
     CompletionModerateRequest,
     CompletionPatchRequest,
+    CompletionSubmissionBatchRequest,
     CompletionSubmissionJobResponse,
     CompletionVerificationUpdateRequest,
     PendingVerificationResponse,
@@ -97,8 +100,10 @@ from genjishimada_sdk.tags import (
     TagsAutocompleteResponse,
     TagsMutateRequest,
     TagsMutateResponse,
+    TagsMutateResult,
     TagsSearchFilters,
     TagsSearchResponse,
+    TagsUsageIncrementRequest,
 )
 from genjishimada_sdk.tournaments import (
     TournamentCategoryResponse,
@@ -113,16 +118,24 @@ from genjishimada_sdk.users import (
     OverwatchUsernamesResponse,
     OverwatchUsernamesUpdateRequest,
     RankDetailResponse,
+    RankDetailsBatchRequest,
     UserCreateRequest,
+    UserRankDetailsResponse,
     UserResponse,
     UserUpdateRequest,
 )
-from genjishimada_sdk.xp import TierChangeResponse, XpGrantRequest, XpGrantResponse
-from multidict import MultiDict
+from genjishimada_sdk.xp import (
+    TierChangeResponse,
+    XpGrantBatchRequest,
+    XpGrantBatchResponse,
+    XpGrantRequest,
+    XpGrantResponse,
+)
 
 from extensions.completions import CompletionLeaderboardFormattable, CompletionUserFormattable
 from utilities.change_requests import FormattableChangeRequest
 from utilities.completions import CompletionSubmissionModel, SuspiciousCompletionModel
+from utilities.entity_cache import EntityCache
 from utilities.errors import APIHTTPError, APIUnavailableError
 from utilities.maps import MapCreateModel, MapModel
 from utilities.views.mod_guides_view import FormattableGuide
@@ -144,6 +157,14 @@ elif APP_ENVIRONMENT == "production":
 else:
     raise RuntimeError(f"Invalid APP_ENVIRONMENT: {APP_ENVIRONMENT}")
 
+# Connection pooling for the single API host. Keep-alive stays under the API
+# server's idle timeout (uvicorn closes idle connections after 5s) so a pooled
+# connection is never reused just as the server drops it.
+API_HTTP_CONNECTION_LIMIT = int(os.getenv("API_HTTP_CONNECTION_LIMIT", "64"))
+API_HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("API_HTTP_KEEPALIVE_TIMEOUT", "4"))
+API_HTTP_DNS_CACHE_TTL = int(os.getenv("API_HTTP_DNS_CACHE_TTL", "300"))
+# Ask the API for gzip-compressed responses; set to 0 to request identity encoding.
+API_HTTP_COMPRESSION = os.getenv("API_HTTP_COMPRESSION", "1") != "0"
 
 log = getLogger(__name__)
 
@@ -153,6 +174,26 @@ MedalFilter = _TriFilter
 PlaytestFilter = Literal["All", "Only", "None"]
 OfficialFilter = Literal["All", "Global Only", "Chinese Only"]
 
+# Non-GET requests under these route prefixes drop the named entity caches.
+# Read-only POSTs are listed in _READ_ONLY_WRITES and skipped.
+_WRITE_INVALIDATES: tuple[tuple[str, str], ...] = (
+    ("/users", "users"),
+    ("/lootbox/users", "users"),
+    ("/maps", "maps"),
+    ("/completions", "submissions"),
+    ("/completions/{code}/quality", "maps"),
+)
+_READ_ONLY_WRITES = frozenset({"/completions/submissions/batch", "/users/ranks/batch"})
+
+
+def _map_cache_tags(maps: list[MapModel]) -> list[tuple[str, object]]:
+    tags: list[tuple[str, object]] = []
+    for m in maps:
+        tags.append(("code", m.code))
+        if m.playtest:
+            tags.append(("thread", m.playtest.thread_id))
+    return tags
+
 
 @lru_cache(maxsize=None)
 def get_decoder(model: type[D]) -> msgspec.json.Decoder[D]:
@@ -167,6 +208,70 @@ def get_decoder(model: type[D]) -> msgspec.json.Decoder[D]:
     return msgspec.json.Decoder(model)
 
 
+class _ErrorEnvelope(msgspec.Struct):
+    error: str | None = None
+    extra: Any = None
+
+
+_error_decoder = msgspec.json.Decoder(_ErrorEnvelope)
+
+
+def _decode_error(raw: bytes) -> _ErrorEnvelope:
+    try:
+        return _error_decoder.decode(raw)
+    except msgspec.DecodeError:
+        return _ErrorEnvelope()
+
+
+def _flatten_params(params: Mapping[str, Any]) -> tuple[tuple[str, str], ...]:
+    """Flatten query params into hashable pairs, dropping None and expanding lists."""
+    pairs: list[tuple[str, str]] = []
+    for k, v in params.items():
+        if v is None:
+            continue
+        if isinstance(v, list):
+            pairs.extend((k, str(item)) for item in v)
+        else:
+            pairs.append((k, str(v)))
+    return tuple(pairs)
+
+
+class _RouteLatency:
+    """Request counters and recent latencies for one route template."""
+
+    __slots__ = ("coalesced", "count", "errors", "max_ms", "recent", "total_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=256)
+
+    def record(self, elapsed_ms: float, *, failed: bool) -> None:
+        self.count += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent.append(elapsed_ms)
+
+    def stats(self) -> dict[str, int | float]:
+        p50 = p95 = self.recent[0] if self.recent else 0.0
+        if len(self.recent) > 1:
+            quantiles = statistics.quantiles(self.recent, n=20, method="inclusive")
+            p50, p95 = quantiles[9], quantiles[18]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "coalesced": self.coalesced,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "max_ms": self.max_ms,
+        }
+
+
 class Route:
     BASE: ClassVar[str] = _BASE + "/api/v3"
 
@@ -193,10 +298,73 @@ class APIService:
         """Initialize the APIService with authentication and heartbeat logic."""
         self.api_key: str = os.getenv("API_KEY", "")
         self._encoder = msgspec.json.Encoder(decimal_format="number")
-        self.__session: aiohttp.ClientSession = aiohttp.ClientSession(headers={"X-API-KEY": self.api_key})
+        connector = aiohttp.TCPConnector(
+            limit=API_HTTP_CONNECTION_LIMIT,
+            limit_per_host=API_HTTP_CONNECTION_LIMIT,
+            keepalive_timeout=API_HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=API_HTTP_DNS_CACHE_TTL,
+        )
+        self.__session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                "X-API-KEY": self.api_key,
+                "Accept-Encoding": "gzip" if API_HTTP_COMPRESSION else "identity",
+            },
+        )
+        self._inflight_gets: dict[tuple[str, tuple[tuple[str, str], ...]], asyncio.Task[tuple[int, bytes]]] = {}
+        self._latency: dict[str, _RouteLatency] = {}
         self._is_available = False
         self._lock = asyncio.Lock()
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._caches: dict[str, EntityCache] = {
+            "users": EntityCache("users", UserResponse | None),
+            "maps": EntityCache("maps", list[MapModel], tags=_map_cache_tags),
+            "submissions": EntityCache("submissions", CompletionSubmissionModel),
+        }
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop a cached user so the next read refetches it."""
+        self._caches["users"].invalidate(user_id)
+
+    def invalidate_map(self, *, code: OverwatchCode | None = None, thread_id: int | None = None) -> None:
+        """Drop cached map lookups by code and/or playtest thread."""
+        self._caches["maps"].invalidate(("code", code), ("thread", thread_id))
+
+    def invalidate_maps(self) -> None:
+        """Drop every cached map lookup."""
+        self._caches["maps"].clear()
+
+    def invalidate_completion_submission(self, record_id: int | None = None) -> None:
+        """Drop one cached completion submission, or all of them when no ID is given."""
+        if record_id is None:
+            self._caches["submissions"].clear()
+        else:
+            self._caches["submissions"].invalidate(record_id)
+
+    def cache_stats(self) -> dict[str, dict[str, int | float]]:
+        """Return hit, miss and size counters for each entity cache."""
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+    def route_latency_stats(self) -> dict[str, dict[str, int | float]]:
+        """Return request counts and latency percentiles per route, keyed like ``"GET /maps"``."""
+        return {name: latency.stats() for name, latency in self._latency.items()}
+
+    def _route_latency(self, route: Route) -> _RouteLatency:
+        name = f"{route.method} {route.path}"
+        latency = self._latency.get(name)
+        if latency is None:
+            latency = self._latency[name] = _RouteLatency()
+        return latency
+
+    def _invalidate_after_write(self, route: Route) -> None:
+        if route.method == "GET" or route.path in _READ_ONLY_WRITES:
+            return
+        # A GET already in flight may have read the old state; later callers
+        # must not join it.
+        self._inflight_gets.clear()
+        for prefix, name in _WRITE_INVALIDATES:
+            if route.path.startswith(prefix):
+                self._caches[name].clear()
 
     async def _heartbeat_loop(self) -> None:
         """Continuously ping the API to determine availability and update internal state."""
@@ -319,7 +487,7 @@ class APIService:
             self._is_available = False
             raise APIUnavailableError("Connection error; API marked unavailable.")
 
-    async def _request(  # noqa: PLR0912
+    async def _request(
         self,
         route: Route,
         *,
@@ -330,6 +498,9 @@ class APIService:
     ) -> Any:  # noqa: ANN401
         """Send an HTTP request to the API and optionally decode the response.
 
+        Identical GETs already in flight share one request; each caller decodes
+        the shared response on its own.
+
         Args:
             route (Route): The route to call.
             response_model (Type[T] | T | None): Optional type to decode the response as.
@@ -345,53 +516,77 @@ class APIService:
             ValueError: If no content is returned but a model was expected.
         """
         await self._ensure_available()
-        headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json",
-        }
 
         if data is not None:
             kwargs["data"] = self._encoder.encode(data)
+        query = _flatten_params(params) if params else ()
+        log.debug(f"The params inside of _request show as {query}")
+
+        if route.method == "GET" and not kwargs:
+            key = (route.url, query)
+            task = self._inflight_gets.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._send(route, query))
+                self._inflight_gets[key] = task
+                task.add_done_callback(lambda t: self._finish_get(key, t))
+            else:
+                self._route_latency(route).coalesced += 1
+            status, raw = await asyncio.shield(task)
+        else:
+            status, raw = await self._send(route, query, **kwargs)
+            self._invalidate_after_write(route)
+
+        if status == HTTPStatus.NO_CONTENT:
+            if response_model:
+                raise ValueError(f"Expected JSON but got no content from {route.url}")
+            return None
+
+        if response_model is None:
+            return raw
+        if raw is None:
+            return None
+        return get_decoder(response_model).decode(raw)
+
+    async def _send(
+        self,
+        route: Route,
+        query: tuple[tuple[str, str], ...],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> tuple[int, bytes]:
+        """Perform one HTTP round trip and record its latency.
 
-        if params:
-            flat_params = MultiDict()
-            for k, v in params.items():
-                if v is None:
-                    continue
-                elif isinstance(v, list):
-                    for item in v:
-                        flat_params.add(k, str(item))
-                else:
-                    flat_params.add(k, str(v))
-            params = flat_params
+        Returns:
+            tuple[int, bytes]: Response status and body.
 
+        Raises:
+            APIHTTPError: If the API answers with an error status.
+            APIUnavailableError: If the API connection fails.
+        """
+        headers = {"Content-Type": "application/json"}
+        started = time.perf_counter()
+        failed = True
         try:
             async with self.__session.request(
-                route.method, route.url, headers=headers, params=params, **kwargs
+                route.method, route.url, headers=headers, params=query or None, **kwargs
             ) as resp:
-                log.debug(f"The params inside of _request show as {params}")
                 raw = await resp.read()
-                try:
-                    resp.raise_for_status()
-                except Exception:
-                    decoded = json.loads(raw) if raw else {}
-                    error = decoded.get("error")
-                    extra = decoded.get("extra")
-                    raise APIHTTPError(resp.status, resp.reason, error, extra)
-                if resp.status == HTTPStatus.NO_CONTENT:
-                    if response_model:
-                        raise ValueError(f"Expected JSON but got no content from {route.url}")
-                    return None
-
-                if response_model is None:
-                    return raw
-                if raw is None:
-                    return None
-                return get_decoder(response_model).decode(raw)
-
+                if resp.status >= HTTPStatus.BAD_REQUEST:
+                    envelope = _decode_error(raw) if raw else _ErrorEnvelope()
+                    raise APIHTTPError(resp.status, resp.reason, envelope.error, envelope.extra)
+                failed = False
+                return resp.status, raw
         except aiohttp.ClientConnectorError:
             self._is_available = False
             raise APIUnavailableError("Connection error; API marked unavailable.")
+        finally:
+            self._route_latency(route).record((time.perf_counter() - started) * 1000, failed=failed)
+
+    def _finish_get(self, key: tuple[str, tuple[tuple[str, str], ...]], task: asyncio.Task[tuple[int, bytes]]) -> None:
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+        if not task.cancelled():
+            # Mark the error retrieved even when every waiter has gone away.
+            task.exception()
 
     def submit_map(self, data: MapCreateModel) -> Response[MapCreationJobResponse]:
         """Submit a new map to the API.
@@ -585,7 +780,13 @@ class APIService:
             "page_size": page_size,
             "page_number": page_number,
         }
-        maps = await self.get_maps(**params)  # type: ignore
+        if code is None and playtest_thread_id is None:
+            maps = await self.get_maps(**params)  # type: ignore
+        else:
+            # Lookups of one map by code or thread are cached; the entry is
+            # invalidated by the code and thread of the map it returned.
+            key = tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())
+            maps = await self._caches["maps"].get(key, lambda: self.get_maps(**params))  # type: ignore
         if maps:
             return maps[0]
         raise ValueError("No maps were found.")
@@ -998,17 +1199,17 @@ class APIService:
         r = Route("GET", "/users")
         return self._request(r, response_model=list[UserResponse] | None)
 
-    def get_user(self, user_id: int) -> Response[UserResponse | None]:
-        """Fetch a single user by ID.
+    async def get_user(self, user_id: int) -> UserResponse | None:
+        """Fetch a single user by ID, served from the entity cache when fresh.
 
         Args:
             user_id (int): The user ID to fetch.
 
         Returns:
-            Response[User | None]: The user, if found.
+            User | None: The user, if found.
         """
         r = Route("GET", "/users/{user_id}", user_id=user_id)
-        return self._request(r, response_model=UserResponse | None)
+        return await self._caches["users"].get(user_id, lambda: self._request(r, response_model=UserResponse | None))
 
     def create_user(self, data: UserCreateRequest) -> Response[UserResponse]:
         """Create a new user.
@@ -1034,6 +1235,19 @@ class APIService:
         r = Route("GET", "/users/{user_id}/rank", user_id=user_id)
         return self._request(r, response_model=list[RankDetailResponse])
 
+    def get_users_rank_data(self, user_ids: list[int]) -> Response[list[UserRankDetailsResponse]]:
+        """Fetch detailed rank data for several users in one request.
+
+        Args:
+            user_ids: IDs of the users to retrieve rank data for (at most 1000).
+
+        Returns:
+            Response[list[UserRankDetailsResponse]]: Rank detail records per user, in request order.
+        """
+        r = Route("POST", "/users/ranks/batch")
+        data = RankDetailsBatchRequest(user_ids=user_ids)
+        return self._request(r, response_model=list[UserRankDetailsResponse], data=data)
+
     def get_affected_users(self, code: OverwatchCode) -> Response[list[int]]:
         """Fetch user IDs affected by a specific map.
 
@@ -1068,17 +1282,32 @@ class APIService:
         r = Route("POST", "/completions")
         return self._request(r, response_model=CompletionSubmissionJobResponse, data=data)
 
-    def get_completion_submission(self, record_id: int) -> Response[CompletionSubmissionModel]:
-        """Fetch a completion submission by its record ID.
+    async def get_completion_submission(self, record_id: int) -> CompletionSubmissionModel:
+        """Fetch a completion submission by its record ID, served from the entity cache when fresh.
 
         Args:
             record_id (int): The ID of the completion submission.
 
         Returns:
-            Response[CompletionSubmissionModel]: The submission data.
+            CompletionSubmissionModel: The submission data.
         """
         r = Route("GET", "/completions/{record_id}/submission", record_id=record_id)
-        return self._request(r, response_model=CompletionSubmissionModel)
+        return await self._caches["submissions"].get(
+            record_id, lambda: self._request(r, response_model=CompletionSubmissionModel)
+        )
+
+    def get_completion_submissions(self, record_ids: list[int]) -> Response[list[CompletionSubmissionModel]]:
+        """Fetch several completion submissions in one request.
+
+        Args:
+            record_ids (list[int]): The IDs of the completion submissions (at most 500).
+
+        Returns:
+            Response[list[CompletionSubmissionModel]]: The submissions found, ordered by ID.
+        """
+        r = Route("POST", "/completions/submissions/batch")
+        data = CompletionSubmissionBatchRequest(ids=record_ids)
+        return self._request(r, response_model=list[CompletionSubmissionModel], data=data)
 
     def get_pending_verifications(self) -> Response[list[PendingVerificationResponse]]:
         """Retrieve all pending completion verifications.
@@ -1458,6 +1687,18 @@ class APIService:
         r = Route("POST", "/lootbox/users/{user_id}/xp", user_id=user_id)
         return self._request(r, response_model=XpGrantResponse, data=data)
 
+    def grant_users_xp(self, data: XpGrantBatchRequest) -> Response[XpGrantBatchResponse]:
+        """Grant XP to many users in one request.
+
+        Args:
+            data: Batch of XP grants.
+
+        Returns:
+            Response[XpGrantBatchResponse]: Resulting XP totals for each grant.
+        """
+        r = Route("POST", "/lootbox/xp/batch")
+        return self._request(r, response_model=XpGrantBatchResponse, data=data)
+
     def get_xp_tier_change(self, old_xp: int, new_xp: int) -> Response[TierChangeResponse]:
         """Get XP tier changes between old and new XP values.
 
@@ -1734,6 +1975,11 @@ class APIService:
         r = Route("POST", "/tags/mutate")
         return self._request(r, response_model=TagsMutateResponse, data=data)
 
+    def increment_tag_usage(self, data: TagsUsageIncrementRequest) -> Response[TagsMutateResult]:
+        """Apply a batch of accumulated tag usage counters."""
+        r = Route("POST", "/tags/usage")
+        return self._request(r, response_model=TagsMutateResult, data=data)
+
     def autocomplete_tags(self, data: TagsAutocompleteRequest) -> Response[TagsAutocompleteResponse]:
         """Autocomplete tag names (aliased/non-aliased, owned variants)."""
         r = Route("POST", "/tags/autocomplete")
@@ -81,6 +81,18 @@ if TYPE_CHECKING:
 
 log = getLogger(__name__)
 
+# Pending submissions fetched per batch request, and batches in flight at once,
+# when restoring verification views on startup.
+_VIEW_RESTORE_BATCH_SIZE = 100
+_VIEW_RESTORE_CONCURRENCY = 4
+
+# Users per bulk rank request, and concurrent member edits, when reconciling skill
+# roles after a map change. Member edits share one per-guild Discord rate limit
+# bucket; discord.py waits out that bucket, so a few workers keep it saturated
+# without piling up requests behind it.
+_SKILL_ROLE_RANK_BATCH_SIZE = 1000
+_SKILL_ROLE_EDIT_CONCURRENCY = 4
+
 _ARCHIVED_FILTER_CHOICES = [
     app_commands.Choice(name="All", value="all"),
     app_commands.Choice(name="Archived only", value="archived"),
@@ -596,6 +608,7 @@ class CompletionHandler(BaseHandler):
         self, event: VerificationChangedEvent, _: AbstractIncomingMessage
     ) -> None:
         log.debug(f"[x] [RabbitMQ] Processing message: {event.completion_id}")
+        self.bot.api.invalidate_completion_submission(event.completion_id)
         _data = await self.bot.api.get_completion_submission(event.completion_id)
         completion_data = msgspec.convert(_data, CompletionPostVerificationModel, from_attributes=True)
 
@@ -805,13 +818,13 @@ class CompletionHandler(BaseHandler):
 
         return roles_to_grant, roles_to_remove
 
-    async def _grant_skill_rank_roles(
-        self,
+    @staticmethod
+    def _diff_skill_rank_roles(
         member: Member,
         roles_to_grant: list[Role],
         roles_to_remove: list[Role],
-    ) -> None:
-        """Grant skill rank roles to a Discord server Member."""
+    ) -> tuple[list[Role], list[Role], list[Role]]:
+        """Compute a Member's new role list, and which roles it adds and removes."""
         new_roles = member.roles
         _actual_added_roles: list[Role] = []
         _actual_removed_roles: list[Role] = []
@@ -823,10 +836,28 @@ class CompletionHandler(BaseHandler):
             if r in new_roles:
                 new_roles.remove(r)
                 _actual_removed_roles.append(r)
+        return new_roles, _actual_added_roles, _actual_removed_roles
 
+    async def _grant_skill_rank_roles(
+        self,
+        member: Member,
+        roles_to_grant: list[Role],
+        roles_to_remove: list[Role],
+    ) -> None:
+        """Grant skill rank roles to a Discord server Member."""
+        new_roles, added, removed = self._diff_skill_rank_roles(member, roles_to_grant, roles_to_remove)
         if set(new_roles) == set(member.roles):
             return
+        await self._apply_skill_rank_roles(member, new_roles, added, removed)
 
+    async def _apply_skill_rank_roles(
+        self,
+        member: Member,
+        new_roles: list[Role],
+        _actual_added_roles: list[Role],
+        _actual_removed_roles: list[Role],
+    ) -> None:
+        """Edit a Member's roles and announce the change."""
         await member.edit(roles=new_roles)
         response = (
             "🚨***ALERT!***🚨\nYour roles have been updated! If roles have been removed, "
@@ -869,6 +900,33 @@ class CompletionHandler(BaseHandler):
         add, remove = self._determine_skill_rank_roles_to_give(data)
         await self._grant_skill_rank_roles(member, add, remove)
 
+    async def _reconcile_skill_roles(self, members: list[Member]) -> None:
+        """Bring many Members' skill roles in line with their rank data.
+
+        Rank data is fetched in bulk and diffed against each Member's current roles
+        locally; only Members whose roles change are edited, by a small pool of
+        workers so the edits run concurrently within Discord's rate limits.
+        """
+        changes: asyncio.Queue[tuple[Member, list[Role], list[Role], list[Role]]] = asyncio.Queue()
+        for i in range(0, len(members), _SKILL_ROLE_RANK_BATCH_SIZE):
+            batch = {m.id: m for m in members[i : i + _SKILL_ROLE_RANK_BATCH_SIZE]}
+            for row in await self.bot.api.get_users_rank_data(list(batch)):
+                member = batch[row.user_id]
+                add, remove = self._determine_skill_rank_roles_to_give(row.ranks)
+                new_roles, added, removed = self._diff_skill_rank_roles(member, add, remove)
+                if set(new_roles) != set(member.roles):
+                    changes.put_nowait((member, new_roles, added, removed))
+
+        async def _worker() -> None:
+            while not changes.empty():
+                member, new_roles, added, removed = changes.get_nowait()
+                try:
+                    await self._apply_skill_rank_roles(member, new_roles, added, removed)
+                except Exception:
+                    log.exception("Failed to update skill roles for member %s", member.id)
+
+        await asyncio.gather(*(_worker() for _ in range(min(_SKILL_ROLE_EDIT_CONCURRENCY, changes.qsize()))))
+
     async def _update_affected_users(self, code: OverwatchCode) -> None:
         """Update roles for users affected by map edits or changes."""
         ids = await self.bot.api.get_affected_users(code)
@@ -878,9 +936,8 @@ class CompletionHandler(BaseHandler):
 
         guild = self.bot.get_guild(self.bot.config.guild)
         assert guild
-        for _id in ids:
-            if member := guild.get_member(_id):
-                await self.auto_skill_role(member)
+        members = [member for _id in ids if (member := guild.get_member(_id))]
+        await self._reconcile_skill_roles(members)
 
 
 class CompletionLeaderboardFormattable(CompletionResponse):
@@ -1123,11 +1180,25 @@ class CompletionsCog(BaseCog):
         """
         await self.bot.rabbit.wait_until_drained()
         pending = await self.bot.api.get_pending_verifications()
-        for p in pending:
-            data = await self.bot.api.get_completion_submission(p.id)
-            view = CompletionVerificationView(data, self.bot)
-            self.bot.add_view(view, message_id=p.verification_id)
-            self.bot.completions.verification_views[p.verification_id] = view
+        verification_ids = {p.id: p.verification_id for p in pending}
+        record_ids = list(verification_ids)
+        semaphore = asyncio.Semaphore(_VIEW_RESTORE_CONCURRENCY)
+
+        async def _restore(batch: list[int]) -> None:
+            async with semaphore:
+                submissions = await self.bot.api.get_completion_submissions(batch)
+            for data in submissions:
+                verification_id = verification_ids[data.id]
+                view = CompletionVerificationView(data, self.bot)
+                self.bot.add_view(view, message_id=verification_id)
+                self.bot.completions.verification_views[verification_id] = view
+
+        await asyncio.gather(
+            *(
+                _restore(record_ids[i : i + _VIEW_RESTORE_BATCH_SIZE])
+                for i in range(0, len(record_ids), _VIEW_RESTORE_BATCH_SIZE)
+            )
+        )
 
     async def mark_submission_as_suspicious_context_command(self, itx: GenjiItx, message: Message) -> None:
         """Mark a submission message as suspicious via context command.
@@ -12,6 +12,7 @@ from genjishimada_sdk.newsfeed import NewsfeedAnnouncement, NewsfeedEvent
 from genjishimada_sdk.users import UserCreateRequest, UserUpdateRequest
 
 from utilities.base import BaseCog
+from utilities.role_invariants import NINJA_ROLE_VERIFY_HOURS, RoleInvariant
 
 if TYPE_CHECKING:
     from core import Genji
@@ -25,14 +26,16 @@ class EventsCog(BaseCog):
     def __init__(self, bot: Genji) -> None:
         """Initialize the EventsCog.
 
-        Starts the ninja_check task.
+        Starts the ninja_check task, whose first run reconciles the Ninja role.
         """
         super().__init__(bot)
+        self.ninja_role = RoleInvariant("Ninja")
         self.ninja_check.start()
 
     async def cog_unload(self) -> None:
         """Stop tasks for running upon cog unload."""
         self.ninja_check.cancel()
+        await self.ninja_role.close()
         await super().cog_unload()
 
     @commands.Cog.listener()
@@ -72,9 +75,7 @@ class EventsCog(BaseCog):
                 member.nick or member.name,
             )
             await self.bot.api.create_user(data)
-        ninja_role = discord.utils.get(member.guild.roles, name="Ninja")
-        assert ninja_role
-        await member.add_roles(ninja_role)
+        self.ninja_role.ensure(member)
         if await self.bot.api.check_user_is_creator(member.id):
             creator_role = discord.utils.get(member.guild.roles, name="Map Creator")
             assert creator_role
@@ -93,6 +94,8 @@ class EventsCog(BaseCog):
         if before.nick != after.nick and after.nick is not None:
             data = UserUpdateRequest(nickname=after.nick)
             await self.bot.api.update_user_names(after.id, data)
+        if before.roles != after.roles:
+            self.ninja_role.ensure(after)
 
     @commands.Cog.listener()
     async def on_user_update(self, before: User, after: User) -> None:
@@ -106,19 +109,21 @@ class EventsCog(BaseCog):
             data = UserUpdateRequest(global_name=after.global_name)
             await self.bot.api.update_user_names(after.id, data)
 
-    @tasks.loop(minutes=1)
+    @tasks.loop(hours=NINJA_ROLE_VERIFY_HOURS)
     async def ninja_check(self) -> None:
-        """Create a loop that checks all users for the Ninja role."""
+        """Reconcile the Ninja role at startup, then periodically verify it.
+
+        Joins and member updates keep the role in place; this run only catches
+        members those events missed (e.g. while the bot was offline).
+        """
         await self.bot.wait_until_ready()
         guild = self.bot.get_guild(self.bot.config.guild)
         if not guild:
             return
-        ninja_role = discord.utils.get(guild.roles, name="Ninja")
-        assert ninja_role
-
-        for member in guild.members:
-            if not member.get_role(ninja_role.id):
-                await member.add_roles(ninja_role)
+        queued = self.ninja_role.reconcile(guild)
+        if queued:
+            log.info("Queued the Ninja role for %s members.", queued)
+        log.debug("Ninja role stats: %s", self.ninja_role.stats())
 
     @commands.Cog.listener()
     async def on_interaction(self, itx: GenjiItx) -> None:
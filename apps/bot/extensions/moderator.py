@@ -1989,6 +1989,8 @@ class MapEditHandler(BaseHandler):
         log.debug(f"[RabbitMQ] Processing map edit resolved: {event.edit_request_id}")
 
         edit_data = await self.bot.api.get_map_edit_request(event.edit_request_id)
+        if event.accepted:
+            self.bot.api.invalidate_map(code=edit_data.code)
 
         if edit_data.message_id:
             try:
@@ -4,7 +4,7 @@ import asyncio
 import contextlib
 import os
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Literal, NamedTuple, cast
 
 import discord
 from discord.app_commands import AppCommandError
@@ -47,11 +47,13 @@ from utilities.maps import MapModel
 
 if TYPE_CHECKING:
     from aio_pika.abc import AbstractIncomingMessage
+    from genjishimada_sdk.xp import XP_TYPES
 
     import core
     from utilities._types import GenjiItx
 
 GENJI_API_KEY: str = os.getenv("GENJI_API_KEY", "")
+PLAYTEST_REFRESH_INTERVAL = float(os.getenv("PLAYTEST_REFRESH_INTERVAL", "10"))
 
 log = getLogger(__name__)
 
@@ -62,10 +64,76 @@ _disabled_notifications_alert = (
 )
 
 
+class _ThreadRefreshCoalescer:
+    """Run a per-thread refresh at most once per interval, always ending on the latest state.
+
+    ``mark_dirty`` starts one task per thread. The task refreshes immediately,
+    then keeps refreshing once per interval while more changes arrive, so a
+    burst of votes costs a handful of renders and the last one happens after
+    the burst ends.
+    """
+
+    def __init__(self, refresh: Callable[[int], Awaitable[None]], interval: float) -> None:
+        self._refresh = refresh
+        self._interval = interval
+        self._dirty: set[int] = set()
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+
+    def mark_dirty(self, thread_id: int) -> None:
+        """Schedule a refresh of ``thread_id`` reflecting every change up to now."""
+        self._dirty.add(thread_id)
+        if thread_id not in self._tasks:
+            self._tasks[thread_id] = asyncio.create_task(self._run(thread_id))
+
+    def discard(self, thread_id: int) -> None:
+        """Cancel any pending or running refresh of ``thread_id``."""
+        self._dirty.discard(thread_id)
+        task = self._tasks.pop(thread_id, None)
+        if task is not None:
+            task.cancel()
+
+    def close(self) -> None:
+        """Cancel every pending or running refresh."""
+        for thread_id in list(self._tasks):
+            self.discard(thread_id)
+
+    async def _run(self, thread_id: int) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while thread_id in self._dirty:
+                self._dirty.discard(thread_id)
+                started = loop.time()
+                try:
+                    await self._refresh(thread_id)
+                except Exception:
+                    log.exception(f"Playtest refresh failed for {thread_id=}")
+                await asyncio.sleep(max(self._interval - (loop.time() - started), 0))
+        finally:
+            if self._tasks.get(thread_id) is asyncio.current_task():
+                del self._tasks[thread_id]
+
+
 class PlaytestHandler(BaseHandler):
     playtest_channel: discord.ForumChannel
     verification_channel: discord.TextChannel
 
+    def __init__(self, bot: core.Genji) -> None:
+        """Initialize the playtest handler and its debounced view refresher.
+
+        Args:
+            bot (core.Genji): The bot instance.
+        """
+        super().__init__(bot)
+        self._view_refresher = _ThreadRefreshCoalescer(
+            lambda thread_id: self._rebuild_view_and_plot(thread_id=thread_id),
+            PLAYTEST_REFRESH_INTERVAL,
+        )
+        self._rendered_vote_counts: dict[int, int] = {}
+
+    def cancel_view_refreshes(self) -> None:
+        """Cancel every pending playtest view refresh."""
+        self._view_refresher.close()
+
     async def _resolve_channels(self) -> None:
         """Resolve and cache the playtest forum channel.
 
@@ -251,6 +319,9 @@ class PlaytestHandler(BaseHandler):
         """
         log.debug("Edit thread tags close starting")
 
+        # A deferred vote refresh would unarchive the thread again.
+        self._view_refresher.discard(thread_id)
+        self._rendered_vote_counts.pop(thread_id, None)
         thread = await self._fetch_thread(thread_id)
         open_tag = self._get_forum_tag("Open")
         final_tag = self._get_forum_tag("Cancelled" if cancelled else "Complete")
@@ -290,11 +361,10 @@ class PlaytestHandler(BaseHandler):
     async def _grant_xp_upon_successful_playtest(self, thread_id: int) -> None:
         pt = await self.bot.api.get_playtest(thread_id)
         map_data = await self.bot.api.get_map(code=pt.code)
-        for creator in map_data.creators:
-            await self.bot.xp.grant_user_xp_of_type(creator.id, "Map Submission")
         votes = await self.bot.api.get_all_votes(thread_id)
-        for vote in votes.votes:
-            await self.bot.xp.grant_user_xp_of_type(vote.user_id, "Playtest")
+        grants: list[tuple[int, XP_TYPES]] = [(creator.id, "Map Submission") for creator in map_data.creators]
+        grants += [(vote.user_id, "Playtest") for vote in votes.votes]
+        await self.bot.xp.grant_users_xp_of_types(grants)
 
     async def _approve_playtest(
         self,
@@ -437,6 +507,8 @@ class PlaytestHandler(BaseHandler):
             notify_primary_creator_id (int | None): Primary creator to notify, if any.
         """
         await self._update_plot_image_on_playtest_message(thread_id=thread_id)
+        if remove_votes:
+            self._rendered_vote_counts[thread_id] = 0
 
         msg_prefix = (
             "All votes and completions have been removed."
@@ -489,7 +561,9 @@ class PlaytestHandler(BaseHandler):
     async def _rebuild_view_and_plot(self, *, thread_id: int) -> None:
         """Refresh the playtest view and replace the plot attachment.
 
-        If the submission becomes finalizable, notifies creators in-thread.
+        If the submission became finalizable since the last render, notifies
+        creators in-thread. Votes are coalesced, so the count may skip past the
+        threshold between renders.
 
         Args:
             thread_id (int): Playtest thread ID.
@@ -512,11 +586,14 @@ class PlaytestHandler(BaseHandler):
         msg = thread.get_partial_message(thread_id)
         await msg.edit(view=view, attachments=[file])
         assert playtest_data.playtest
-        if (
-            playtest_data.finalizable
-            and not view.data.override_finalize
-            and playtest_data.playtest.vote_count == playtest_data.playtest_threshold
-        ):
+        vote_count = playtest_data.playtest.vote_count
+        threshold = playtest_data.playtest_threshold
+        previous_count = self._rendered_vote_counts.get(thread_id)
+        self._rendered_vote_counts[thread_id] = vote_count
+        reached_threshold = (
+            vote_count == threshold if previous_count is None else previous_count < threshold <= vote_count
+        )
+        if playtest_data.finalizable and not view.data.override_finalize and reached_threshold:
             guild = thread.guild
             mentions = []
             for c in playtest_data.creators:
@@ -528,7 +605,7 @@ class PlaytestHandler(BaseHandler):
             )
 
     async def _apply_vote_discord_side(self, *, thread_id: int, voter_id: int, difficulty_value: float) -> None:
-        """Announce a cast vote and refresh the UI/plot.
+        """Announce a cast vote and schedule a debounced UI/plot refresh.
 
         Args:
             code (str): Map code (for completeness/logging).
@@ -537,17 +614,17 @@ class PlaytestHandler(BaseHandler):
             difficulty_value (float): Raw difficulty value to convert and display.
         """
         label = convert_raw_difficulty_to_difficulty_all(difficulty_value)
-        await self._rebuild_view_and_plot(thread_id=thread_id)
+        self._view_refresher.mark_dirty(thread_id)
         await self._announce_vote_in_thread(thread_id=thread_id, voter_id=voter_id, label=label)
 
     async def _remove_vote_discord_side(self, *, thread_id: int, voter_id: int) -> None:
-        """Announce a removed vote and refresh the UI/plot.
+        """Announce a removed vote and schedule a debounced UI/plot refresh.
 
         Args:
             thread_id (int): Playtest thread ID.
             voter_id (int): Discord user ID of the voter.
         """
-        await self._rebuild_view_and_plot(thread_id=thread_id)
+        self._view_refresher.mark_dirty(thread_id)
         await self._announce_vote_in_thread(thread_id=thread_id, voter_id=voter_id, label=None)
 
     @queue_consumer("api.playtest.vote.cast", struct_type=PlaytestVoteCastEvent)
@@ -555,6 +632,7 @@ class PlaytestHandler(BaseHandler):
         log.debug(
             f"[RabbitMQ] Processing playest vote event {event.thread_id=} {event.voter_id=} {event.difficulty_value=}"
         )
+        self.bot.api.invalidate_map(thread_id=event.thread_id)
         await self._apply_vote_discord_side(
             thread_id=event.thread_id,
             voter_id=event.voter_id,
@@ -564,6 +642,7 @@ class PlaytestHandler(BaseHandler):
     @queue_consumer("api.playtest.vote.remove", struct_type=PlaytestVoteRemovedEvent)
     async def _process_vote_remove(self, event: PlaytestVoteRemovedEvent, _: AbstractIncomingMessage) -> None:
         log.debug(f"[RabbitMQ] Processing playest vote remove event {event.thread_id=} {event.voter_id=}")
+        self.bot.api.invalidate_map(thread_id=event.thread_id)
         await self._remove_vote_discord_side(
             thread_id=event.thread_id,
             voter_id=event.voter_id,
@@ -572,6 +651,7 @@ class PlaytestHandler(BaseHandler):
     @queue_consumer("api.playtest.approve", struct_type=PlaytestApprovedEvent, idempotent=True)
     async def _process_approve_playtest(self, event: PlaytestApprovedEvent, _: AbstractIncomingMessage) -> None:
         log.debug(f"[RabbitMQ] Processing playest approved event {event.code=} {event.thread_id=}")
+        self.bot.api.invalidate_map(code=event.code, thread_id=event.thread_id)
         await self._approve_playtest(
             code=event.code,
             thread_id=event.thread_id,
@@ -585,6 +665,7 @@ class PlaytestHandler(BaseHandler):
         self, event: PlaytestForceAcceptedEvent, _: AbstractIncomingMessage
     ) -> None:
         log.debug(f"[RabbitMQ] Processing playest force accept event {event.thread_id=}")
+        self.bot.api.invalidate_map(thread_id=event.thread_id)
         playtest_data = await self.bot.api.get_playtest(event.thread_id)
         map_data = await self.bot.api.get_map(code=playtest_data.code)
         await self._force_accept_playtest(
@@ -598,6 +679,7 @@ class PlaytestHandler(BaseHandler):
     @queue_consumer("api.playtest.force_deny", struct_type=PlaytestForceDeniedEvent, idempotent=True)
     async def _process_force_deny_playtest(self, event: PlaytestForceDeniedEvent, _: AbstractIncomingMessage) -> None:
         log.debug(f"[RabbitMQ] Processing playest force deny event {event.thread_id=}")
+        self.bot.api.invalidate_map(thread_id=event.thread_id)
         playtest_data = await self.bot.api.get_playtest(event.thread_id)
         map_data = await self.bot.api.get_map(code=playtest_data.code)
         await self._force_deny_playtest(
@@ -611,6 +693,7 @@ class PlaytestHandler(BaseHandler):
     @queue_consumer("api.playtest.reset", struct_type=PlaytestResetEvent, idempotent=True)
     async def _process_reset_playtest(self, event: PlaytestResetEvent, _: AbstractIncomingMessage) -> None:
         log.debug(f"[RabbitMQ] Processing playest reset event {event.thread_id=}")
+        self.bot.api.invalidate_map(thread_id=event.thread_id)
         playtest_data = await self.bot.api.get_playtest(event.thread_id)
         map_data = await self.bot.api.get_map(code=playtest_data.code)
         await self._reset_playtest_votes_and_completions(
@@ -1300,6 +1383,10 @@ class PlaytestCog(BaseCog):
         """Start post-RabbitMQ initialization when the cog loads."""
         self._task = asyncio.create_task(self.post_rabbit_load())
 
+    async def cog_unload(self) -> None:
+        """Cancel pending playtest view refreshes when the cog unloads."""
+        self.bot.playtest.cancel_view_refreshes()
+
     async def post_rabbit_load(self) -> None:
         """Attach persistent views after MQ drains and data is available.
 
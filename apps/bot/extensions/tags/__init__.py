@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .cache import TagCacheHandler
 from .tags import Tags
 
 if TYPE_CHECKING:
@@ -10,4 +11,5 @@ if TYPE_CHECKING:
 
 async def setup(bot: Genji) -> None:
     """Setup."""
+    bot.tag_cache = TagCacheHandler(bot)
     await bot.add_cog(Tags(bot))
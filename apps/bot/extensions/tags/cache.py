@@ -0,0 +1,189 @@
+"""Per-guild tag cache and write-behind usage counters for the Tags cog.
+
+Every ``?tag`` invocation used to cost two API round trips: an exact-name search
+to resolve the tag and an ``increment_usage`` mutate that runs its own
+``UPDATE``. This module keeps one snapshot of each guild's tags (aliases
+included, keyed by lowercased name) and accumulates usage locally.
+
+Snapshots are loaded with paged searches and dropped when the API publishes
+``api.tags.mutated`` for the guild, when the cog mutates a tag itself, or once
+they are older than ``TAG_CACHE_TTL`` seconds.
+
+Usage counts are flushed to ``POST /tags/usage`` every
+``TAG_USAGE_FLUSH_INTERVAL`` seconds, or sooner once ``TAG_USAGE_FLUSH_THRESHOLD``
+uses are pending. A failed flush puts its counts back for the next attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import Counter
+from logging import getLogger
+from typing import TYPE_CHECKING, TypedDict
+
+from genjishimada_sdk.tags import (
+    TagRowDTO,
+    TagsMutatedEvent,
+    TagsSearchFilters,
+    TagsUsageIncrementRequest,
+    TagUsageIncrement,
+)
+
+from extensions._queue_registry import queue_consumer
+from utilities.base import BaseHandler
+
+if TYPE_CHECKING:
+    from aio_pika.abc import AbstractIncomingMessage
+
+    import core
+
+log = getLogger(__name__)
+
+TAG_CACHE_TTL = float(os.getenv("TAG_CACHE_TTL", "600"))
+TAG_USAGE_FLUSH_INTERVAL = float(os.getenv("TAG_USAGE_FLUSH_INTERVAL", "30"))
+TAG_USAGE_FLUSH_THRESHOLD = int(os.getenv("TAG_USAGE_FLUSH_THRESHOLD", "50"))
+
+_PAGE_SIZE = 1000
+
+
+class TagEntry(TypedDict):
+    id: int
+    name: str
+    content: str
+
+
+class GuildTags:
+    """Snapshot of one guild's tags, resolvable by tag or alias name."""
+
+    def __init__(self, rows: list[TagRowDTO], *, loaded_at: float) -> None:
+        """Build the snapshot from search rows.
+
+        Args:
+            rows: Tag rows (aliases included) with content.
+            loaded_at: Monotonic timestamp of the load.
+        """
+        self.loaded_at = loaded_at
+        self.entries: list[TagEntry] = [{"id": r.id, "name": r.name, "content": r.content or ""} for r in rows]
+        self._by_name: dict[str, TagEntry] = {e["name"].lower(): e for e in self.entries}
+
+    def get(self, name: str) -> TagEntry | None:
+        """Return the entry for a tag or alias name, case-insensitively."""
+        return self._by_name.get(name.lower())
+
+
+class TagCacheHandler(BaseHandler):
+    """Serve tag lookups from memory and batch usage increments."""
+
+    def __init__(self, bot: core.Genji) -> None:
+        """Initialize the cache.
+
+        Args:
+            bot: The bot instance.
+        """
+        super().__init__(bot)
+        self._guilds: dict[int, GuildTags] = {}
+        self._load_locks: dict[int, asyncio.Lock] = {}
+        self._pending_usage: Counter[tuple[int, str]] = Counter()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._early_flush: asyncio.Task | None = None
+
+    async def _resolve_channels(self) -> None:
+        """No channels are needed for the tag cache."""
+        return None
+
+    async def _load(self, guild_id: int) -> GuildTags:
+        """Fetch every tag in a guild, paging through the search endpoint."""
+        rows: list[TagRowDTO] = []
+        loaded_at = time.monotonic()
+        offset = 0
+        while True:
+            page = await self.bot.api.search_tags(
+                TagsSearchFilters(guild_id=guild_id, include_content=True, limit=_PAGE_SIZE, offset=offset)
+            )
+            rows.extend(page.items)
+            if len(page.items) < _PAGE_SIZE:
+                break
+            offset += _PAGE_SIZE
+        return GuildTags(rows, loaded_at=loaded_at)
+
+    async def get_guild(self, guild_id: int) -> GuildTags:
+        """Return the guild's snapshot, loading it when missing or expired.
+
+        Concurrent callers on a cold guild share a single load.
+
+        Args:
+            guild_id: Guild to look up.
+
+        Returns:
+            The guild's tag snapshot.
+        """
+        tags = self._guilds.get(guild_id)
+        if tags is not None and time.monotonic() - tags.loaded_at <= TAG_CACHE_TTL:
+            return tags
+        lock = self._load_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            tags = self._guilds.get(guild_id)
+            if tags is not None and time.monotonic() - tags.loaded_at <= TAG_CACHE_TTL:
+                return tags
+            tags = await self._load(guild_id)
+            self._guilds[guild_id] = tags
+            return tags
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drop a guild's snapshot so the next lookup reloads it."""
+        self._guilds.pop(guild_id, None)
+
+    @queue_consumer("api.tags.mutated", struct_type=TagsMutatedEvent)
+    async def _on_tags_mutated(self, event: TagsMutatedEvent, _: AbstractIncomingMessage) -> None:
+        """Drop the snapshot of a guild whose tags changed."""
+        self.invalidate(event.guild_id)
+
+    def record_use(self, guild_id: int, name: str) -> None:
+        """Count one use of a tag, flushing early once enough uses are pending.
+
+        Args:
+            guild_id: Guild the tag belongs to.
+            name: Tag or alias name that was invoked.
+        """
+        self._pending_usage[(guild_id, name.lower())] += 1
+        if self._pending_usage.total() >= TAG_USAGE_FLUSH_THRESHOLD and (
+            self._early_flush is None or self._early_flush.done()
+        ):
+            self._early_flush = asyncio.create_task(self.flush_usage())
+
+    async def flush_usage(self) -> None:
+        """Send pending usage counters to the API in one request.
+
+        Counts are swapped out before the request; on failure they are merged
+        back so no uses are lost.
+        """
+        async with self._flush_lock:
+            if not self._pending_usage:
+                return
+            pending, self._pending_usage = self._pending_usage, Counter()
+            items = [TagUsageIncrement(guild_id=g, name=n, count=c) for (g, n), c in pending.items()]
+            try:
+                await self.bot.api.increment_tag_usage(TagsUsageIncrementRequest(items=items))
+            except Exception:
+                log.exception("Failed to flush %d tag usage counters; retrying next interval.", len(items))
+                self._pending_usage.update(pending)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(TAG_USAGE_FLUSH_INTERVAL)
+            await self.flush_usage()
+
+    def start(self) -> None:
+        """Start the periodic usage flush."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stop the periodic flush and send whatever is still pending."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_usage()
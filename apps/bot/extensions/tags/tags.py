@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import io
 import os
-from typing import TYPE_CHECKING, Annotated, Any, Iterable, Literal, Optional, Sequence, TypedDict
+import random
+from typing import TYPE_CHECKING, Annotated, Any, Iterable, Literal, Optional, Sequence
 
 import discord
 from discord import Message, app_commands
@@ -15,7 +16,6 @@ from genjishimada_sdk.tags import (
     OpClaim,
     OpCreate,
     OpEdit,
-    OpIncrementUsage,
     OpPurge,
     OpRemove,
     OpRemoveById,
@@ -31,6 +31,7 @@ from genjishimada_sdk.tags import (
 
 from utilities.base import ConfirmationView
 
+from .cache import TagEntry
 from .tags_paginator import SimplePages
 
 if TYPE_CHECKING:
@@ -83,12 +84,6 @@ def has_guild_permissions(*, check=all, **perms: bool) -> Any:  # noqa: ANN001,
     return commands.check(pred)
 
 
-class TagEntry(TypedDict):
-    id: int
-    name: str
-    content: str
-
-
 class TagAllFlags(commands.FlagConverter):
     text: bool = commands.flag(default=False, description="Whether to dump the tags as a text file.")
 
@@ -268,6 +263,14 @@ class Tags(commands.Cog):
         self.bot: Genji = bot
         self._reserved_tags_being_made: dict[int, set[str]] = {}
 
+    async def cog_load(self) -> None:
+        """Start the periodic tag usage flush."""
+        self.bot.tag_cache.start()
+
+    async def cog_unload(self) -> None:
+        """Flush pending tag usage before the cog goes away."""
+        await self.bot.tag_cache.close()
+
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         """A small label emoji used to represent this cog.
@@ -360,7 +363,9 @@ class Tags(commands.Cog):
         """Perform a tag mutation operation through the API.
 
         Wraps one or more tag operation objects (OpCreate, OpEdit, OpRemove, etc.)
-        into a single mutation request and sends it to the API.
+        into a single mutation request and sends it to the API. The cached
+        snapshot of every affected guild is dropped right away rather than
+        waiting for the API's invalidation event.
 
         Args:
             *ops: One or more tag operation instances to include in the request.
@@ -369,7 +374,11 @@ class Tags(commands.Cog):
             A TagsMutateResponse containing the results of each operation.
         """
         req = TagsMutateRequest(list(ops))
-        return await self.bot.api.mutate_tags(req)
+        try:
+            return await self.bot.api.mutate_tags(req)
+        finally:
+            for guild_id in {op.guild_id for op in ops}:
+                self.bot.tag_cache.invalidate(guild_id)
 
     async def _api_autocomplete(
         self,
@@ -402,14 +411,16 @@ class Tags(commands.Cog):
     async def get_possible_tags(self, guild: discord.abc.Snowflake) -> list[TagEntry]:
         """Fetch all tags for a guild, including content.
 
+        Served from the guild's cached tag snapshot.
+
         Args:
             guild: Guild-like object providing an id.
 
         Returns:
             A list of tag entries, each with id, name, and content.
         """
-        res = await self._api_search(guild.id, include_content=True, limit=1000)
-        return [{"id": r.id, "name": r.name, "content": r.content or ""} for r in res.items]
+        tags = await self.bot.tag_cache.get_guild(guild.id)
+        return list(tags.entries)
 
     async def get_random_tag(self, guild: discord.abc.Snowflake) -> Optional[TagEntry]:
         """Retrieve a single random tag from a guild.
@@ -421,17 +432,18 @@ class Tags(commands.Cog):
             A tag entry dict containing id, name, and content,
             or None if the guild has no tags.
         """
-        res = await self._api_search(guild.id, random=True, include_content=True, limit=1)
-        if not res.items:
+        tags = await self.bot.tag_cache.get_guild(guild.id)
+        if not tags.entries:
             return None
-        r = res.items[0]
-        return {"id": r.id, "name": r.name, "content": r.content or ""}
+        return random.choice(tags.entries)
 
     async def get_tag(self, guild_id: Optional[int], name: str) -> TagEntry:
         """Retrieve a tag by name for a given guild.
 
-        Performs an exact match search; if no result is found,
-        suggested similar names are provided in the error message.
+        Resolves the name (or alias) from the guild's cached tag snapshot. On a
+        miss, performs an exact match search so similar names can be suggested
+        in the error message; a hit there means the snapshot is stale, so it is
+        dropped.
 
         Args:
             guild_id: The guild to search within.
@@ -443,12 +455,19 @@ class Tags(commands.Cog):
         Returns:
             A tag entry dict containing id, name, and content.
         """
-        res = await self._api_search(guild_id or 0, name=name, include_content=True, fuzzy=False, limit=1)
+        guild_id = guild_id or 0
+        tags = await self.bot.tag_cache.get_guild(guild_id)
+        entry = tags.get(name)
+        if entry is not None:
+            return entry
+
+        res = await self._api_search(guild_id, name=name, include_content=True, fuzzy=False, limit=1)
         if not res.items:
             if res.suggestions:
                 names = "\n".join(res.suggestions)
                 raise RuntimeError(f"Tag not found. Did you mean...\n{names}")
             raise RuntimeError("Tag not found.")
+        self.bot.tag_cache.invalidate(guild_id)
         item = res.items[0]
         return {"id": item.id, "name": item.name, "content": item.content or ""}
 
@@ -611,7 +630,8 @@ class Tags(commands.Cog):
     async def _tag_get(self, ctx: GenjiCtx, *, name: Annotated[str, TagName(lower=True)]) -> Message | None:
         """Internal helper to fetch and display a tag by name.
 
-        Sends the tag's content if found and increments its usage count.
+        Sends the tag's content if found and records a use; usage counts are
+        flushed to the API in batches.
 
         Args:
             ctx: Invocation context.
@@ -622,9 +642,7 @@ class Tags(commands.Cog):
         except RuntimeError as e:
             return await ctx.send(str(e))
         await ctx.send(tag["content"])
-
-        op = OpIncrementUsage(guild_id=ctx.guild.id, name=tag["name"])  # pyright: ignore[reportOptionalMemberAccess]
-        await self._api_mutate(op)
+        self.bot.tag_cache.record_use(ctx.guild.id, tag["name"])  # pyright: ignore[reportOptionalMemberAccess]
 
     @tag.command()
     @commands.guild_only()
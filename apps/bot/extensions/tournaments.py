@@ -30,11 +30,13 @@ from __future__ import annotations
 
 import asyncio
 import os
+import time
 from http import HTTPStatus
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Literal, Sequence, cast
 
 import discord
+import msgspec
 from discord import AllowedMentions, ButtonStyle, MediaGalleryItem, TextChannel, app_commands, ui
 from discord.ext import commands
 from genjishimada_sdk.maps import OverwatchCode
@@ -44,6 +46,7 @@ from genjishimada_sdk.tournaments import (
     TournamentCompletionCreatedEvent,
     TournamentCycleCompletedEvent,
     TournamentEditionResultsEvent,
+    TournamentLeaderboardDeltaEvent,
     TournamentLeaderboardEntryResponse,
     TournamentRolloverEvent,
     TournamentVerificationChangedEvent,
@@ -75,6 +78,11 @@ _WORKSHOP_URL = "https://genji.pk/search?section=map_search&modal=map&modal_code
 # Top-N standings shown on the results podium (D-03 — compact card).
 _PODIUM_SIZE = 3
 
+# Cached live leaderboards: at most one per concurrently active cycle, refetched
+# after the TTL as a backstop for any delta missed while the bot was offline.
+_LEADERBOARD_CACHE_SIZE = 8
+_LEADERBOARD_CACHE_TTL = 300.0
+
 # Static hero image shown on the started/completed announcement cards. Replaces the
 # old per-map banner so tournament surfaces carry consistent artwork.
 # TODO: swap for real tournament artwork.
@@ -274,12 +282,50 @@ class TournamentVerificationView(ui.LayoutView):
         await itx.client.tree.on_error(itx, cast("app_commands.AppCommandError", error))
 
 
+def apply_leaderboard_delta(
+    entries: Sequence[TournamentLeaderboardEntryResponse],
+    event: TournamentLeaderboardDeltaEvent,
+) -> list[TournamentLeaderboardEntryResponse]:
+    """Patch a cached leaderboard with one rank delta.
+
+    The user is removed from wherever they sat and re-inserted at ``event.rank``;
+    every other entry is renumbered so the ranks stay contiguous. Applying the same
+    delta twice yields the same board, so a redelivered event is harmless.
+
+    Args:
+        entries: The cached ranked leaderboard.
+        event: The delta published by the API's live leaderboard.
+
+    Returns:
+        The patched, renumbered leaderboard.
+    """
+    remaining = [entry for entry in entries if entry.user_id != event.user_id]
+    if event.entry is not None and event.rank is not None:
+        remaining.insert(event.rank - 1, event.entry)
+    return [msgspec.structs.replace(entry, rank=index + 1) for index, entry in enumerate(remaining)]
+
+
 class TournamentHandler(BaseHandler):
-    """Posts tournament announcements and transfers the per-category champion role."""
+    """Posts tournament announcements and transfers the per-category champion role.
+
+    Also keeps the last fetched leaderboard per active cycle, patched in place from
+    ``api.tournament.leaderboard.delta`` so ``/tournament leaderboard`` does not
+    refetch the whole board on every invocation.
+    """
 
     announcement_channel: TextChannel
     verification_channel: TextChannel
 
+    def __init__(self, bot: core.Genji) -> None:
+        """Initialize the handler and its per-cycle leaderboard cache.
+
+        Args:
+            bot: The running Genji bot.
+        """
+        super().__init__(bot)
+        self.leaderboards: dict[int, list[TournamentLeaderboardEntryResponse]] = {}
+        self._leaderboard_fetched_at: dict[int, float] = {}
+
     async def _resolve_channels(self) -> None:
         """Resolve the announcement channel and the (shared) mod verification channel.
 
@@ -672,6 +718,57 @@ class TournamentHandler(BaseHandler):
             event.tournament_completion_id,
         )
 
+    @queue_consumer(
+        "api.tournament.leaderboard.delta",
+        struct_type=TournamentLeaderboardDeltaEvent,
+    )
+    async def _on_leaderboard_delta(self, event: TournamentLeaderboardDeltaEvent, _: AbstractIncomingMessage) -> None:
+        """Patch the cached cycle leaderboard from a live rank delta.
+
+        Only cycles already cached by ``/tournament leaderboard`` are patched. If the
+        patched board's size disagrees with the API's ``total`` the cache missed an
+        event, so it is dropped and the next command refetches it.
+        """
+        cached = self.leaderboards.get(event.cycle_id)
+        if cached is None:
+            return
+        patched = apply_leaderboard_delta(cached, event)
+        if len(patched) != event.total:
+            log.info("[!] [Tournament] leaderboard cache for cycle=%s out of sync; dropping", event.cycle_id)
+            self.leaderboards.pop(event.cycle_id, None)
+            self._leaderboard_fetched_at.pop(event.cycle_id, None)
+            return
+        self.leaderboards[event.cycle_id] = patched
+        log.debug(
+            "[✓] [Tournament] patched leaderboard cycle=%s user=%s rank %s -> %s",
+            event.cycle_id,
+            event.user_id,
+            event.previous_rank,
+            event.rank,
+        )
+
+    async def get_leaderboard(self, cycle_id: int) -> list[TournamentLeaderboardEntryResponse]:
+        """Return the cycle leaderboard, fetching it only when it is not cached.
+
+        Args:
+            cycle_id: The active cycle to read.
+
+        Returns:
+            The ranked leaderboard.
+        """
+        cached = self.leaderboards.get(cycle_id)
+        if cached is not None and time.monotonic() - self._leaderboard_fetched_at[cycle_id] < _LEADERBOARD_CACHE_TTL:
+            return cached
+        entries = list(await self.bot.api.get_tournament_leaderboard(cycle_id))
+        # Only a handful of cycles are active at once; evict the oldest fetch beyond that.
+        if cycle_id not in self.leaderboards and len(self.leaderboards) >= _LEADERBOARD_CACHE_SIZE:
+            oldest = min(self._leaderboard_fetched_at, key=self._leaderboard_fetched_at.__getitem__)
+            self.leaderboards.pop(oldest, None)
+            self._leaderboard_fetched_at.pop(oldest, None)
+        self.leaderboards[cycle_id] = entries
+        self._leaderboard_fetched_at[cycle_id] = time.monotonic()
+        return entries
+
     async def _transfer_champion_role(
         self,
         event: TournamentCycleCompletedEvent,
@@ -858,7 +955,7 @@ class TournamentCommandCog(commands.GroupCog, group_name="tournament"):
             return
 
         active = cycles[0]
-        entries = await itx.client.api.get_tournament_leaderboard(active.id)
+        entries = await itx.client.tournaments.get_leaderboard(active.id)
 
         # Pitfall 1: an empty leaderboard would build a zero-page StaticPaginatorView,
         # and navigation does modulo by the page count → ZeroDivisionError. Short-circuit
@@ -3,13 +3,21 @@ from __future__ import annotations
 import os
 from logging import getLogger
 from math import floor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from aio_pika.abc import AbstractIncomingMessage
 from discord import TextChannel, app_commands, utils
 from discord.ext import commands
 from genjishimada_sdk.notifications import NotificationEventType
-from genjishimada_sdk.xp import XP_AMOUNTS, XP_TYPES, XpGrantEvent, XpGrantRequest
+from genjishimada_sdk.xp import (
+    XP_AMOUNTS,
+    XP_TYPES,
+    XpGrantBatchEvent,
+    XpGrantBatchItem,
+    XpGrantBatchRequest,
+    XpGrantEvent,
+    XpGrantRequest,
+)
 
 from extensions._queue_registry import queue_consumer
 from utilities import transformers
@@ -103,14 +111,51 @@ class XPHandler(BaseHandler):
         data = XpGrantRequest(XP_AMOUNTS[xp_type], xp_type)
         await self.bot.api.grant_user_xp(user_id, data)
 
+    async def grant_users_xp_of_types(self, grants: Iterable[tuple[int, XP_TYPES]]) -> None:
+        """Grant XP of configured types to several users in one API call.
+
+        The API publishes a single batched event, which is announced by
+        `_process_xp_grant_batch`.
+
+        Args:
+            grants (Iterable[tuple[int, XP_TYPES]]): (user ID, XP type) pairs. A user may appear more than once.
+        """
+        items = [XpGrantBatchItem(user_id, XP_AMOUNTS[xp_type], xp_type) for user_id, xp_type in grants]
+        if items:
+            await self.bot.api.grant_users_xp(XpGrantBatchRequest(items))
+
     @queue_consumer("api.xp.grant", struct_type=XpGrantEvent, idempotent=True)
     async def _process_xp_grant(self, event: XpGrantEvent, _: AbstractIncomingMessage) -> None:
         log.debug(f"[x] [RabbitMQ] Processing XP grant event: {event.user_id}")
+        if not self.guild.get_member(event.user_id):
+            return
+
+        multiplier = await self.bot.api.get_xp_multiplier()
+        await self._announce_xp_grant(event, multiplier)
+
+    @queue_consumer("api.xp.grant.batch", struct_type=XpGrantBatchEvent, idempotent=True)
+    async def _process_xp_grant_batch(self, event: XpGrantBatchEvent, _: AbstractIncomingMessage) -> None:
+        log.debug(f"[x] [RabbitMQ] Processing XP grant batch event: {len(event.grants)} grant(s)")
+        multiplier = await self.bot.api.get_xp_multiplier()
+        for grant in event.grants:
+            # The XP is already persisted; one failed announcement must not
+            # redeliver (and re-announce) the rest of the batch.
+            try:
+                await self._announce_xp_grant(grant, multiplier)
+            except Exception:
+                log.exception(f"Failed to announce XP grant for {grant.user_id=}")
+
+    async def _announce_xp_grant(self, event: XpGrantEvent, multiplier: float) -> None:
+        """Announce an XP grant and apply any rank-up or prestige rewards.
+
+        Args:
+            event (XpGrantEvent): The persisted XP grant.
+            multiplier (float): XP multiplier in effect, for the displayed amount.
+        """
         user = self.guild.get_member(event.user_id)
         if not user:
             return
 
-        multiplier = await self.bot.api.get_xp_multiplier()
         amount = floor(event.amount * multiplier)
 
         type_display = f"{event.type} - {event.reason}" if event.reason else event.type
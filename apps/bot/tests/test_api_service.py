@@ -17,7 +17,12 @@ _BOT_ROOT = str(Path(__file__).resolve().parent.parent)
 if _BOT_ROOT not in sys.path:
     sys.path.insert(0, _BOT_ROOT)
 
+from genjishimada_sdk.completions import CompletionSubmissionBatchRequest  # noqa: E402
+from genjishimada_sdk.users import RankDetailsBatchRequest, UserRankDetailsResponse  # noqa: E402
+from genjishimada_sdk.xp import XpGrantBatchItem, XpGrantBatchRequest, XpGrantBatchResponse  # noqa: E402
+
 from extensions.api_service import APIService, Route  # noqa: E402
+from utilities.completions import CompletionSubmissionModel  # noqa: E402
 
 
 def _make_service() -> APIService:
@@ -67,3 +72,58 @@ def test_get_all_map_names_is_not_a_coroutine_function() -> None:
     import inspect
 
     assert not inspect.iscoroutinefunction(APIService.get_all_map_names)
+
+
+def test_get_completion_submissions_posts_ids_in_one_request() -> None:
+    svc = _make_service()
+    sentinel = object()
+    svc._request = Mock(return_value=sentinel)
+
+    result = svc.get_completion_submissions([3, 1, 2])
+
+    assert result is sentinel
+    svc._request.assert_called_once()
+    call = svc._request.call_args
+
+    route = call.args[0]
+    assert route.method == "POST"
+    assert route.path == "/completions/submissions/batch"
+    assert call.kwargs["response_model"] == list[CompletionSubmissionModel]
+    assert call.kwargs["data"] == CompletionSubmissionBatchRequest(ids=[3, 1, 2])
+
+
+def test_get_users_rank_data_posts_ids_in_one_request() -> None:
+    svc = _make_service()
+    sentinel = object()
+    svc._request = Mock(return_value=sentinel)
+
+    result = svc.get_users_rank_data([5, 7])
+
+    assert result is sentinel
+    svc._request.assert_called_once()
+    call = svc._request.call_args
+
+    route = call.args[0]
+    assert route.method == "POST"
+    assert route.path == "/users/ranks/batch"
+    assert call.kwargs["response_model"] == list[UserRankDetailsResponse]
+    assert call.kwargs["data"] == RankDetailsBatchRequest(user_ids=[5, 7])
+
+
+def test_grant_users_xp_posts_all_grants_in_one_request() -> None:
+    svc = _make_service()
+    sentinel = object()
+    svc._request = Mock(return_value=sentinel)
+    data = XpGrantBatchRequest([XpGrantBatchItem(1, 30, "Map Submission"), XpGrantBatchItem(2, 35, "Playtest")])
+
+    result = svc.grant_users_xp(data)
+
+    assert result is sentinel
+    svc._request.assert_called_once()
+    call = svc._request.call_args
+
+    route = call.args[0]
+    assert route.method == "POST"
+    assert route.path == "/lootbox/xp/batch"
+    assert call.kwargs["response_model"] == XpGrantBatchResponse
+    assert call.kwargs["data"] is data
@@ -0,0 +1,142 @@
+"""Self-contained unit tests for the APIService transport layer.
+
+The bot has no test harness, conftest, or shared fixtures. These tests point
+``APIService`` at an in-process aiohttp server (no API or Discord runtime) and
+are run with an explicit command:
+
+    cd apps/bot && uv run pytest tests/test_api_transport.py -x
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+# The bot runs as `python main.py` from apps/bot, so `extensions` is a top-level
+# import. pytest does not add the bot root to sys.path on its own (no conftest in
+# this project), so bootstrap it here to stay self-contained.
+_BOT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _BOT_ROOT not in sys.path:
+    sys.path.insert(0, _BOT_ROOT)
+
+from extensions.api_service import APIService, Route  # noqa: E402
+from utilities.errors import APIHTTPError  # noqa: E402
+
+
+async def _serve(handler: web.RequestHandler) -> tuple[web.AppRunner, str]:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _client() -> APIService:
+    api = APIService()
+    api._heartbeat_task.cancel()
+    api._is_available = True
+    return api
+
+
+def _route(base: str, method: str, path: str) -> Route:
+    route = Route(method, path)
+    route.url = base + path
+    return route
+
+
+def test_identical_gets_share_one_request() -> None:
+    async def scenario() -> tuple[int, list[bytes]]:
+        hits = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal hits
+            hits += 1
+            await asyncio.sleep(0.05)
+            return web.json_response({"code": request.query["code"]})
+
+        runner, base = await _serve(handler)
+        api = _client()
+        try:
+            route = _route(base, "GET", "/maps")
+            results = await asyncio.gather(*(api._request(route, params={"code": "ABC12"}) for _ in range(5)))
+            stats = api.route_latency_stats()["GET /maps"]
+            assert stats["count"] == 1
+            assert stats["coalesced"] == 4
+        finally:
+            await api._APIService__session.close()
+            await runner.cleanup()
+        return hits, results
+
+    hits, results = asyncio.run(scenario())
+    assert hits == 1
+    assert set(results) == {b'{"code": "ABC12"}'}
+
+
+def test_writes_are_not_coalesced() -> None:
+    async def scenario() -> int:
+        hits = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal hits
+            hits += 1
+            await asyncio.sleep(0.01)
+            return web.Response(status=204)
+
+        runner, base = await _serve(handler)
+        api = _client()
+        try:
+            route = _route(base, "POST", "/newsfeed")
+            await asyncio.gather(*(api._request(route) for _ in range(3)))
+        finally:
+            await api._APIService__session.close()
+            await runner.cleanup()
+        return hits
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_error_envelope_is_decoded() -> None:
+    async def scenario() -> APIHTTPError:
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response({"error": "Map not found.", "extra": {"code": "ABC12"}}, status=404)
+
+        runner, base = await _serve(handler)
+        api = _client()
+        try:
+            with pytest.raises(APIHTTPError) as exc_info:
+                await api._request(_route(base, "GET", "/maps/{code}"))
+            assert api.route_latency_stats()["GET /maps/{code}"]["errors"] == 1
+        finally:
+            await api._APIService__session.close()
+            await runner.cleanup()
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    assert error.status == 404
+    assert error.error == "Map not found."
+    assert error.extra == {"code": "ABC12"}
+
+
+def test_non_json_error_body_still_raises() -> None:
+    async def scenario() -> APIHTTPError:
+        async def handler(_: web.Request) -> web.Response:
+            return web.Response(status=502, text="Bad Gateway")
+
+        runner, base = await _serve(handler)
+        api = _client()
+        try:
+            with pytest.raises(APIHTTPError) as exc_info:
+                await api._request(_route(base, "GET", "/users"))
+        finally:
+            await api._APIService__session.close()
+            await runner.cleanup()
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    assert error.status == 502
+    assert error.error is None
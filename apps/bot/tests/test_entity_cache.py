@@ -0,0 +1,125 @@
+"""Self-contained unit tests for the API entity cache.
+
+The bot has no test harness, conftest, or shared fixtures. These tests drive
+``EntityCache`` with counting fetch callbacks (no API or Discord runtime) and
+are run with an explicit command:
+
+    cd apps/bot && uv run pytest tests/test_entity_cache.py -x
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import msgspec
+
+# The bot runs as `python main.py` from apps/bot, so `utilities` is a top-level
+# import. pytest does not add the bot root to sys.path on its own (no conftest in
+# this project), so bootstrap it here to stay self-contained.
+_BOT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _BOT_ROOT not in sys.path:
+    sys.path.insert(0, _BOT_ROOT)
+
+from utilities.entity_cache import EntityCache  # noqa: E402
+
+
+class _Map(msgspec.Struct):
+    code: str
+    thread_id: int
+    votes: int = 0
+
+
+def _map_tags(maps: list[_Map]) -> list[tuple[str, object]]:
+    return [t for m in maps for t in (("code", m.code), ("thread", m.thread_id))]
+
+
+def _counting_fetch(value: object) -> tuple[list[int], object]:
+    calls: list[int] = []
+
+    async def fetch() -> object:
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+
+    return calls, fetch
+
+
+def test_hit_returns_fresh_copy() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[list[_Map]] = EntityCache("maps", list[_Map], ttl=60, max_entries=10)
+        calls, fetch = _counting_fetch([_Map("ABC12", 1)])
+        first = await cache.get("ABC12", fetch)
+        first[0].votes = 99
+        second = await cache.get("ABC12", fetch)
+        assert second[0].votes == 0
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_fetch() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[_Map] = EntityCache("maps", _Map, ttl=60, max_entries=10)
+        calls, fetch = _counting_fetch(_Map("ABC12", 1))
+        results = await asyncio.gather(*(cache.get("ABC12", fetch) for _ in range(5)))
+        assert len(calls) == 1
+        assert all(r.code == "ABC12" for r in results)
+        assert cache.stats()["coalesced"] == 4
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_by_tag_drops_entries_fetched_by_other_key() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[list[_Map]] = EntityCache("maps", list[_Map], tags=_map_tags, ttl=60, max_entries=10)
+        calls, fetch = _counting_fetch([_Map("ABC12", 7)])
+        await cache.get(("code", "ABC12"), fetch)
+        cache.invalidate(("thread", 7))
+        await cache.get(("code", "ABC12"), fetch)
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_invalidation_during_fetch_is_not_stored() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[_Map] = EntityCache("maps", _Map, ttl=60, max_entries=10)
+        calls, fetch = _counting_fetch(_Map("ABC12", 1))
+        pending = asyncio.ensure_future(cache.get("ABC12", fetch))
+        await asyncio.sleep(0)
+        cache.invalidate("ABC12")
+        await pending
+        await cache.get("ABC12", fetch)
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_empty_results_and_expired_entries_refetch() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[_Map | None] = EntityCache("users", _Map | None, ttl=0, max_entries=10)
+        calls, fetch = _counting_fetch(None)
+        assert await cache.get(1, fetch) is None
+        assert await cache.get(1, fetch) is None
+        calls, fetch = _counting_fetch(_Map("ABC12", 1))
+        await cache.get(2, fetch)
+        await cache.get(2, fetch)
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    async def scenario() -> None:
+        cache: EntityCache[_Map] = EntityCache("maps", _Map, ttl=60, max_entries=2)
+        calls, fetch = _counting_fetch(_Map("ABC12", 1))
+        await cache.get("a", fetch)
+        await cache.get("b", fetch)
+        await cache.get("a", fetch)
+        await cache.get("c", fetch)
+        await cache.get("a", fetch)
+        await cache.get("b", fetch)
+        assert len(calls) == 4
+
+    asyncio.run(scenario())
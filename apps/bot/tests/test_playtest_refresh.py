@@ -0,0 +1,95 @@
+"""Self-contained unit tests for the debounced playtest view refresher.
+
+The bot has no test harness, conftest, or shared fixtures. These tests drive
+``_ThreadRefreshCoalescer`` with a recording callback (no Discord runtime) and
+are run with an explicit command:
+
+    cd apps/bot && uv run pytest tests/test_playtest_refresh.py -x
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# The bot runs as `python main.py` from apps/bot, so `extensions` is a top-level
+# import. pytest does not add the bot root to sys.path on its own (no conftest in
+# this project), so bootstrap it here to stay self-contained.
+_BOT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _BOT_ROOT not in sys.path:
+    sys.path.insert(0, _BOT_ROOT)
+
+from extensions.playtest import _ThreadRefreshCoalescer  # noqa: E402
+
+_INTERVAL = 0.05
+
+
+def test_burst_renders_first_and_last_only() -> None:
+    async def scenario() -> list[int]:
+        refreshed: list[int] = []
+
+        async def refresh(thread_id: int) -> None:
+            refreshed.append(thread_id)
+
+        coalescer = _ThreadRefreshCoalescer(refresh, _INTERVAL)
+        for _ in range(10):
+            coalescer.mark_dirty(1)
+            await asyncio.sleep(0)
+        await asyncio.sleep(_INTERVAL * 3)
+        return refreshed
+
+    # One immediate render for the first vote, one trailing render for the rest.
+    assert asyncio.run(scenario()) == [1, 1]
+
+
+def test_threads_refresh_independently() -> None:
+    async def scenario() -> list[int]:
+        refreshed: list[int] = []
+
+        async def refresh(thread_id: int) -> None:
+            refreshed.append(thread_id)
+
+        coalescer = _ThreadRefreshCoalescer(refresh, _INTERVAL)
+        coalescer.mark_dirty(1)
+        coalescer.mark_dirty(2)
+        await asyncio.sleep(_INTERVAL * 2)
+        return refreshed
+
+    assert sorted(asyncio.run(scenario())) == [1, 2]
+
+
+def test_failed_refresh_does_not_stop_later_refreshes() -> None:
+    async def scenario() -> int:
+        calls = 0
+
+        async def refresh(_: int) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("discord is down")
+
+        coalescer = _ThreadRefreshCoalescer(refresh, _INTERVAL)
+        coalescer.mark_dirty(1)
+        await asyncio.sleep(0)
+        coalescer.mark_dirty(1)
+        await asyncio.sleep(_INTERVAL * 3)
+        return calls
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_discard_drops_pending_refresh() -> None:
+    async def scenario() -> list[int]:
+        refreshed: list[int] = []
+
+        async def refresh(thread_id: int) -> None:
+            refreshed.append(thread_id)
+
+        coalescer = _ThreadRefreshCoalescer(refresh, _INTERVAL)
+        coalescer.mark_dirty(1)
+        await asyncio.sleep(0)
+        coalescer.mark_dirty(1)
+        coalescer.discard(1)
+        await asyncio.sleep(_INTERVAL * 3)
+        return refreshed
+
+    assert asyncio.run(scenario()) == [1]
@@ -0,0 +1,162 @@
+"""Self-contained unit tests for the role invariant queue.
+
+Guilds, members and roles are small stand-ins exposing only what
+``RoleInvariant`` reads (no Discord runtime). Run with:
+
+    cd apps/bot && uv run pytest tests/test_role_invariants.py -x
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import discord
+
+# See test_entity_cache.py: bootstrap the bot root onto sys.path.
+_BOT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _BOT_ROOT not in sys.path:
+    sys.path.insert(0, _BOT_ROOT)
+
+from utilities.role_invariants import RoleInvariant  # noqa: E402
+
+
+class _Role:
+    def __init__(self, guild: "_Guild", role_id: int, name: str) -> None:
+        self.guild = guild
+        self.id = role_id
+        self.name = name
+
+    @property
+    def members(self) -> list["_Member"]:
+        return [m for m in self.guild.members if self.id in m.role_ids]
+
+
+class _Member:
+    def __init__(self, guild: "_Guild", member_id: int, *, role_ids: set[int] | None = None) -> None:
+        self.guild = guild
+        self.id = member_id
+        self.role_ids = role_ids or set()
+        self.add_calls = 0
+        self.error: Exception | None = None
+
+    def get_role(self, role_id: int) -> object | None:
+        return object() if role_id in self.role_ids else None
+
+    async def add_roles(self, role: _Role, *, reason: str | None = None) -> None:
+        self.add_calls += 1
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        self.role_ids.add(role.id)
+
+
+class _Guild:
+    def __init__(self) -> None:
+        self.id = 1
+        self.members: list[_Member] = []
+        self.roles = [_Role(self, 10, "Ninja")]
+
+    def add_member(self, member_id: int, *, ninja: bool = False) -> _Member:
+        member = _Member(self, member_id, role_ids={10} if ninja else set())
+        self.members.append(member)
+        return member
+
+    def get_member(self, member_id: int) -> _Member | None:
+        return next((m for m in self.members if m.id == member_id), None)
+
+
+class _Response:
+    status = 500
+    reason = "Internal Server Error"
+
+
+def test_reconcile_grants_only_members_missing_the_role() -> None:
+    async def run() -> None:
+        guild = _Guild()
+        holders = [guild.add_member(i, ninja=True) for i in range(5)]
+        missing = [guild.add_member(i) for i in range(5, 8)]
+        invariant = RoleInvariant("Ninja", concurrency=2)
+
+        assert invariant.reconcile(guild) == 3
+        await invariant.join()
+        await invariant.close()
+
+        assert all(m.add_calls == 1 and 10 in m.role_ids for m in missing)
+        assert all(m.add_calls == 0 for m in holders)
+        assert invariant.stats()["granted"] == 3
+        assert invariant.stats()["last_missing"] == 3
+
+    asyncio.run(run())
+
+
+def test_member_is_queued_once() -> None:
+    async def run() -> None:
+        guild = _Guild()
+        member = guild.add_member(1)
+        invariant = RoleInvariant("Ninja")
+
+        assert invariant.ensure(member) is True
+        assert invariant.ensure(member) is False
+        assert invariant.reconcile(guild) == 0
+        await invariant.join()
+        await invariant.close()
+
+        assert member.add_calls == 1
+
+    asyncio.run(run())
+
+
+def test_departed_and_already_granted_members_are_skipped() -> None:
+    async def run() -> None:
+        guild = _Guild()
+        departed = guild.add_member(1)
+        granted_meanwhile = guild.add_member(2)
+        invariant = RoleInvariant("Ninja")
+
+        invariant.ensure(departed)
+        invariant.ensure(granted_meanwhile)
+        guild.members.remove(departed)
+        granted_meanwhile.role_ids.add(10)
+        await invariant.join()
+        await invariant.close()
+
+        assert departed.add_calls == 0
+        assert granted_meanwhile.add_calls == 0
+        assert invariant.stats()["skipped"] == 2
+
+    asyncio.run(run())
+
+
+def test_failed_grant_is_counted_and_retried_by_next_reconcile() -> None:
+    async def run() -> None:
+        guild = _Guild()
+        member = guild.add_member(1)
+        member.error = discord.HTTPException(_Response(), "boom")
+        invariant = RoleInvariant("Ninja")
+
+        invariant.reconcile(guild)
+        await invariant.join()
+        assert invariant.stats()["failed"] == 1
+
+        member.error = None
+        assert invariant.reconcile(guild) == 1
+        await invariant.join()
+        await invariant.close()
+
+        assert 10 in member.role_ids
+        assert invariant.stats()["granted"] == 1
+
+    asyncio.run(run())
+
+
+def test_missing_role_queues_nothing() -> None:
+    async def run() -> None:
+        guild = _Guild()
+        guild.roles = []
+        guild.add_member(1)
+        invariant = RoleInvariant("Ninja")
+
+        assert invariant.reconcile(guild) == 0
+        await invariant.close()
+
+    asyncio.run(run())
@@ -0,0 +1,165 @@
+"""Short-lived read-through cache for entities the bot re-reads from the API.
+
+One event flow often fetches the same user, map or completion submission
+several times; verifying a completion alone reads the submission up to three
+times plus the verifier and the map. ``EntityCache`` keeps each entity for
+``API_ENTITY_CACHE_TTL`` seconds, at most ``API_ENTITY_CACHE_MAX_ENTRIES`` per
+cache in LRU order.
+
+Entries are stored encoded and decoded again on every hit, so callers get their
+own object and may mutate it freely. Concurrent misses on one key share a single
+request. Empty results (``None`` or ``[]``) are never stored.
+
+Entries are dropped when the API publishes an event that changes them, when the
+bot writes to the entity's route itself, or once they expire. Invalidating also
+detaches requests already in flight, so a response read before a write is never
+stored after it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Generic, Hashable, TypeVar
+
+import msgspec
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+__all__ = ("API_ENTITY_CACHE_MAX_ENTRIES", "API_ENTITY_CACHE_TTL", "EntityCache")
+
+log = getLogger(__name__)
+
+API_ENTITY_CACHE_TTL = float(os.getenv("API_ENTITY_CACHE_TTL", "30"))
+API_ENTITY_CACHE_MAX_ENTRIES = int(os.getenv("API_ENTITY_CACHE_MAX_ENTRIES", "1000"))
+
+T = TypeVar("T")
+
+
+class _Entry:
+    __slots__ = ("expires_at", "raw", "tags")
+
+    def __init__(self, raw: bytes, tags: frozenset[Hashable], expires_at: float) -> None:
+        self.raw = raw
+        self.tags = tags
+        self.expires_at = expires_at
+
+
+class EntityCache(Generic[T]):
+    """TTL and size bounded cache of one entity type, keyed by lookup."""
+
+    def __init__(
+        self,
+        name: str,
+        model: Any,  # noqa: ANN401
+        *,
+        tags: Callable[[T], Iterable[Hashable]] | None = None,
+        ttl: float = API_ENTITY_CACHE_TTL,
+        max_entries: int = API_ENTITY_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name: Label used in stats and logs.
+            model: Type the cached values decode as.
+            tags: Returns extra keys an entry is invalidated by, besides its own
+                (e.g. the code and thread of a map fetched by either).
+            ttl: Seconds an entry stays fresh.
+            max_entries: Entries kept before the least recently used is evicted.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._tags = tags
+        self._encoder = msgspec.json.Encoder(decimal_format="number")
+        self._decoder: msgspec.json.Decoder[T] = msgspec.json.Decoder(model)
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[bytes]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the entity under ``key``, fetching it on a miss.
+
+        Args:
+            key: Lookup the entity is cached under.
+            fetch: Loads the entity from the API.
+
+        Returns:
+            A fresh copy of the entity.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._decoder.decode(entry.raw)
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, fetch, self._generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.coalesced += 1
+        return self._decoder.decode(await asyncio.shield(task))
+
+    async def _load(self, key: Hashable, fetch: Callable[[], Awaitable[T]], generation: int) -> bytes:
+        value = await fetch()
+        raw = self._encoder.encode(value)
+        if value and generation == self._generation:
+            tags = frozenset(self._tags(value)) if self._tags else frozenset()
+            self._entries[key] = _Entry(raw, tags, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return raw
+
+    def _finish(self, key: Hashable, task: asyncio.Task[bytes]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            log.debug("Entity cache %s failed to load %r.", self.name, key)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop entries stored under, or tagged with, any of ``keys``."""
+        wanted = set(keys)
+        stale = [k for k, e in self._entries.items() if k in wanted or not wanted.isdisjoint(e.tags)]
+        for k in stale:
+            del self._entries[k]
+        self._detach_inflight()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._detach_inflight()
+
+    def _detach_inflight(self) -> None:
+        # Requests already running may have read the old state; let their
+        # current waiters have the result, but neither store it nor share it.
+        self._generation += 1
+        self._inflight.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered without a request of their own."""
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the cache's counters and size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,154 @@
+"""Keep a role on every member of a guild without sweeping the guild.
+
+Every member should hold the Ninja role. Instead of visiting each member on a
+timer, ``RoleInvariant`` checks members as they join or change, diffs the role's
+holders against the member list (both already in the gateway cache) to find
+anyone missed, and hands the members that need the role to a small queue.
+
+The queue grants the role with ``ROLE_GRANT_CONCURRENCY`` workers. All role
+edits in a guild share one Discord rate limit bucket, which discord.py waits out
+before each request, so extra workers would only queue up behind it. A member is
+queued at most once at a time and re-checked from the cache just before the
+request, so members who already got the role or left the guild cost nothing.
+Grants that still fail are logged and counted; the next reconciliation retries
+them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from discord import Guild, Member, Role
+
+__all__ = ("NINJA_ROLE_VERIFY_HOURS", "ROLE_GRANT_CONCURRENCY", "RoleInvariant")
+
+log = getLogger(__name__)
+
+ROLE_GRANT_CONCURRENCY = int(os.getenv("ROLE_GRANT_CONCURRENCY", "2"))
+NINJA_ROLE_VERIFY_HOURS = float(os.getenv("NINJA_ROLE_VERIFY_HOURS", "6"))
+
+
+class RoleInvariant:
+    """Ensures every member of a guild holds the role named ``role_name``."""
+
+    def __init__(self, role_name: str, *, concurrency: int = ROLE_GRANT_CONCURRENCY) -> None:
+        """Initialize the invariant; grant workers start with the first queued member.
+
+        Args:
+            role_name: Name of the role every member should hold.
+            concurrency: Number of workers sending role grants.
+        """
+        self.role_name = role_name
+        self.concurrency = max(1, concurrency)
+        self._queue: asyncio.Queue[Member] = asyncio.Queue()
+        self._queued: set[int] = set()
+        self._workers: list[asyncio.Task[None]] = []
+        self.granted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.reconciliations = 0
+        self.last_missing = 0
+        self.last_reconcile_ms = 0.0
+
+    def role(self, guild: Guild) -> Role | None:
+        """Return the guild's role with this invariant's name, if it exists."""
+        return discord.utils.get(guild.roles, name=self.role_name)
+
+    def ensure(self, member: Member) -> bool:
+        """Queue ``member`` for the role if they lack it.
+
+        Returns:
+            True if the member was queued.
+        """
+        role = self.role(member.guild)
+        if role is None:
+            log.warning("Role %r does not exist in guild %s.", self.role_name, member.guild.id)
+            return False
+        if member.get_role(role.id) is not None or member.id in self._queued:
+            return False
+        self._queued.add(member.id)
+        self._queue.put_nowait(member)
+        self._start()
+        return True
+
+    def missing(self, guild: Guild) -> list[Member]:
+        """Return the cached members of ``guild`` who lack the role."""
+        role = self.role(guild)
+        if role is None:
+            return []
+        holders = {member.id for member in role.members}
+        return [member for member in guild.members if member.id not in holders]
+
+    def reconcile(self, guild: Guild) -> int:
+        """Queue every member of ``guild`` who lacks the role.
+
+        Returns:
+            Number of members newly queued.
+        """
+        started = time.perf_counter()
+        missing = self.missing(guild)
+        queued = sum(self.ensure(member) for member in missing)
+        self.reconciliations += 1
+        self.last_missing = len(missing)
+        self.last_reconcile_ms = (time.perf_counter() - started) * 1000
+        return queued
+
+    async def join(self) -> None:
+        """Wait until every queued grant has been attempted."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the grant workers, dropping queued grants."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return grant counters and the outcome of the last reconciliation."""
+        return {
+            "queued": self._queue.qsize(),
+            "granted": self.granted,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "reconciliations": self.reconciliations,
+            "last_missing": self.last_missing,
+            "last_reconcile_ms": self.last_reconcile_ms,
+        }
+
+    def _start(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._work(), name=f"role-invariant:{self.role_name}"))
+
+    async def _work(self) -> None:
+        while True:
+            member = await self._queue.get()
+            self._queued.discard(member.id)
+            try:
+                await self._grant(member)
+            finally:
+                self._queue.task_done()
+
+    async def _grant(self, member: Member) -> None:
+        current = member.guild.get_member(member.id)
+        role = self.role(member.guild)
+        if current is None or role is None or current.get_role(role.id) is not None:
+            self.skipped += 1
+            return
+        try:
+            await current.add_roles(role, reason="Every member holds this role.")
+        except discord.NotFound:
+            self.skipped += 1
+        except discord.HTTPException:
+            self.failed += 1
+            log.exception("Failed to grant role %r to member %s.", self.role_name, member.id)
+        else:
+            self.granted += 1
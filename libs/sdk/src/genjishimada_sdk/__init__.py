@@ -1,25 +1,33 @@
 # src/genjishimada_sdk/__init__.py
+#
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# ``import genjishimada_sdk`` or ``from genjishimada_sdk.tags import ...`` does not
+# pay for decoding every Struct module in the package.
+import importlib
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from . import (
-    auth,
-    change_requests,
-    completions,
-    difficulties,
-    internal,
-    logs,
-    lootbox,
-    maps,
-    newsfeed,
-    notifications,
-    rank_card,
-    skill,
-    store,
-    tournaments,
-    users,
-    xp,
-)
+if TYPE_CHECKING:
+    from . import (
+        auth,
+        change_requests,
+        completions,
+        difficulties,
+        internal,
+        logs,
+        lootbox,
+        maps,
+        newsfeed,
+        notifications,
+        rank_card,
+        skill,
+        store,
+        tournaments,
+        users,
+        xp,
+    )
 
 __all__ = [
     "auth",
@@ -44,3 +52,17 @@ try:
     __version__ = _pkg_version("genjipk-sdk")
 except PackageNotFoundError:
     __version__ = "0.0.0"
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a public submodule on first access."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported submodules in ``dir()``."""
+    return sorted({*globals(), *__all__})
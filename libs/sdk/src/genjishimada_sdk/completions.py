@@ -14,6 +14,7 @@ __all__ = (
     "CompletionModerateRequest",
     "CompletionPatchRequest",
     "CompletionResponse",
+    "CompletionSubmissionBatchRequest",
     "CompletionSubmissionJobResponse",
     "CompletionSubmissionResponse",
     "CompletionVerificationUpdateRequest",
@@ -34,6 +35,7 @@ __all__ = (
     "UpvoteUpdateEvent",
     "VerificationChangedEvent",
     "VerificationMessageDeleteEvent",
+    "WorldRecordDriftResponse",
     "WorldRecordXPCheckResponse",
 )
 
@@ -269,6 +271,20 @@ class WorldRecordXPCheckResponse(Struct):
     user_id: int
 
 
+class WorldRecordDriftResponse(Struct):
+    """A map whose stored world record disagrees with its completions.
+
+    Attributes:
+        map_id: Identifier of the map.
+        expected_completion_id: Completion that holds the record, if any.
+        stored_completion_id: Completion the stored record pointed at, if any.
+    """
+
+    map_id: int
+    expected_completion_id: int | None
+    stored_completion_id: int | None
+
+
 class CompletionVerificationUpdateRequest(Struct):
     """Update verification metadata for a completion.
 
@@ -318,6 +334,16 @@ class CompletionModerateRequest(Struct, kw_only=True):
     suspicious_flag_type: SuspiciousFlag | UnsetType = UNSET
 
 
+class CompletionSubmissionBatchRequest(Struct):
+    """Request body for fetching several completion submissions at once.
+
+    Attributes:
+        ids: Completion identifiers to fetch; unknown IDs are skipped.
+    """
+
+    ids: Annotated[list[int], Meta(max_length=500)]
+
+
 class PendingVerificationResponse(Struct):
     """Represents a completion waiting for verification.
 
@@ -13,6 +13,7 @@ from .internal import JobStatusResponse
 from .users import Creator, CreatorFull
 
 __all__ = (
+    "IMAGE_VARIANT_WIDTHS",
     "MAX_CREATORS",
     "PLAYTEST_VOTE_THRESHOLD",
     "URL_PATTERN",
@@ -943,10 +944,23 @@ PLAYTEST_VOTE_THRESHOLD: dict[DifficultyTop, int] = {
 }
 
 
-def get_map_banner(map_name: str) -> str:
-    """Get the applicable map banner."""
+IMAGE_VARIANT_WIDTHS: tuple[int, ...] = (320, 640, 1280)
+
+
+def get_map_banner(map_name: str, width: int | None = None) -> str:
+    """Get the applicable map banner.
+
+    Args:
+        map_name: The map name.
+        width: One of ``IMAGE_VARIANT_WIDTHS`` to get the resized WebP variant
+            instead of the original PNG.
+    """
     _map = re.sub(r"[^a-zA-Z0-9]", "", map_name)
     sanitized_name = _map.lower().strip().replace(" ", "")
+    if width is not None:
+        if width not in IMAGE_VARIANT_WIDTHS:
+            raise ValueError(f"width must be one of {IMAGE_VARIANT_WIDTHS}, got {width}.")
+        return f"https://cdn.genji.pk/assets/map_banners/{sanitized_name}_w{width}.webp"
     return f"https://cdn.genji.pk/assets/map_banners/{sanitized_name}.png"
 
 
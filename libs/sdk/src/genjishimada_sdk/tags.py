@@ -16,13 +16,16 @@ __all__ = (
     "OpTransfer",
     "TagOp",
     "TagRowDTO",
+    "TagUsageIncrement",
     "TagsAutocompleteRequest",
     "TagsAutocompleteResponse",
     "TagsMutateRequest",
     "TagsMutateResponse",
     "TagsMutateResult",
+    "TagsMutatedEvent",
     "TagsSearchFilters",
     "TagsSearchResponse",
+    "TagsUsageIncrementRequest",
 )
 
 
@@ -283,6 +286,40 @@ class TagsMutateResponse(Struct):
     results: list[TagsMutateResult]
 
 
+class TagUsageIncrement(Struct):
+    """Accumulated usage for a single tag name.
+
+    Attributes:
+        guild_id: Discord guild identifier that owns the tag.
+        name: Name (or alias) the tag was invoked by.
+        count: Number of uses to add.
+    """
+
+    guild_id: int
+    name: str
+    count: int = 1
+
+
+class TagsUsageIncrementRequest(Struct):
+    """Batch of usage counters flushed by the bot.
+
+    Attributes:
+        items: Usage increments to apply in a single statement.
+    """
+
+    items: list[TagUsageIncrement]
+
+
+class TagsMutatedEvent(Struct):
+    """Event published after tags in a guild were created, edited, or removed.
+
+    Attributes:
+        guild_id: Discord guild whose tags changed.
+    """
+
+    guild_id: int
+
+
 class TagsAutocompleteRequest(Struct):
     """Request payload for tag autocomplete queries.
 
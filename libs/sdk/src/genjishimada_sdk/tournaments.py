@@ -34,6 +34,7 @@ __all__ = (
     "TournamentDebugCycleLengthRequest",
     "TournamentEditionResponse",
     "TournamentEditionResultsEvent",
+    "TournamentLeaderboardDeltaEvent",
     "TournamentLeaderboardEntryResponse",
     "TournamentLifecycleResponse",
     "TournamentNextCycleResponse",
@@ -433,6 +434,30 @@ class TournamentLeaderboardEntryResponse(Struct):
     completion: bool
 
 
+class TournamentLeaderboardDeltaEvent(Struct):
+    """Compact rank change on a live tournament cycle leaderboard.
+
+    Rides ``api.tournament.leaderboard.delta``. One event describes one user's
+    move; every entry strictly between ``previous_rank`` and ``rank`` shifts by
+    one place, so a consumer holding the board can patch it without refetching.
+
+    Attributes:
+        cycle_id: Identifier of the tournament cycle.
+        user_id: Identifier of the user whose best run changed.
+        previous_rank: Rank before the change, or None if the user was not ranked.
+        rank: Rank after the change, or None if the user dropped off the board.
+        entry: The user's new leaderboard entry, or None if they dropped off.
+        total: Number of ranked entries after the change.
+    """
+
+    cycle_id: int
+    user_id: int
+    previous_rank: int | None
+    rank: int | None
+    entry: TournamentLeaderboardEntryResponse | None
+    total: int
+
+
 class TournamentCycleResultsResponse(Struct):
     """Archived cycle results with standings.
 
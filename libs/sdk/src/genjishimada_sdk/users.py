@@ -1,7 +1,7 @@
 import enum
-from typing import Literal
+from typing import Annotated, Literal
 
-from msgspec import UNSET, Struct, UnsetType
+from msgspec import UNSET, Meta, Struct, UnsetType
 
 from .difficulties import DifficultyTop
 
@@ -15,8 +15,10 @@ __all__ = (
     "OverwatchUsernamesResponse",
     "OverwatchUsernamesUpdateRequest",
     "RankDetailResponse",
+    "RankDetailsBatchRequest",
     "SettingsUpdateRequest",
     "UserCreateRequest",
+    "UserRankDetailsResponse",
     "UserResponse",
     "UserUpdateRequest",
 )
@@ -211,6 +213,28 @@ class RankDetailResponse(Struct):
     bronze_rank_met: bool
 
 
+class RankDetailsBatchRequest(Struct):
+    """Request body for fetching rank details for several users at once.
+
+    Attributes:
+        user_ids: Identifiers of the users to fetch.
+    """
+
+    user_ids: Annotated[list[int], Meta(max_length=1000)]
+
+
+class UserRankDetailsResponse(Struct):
+    """Rank breakdown for one user in a batch.
+
+    Attributes:
+        user_id: Identifier of the user.
+        ranks: Per-difficulty rank details, easiest first.
+    """
+
+    user_id: int
+    ranks: list[RankDetailResponse]
+
+
 class CommunityLeaderboardResponse(Struct):
     """Entry in the community leaderboard.
 
@@ -1,6 +1,6 @@
-from typing import Literal
+from typing import Annotated, Literal
 
-from msgspec import Struct
+from msgspec import Meta, Struct
 
 __all__ = (
     "XP_AMOUNTS",
@@ -8,6 +8,10 @@ __all__ = (
     "PlayersPerSkillTierResponse",
     "PlayersPerXPTierResponse",
     "TierChangeResponse",
+    "XpGrantBatchEvent",
+    "XpGrantBatchItem",
+    "XpGrantBatchRequest",
+    "XpGrantBatchResponse",
     "XpGrantEvent",
     "XpGrantRequest",
     "XpGrantResponse",
@@ -160,3 +164,52 @@ class XpGrantEvent(Struct):
     previous_amount: int
     new_amount: int
     reason: str | None = None
+
+
+class XpGrantBatchItem(Struct):
+    """One recipient of a batched XP grant.
+
+    Attributes:
+        user_id: Identifier of the user receiving XP.
+        amount: Amount of XP to grant.
+        type: Category describing why XP is granted.
+        reason: Optional free-text reason for the grant.
+    """
+
+    user_id: int
+    amount: int
+    type: XP_TYPES
+    reason: str | None = None
+
+
+class XpGrantBatchRequest(Struct):
+    """Request payload for granting XP to many users at once.
+
+    A user may appear more than once; grants apply in list order.
+
+    Attributes:
+        grants: Grants to apply.
+    """
+
+    grants: Annotated[list[XpGrantBatchItem], Meta(max_length=1000)]
+
+
+class XpGrantBatchResponse(Struct):
+    """Return payload when XP is granted in a batch.
+
+    Attributes:
+        grants: One entry per requested grant, in request order, with the
+            recipient's totals before and after that grant.
+    """
+
+    grants: list[XpGrantEvent]
+
+
+class XpGrantBatchEvent(Struct):
+    """Event emitted when XP is granted to several users at once.
+
+    Attributes:
+        grants: The individual grants, in the order they were applied.
+    """
+
+    grants: list[XpGrantEvent]
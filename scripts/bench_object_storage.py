@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Compare screenshot upload latency: a client per request vs the shared, pooled client.
+
+Uploads random images to the configured S3-compatible endpoint (the local MinIO
+from ``just infra-up``) two ways:
+
+* ``before``: the old path, a fresh ``ImageStorageService()`` (and boto3 client)
+  per upload, with the upload run inline on the event loop.
+* ``after``: ``OBJECT_STORAGE`` with one shared client, uploads streamed from a
+  spooled file on its bounded thread pool, ``--concurrency`` at a time.
+
+While each scenario runs, a ticker measures how late the event loop wakes up,
+which is what every other request on the API would feel. Storage settings come
+from the same ``S3_*`` and ``AWS_*`` variables as the API.
+
+Usage:
+    python scripts/bench_object_storage.py
+    python scripts/bench_object_storage.py --uploads 100 --size-kb 2048 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "apps" / "api"))
+
+from services.image_storage_service import OBJECT_STORAGE, ImageStorageService
+
+
+async def _loop_lag(stop: asyncio.Event, samples: list[float], interval: float = 0.005) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def _run(upload: Callable[[bytes], Awaitable[object]], images: list[bytes], concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    lag: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_loop_lag(stop, lag))
+    latencies: list[float] = []
+
+    async def one(image: bytes) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await upload(image)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(image) for image in images))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    mib = sum(len(i) for i in images) / 1024 / 1024
+    print(f"  upload p50 {quantiles[49]:7.1f} ms  p99 {quantiles[98]:7.1f} ms  {mib / elapsed:6.1f} MiB/s")
+    print(f"  loop lag max {max(lag, default=0.0):7.1f} ms  mean {statistics.fmean(lag or [0.0]):6.2f} ms")
+
+
+async def main() -> None:
+    """Upload the same images with per-request clients and the shared client and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=50, help="uploads per scenario")
+    parser.add_argument("--size-kb", type=int, default=1024, help="size of each image")
+    parser.add_argument("--concurrency", type=int, default=8, help="uploads in flight in the after scenario")
+    args = parser.parse_args()
+
+    if not os.getenv("S3_ENDPOINT_URL"):
+        sys.exit("S3_ENDPOINT_URL is not set; run with --env-file .env.local against `just infra-up`.")
+
+    images = [os.urandom(args.size_kb * 1024) for _ in range(args.uploads)]
+
+    async def before(image: bytes) -> None:
+        ImageStorageService().upload_screenshot(image, "image/png")
+
+    service = ImageStorageService(OBJECT_STORAGE.client)
+
+    async def after(image: bytes) -> None:
+        # Litestar hands handlers a spooled temporary file, not bytes.
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as fileobj:
+            fileobj.write(image)
+            await service.put_screenshot(fileobj, "image/png")
+
+    print(f"{args.uploads} uploads of {args.size_kb} KiB")
+    print("before (client per upload, inline):")
+    await _run(before, images, 1)
+    print(f"after (shared client, pooled, concurrency {args.concurrency}):")
+    OBJECT_STORAGE.start()
+    try:
+        await _run(after, images, args.concurrency)
+        print(f"  storage stats: {OBJECT_STORAGE.stats()['screenshot']}")
+    finally:
+        OBJECT_STORAGE.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Show what a login burst does to unrelated requests on the same event loop.
+
+A probe task stands in for an unrelated cheap endpoint: it repeatedly awaits a
+short sleep and records how late it woke up. While it runs, a burst of
+concurrent bcrypt verifications is fired, once inline on the loop (how
+``AuthService.login`` used to hash) and once through the API's
+``PasswordHasher`` process pool. The probe's p50/p99/max latency is printed for
+an idle loop and for both modes; with the pool, p99 should stay near idle.
+
+Usage:
+    python scripts/bench_password_hashing.py
+    python scripts/bench_password_hashing.py --logins 64 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "apps" / "api"))
+
+from utilities.password_hashing import (
+    PasswordHasher,
+    hash_password_sync,
+    verify_password_sync,
+)
+
+PASSWORD = "ValidPass123!"
+PROBE_INTERVAL = 0.005
+
+
+async def _probe(stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def _measure(burst: Callable[[], Awaitable[None]]) -> list[float]:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(stop, samples))
+    await asyncio.sleep(0.05)
+    await burst()
+    stop.set()
+    await probe
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+    print(f"{label:>8}: p50 {quantiles[49]:7.1f} ms  p99 {quantiles[98]:7.1f} ms  max {max(samples):7.1f} ms")
+
+
+async def main() -> None:
+    """Run the idle, inline and pooled scenarios and print probe latency."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32, help="concurrent logins in the burst")
+    parser.add_argument("--workers", type=int, default=2, help="hashing worker processes")
+    args = parser.parse_args()
+
+    password_hash = hash_password_sync(PASSWORD)
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.logins)
+    hasher.start()
+    await hasher.verify(PASSWORD, password_hash)  # warm the workers
+
+    async def idle() -> None:
+        await asyncio.sleep(1)
+
+    async def inline() -> None:
+        async def login() -> None:
+            verify_password_sync(PASSWORD, password_hash)
+
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+
+    async def pooled() -> None:
+        await asyncio.gather(*(hasher.verify(PASSWORD, password_hash) for _ in range(args.logins)))
+
+    try:
+        print(f"{args.logins} concurrent logins, {args.workers} workers, probe every {PROBE_INTERVAL * 1000:g} ms")
+        _report("idle", await _measure(idle))
+        _report("inline", await _measure(inline))
+        _report("pool", await _measure(pooled))
+    finally:
+        hasher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare rank card throughput: ten sequential queries vs the single-row read and its cache.
+
+A rank card used to cost eleven queries on two connections. This script drives
+``--concurrency`` simultaneous rank card loads for ``--seconds`` against a real
+database and reports requests per second and latency three ways:
+
+* ``before``: the old path, rank data, nickname, background, maps created,
+  playtests voted, WR count, avatar, map totals, XP and skill summary in
+  sequence on one connection, then the badges on another.
+* ``cold``: ``RankCardService`` with the user's card invalidated before every load, so
+  each card is one ``fetch_rank_card`` round trip.
+* ``warm``: ``RankCardService`` with its cache left populated, as repeat views
+  of a profile see it.
+
+Loads cycle through the ``--users`` users with the most verified completions.
+Connection settings come from the same ``POSTGRES_*`` variables as the API.
+
+Usage:
+    python scripts/bench_rank_card.py
+    python scripts/bench_rank_card.py --seconds 20 --concurrency 32 --users 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "apps" / "api"))
+
+import asyncpg
+from litestar.datastructures import State
+from repository.rank_card_repository import RankCardRepository
+from services.rank_card_service import RankCardService, invalidate_rank_cards
+from utilities.shared_queries import get_user_rank_data
+
+
+def _dsn() -> str:
+    user = os.getenv("POSTGRES_USER")
+    password = os.getenv("POSTGRES_PASSWORD")
+    host = os.getenv("POSTGRES_HOST", "localhost")
+    db = os.getenv("POSTGRES_DB")
+    return f"postgresql://{user}:{password}@{host}:5432/{db}"
+
+
+async def _drive(
+    load: Callable[[int], Awaitable[object]], user_ids: list[int], seconds: float, concurrency: int
+) -> tuple[list[float], float]:
+    users = itertools.cycle(user_ids)
+    samples: list[float] = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await load(next(users))
+            samples.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+def _report(label: str, samples: list[float], elapsed: float) -> None:
+    quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+    rps = len(samples) / elapsed
+    print(f"{label:>6}: {rps:8.1f} req/s  p50 {quantiles[49]:6.2f} ms  p99 {quantiles[98]:6.2f} ms")
+
+
+async def main() -> None:
+    """Drive before, cold and warm rank card loads and print throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10, help="duration of each scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="simultaneous rank card loads")
+    parser.add_argument("--users", type=int, default=100, help="distinct users to cycle through")
+    args = parser.parse_args()
+
+    pool = await asyncpg.create_pool(_dsn(), min_size=args.concurrency, max_size=args.concurrency + 4)
+    assert pool
+    try:
+        user_ids = [
+            row["user_id"]
+            for row in await pool.fetch(
+                "SELECT user_id FROM core.completions WHERE verified GROUP BY user_id ORDER BY count(*) DESC LIMIT $1",
+                args.users,
+            )
+        ]
+        repo = RankCardRepository(pool)
+        service = RankCardService(pool, State(), repo)
+
+        async def before(user_id: int) -> None:
+            async with pool.acquire() as conn:
+                await conn.fetchval("SELECT EXISTS(SELECT 1 FROM core.users WHERE id = $1)", user_id)
+            async with pool.acquire() as conn:
+                await get_user_rank_data(conn, user_id)  # type: ignore[arg-type]
+                await repo.fetch_nickname(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_background(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_maps_created_count(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_playtests_voted_count(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_world_record_count(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_avatar(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_map_totals(conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_community_rank_xp(user_id, conn=conn)  # type: ignore[arg-type]
+                await repo.fetch_skill_summary(user_id, conn=conn)  # type: ignore[arg-type]
+            await service.get_badges(user_id)
+
+        async def cold(user_id: int) -> None:
+            invalidate_rank_cards(user_id)
+            await service.get_rank_card_data(user_id)
+
+        async def warm(user_id: int) -> None:
+            await service.get_rank_card_data(user_id)
+
+        print(f"{args.seconds:g}s per scenario, {args.concurrency} concurrent loads, {len(user_ids)} users")
+        for label, load in (("before", before), ("cold", cold), ("warm", warm)):
+            await load(user_ids[0])  # warm connections and plans
+            _report(label, *await _drive(load, user_ids, args.seconds, args.concurrency))
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare store page read latency: per-item ownership checks vs the cached, set-based path.
+
+A store page load reads the current rotation (with the viewer's ownership of
+each item) and the key pricing. This script times that pair three ways against
+a real database:
+
+* ``before``: the old path, one rotation query, one ``check_user_has_reward``
+  per item, and a fresh config + key type read for pricing.
+* ``cold``: ``StoreService`` with its cache cleared before every load, so the
+  rotation and ownership come from one query.
+* ``warm``: ``StoreService`` with its cache left populated, as most requests see it.
+
+Connection settings come from the same ``POSTGRES_*`` variables as the API.
+
+Usage:
+    python scripts/bench_store_rotation.py
+    python scripts/bench_store_rotation.py --loads 500 --user-id 123
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "apps" / "api"))
+
+import asyncpg
+from litestar.datastructures import State
+from repository.lootbox_repository import LootboxRepository
+from repository.store_repository import StoreRepository
+from services.lootbox_service import LootboxService
+from services.store_service import _STORE_CACHE, StoreService
+
+
+def _dsn() -> str:
+    user = os.getenv("POSTGRES_USER")
+    password = os.getenv("POSTGRES_PASSWORD")
+    host = os.getenv("POSTGRES_HOST", "localhost")
+    db = os.getenv("POSTGRES_DB")
+    return f"postgresql://{user}:{password}@{host}:5432/{db}"
+
+
+async def _time(load: Callable[[], Awaitable[object]], loads: int) -> list[float]:
+    await load()  # warm connections and plans
+    samples = []
+    for _ in range(loads):
+        started = time.perf_counter()
+        await load()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+    mean = statistics.fmean(samples)
+    print(f"{label:>6}: p50 {quantiles[49]:6.2f} ms  p99 {quantiles[98]:6.2f} ms  mean {mean:6.2f} ms")
+
+
+async def main() -> None:
+    """Time the before, cold and warm store page loads and print latency."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--loads", type=int, default=200, help="store page loads per scenario")
+    parser.add_argument("--user-id", type=int, help="viewer (defaults to the user owning the most rewards)")
+    args = parser.parse_args()
+
+    pool = await asyncpg.create_pool(_dsn(), min_size=1, max_size=4)
+    assert pool
+    try:
+        user_id = args.user_id or await pool.fetchval(
+            "SELECT user_id FROM lootbox.user_rewards GROUP BY user_id ORDER BY count(*) DESC LIMIT 1"
+        )
+        store_repo = StoreRepository(pool)
+        lootbox_repo = LootboxRepository(pool)
+        service = StoreService(pool, State(), store_repo, lootbox_repo, LootboxService(pool, State(), lootbox_repo))
+
+        async def before() -> None:
+            items = await store_repo.fetch_current_rotation()
+            for item in items:
+                await lootbox_repo.check_user_has_reward(
+                    user_id=user_id,
+                    reward_type=item["item_type"],
+                    key_type=item["key_type"],
+                    reward_name=item["item_name"],
+                )
+            await store_repo.fetch_config()
+            await lootbox_repo.fetch_all_key_types()
+
+        async def cold() -> None:
+            _STORE_CACHE.invalidate()
+            await service.get_current_rotation(user_id)
+            await service.get_key_pricing()
+
+        async def warm() -> None:
+            await service.get_current_rotation(user_id)
+            await service.get_key_pricing()
+
+        items = await store_repo.fetch_current_rotation()
+        print(f"{args.loads} store page loads, {len(items)} rotation items, viewer {user_id}")
+        _report("before", await _time(before, args.loads))
+        _report("cold", await _time(cold, args.loads))
+        _report("warm", await _time(warm, args.loads))
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
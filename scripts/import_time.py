@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Measure cold import time of the API and bot entry points.
+
+Each entry point is imported in a fresh interpreter under ``python -X importtime``
+and the cumulative time of its top-level imports is reported, together with the
+slowest modules. Every target is measured several times and the fastest run is
+kept, which filters out most scheduler noise.
+
+The timings are informational: wall-clock time varies too much between
+machines and CI runners to gate on. With ``--check`` the script instead exits
+non-zero when an entry point imports one of its deferred modules, the heavy
+dependencies that are only imported inside the functions that need them, so CI
+fails when a change drags one back onto the import path.
+
+Usage:
+    python scripts/import_time.py
+    python scripts/import_time.py --check
+    python scripts/import_time.py --target api --top 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    cwd: Path
+    module: str
+    deferred: tuple[str, ...] = ()
+
+
+# ``deferred`` lists the packages the entry point must not import; each is
+# imported lazily ("# deferred heavy import") where it is used. The bot has none:
+# discord.py imports aiohttp itself.
+TARGETS = (
+    Target("api", repo_root / "apps" / "api", "app", ("aiohttp", "boto3", "botocore", "PIL")),
+    Target("bot", repo_root / "apps" / "bot", "main"),
+)
+
+
+def measure(target: Target) -> tuple[float, list[tuple[float, str]]]:
+    """Import ``target.module`` once and parse the ``-X importtime`` report.
+
+    Returns:
+        The total cumulative milliseconds of top-level imports, and
+        ``(cumulative_ms, module)`` pairs for every imported module.
+    """
+    env = {**os.environ, "PYTHONPATH": str(target.cwd)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target.module}"],
+        cwd=target.cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {target.module!r} failed:\n{proc.stderr[-2000:]}")
+
+    total_us = 0
+    modules: list[tuple[float, str]] = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        cumulative_us = int(match[2])
+        # Nested imports are indented under their importer; only top-level
+        # entries contribute to the total so nothing is counted twice.
+        if len(match[3]) == 1:
+            total_us += cumulative_us
+        modules.append((cumulative_us / 1000, match[4]))
+    return total_us / 1000, modules
+
+
+def eager_deferred(target: Target, modules: list[tuple[float, str]]) -> list[str]:
+    """Return the deferred packages of ``target`` that its import pulled in."""
+    imported = {module.split(".", 1)[0] for _, module in modules}
+    return [package for package in target.deferred if package in imported]
+
+
+def main() -> int:
+    """Measure the selected targets and check that their deferred imports stay deferred."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=[t.name for t in TARGETS], action="append")
+    parser.add_argument("--runs", type=int, default=3, help="runs per target; the fastest is kept")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a target imports a deferred module")
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    for target in TARGETS:
+        if args.target and target.name not in args.target:
+            continue
+        total_ms, modules = min((measure(target) for _ in range(args.runs)), key=lambda run: run[0])
+        eager = eager_deferred(target, modules)
+
+        status = f"imports deferred {', '.join(eager)}" if eager else "ok"
+        print(f"{target.name}: import {target.module} took {total_ms:.0f} ms [{status}]")
+        for cumulative_ms, module in sorted(modules, reverse=True)[: args.top]:
+            print(f"  {cumulative_ms:9.1f} ms  {module}")
+        if eager:
+            failures.append(f"{target.name} ({', '.join(eager)})")
+
+    if args.check and failures:
+        print(f"Deferred modules imported eagerly by: {'; '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())